@@ -7,6 +7,8 @@ and executes them automatically.
 Now uses the protocol module for schema-driven message validation.
 """
 
+import time
+
 import bpy
 from bpy.types import Operator
 from pathlib import Path
@@ -42,6 +44,11 @@ class UAL_OT_check_import_queue(Operator):
     bl_label = "Check Import Queue"
     bl_description = "Check for pending asset requests"
 
+    # Batch thumbnail jobs render items until this many seconds have
+    # passed, then yield to the UI until the next timer tick. Each tick
+    # renders at least one item, so a slow render still makes progress.
+    BATCH_TICK_BUDGET_S = 0.1
+
     def execute(self, context):
         """Process any pending requests"""
         client = get_queue_client()
@@ -54,6 +61,9 @@ class UAL_OT_check_import_queue(Operator):
         for request in client.get_pending_thumbnail_requests():
             self._process_thumbnail_request(context, request, client)
 
+        # Process batch thumbnail jobs (time-sliced)
+        self._process_thumbnail_batches(context, client)
+
         return {'FINISHED'}
 
     def _process_import_request(self, context, request: dict, client):
@@ -478,39 +488,88 @@ class UAL_OT_check_import_queue(Operator):
         thumbnail_path = request.get('thumbnail_path', '')
 
         try:
-            if not usd_file_path or not Path(usd_file_path).exists():
-                client.mark_failed(file_path, "USD file not found")
-                return
-
-            # Import USD temporarily
-            bpy.ops.wm.usd_import(filepath=usd_file_path)
-
-            if not context.selected_objects:
-                client.mark_failed(file_path, "No objects imported")
-                return
-
-            # Frame objects in viewport
-            view3d_area, view3d_region, _ = find_3d_viewport(context)
-            if view3d_area and view3d_region:
-                with context.temp_override(area=view3d_area, region=view3d_region):
-                    bpy.ops.view3d.view_selected()
-
-            # Generate thumbnail using utility
-            success = generate_thumbnail(context, thumbnail_path, size=256)
-
-            # Delete imported objects
-            bpy.ops.object.delete()
-
-            if success:
+            error = self._render_thumbnail(context, usd_file_path, thumbnail_path)
+            if error is None:
                 self.report({'INFO'}, f"Regenerated thumbnail for '{asset_name}'")
                 client.mark_completed(file_path)
             else:
-                client.mark_failed(file_path, "Thumbnail generation failed")
+                client.mark_failed(file_path, error)
 
         except Exception as e:
             self.report({'ERROR'}, f"Thumbnail failed for '{asset_name}': {str(e)}")
             client.mark_failed(file_path, str(e))
 
+    def _process_thumbnail_batches(self, context, client):
+        """Render pending batch items until the tick budget is used up"""
+        deadline = time.monotonic() + self.BATCH_TICK_BUDGET_S
+        rendered = False
+
+        for batch in client.get_pending_thumbnail_batches():
+            file_path = batch['file_path']
+
+            # Validate message against protocol schema
+            try:
+                validate_message(batch, "thumbnail_batch")
+            except ValidationError as e:
+                # Continue processing - validation is advisory for backwards compatibility
+                pass
+
+            size = batch.get('thumbnail_size', 256)
+            done = client.get_batch_done(file_path)
+
+            for item in batch.get('items', []):
+                asset_uuid = item.get('asset_uuid', '')
+                if not asset_uuid or asset_uuid in done:
+                    continue
+                if rendered and time.monotonic() >= deadline:
+                    return
+                rendered = True
+
+                thumbnail_path = item.get('thumbnail_path', '')
+                try:
+                    error = self._render_thumbnail(
+                        context, item.get('usd_file_path', ''), thumbnail_path, size
+                    )
+                except Exception as e:
+                    error = str(e)
+
+                if not client.record_batch_result(file_path, asset_uuid, thumbnail_path, error):
+                    break  # Cancelled from the desktop app
+            else:
+                client.complete_batch(file_path)
+                self.report({'INFO'}, f"Thumbnail batch finished ({len(batch.get('items', []))} assets)")
+
+    def _render_thumbnail(self, context, usd_file_path: str, thumbnail_path: str,
+                          size: int = 256):
+        """
+        Import a USD file temporarily and render its thumbnail.
+
+        Returns:
+            None on success, otherwise an error message
+        """
+        if not usd_file_path or not Path(usd_file_path).exists():
+            return "USD file not found"
+
+        # Import USD temporarily
+        bpy.ops.wm.usd_import(filepath=usd_file_path)
+
+        if not context.selected_objects:
+            return "No objects imported"
+
+        # Frame objects in viewport
+        view3d_area, view3d_region, _ = find_3d_viewport(context)
+        if view3d_area and view3d_region:
+            with context.temp_override(area=view3d_area, region=view3d_region):
+                bpy.ops.view3d.view_selected()
+
+        # Generate thumbnail using utility
+        success = generate_thumbnail(context, thumbnail_path, size=size)
+
+        # Delete imported objects
+        bpy.ops.object.delete()
+
+        return None if success else "Thumbnail generation failed"
+
 
 class UAL_OT_start_queue_listener(Operator):
     """Start the queue listener modal operator"""
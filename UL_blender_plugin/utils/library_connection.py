@@ -5,6 +5,7 @@ Provides read/write access to the asset library from Blender.
 """
 
 import os
+import re
 import json
 import sqlite3
 import uuid
@@ -36,6 +37,16 @@ class LibraryConnection:
         conn.add_asset(asset_data)
     """
 
+    # Triggers the desktop app creates to keep assets_fts in sync
+    # (schema_manager.py _SEARCH_INDEX_TRIGGERS)
+    SEARCH_INDEX_TRIGGERS = (
+        'assets_fts_ai', 'assets_fts_ad', 'assets_fts_au',
+        'asset_tags_fts_ai', 'asset_tags_fts_ad', 'tags_fts_au',
+    )
+
+    # Whether this Python's SQLite build has FTS5 (probed once)
+    _fts5_supported: Optional[bool] = None
+
     def __init__(self, library_path: str = None):
         """
         Initialize library connection
@@ -100,6 +111,7 @@ class LibraryConnection:
 
             # Create tables if needed (schema matches desktop app)
             self._create_tables()
+            self._guard_search_index()
 
             return True
         except Exception:
@@ -269,6 +281,35 @@ class LibraryConnection:
 
         self._connection.commit()
 
+    @classmethod
+    def _fts5_available(cls) -> bool:
+        """Check whether this SQLite build has the FTS5 module (once per process)"""
+        if cls._fts5_supported is None:
+            probe = sqlite3.connect(':memory:')
+            try:
+                probe.execute('CREATE VIRTUAL TABLE fts5_probe USING fts5(x)')
+                cls._fts5_supported = True
+            except sqlite3.OperationalError:
+                cls._fts5_supported = False
+            finally:
+                probe.close()
+        return cls._fts5_supported
+
+    def _guard_search_index(self):
+        """
+        Drop the search index sync triggers if this SQLite lacks FTS5
+
+        Blender's bundled SQLite may be built without FTS5. The triggers
+        write to assets_fts, so every asset write here would fail. The
+        desktop app finds them missing on its next start and rebuilds the
+        index with them, so search results catch up then.
+        """
+        if self._fts5_available():
+            return
+        for name in self.SEARCH_INDEX_TRIGGERS:
+            self._connection.execute(f'DROP TRIGGER IF EXISTS {name}')
+        self._connection.commit()
+
     def get_all_assets(self, folder_id: int = None) -> List[Dict[str, Any]]:
         """Get all assets, optionally filtered by folder"""
         if not self._connection:
@@ -1077,11 +1118,31 @@ class LibraryConnection:
             return False
 
     def search_assets(self, query: str) -> List[Dict[str, Any]]:
-        """Search assets by name or tags"""
+        """
+        Search assets by name, description, tags, type or author
+
+        Uses the library's assets_fts index (prefix terms, best matches
+        first). Falls back to LIKE for libraries without the index.
+        """
         if not self._connection:
             self.connect()
 
         cursor = self._connection.cursor()
+
+        # Same MATCH syntax and weights as the desktop AssetRepository.search
+        match = ' '.join(f'"{term}"*' for term in re.findall(r'\w+', query.lower()))
+        if match:
+            try:
+                cursor.execute("""
+                    SELECT assets.* FROM assets_fts
+                    JOIN assets ON assets.id = assets_fts.rowid
+                    WHERE assets_fts MATCH ?
+                    ORDER BY bm25(assets_fts, 10.0, 2.0, 5.0, 3.0, 1.0), assets.name
+                """, (match,))
+                return [dict(row) for row in cursor.fetchall()]
+            except sqlite3.OperationalError:
+                pass  # Older library without the search index
+
         search_term = f"%{query}%"
 
         cursor.execute("""
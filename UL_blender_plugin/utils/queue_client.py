@@ -6,11 +6,19 @@ Matching the queue system used by the desktop app's BlenderService.
 """
 
 import json
+import os
 import tempfile
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
 
-from .constants import QUEUE_DIR_NAME, STATUS_PENDING
+from .constants import (
+    QUEUE_DIR_NAME,
+    STATUS_PENDING,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    THUMBNAIL_BATCH_PROGRESS_SUFFIX,
+)
 
 
 class QueueClient:
@@ -40,6 +48,9 @@ class QueueClient:
     def __init__(self):
         """Initialize the queue client"""
         self._queue_dir = Path(tempfile.gettempdir()) / QUEUE_DIR_NAME
+        # Batch manifests are re-read only when they change
+        self._batches: Dict[str, Tuple[int, Dict[str, Any]]] = {}  # path -> (mtime_ns, manifest)
+        self._batch_done: Dict[str, Set[str]] = {}  # path -> finished asset UUIDs
 
     @property
     def queue_directory(self) -> Path:
@@ -47,12 +58,13 @@ class QueueClient:
         return self._queue_dir
 
     def get_pending_count(self) -> int:
-        """Get count of pending requests (import + thumbnail)"""
+        """Get count of pending requests (import + thumbnail + thumbnail batch)"""
         if not self._queue_dir.exists():
             return 0
         import_count = len(list(self._queue_dir.glob("import_*.json")))
         thumbnail_count = len(list(self._queue_dir.glob("thumbnail_*.json")))
-        return import_count + thumbnail_count
+        batch_count = len(list(self._queue_dir.glob("thumbbatch_*.json")))
+        return import_count + thumbnail_count + batch_count
 
     def get_pending_requests(self) -> List[Dict[str, Any]]:
         """
@@ -99,6 +111,152 @@ class QueueClient:
 
         return requests
 
+    def get_pending_thumbnail_batches(self) -> List[Dict[str, Any]]:
+        """
+        Get all pending batch thumbnail jobs.
+
+        Returns:
+            List of manifest dictionaries, each with added 'file_path' key
+        """
+        if not self._queue_dir.exists():
+            return []
+
+        batches = []
+        for json_file in sorted(self._queue_dir.glob("thumbbatch_*.json")):
+            key = str(json_file)
+            try:
+                mtime_ns = json_file.stat().st_mtime_ns
+            except OSError:
+                continue
+            cached = self._batches.get(key)
+            if cached is None or cached[0] != mtime_ns:
+                manifest = self.read_request(json_file)
+                if not manifest:
+                    continue
+                manifest['file_path'] = key
+                self._batches[key] = (mtime_ns, manifest)
+                cached = self._batches[key]
+            if cached[1].get('status') == STATUS_PENDING:
+                batches.append(cached[1])
+
+        return batches
+
+    @staticmethod
+    def get_batch_progress_path(file_path: str) -> Path:
+        """Get the progress file of a batch manifest"""
+        path = Path(file_path)
+        return path.with_name(path.stem + THUMBNAIL_BATCH_PROGRESS_SUFFIX)
+
+    def get_batch_done(self, file_path: str) -> Set[str]:
+        """
+        Get the asset UUIDs a batch job has already finished.
+
+        Read from the progress file once, so a job restarted after a
+        crash skips the items it already rendered.
+
+        Args:
+            file_path: Path to the batch manifest
+
+        Returns:
+            Set of asset UUIDs with a recorded result
+        """
+        done = self._batch_done.get(file_path)
+        if done is None:
+            done = set()
+            progress_path = self.get_batch_progress_path(file_path)
+            try:
+                with open(progress_path, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+                for line in lines:
+                    try:
+                        done.add(json.loads(line)['asset_uuid'])
+                    except (ValueError, KeyError, TypeError):
+                        pass  # Torn last line; that item is rendered again
+                if lines and not lines[-1].endswith("\n"):
+                    # Terminate the torn line so the next result starts on its own
+                    with open(progress_path, 'a', encoding='utf-8') as f:
+                        f.write("\n")
+            except OSError:
+                pass
+            self._batch_done[file_path] = done
+        return done
+
+    def record_batch_result(
+        self,
+        file_path: str,
+        asset_uuid: str,
+        thumbnail_path: str,
+        error: Optional[str] = None
+    ) -> bool:
+        """
+        Append one item's result to a batch job's progress file.
+
+        Args:
+            file_path: Path to the batch manifest
+            asset_uuid: UUID of the finished asset
+            thumbnail_path: Path the thumbnail was rendered to
+            error: Error message if rendering failed
+
+        Returns:
+            False if the job was cancelled (manifest removed) or writing failed
+        """
+        if not Path(file_path).exists():
+            self._forget_batch(file_path)
+            return False
+
+        record = {
+            "asset_uuid": asset_uuid,
+            "status": STATUS_FAILED if error else STATUS_COMPLETED,
+            "thumbnail_path": thumbnail_path,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if error:
+            record["error"] = error
+
+        try:
+            with open(self.get_batch_progress_path(file_path), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            return False
+
+        self.get_batch_done(file_path).add(asset_uuid)
+        return True
+
+    def complete_batch(self, file_path: str) -> bool:
+        """
+        Mark a batch job as completed.
+
+        The desktop app removes the manifest and progress file once it
+        has read every result.
+
+        Args:
+            file_path: Path to the batch manifest
+
+        Returns:
+            True if successful
+        """
+        path = Path(file_path)
+        try:
+            manifest = self.read_request(path)
+            if manifest:
+                manifest['status'] = STATUS_COMPLETED
+                tmp_path = path.with_name(f"{path.name}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f)
+                os.replace(tmp_path, path)
+                return True
+        except Exception as e:
+            pass
+        finally:
+            self._forget_batch(file_path)
+        return False
+
+    def _forget_batch(self, file_path: str):
+        self._batches.pop(file_path, None)
+        self._batch_done.pop(file_path, None)
+
     def read_request(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """
         Read a single request file.
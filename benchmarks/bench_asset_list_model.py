@@ -0,0 +1,73 @@
+"""
+Benchmark AssetListModel UUID operations on a large model
+
+Times lookups, updates and removals (single and batched) through the UUID index,
+and compares lookups with a linear scan of the asset list (the approach
+used before the index existed).
+
+Usage:
+    python benchmarks/bench_asset_list_model.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from universal_library.models.asset_list_model import AssetListModel  # noqa: E402
+
+
+def _make_assets(count: int):
+    return [{'uuid': f'uuid-{i:07d}', 'name': f'Asset {i}', 'asset_type': 'mesh'}
+            for i in range(count)]
+
+
+def _timed(label: str, count: int, func):
+    start = time.perf_counter()
+    func()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label:<34} {elapsed:9.1f} ms  ({elapsed * 1000 / count:8.2f} us/op)")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    ops = 2_000
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+
+    model = AssetListModel()
+    assets = _make_assets(rows)
+    model.set_assets(assets)
+    rng = random.Random(0)
+    sample = [f'uuid-{rng.randrange(rows):07d}' for _ in range(ops)]
+
+    print(f"AssetListModel with {rows} rows, {ops} operations each:")
+    _timed("get_asset_by_uuid (index)", ops,
+           lambda: [model.get_asset_by_uuid(uuid) for uuid in sample])
+    _timed("linear scan (baseline)", ops,
+           lambda: [next(a for a in assets if a['uuid'] == uuid) for uuid in sample])
+    _timed("update_asset", ops,
+           lambda: [model.update_asset(uuid, {'name': 'Renamed'}) for uuid in sample])
+
+    # Deleting one asset at a time, as after single deletes in the UI
+    victims = list(dict.fromkeys(sample))
+    _timed("remove_asset (one at a time)", len(victims),
+           lambda: [model.remove_asset(uuid) for uuid in victims])
+
+    # Bulk delete of a scattered selection, as the main window does
+    batch = [model.get_asset_at_index(row)['uuid'] for row in range(0, model.rowCount(), 25)]
+    _timed("remove_assets (one batch)", len(batch), lambda: model.remove_assets(batch))
+
+    # Sanity check: the index still matches the rows
+    for row in range(model.rowCount()):
+        uuid = model.get_asset_at_index(row)['uuid']
+        assert model.get_row_for_uuid(uuid) == row, uuid
+    print(f"  index consistent after removals ({model.rowCount()} rows left)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark AssetRepository list reads with bulk and per-row EAV hydration
+
+Builds a throwaway library with assets carrying EAV metadata, then reads
+the whole list through get_all() (one chunked metadata query per result
+set) and through the per-row path (_row_to_dict(), one metadata query per
+asset, as list reads did before bulk hydration). Reports SQL statements
+executed and wall time for each.
+
+Usage:
+    python benchmarks/bench_asset_repository.py [assets]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid as uuid_lib
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from universal_library.services.connection_manager import (  # noqa: E402
+    ConnectionManager, get_connection_manager,
+)
+from universal_library.services.database_service import DatabaseService  # noqa: E402
+
+
+class _QueryCounter:
+    """Counts statements run on this thread's library connections"""
+
+    def __init__(self):
+        self.count = 0
+        manager = get_connection_manager()
+        self._conns = {
+            manager.get_connection(),
+            manager.get_connection(ConnectionManager.ROLE_READ),
+        }
+
+    def _trace(self, statement):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        for conn in self._conns:
+            conn.set_trace_callback(self._trace)
+        return self
+
+    def __exit__(self, *exc):
+        for conn in self._conns:
+            conn.set_trace_callback(None)
+
+
+def _populate(db: DatabaseService, count: int):
+    folder_id = db.get_root_folder_id()
+    for i in range(count):
+        db.add_asset({
+            'uuid': str(uuid_lib.uuid4()),
+            'name': f'Asset {i:06d}',
+            'folder_id': folder_id,
+            'asset_type': 'mesh',
+            'polygon_count': 1000 + i,
+            'material_count': i % 5,
+            'has_materials': 1,
+            'file_size_mb': 1.5,
+        })
+
+
+def _timed(label: str, repeats: int, counter: _QueryCounter, func):
+    best = float('inf')
+    for _ in range(repeats):
+        with counter:
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+    print(f"  {label:<28} {best * 1000:9.1f} ms  {counter.count:7d} queries")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    repeats = 3
+    tmp = Path(tempfile.mkdtemp(prefix='ul_bench_'))
+    try:
+        db = DatabaseService(tmp / 'database.db')
+        print(f"Populating {count} assets...")
+        _populate(db, count)
+
+        repo = db._assets
+        conn = get_connection_manager().get_connection(ConnectionManager.ROLE_READ)
+        counter = _QueryCounter()
+
+        def per_row():
+            rows = conn.execute(
+                "SELECT * FROM assets WHERE (is_retired = 0 OR is_retired IS NULL) ORDER BY name"
+            ).fetchall()
+            return [repo._row_to_dict(row) for row in rows]
+
+        print(f"AssetRepository list read of {count} assets (best of {repeats}):")
+        bulk_result = _timed("get_all (bulk hydration)", repeats, counter, repo.get_all)
+        row_result = _timed("per-row hydration", repeats, counter, per_row)
+
+        assert bulk_result == row_result, "bulk and per-row hydration differ"
+        print("  results identical")
+    finally:
+        get_connection_manager().close_all()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark AssetCardDelegate painting of a 400-card grid viewport
+
+Paints every card of a model through the delegate into an offscreen
+image, once with empty render caches (fonts, badge pixmaps and elided
+names rebuilt, as after a theme or card size change) and once with warm
+caches (every later repaint). Cards carry every badge the grid draws;
+thumbnails are left out so only text and badge work is measured.
+
+Usage:
+    python benchmarks/bench_card_delegate_paint.py [cards] [repeats]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QRect  # noqa: E402
+from PyQt6.QtGui import QImage, QPainter  # noqa: E402
+from PyQt6.QtWidgets import QApplication, QStyleOptionViewItem  # noqa: E402
+
+from universal_library.models.asset_list_model import AssetListModel  # noqa: E402
+from universal_library.views.asset_card_delegate import AssetCardDelegate  # noqa: E402
+
+STATUSES = ('wip', 'review', 'approved', 'deprecated')
+TYPES = ('mesh', 'material', 'rig', 'animation', 'light')
+
+
+def _make_assets(count: int):
+    return [{
+        'uuid': f'uuid-{i:05d}',
+        'name': f'Very Long Asset Name Number {i} With Extra Words',
+        'asset_type': TYPES[i % len(TYPES)],
+        'status': STATUSES[i % len(STATUSES)],
+        'version_label': f'v{i % 12 + 1:03d}',
+        'variant_name': 'Base' if i % 3 else f'Variant{i % 7}',
+        'representation_type': 'lookdev' if i % 2 else 'model',
+        'is_cold': 1 if i % 5 == 0 else 0,
+        'is_favorite': i % 4 == 0,
+        'is_latest': 1,
+        'tags_v2': [{'id': t, 'name': f'tag{t}'} for t in range(i % 4)],
+    } for i in range(count)]
+
+
+def _paint_all(delegate, model, image, columns: int, cell_w: int, cell_h: int) -> float:
+    """Paint every card once; returns elapsed seconds"""
+    option = QStyleOptionViewItem()
+    painter = QPainter(image)
+    start = time.perf_counter()
+    for row in range(model.rowCount()):
+        col, line = row % columns, row // columns
+        option.rect = QRect(col * cell_w, line * cell_h, cell_w, cell_h)
+        delegate.paint(painter, option, model.index(row, 0))
+    elapsed = time.perf_counter() - start
+    painter.end()
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+
+    model = AssetListModel()
+    model.set_assets(_make_assets(count))
+    delegate = AssetCardDelegate(view_mode="grid")
+
+    option = QStyleOptionViewItem()
+    size = delegate.sizeHint(option, model.index(0, 0))
+    columns = 20
+    lines = -(-count // columns)
+    image = QImage(columns * size.width(), lines * size.height(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    cold = []
+    for _ in range(repeats):
+        delegate.clear_render_cache()
+        cold.append(_paint_all(delegate, model, image, columns, size.width(), size.height()))
+    warm = [_paint_all(delegate, model, image, columns, size.width(), size.height())
+            for _ in range(repeats)]
+
+    print(f"AssetCardDelegate grid paint, {count} cards of {size.width()}x{size.height()} "
+          f"(best / mean of {repeats}):")
+    for label, samples in (("cold render caches", cold), ("warm render caches", warm)):
+        best, mean = min(samples) * 1000, sum(samples) / len(samples) * 1000
+        print(f"  {label:<22} {best:8.1f} ms / {mean:8.1f} ms  "
+              f"({best * 1000 / count:7.1f} us/card)")
+    print(f"  cached badges: {len(delegate._badge_cache)}, "
+          f"elided names: {len(delegate._elide_cache)}, fonts: {len(delegate._fonts)}")
+
+
+if __name__ == '__main__':
+    main()
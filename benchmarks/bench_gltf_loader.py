@@ -0,0 +1,257 @@
+"""
+Benchmark GLB parse time and memory: the pre-mmap loader vs load_glb
+
+Writes a large synthetic GLB (one mesh with separate position/normal/uv
+bufferViews, one with a single interleaved bufferView using byteStride),
+then parses it with two loaders, each in a fresh subprocess:
+
+    baseline - gltf_loader.py as it was before it memory-mapped files
+               (whole file read into bytes, every accessor sliced into a
+               copy), taken from git history: the parent of the commit
+               that added `import mmap` to the loader
+    mmap     - the current load_glb(): BIN chunk mapped, accessors as views
+
+Reported per loader:
+    parse       best wall time over the repeats
+    heap peak   tracemalloc peak of one more, traced parse. Counts Python
+                and numpy allocations (private memory), not mapped pages
+    RSS growth  growth of ru_maxrss over the process baseline. Mapped
+                pages count while resident, but they are clean page cache
+                the kernel can drop, not private memory
+    kept        bytes of the mesh arrays in the returned GLBData
+
+The GLB is written by a subprocess as well: Linux carries ru_maxrss across
+exec, so a parent that built the file would skew every child's baseline.
+The loaders must agree on the separate-bufferView mesh (float sums to
+1e-6: the baseline transforms in float64, load_glb in float32). The
+baseline ignored byteStride, so for the interleaved mesh only shape and
+indices are compared.
+
+Usage:
+    python benchmarks/bench_gltf_loader.py [vertices_per_mesh] [repeats]
+"""
+
+import importlib.util
+import json
+import math
+import os
+import resource
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from universal_library.widgets.viewport_3d import gltf_loader  # noqa: E402
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOADER = 'universal_library/widgets/viewport_3d/gltf_loader.py'
+
+FLOAT, UINT32 = 5126, 5125
+ARRAY_BUFFER, ELEMENT_ARRAY_BUFFER = 34962, 34963
+
+
+def _write_glb(path: Path, vertex_count: int):
+    """Write a two-mesh GLB of `vertex_count` vertices and triangles per mesh"""
+    rng = np.random.default_rng(0)
+    positions = rng.random((vertex_count, 3), dtype=np.float32)
+    normals = rng.random((vertex_count, 3), dtype=np.float32)
+    uvs = rng.random((vertex_count, 2), dtype=np.float32)
+    indices = rng.integers(0, vertex_count, vertex_count * 3, dtype=np.uint32)
+    interleaved = np.hstack([positions, normals, uvs])  # 32-byte stride
+
+    blobs, views, accessors = [], [], []
+    offset = 0
+
+    def add_view(data: bytes, target: int, stride: int = 0) -> int:
+        nonlocal offset
+        view = {'buffer': 0, 'byteOffset': offset, 'byteLength': len(data), 'target': target}
+        if stride:
+            view['byteStride'] = stride
+        blobs.append(data)
+        views.append(view)
+        offset += len(data)
+        return len(views) - 1
+
+    def add_accessor(view: int, type_: str, component: int, count: int,
+                     byte_offset: int = 0) -> int:
+        accessors.append({'bufferView': view, 'byteOffset': byte_offset,
+                          'componentType': component, 'count': count, 'type': type_})
+        return len(accessors) - 1
+
+    index_view = add_view(indices.tobytes(), ELEMENT_ARRAY_BUFFER)
+    separate = {
+        'POSITION': add_accessor(add_view(positions.tobytes(), ARRAY_BUFFER),
+                                 'VEC3', FLOAT, vertex_count),
+        'NORMAL': add_accessor(add_view(normals.tobytes(), ARRAY_BUFFER),
+                               'VEC3', FLOAT, vertex_count),
+        'TEXCOORD_0': add_accessor(add_view(uvs.tobytes(), ARRAY_BUFFER),
+                                   'VEC2', FLOAT, vertex_count),
+    }
+    interleaved_view = add_view(interleaved.tobytes(), ARRAY_BUFFER, stride=32)
+    strided = {
+        'POSITION': add_accessor(interleaved_view, 'VEC3', FLOAT, vertex_count, 0),
+        'NORMAL': add_accessor(interleaved_view, 'VEC3', FLOAT, vertex_count, 12),
+        'TEXCOORD_0': add_accessor(interleaved_view, 'VEC2', FLOAT, vertex_count, 24),
+    }
+    primitive_indices = add_accessor(index_view, 'SCALAR', UINT32, vertex_count * 3)
+
+    gltf = {
+        'asset': {'version': '2.0'},
+        'scene': 0,
+        'scenes': [{'nodes': [0, 1]}],
+        'nodes': [{'mesh': 0}, {'mesh': 1, 'translation': [2.0, 0.0, 0.0]}],
+        'meshes': [
+            {'primitives': [{'attributes': separate, 'indices': primitive_indices}]},
+            {'primitives': [{'attributes': strided, 'indices': primitive_indices}]},
+        ],
+        'accessors': accessors,
+        'bufferViews': views,
+        'buffers': [{'byteLength': offset}],
+    }
+    json_bytes = json.dumps(gltf).encode('utf-8')
+    json_bytes += b' ' * (-len(json_bytes) % 4)
+    bin_bytes = b''.join(blobs)
+    bin_bytes += b'\x00' * (-len(bin_bytes) % 4)
+    total = 12 + 8 + len(json_bytes) + 8 + len(bin_bytes)
+
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<4sII', b'glTF', 2, total))
+        f.write(struct.pack('<I4s', len(json_bytes), b'JSON'))
+        f.write(json_bytes)
+        f.write(struct.pack('<I4s', len(bin_bytes), b'BIN\x00'))
+        f.write(bin_bytes)
+
+
+def _git(*args) -> str:
+    return subprocess.run(['git', '-C', REPO_ROOT, *args],
+                          check=True, capture_output=True, text=True).stdout
+
+
+def _baseline_source() -> Optional[str]:
+    """Loader source from before the mmap change (None outside a git checkout)"""
+    try:
+        revs = _git('log', '--reverse', '--format=%H', '-S', 'import mmap',
+                    '--', LOADER).split()
+        return _git('show', f'{revs[0]}^:{LOADER}') if revs else None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _import_baseline(path: str):
+    """Import the baseline loader saved at `path` as its own module"""
+    spec = importlib.util.spec_from_file_location('gltf_loader_baseline', path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses look the module up
+    spec.loader.exec_module(module)
+    return module
+
+
+def _checksum(glb) -> list:
+    return [(list(m.vertices.shape), float(m.vertices.sum()), float(m.normals.sum()),
+             float(m.uvs.sum()), int(m.indices.sum())) for m in glb.meshes]
+
+
+def _kept_bytes(glb) -> int:
+    """Bytes of the mesh arrays (the baseline GLBData has no nbytes)"""
+    return sum(value.nbytes for m in glb.meshes for value in vars(m).values()
+               if isinstance(value, np.ndarray))
+
+
+def _same_meshes(baseline: list, mapped: list) -> bool:
+    if len(baseline) != len(mapped):
+        return False
+    separate, strided = zip(baseline, mapped)
+    return all(
+        x == y if not isinstance(x, float) else math.isclose(x, y, rel_tol=1e-6)
+        for x, y in zip(*separate)
+    ) and strided[0][0] == strided[1][0] and strided[0][-1] == strided[1][-1]
+
+
+def _child(mode: str, path: str, repeats: int, baseline_path: str = ''):
+    """Run in a fresh process: parse `repeats` times, print a JSON result"""
+    loader = gltf_loader if mode == 'mmap' else _import_baseline(baseline_path)
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    best = float('inf')
+    glb = None
+    for _ in range(repeats):
+        glb = None  # Drop the previous result so peaks don't stack
+        start = time.perf_counter()
+        glb = loader.load_glb(path)
+        best = min(best, time.perf_counter() - start)
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    glb = None
+    tracemalloc.start()
+    glb = loader.load_glb(path)
+    heap_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(json.dumps({
+        'seconds': best,
+        'peak_mb': (peak_kb - baseline_kb) / 1024,
+        'heap_mb': heap_peak / (1024 * 1024),
+        'result_mb': _kept_bytes(glb) / (1024 * 1024),
+        'checksum': _checksum(glb),
+    }))
+
+
+def _run(*args) -> str:
+    return subprocess.run(
+        [sys.executable, os.path.abspath(__file__), *map(str, args)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--write':
+        _write_glb(Path(sys.argv[2]), int(sys.argv[3]))
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        _child(sys.argv[2], sys.argv[3], int(sys.argv[4]), *sys.argv[5:])
+        return
+
+    vertex_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    source = _baseline_source()
+    if source is None:
+        sys.exit(f"Baseline loader not found: needs the git history of {LOADER}")
+
+    tmp = Path(tempfile.mkdtemp(prefix='ul_bench_'))
+    try:
+        path = tmp / 'large.glb'
+        _run('--write', path, vertex_count)
+        size_mb = path.stat().st_size / (1024 * 1024)
+        baseline_path = tmp / 'gltf_loader_baseline.py'
+        baseline_path.write_text(source, encoding='utf-8')
+
+        results = {}
+        for mode in ('baseline', 'mmap'):
+            out = _run('--child', mode, path, repeats, baseline_path)
+            results[mode] = json.loads(out.strip().splitlines()[-1])
+
+        print(f"GLB parse of {size_mb:.1f} MB, 2 meshes x {vertex_count} vertices "
+              f"(best of {repeats}, one process per loader):")
+        print(f"  {'loader':<8} {'parse':>10} {'heap peak':>12} {'RSS growth':>12} {'kept':>10}")
+        for mode, r in results.items():
+            print(f"  {mode:<8} {r['seconds'] * 1000:7.1f} ms {r['heap_mb']:9.1f} MB "
+                  f"{r['peak_mb']:9.1f} MB {r['result_mb']:7.1f} MB")
+
+        assert _same_meshes(results['baseline']['checksum'], results['mmap']['checksum']), \
+            "baseline and mmap loaders produced different meshes"
+        print("  meshes match")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Count filesystem calls made while repainting the asset grid
+
+Fills an AssetView with assets whose thumbnails exist on disk, lets the
+thumbnail loader warm up, then repaints the viewport repeatedly while
+counting os.stat()/os.lstat() calls. With PathInfoCache in front of the
+thumbnail requests a warm repaint must not touch the filesystem; the
+script fails if it does.
+
+Usage:
+    python benchmarks/bench_grid_paint_syscalls.py [assets] [repaints]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtGui import QColor, QImage  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from universal_library.models.asset_list_model import AssetListModel  # noqa: E402
+from universal_library.services import thumbnail_disk_cache  # noqa: E402
+from universal_library.services.path_info_cache import get_path_info_cache  # noqa: E402
+from universal_library.services.thumbnail_loader import get_thumbnail_loader  # noqa: E402
+from universal_library.views.asset_view import AssetView  # noqa: E402
+
+
+class _StatCounter:
+    """Wraps os.stat and os.lstat to count calls"""
+
+    def __init__(self):
+        self.count = 0
+        self._originals = {}
+
+    def __enter__(self):
+        self.count = 0
+        for name in ('stat', 'lstat'):
+            original = getattr(os, name)
+            self._originals[name] = original
+
+            def counted(*args, _original=original, **kwargs):
+                self.count += 1
+                return _original(*args, **kwargs)
+
+            setattr(os, name, counted)
+        return self
+
+    def __exit__(self, *exc):
+        for name, original in self._originals.items():
+            setattr(os, name, original)
+
+
+def _make_thumbnails(folder: Path, count: int):
+    image = QImage(256, 256, QImage.Format.Format_RGB32)
+    assets = []
+    for i in range(count):
+        image.fill(QColor.fromHsv(i * 37 % 360, 160, 200))
+        path = folder / f'thumb_{i:05d}.png'
+        image.save(str(path))
+        assets.append({
+            'uuid': f'uuid-{i:05d}', 'name': f'Asset {i}', 'asset_type': 'mesh',
+            'thumbnail_path': str(path), 'is_latest': 1,
+        })
+    return assets
+
+
+def _wait_for_loads(app, loader, timeout=30.0):
+    """Spin the event loop until no thumbnail loads or scales are pending"""
+    deadline = time.monotonic() + timeout
+    idle_passes = 0
+    while time.monotonic() < deadline and idle_passes < 20:
+        app.processEvents()
+        stats = loader.get_cache_stats()
+        busy = stats['pending_count'] or stats['in_flight_count'] or loader._fitting
+        idle_passes = 0 if busy else idle_passes + 1
+        time.sleep(0.01)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    repaints = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    app = QApplication.instance() or QApplication([])
+
+    tmp = Path(tempfile.mkdtemp(prefix='ul_bench_'))
+    try:
+        # Keep the mip cache out of the user's library folder
+        thumbnail_disk_cache._thumbnail_disk_cache_instance = \
+            thumbnail_disk_cache.ThumbnailDiskCache(tmp / 'cache')
+        (tmp / 'thumbs').mkdir()
+        assets = _make_thumbnails(tmp / 'thumbs', count)
+
+        model = AssetListModel()
+        model.set_assets(assets)
+        loader = get_thumbnail_loader()
+        for signal in (loader.tiles_loaded, loader.fitted_loaded):
+            signal.connect(model.notify_thumbnails_changed)
+        loader.thumbnail_loaded.connect(lambda uuid, _: model.notify_thumbnails_changed([uuid]))
+
+        view = AssetView()
+        view.setModel(model)
+        view.resize(1600, 1000)
+        view.show()
+
+        # Cold: first paint queues the loads
+        with _StatCounter() as cold:
+            view.viewport().grab()
+        _wait_for_loads(app, loader)
+        view.viewport().grab()  # Paint once with everything loaded
+        _wait_for_loads(app, loader)
+
+        path_info = get_path_info_cache()
+        path_info.reset_stats()
+        with _StatCounter() as warm:
+            start = time.perf_counter()
+            for _ in range(repaints):
+                view.viewport().grab()
+            elapsed = time.perf_counter() - start
+
+        stats = path_info.get_stats()
+        print(f"Grid of {count} assets, {repaints} warm repaints:")
+        print(f"  cold first paint             {cold.count:6d} stat calls")
+        print(f"  warm repaints                {warm.count:6d} stat calls "
+              f"({warm.count / repaints:.2f} per repaint)")
+        print(f"  path info lookups            {stats['lookups']:6d} "
+              f"({stats['stat_calls']} refreshed by stat)")
+        print(f"  repaint time                 {elapsed * 1000 / repaints:9.2f} ms")
+
+        assert warm.count == 0, f"warm repaints made {warm.count} stat calls"
+        print("  no filesystem calls on warm repaints")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,11 @@ Usage:
     python run.py
 """
 
+import multiprocessing
+
 from universal_library.main import main
 
 if __name__ == "__main__":
+    # Thumbnail decode workers are spawned processes; needed in frozen builds
+    multiprocessing.freeze_support()
     main()
@@ -289,6 +289,13 @@ class Config:
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
+    @classmethod
+    def get_meshes_cache_directory(cls) -> Path:
+        """Get parsed 3D preview cache directory"""
+        cache_dir = cls.get_cache_directory() / 'meshes'
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir
+
     @classmethod
     def get_logs_directory(cls) -> Path:
         """Get logs directory path (inside .meta folder)"""
@@ -484,16 +491,57 @@ class Config:
     # ==================== PERFORMANCE ====================
     # Thumbnail loading
     THUMBNAIL_THREAD_COUNT = 4
-    THUMBNAIL_CACHE_SIZE_MB = 100
+    THUMBNAIL_CACHE_SIZE_MB = 512  # On-disk mip cache (ThumbnailDiskCache)
     DEFAULT_THUMBNAIL_SIZE = 300
-
-    # Pixmap cache (in KB for Qt)
-    PIXMAP_CACHE_SIZE_KB = 512 * 1024  # 512 MB
+    PATH_INFO_TTL_S = 10.0  # Re-stat thumbnail files at most this often (PathInfoCache)
+    # Thumbnail decoding: 'thread' (Qt, in THUMBNAIL_THREAD_COUNT threads) or
+    # 'process' (Pillow in worker processes, ThumbnailDecodePool)
+    THUMBNAIL_DECODE_BACKEND = 'thread'
+    THUMBNAIL_PROCESS_COUNT = 0  # Worker processes; 0 = one per CPU core
+    # Atlas for small cards (ThumbnailAtlas): 256 tiles per page, 16 MB each
+    THUMBNAIL_ATLAS_TILE_SIZE = 128  # Cards drawn at or below this size use the atlas
+    THUMBNAIL_ATLAS_PAGE_SIZE = 2048
+    THUMBNAIL_ATLAS_MAX_PAGES = 16
+    # Batch regeneration (ThumbnailBatchService)
+    THUMBNAIL_BATCH_POLL_MS = 500  # How often Blender's progress files are read
+    THUMBNAIL_BATCH_THREADS = 0  # Cache-fill threads; 0 = half the CPU cores
+
+    # Parsed 3D previews in memory (mesh_cache), shared by all viewports
+    MESH_CACHE_MEMORY_MB = 1024
+    # Neighbouring 3D previews parsed ahead of selection (GlbPreloader)
+    GLB_PRELOAD_NEIGHBOURS = 2  # Assets on each side of the selection
+    GLB_PRELOAD_SETTLE_MS = 400  # Selection must be still this long
+    GLB_PRELOAD_BUDGET_FRACTION = 0.5  # Stop once the memory cache is this full
+    # Parsed 3D previews on disk (MeshDiskCache)
+    MESH_CACHE_DISK_SIZE_MB = 2048
+    MESH_CACHE_TEXTURE_SIZE = 1024  # Textures are stored downscaled to this
+
+    # Pixmap cache (in KB for Qt); only Qt's own style/icon pixmaps now
+    PIXMAP_CACHE_SIZE_KB = 32 * 1024  # 32 MB
+
+    # In-memory images (ImageCache): one budget shared by all views, with a
+    # quota per consumer so none can push the others out
+    IMAGE_CACHE_BUDGET_MB = 512
+    IMAGE_CACHE_QUOTAS_MB = {
+        'thumbnails': 384,  # Asset cards and metadata panel (ThumbnailLoader)
+        'previews': 64,  # Version history preview panel
+        'screenshots': 32,  # Review screenshot list thumbnails
+        'review': 192,  # Full-size review screenshots
+    }
 
     # Model updates
     BATCH_UPDATE_SIZE = 50
     SEARCH_DEBOUNCE_MS = 300
 
+    # SQLite connections (applied to every connection by ConnectionManager)
+    DB_BUSY_TIMEOUT_S = 30.0
+    DB_CACHE_SIZE_KB = 8 * 1024  # 8 MB page cache per connection
+    DB_MMAP_SIZE_MB = 256
+
+    # Write queue (small writes grouped into one transaction)
+    WRITE_QUEUE_BATCH_MS = 50
+    WRITE_QUEUE_MAX_BATCH = 500
+
     # ==================== UI DEFAULTS ====================
     # Window
     DEFAULT_WINDOW_WIDTH = 1400
@@ -510,6 +558,9 @@ class Config:
     # List mode
     LIST_ROW_HEIGHT = 56
 
+    # Record a view (for the Recent folder) whenever an asset is selected
+    RECORD_VIEW_ON_SELECT = False
+
     # Tree mode
     TREE_ROW_HEIGHT = 72        # Parent (base) row height
     TREE_CHILD_ROW_HEIGHT = 60  # Variant child row height
@@ -113,7 +113,7 @@ def setup_application() -> QApplication:
     # Set application-wide default font
     app.setFont(get_app_font())
 
-    # Configure global pixmap cache for thumbnail performance
+    # Qt's own pixmap cache; app images are budgeted by ImageCache
     QPixmapCache.setCacheLimit(Config.PIXMAP_CACHE_SIZE_KB)
 
     # Initialize event bus (singleton)
@@ -168,7 +168,7 @@ def main():
     window.show()
 
     logger.info("Application started successfully!")
-    logger.info(f"Pixmap cache: {Config.PIXMAP_CACHE_SIZE_KB / 1024:.0f} MB")
+    logger.info(f"Image cache: {Config.IMAGE_CACHE_BUDGET_MB} MB")
 
     # Run event loop
     sys.exit(app.exec())
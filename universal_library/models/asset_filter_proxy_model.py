@@ -5,10 +5,10 @@ Pattern: Proxy pattern with QSortFilterProxyModel
 Based on animation_library architecture.
 """
 
-from typing import Optional, Set
+from typing import Iterable, List, Optional, Set
 from PyQt6.QtCore import QSortFilterProxyModel, QModelIndex, Qt
 
-from .asset_list_model import AssetRole
+from .asset_list_model import AssetRole, AssetFilterRecord
 from ..config import Config
 
 
@@ -22,7 +22,7 @@ class AssetFilterProxyModel(QSortFilterProxyModel):
     - Asset type filtering
     - Tag filtering
     - Case-insensitive search
-    - Performance: Uses Qt's built-in caching
+    - Performance: Filters on precomputed AssetFilterRecord keys
 
     Usage:
         proxy = AssetFilterProxyModel()
@@ -37,6 +37,7 @@ class AssetFilterProxyModel(QSortFilterProxyModel):
 
         # Filter criteria
         self._search_text: str = ""
+        self._search_matches: Optional[frozenset] = None  # UUIDs from the search index
         self._folder_id: Optional[int] = None
         self._folder_ids: Set[int] = set()  # For recursive folder filtering
         self._filter_tags: Set[str] = set()  # Legacy tag name filter
@@ -51,6 +52,12 @@ class AssetFilterProxyModel(QSortFilterProxyModel):
         self._variants_only: bool = False  # Filter for variant assets (variant_name != 'Base')
         self._show_only_latest: bool = True  # Show only latest versions by default
 
+        # Cached filter results: bumped on every filter change; records
+        # carry the generation their cached result belongs to
+        self._filter_generation: int = 0
+        self._bulk_generation: int = -1
+        self._source_records: Optional[List] = None
+
         # Sort configuration
         self._sort_by: str = "name"  # name, date, file_size, polygon_count
         self._sort_order: str = "ASC"  # ASC or DESC
@@ -61,15 +68,22 @@ class AssetFilterProxyModel(QSortFilterProxyModel):
         self.setDynamicSortFilter(True)  # Auto-refilter on data changes
         self.setSortRole(AssetRole.NameRole)  # Enable sorting by default
 
-    def set_search_text(self, text: str):
+    def set_search_text(self, text: str, matches: Optional[Iterable[str]] = None):
         """
         Set search text filter
 
         Args:
             text: Search query (searches name, description, tags)
+            matches: UUIDs the search index matched for text (word-prefix
+                matches across name, description, tags, type and author).
+                When given, only these are shown; None falls back to a
+                substring match on name, description, tags and type.
         """
-        if self._search_text != text:
-            self._search_text = text.strip().lower()
+        text = text.strip().lower()
+        matches = frozenset(matches) if matches is not None and text else None
+        if self._search_text != text or self._search_matches != matches:
+            self._search_text = text
+            self._search_matches = matches
             self.invalidateFilter()
 
     def set_folder_filter(self, folder_id: Optional[int], folder_ids: Optional[Set[int]] = None):
@@ -355,6 +369,7 @@ class AssetFilterProxyModel(QSortFilterProxyModel):
 
         if self._search_text:
             self._search_text = ""
+            self._search_matches = None
             changed = True
 
         if self._folder_id is not None:
@@ -400,10 +415,31 @@ class AssetFilterProxyModel(QSortFilterProxyModel):
         if changed:
             self.invalidateFilter()
 
+    def setSourceModel(self, source_model):
+        """Set source model and keep a reference to its filter records"""
+        super().setSourceModel(source_model)
+        self._source_records = getattr(source_model, 'filter_records', None)
+        self._filter_generation += 1
+
+    def invalidateFilter(self):
+        """Invalidate cached filter results and re-filter"""
+        self._filter_generation += 1
+        super().invalidateFilter()
+
+    def invalidate(self):
+        """Invalidate cached filter results, re-filter and re-sort"""
+        self._filter_generation += 1
+        super().invalidate()
+
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         """
         Determine if row should be shown
 
+        The first call after a filter change evaluates every row at once
+        (see _filter_records) and stores the result on each row's
+        AssetFilterRecord; remaining calls are lookups. Records created
+        afterwards (inserted or changed rows) are evaluated individually.
+
         Args:
             source_row: Row in source model
             source_parent: Parent index
@@ -411,146 +447,126 @@ class AssetFilterProxyModel(QSortFilterProxyModel):
         Returns:
             True if row matches filters, False otherwise
         """
+        # Fast path: cached result on the row's record for this filter state
+        records = self._source_records
+        if records is not None and source_row < len(records):
+            record = records[source_row]
+            if record is not None and record.accepted_generation == self._filter_generation:
+                return record.accepted
+
         source_model = self.sourceModel()
         if not source_model:
             return True
 
-        index = source_model.index(source_row, 0, source_parent)
-
-        # Favorites only filter
-        if self._favorites_only:
-            is_favorite = source_model.data(index, AssetRole.IsFavoriteRole)
-            if not is_favorite:
-                return False
+        record = source_model.get_filter_record(source_row)
+        if record is None:
+            return False
 
-        # Recent only filter
-        if self._recent_only:
-            last_viewed = source_model.data(index, AssetRole.LastViewedDateRole)
-            if not last_viewed:
-                return False
+        generation = self._filter_generation
+        if self._bulk_generation != generation:
+            # Columnar pass over the whole model for this filter state
+            self._bulk_generation = generation
+            records = source_model.get_filter_records()
+            for other in records:
+                other.accepted = False
+                other.accepted_generation = generation
+            for other in self._filter_records(records):
+                other.accepted = True
+
+        if record.accepted_generation != generation:
+            # Row inserted or changed since the pass
+            record.accepted = bool(self._filter_records([record]))
+            record.accepted_generation = generation
+
+        return record.accepted
+
+    def _filter_records(self, records: List[AssetFilterRecord]) -> List[AssetFilterRecord]:
+        """
+        Apply the active filters to a list of records
 
-        # Cold storage filter
-        is_cold = source_model.data(index, AssetRole.IsColdRole)
-        if self._cold_storage_only:
-            # In Cold Storage view: show only cold assets
-            if not is_cold:
-                return False
-        else:
-            # In regular views: hide cold assets (they only appear in Cold Storage folder)
-            if is_cold:
-                return False
+        Each active criterion narrows the candidate list in one pass, so
+        inactive filters cost nothing and the cheapest checks run first.
 
+        Args:
+            records: Records to filter
 
-        # Base/Variants filter
+        Returns:
+            Records that match all active filters
+        """
+        # Flag filters combined into a single mask comparison
+        mask = AssetFilterRecord.COLD
+        want = AssetFilterRecord.COLD if self._cold_storage_only else 0
+        if self._favorites_only:
+            mask |= AssetFilterRecord.FAVORITE
+            want |= AssetFilterRecord.FAVORITE
+        if self._recent_only:
+            mask |= AssetFilterRecord.RECENT
+            want |= AssetFilterRecord.RECENT
         if self._base_only or self._variants_only:
-            variant_name = source_model.data(index, AssetRole.VariantNameRole) or 'Base'
-            if self._base_only and variant_name != 'Base':
-                return False
-            if self._variants_only and variant_name == 'Base':
-                return False
+            mask |= AssetFilterRecord.BASE
+            if self._base_only:
+                want |= AssetFilterRecord.BASE
+        if self._show_only_latest:
+            mask |= AssetFilterRecord.LATEST
+            want |= AssetFilterRecord.LATEST
+
+        if self._base_only and self._variants_only:
+            return []
+        result = [r for r in records if r.flags & mask == want]
 
-        # Folder filter - uses multi-folder membership (FoldersV2Role)
+        # Folder filter - uses multi-folder membership, falling back to
+        # legacy folder_id for assets not yet migrated
         if self._folder_ids:
-            # Recursive folder filtering (check if asset is in ANY of the folder IDs)
-            folders_v2 = source_model.data(index, AssetRole.FoldersV2Role)
-            if folders_v2:
-                asset_folder_ids = {f.get('id') for f in folders_v2 if f.get('id')}
-                if not asset_folder_ids.intersection(self._folder_ids):
-                    return False
-            else:
-                # Fallback to legacy folder_id for assets not yet migrated
-                folder_id = source_model.data(index, AssetRole.FolderIdRole)
-                if folder_id not in self._folder_ids:
-                    return False
+            folder_ids = self._folder_ids
+            result = [
+                r for r in result
+                if (not r.folder_ids.isdisjoint(folder_ids) if r.folder_ids
+                    else r.legacy_folder_id in folder_ids)
+            ]
         elif self._folder_id is not None:
-            # Single folder filtering - check multi-folder membership
-            folders_v2 = source_model.data(index, AssetRole.FoldersV2Role)
-            if folders_v2:
-                asset_folder_ids = {f.get('id') for f in folders_v2 if f.get('id')}
-                if self._folder_id not in asset_folder_ids:
-                    return False
-            else:
-                # Fallback to legacy folder_id for assets not yet migrated
-                folder_id = source_model.data(index, AssetRole.FolderIdRole)
-                if folder_id != self._folder_id:
-                    return False
+            folder_id = self._folder_id
+            result = [
+                r for r in result
+                if (folder_id in r.folder_ids if r.folder_ids
+                    else r.legacy_folder_id == folder_id)
+            ]
 
         # Asset type filter
         if self._filter_asset_types:
-            asset_type = source_model.data(index, AssetRole.AssetTypeRole)
-            if asset_type not in self._filter_asset_types:
-                return False
+            asset_types = self._filter_asset_types
+            result = [r for r in result if r.asset_type in asset_types]
 
         # Physical path filter (for subfolder filtering)
         if self._filter_physical_path:
-            blend_path = source_model.data(index, AssetRole.BlendBackupPathRole)
-            if not blend_path:
-                return False
-            # Normalize path and check if it starts with the filter prefix
-            normalized_blend = blend_path.replace('/', '\\')
-            if not normalized_blend.startswith(self._filter_physical_path):
-                return False
+            prefix = self._filter_physical_path
+            result = [r for r in result if r.blend_path and r.blend_path.startswith(prefix)]
 
         # Status filter
         if self._filter_statuses:
-            status = source_model.data(index, AssetRole.StatusRole)
-            if status not in self._filter_statuses:
-                return False
-
-        # Version filter (show only latest by default)
-        if self._show_only_latest:
-            is_latest = source_model.data(index, AssetRole.IsLatestRole)
-            if is_latest is not None and not is_latest:
-                return False
+            statuses = self._filter_statuses
+            result = [r for r in result if r.status in statuses]
 
         # Tag filter (legacy - asset must have ALL specified tag names)
         if self._filter_tags:
-            asset_tags = source_model.data(index, AssetRole.TagsRole)
-            if not asset_tags:
-                return False
-            asset_tag_set = set(asset_tags)
-            if not self._filter_tags.issubset(asset_tag_set):
-                return False
+            tags = self._filter_tags
+            result = [r for r in result if tags.issubset(r.tag_names)]
 
         # Tag ID filter (new - asset must have ANY of the specified tag IDs)
         if self._filter_tag_ids:
-            tags_v2 = source_model.data(index, AssetRole.TagsV2Role)
-            if not tags_v2:
-                return False
-            asset_tag_ids = {tag.get('id') for tag in tags_v2 if tag.get('id')}
-            # Check if any of the filter tags match
-            if not asset_tag_ids.intersection(self._filter_tag_ids):
-                return False
-
-        # Search text filter
+            tag_ids = self._filter_tag_ids
+            result = [r for r in result if not r.tag_ids.isdisjoint(tag_ids)]
+
+        # Search filter: the search index result set, or a substring
+        # match (name, description, tags, asset type) without one
         if self._search_text:
-            # Search in name
-            name = source_model.data(index, AssetRole.NameRole)
-            if name and self._search_text in name.lower():
-                return True
-
-            # Search in description
-            description = source_model.data(index, AssetRole.DescriptionRole)
-            if description and self._search_text in description.lower():
-                return True
-
-            # Search in tags
-            tags = source_model.data(index, AssetRole.TagsRole)
-            if tags:
-                for tag in tags:
-                    if self._search_text in tag.lower():
-                        return True
-
-            # Search in asset type
-            asset_type = source_model.data(index, AssetRole.AssetTypeRole)
-            if asset_type and self._search_text in asset_type.lower():
-                return True
-
-            # Not found in any searchable field
-            return False
+            matches = self._search_matches
+            if matches is not None:
+                result = [r for r in result if r.uuid in matches]
+            else:
+                text = self._search_text
+                result = [r for r in result if text in r.haystack]
 
-        # No filters active or all filters passed
-        return True
+        return result
 
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
         """
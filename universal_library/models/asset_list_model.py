@@ -7,7 +7,8 @@ Based on animation_library architecture.
 
 import time
 from enum import IntEnum
-from typing import List, Dict, Any, Optional
+from math import isqrt
+from typing import List, Dict, Any, Iterable, Optional, Set
 from PyQt6.QtCore import (
     QAbstractListModel, QModelIndex, Qt, QMimeData, QByteArray
 )
@@ -91,6 +92,78 @@ class AssetRole(IntEnum):
     AssetDataRole = Qt.ItemDataRole.UserRole + 100
 
 
+class AssetFilterRecord:
+    """
+    Precomputed per-row filter keys for AssetFilterProxyModel
+
+    Built once per asset (and rebuilt when the row changes) so filter
+    passes compare sets, flags and one lower-cased string instead of
+    calling data() and re-normalizing fields for every row.
+    """
+
+    __slots__ = (
+        'uuid', 'flags', 'folder_ids', 'legacy_folder_id', 'tag_ids', 'tag_names',
+        'asset_type', 'status', 'blend_path', 'haystack',
+        'accepted', 'accepted_generation',
+    )
+
+    # Flag bits
+    FAVORITE = 1 << 0
+    RECENT = 1 << 1
+    COLD = 1 << 2
+    LATEST = 1 << 3
+    BASE = 1 << 4
+
+    # Separator between search fields (cannot appear in stripped search text)
+    _SEP = '\x00'
+
+    def __init__(self, asset: Dict[str, Any]):
+        self.uuid = asset.get('uuid')
+
+        flags = 0
+        if asset.get('is_favorite'):
+            flags |= self.FAVORITE
+        if asset.get('last_viewed_date'):
+            flags |= self.RECENT
+        if asset.get('is_cold'):
+            flags |= self.COLD
+        is_latest = asset.get('is_latest', 1)
+        if is_latest is None or is_latest:
+            flags |= self.LATEST
+        if (asset.get('variant_name') or 'Base') == 'Base':
+            flags |= self.BASE
+        self.flags = flags
+
+        # Cached filter result, owned by AssetFilterProxyModel
+        self.accepted = False
+        self.accepted_generation = -1
+
+        self.folder_ids = frozenset(
+            f.get('id') for f in (asset.get('folders_v2') or []) if f.get('id')
+        )
+        self.legacy_folder_id = asset.get('folder_id')
+        self.tag_ids = frozenset(
+            t.get('id') for t in (asset.get('tags_v2') or []) if t.get('id')
+        )
+
+        tags = asset.get('tags') or []
+        self.tag_names = frozenset(tags)
+        self.asset_type = asset.get('asset_type', 'model')
+        self.status = asset.get('status', 'wip')
+
+        blend_path = asset.get('blend_backup_path')
+        self.blend_path = blend_path.replace('/', '\\') if blend_path else None
+
+        self.haystack = self._SEP.join(
+            str(part).lower() for part in (
+                asset.get('name', 'Unknown'),
+                asset.get('description', ''),
+                *tags,
+                self.asset_type,
+            ) if part
+        )
+
+
 class AssetListModel(QAbstractListModel):
     """
     Qt model for USD asset list
@@ -108,10 +181,32 @@ class AssetListModel(QAbstractListModel):
         view.setModel(model)
     """
 
+    # remove_assets() resets the model instead above this many row runs
+    REMOVE_RUNS_BEFORE_RESET = 8
+
+    # remove_asset() queues up to max(this, 4 * sqrt(rows)) removals before
+    # re-indexing; each lookup meanwhile walks the queue
+    MIN_QUEUED_REMOVALS = 32
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._assets: List[Dict[str, Any]] = []
 
+        # UUID -> row index for O(1) lookups (kept in sync with _assets).
+        # Single removals don't shift it: the removed rows are queued and
+        # applied per lookup until _flush_removals() re-indexes once.
+        self._uuid_index: Dict[str, int] = {}
+        self._removed_rows: List[int] = []
+        self._removed_uuids: Set[str] = set()
+
+        # Lazily built filter records, parallel to _assets (None = stale).
+        # Always mutated in place so proxies can hold on to the list.
+        self._filter_records: List[Optional[AssetFilterRecord]] = []
+
+        # Invalidate records before any proxy reacts to the change
+        # (connected first, so this slot runs before proxy handlers)
+        self.dataChanged.connect(self._on_data_changed)
+
         # Variant counts cache (asset_id -> count)
         self._variant_counts: Dict[str, int] = {}
 
@@ -130,6 +225,8 @@ class AssetListModel(QAbstractListModel):
 
         self.beginResetModel()
         self._assets = assets
+        self._filter_records[:] = [None] * len(assets)
+        self._rebuild_uuid_index()
         self.endResetModel()
 
         self._load_time = (time.time() - start_time) * 1000  # Convert to ms
@@ -153,6 +250,27 @@ class AssetListModel(QAbstractListModel):
         row = len(self._assets)
         self.beginInsertRows(QModelIndex(), row, row)
         self._assets.append(asset)
+        self._filter_records.append(None)
+        self._index_rows(row)
+        self.endInsertRows()
+
+    def append_assets(self, assets: List[Dict[str, Any]]):
+        """
+        Append a batch of assets with a single row insertion
+
+        Used for progressive loading; proxy models filter and sort the
+        new rows as they are inserted.
+
+        Args:
+            assets: List of asset data dicts
+        """
+        if not assets:
+            return
+        first = len(self._assets)
+        self.beginInsertRows(QModelIndex(), first, first + len(assets) - 1)
+        self._assets.extend(assets)
+        self._filter_records.extend([None] * len(assets))
+        self._index_rows(first)
         self.endInsertRows()
 
     def remove_asset(self, uuid: str) -> bool:
@@ -165,13 +283,75 @@ class AssetListModel(QAbstractListModel):
         Returns:
             True if removed, False if not found
         """
-        for i, asset in enumerate(self._assets):
-            if asset.get('uuid') == uuid:
-                self.beginRemoveRows(QModelIndex(), i, i)
-                del self._assets[i]
-                self.endRemoveRows()
-                return True
-        return False
+        i = self._row_of(uuid)
+        if i is None:
+            return False
+
+        self.beginRemoveRows(QModelIndex(), i, i)
+        del self._assets[i]
+        del self._filter_records[i]
+        # Rows after i shifted up by one; queued instead of re-indexed here
+        del self._uuid_index[uuid]
+        self._removed_rows.append(i)
+        self._removed_uuids.add(uuid)
+        if len(self._removed_rows) > max(self.MIN_QUEUED_REMOVALS, 4 * isqrt(len(self._assets))):
+            self._flush_removals()
+        self.endRemoveRows()
+        return True
+
+    def remove_assets(self, uuids: List[str]) -> int:
+        """
+        Remove many assets by UUID
+
+        A few contiguous runs are removed with beginRemoveRows (last run
+        first so earlier row numbers stay valid). Widely scattered rows
+        are dropped in one model reset instead, which avoids re-indexing
+        the whole list once per run.
+
+        Args:
+            uuids: Asset UUIDs
+
+        Returns:
+            Number of rows removed
+        """
+        self._flush_removals()
+        rows = sorted(
+            {self._uuid_index[uuid] for uuid in uuids if uuid in self._uuid_index},
+            reverse=True
+        )
+        if not rows:
+            return 0
+
+        # Group into runs of consecutive rows (descending)
+        runs = []
+        last = first = rows[0]
+        for row in rows[1:]:
+            if row == first - 1:
+                first = row
+            else:
+                runs.append((first, last))
+                last = first = row
+        runs.append((first, last))
+
+        if len(runs) > self.REMOVE_RUNS_BEFORE_RESET:
+            removed = set(rows)
+            keep = [i for i in range(len(self._assets)) if i not in removed]
+            self.beginResetModel()
+            self._assets = [self._assets[i] for i in keep]
+            # In place: the filter proxy holds a reference to this list
+            self._filter_records[:] = [self._filter_records[i] for i in keep]
+            self._rebuild_uuid_index()
+            self.endResetModel()
+            return len(rows)
+
+        for first, last in runs:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            removed_uuids = [asset.get('uuid') for asset in self._assets[first:last + 1]]
+            del self._assets[first:last + 1]
+            del self._filter_records[first:last + 1]
+            self._reindex_after_removal(first, removed_uuids)
+            self.endRemoveRows()
+        return len(rows)
 
     def update_asset(self, uuid: str, updates: Dict[str, Any]) -> bool:
         """
@@ -184,14 +364,18 @@ class AssetListModel(QAbstractListModel):
         Returns:
             True if updated, False if not found
         """
-        for i, asset in enumerate(self._assets):
-            if asset.get('uuid') == uuid:
-                asset.update(updates)
-                # Emit dataChanged for this row
-                index = self.index(i, 0)
-                self.dataChanged.emit(index, index)
-                return True
-        return False
+        i = self._row_of(uuid)
+        if i is None:
+            return False
+
+        asset = self._assets[i]
+        asset.update(updates)
+        if 'uuid' in updates and updates['uuid'] != uuid:
+            self._rebuild_uuid_index()
+        # Emit dataChanged for this row
+        index = self.index(i, 0)
+        self.dataChanged.emit(index, index)
+        return True
 
     def refresh_asset(self, uuid: str) -> bool:
         """
@@ -203,6 +387,9 @@ class AssetListModel(QAbstractListModel):
         Returns:
             True if refreshed, False if not found
         """
+        if self._row_of(uuid) is None:
+            return False
+
         from ..services.database_service import get_database_service
 
         db_service = get_database_service()
@@ -213,15 +400,76 @@ class AssetListModel(QAbstractListModel):
             updated_data['tags_v2'] = db_service.get_asset_tags(uuid)
             updated_data['folders_v2'] = db_service.get_asset_folders(uuid)
             
-            for i, asset in enumerate(self._assets):
-                if asset.get('uuid') == uuid:
-                    self._assets[i] = updated_data
-                    # Emit dataChanged for this row
-                    index = self.index(i, 0)
-                    self.dataChanged.emit(index, index)
-                    return True
+            i = self._row_of(uuid)
+            if i is not None:
+                self._assets[i] = updated_data
+                self._filter_records[i] = None
+                # Emit dataChanged for this row
+                index = self.index(i, 0)
+                self.dataChanged.emit(index, index)
+                return True
         return False
 
+    def refresh_assets(self, uuids: Iterable[str]) -> List[str]:
+        """
+        Refresh many assets from database in one pass
+
+        Bulk counterpart of refresh_asset(): one chunked query each for
+        assets, tags and folders, then one dataChanged per run of
+        adjacent rows.
+
+        Args:
+            uuids: Asset UUIDs (ones not in the model are ignored)
+
+        Returns:
+            UUIDs that were refreshed
+        """
+        self._flush_removals()
+        uuids = [uuid for uuid in dict.fromkeys(uuids) if uuid in self._uuid_index]
+        if not uuids:
+            return []
+
+        from ..services.database_service import get_database_service
+
+        db_service = get_database_service()
+        assets = db_service.get_assets_by_uuids(uuids)
+        tags = db_service.get_asset_tags_many(list(assets))
+        folders = db_service.get_asset_folders_many(list(assets))
+
+        rows = []
+        for uuid, updated_data in assets.items():
+            # Enrich with tags_v2 and folders_v2 (not in raw database row)
+            updated_data['tags_v2'] = tags.get(uuid, [])
+            updated_data['folders_v2'] = folders.get(uuid, [])
+            i = self._uuid_index[uuid]
+            self._assets[i] = updated_data
+            self._filter_records[i] = None
+            rows.append(i)
+
+        rows.sort()
+        start = 0
+        for k in range(1, len(rows) + 1):
+            if k == len(rows) or rows[k] != rows[k - 1] + 1:
+                self.dataChanged.emit(self.index(rows[start], 0), self.index(rows[k - 1], 0))
+                start = k
+        return list(assets)
+
+    def notify_thumbnails_changed(self, uuids: Iterable[str]):
+        """
+        Repaint the rows of assets whose thumbnails arrived
+
+        Emits dataChanged for the decoration role only; nothing is
+        reloaded and filter records stay valid.
+
+        Args:
+            uuids: Asset UUIDs
+        """
+        for uuid in uuids:
+            i = self._row_of(uuid)
+            if i is not None:
+                index = self.index(i, 0)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
     def get_asset_by_uuid(self, uuid: str) -> Optional[Dict[str, Any]]:
         """
         Get asset data by UUID
@@ -232,10 +480,20 @@ class AssetListModel(QAbstractListModel):
         Returns:
             Asset dict or None
         """
-        for asset in self._assets:
-            if asset.get('uuid') == uuid:
-                return asset
-        return None
+        i = self._row_of(uuid)
+        return self._assets[i] if i is not None else None
+
+    def get_row_for_uuid(self, uuid: str) -> Optional[int]:
+        """
+        Get source row index for a UUID
+
+        Args:
+            uuid: Asset UUID
+
+        Returns:
+            Row index or None
+        """
+        return self._row_of(uuid)
 
     def get_asset_at_index(self, row: int) -> Optional[Dict[str, Any]]:
         """
@@ -251,6 +509,122 @@ class AssetListModel(QAbstractListModel):
             return self._assets[row]
         return None
 
+    def get_filter_record(self, row: int) -> Optional[AssetFilterRecord]:
+        """
+        Get precomputed filter keys for a row (built on first use)
+
+        Args:
+            row: Row index
+
+        Returns:
+            AssetFilterRecord or None if row is out of range
+        """
+        if not 0 <= row < len(self._assets):
+            return None
+        record = self._filter_records[row]
+        if record is None:
+            record = AssetFilterRecord(self._assets[row])
+            self._filter_records[row] = record
+        return record
+
+    @property
+    def filter_records(self) -> List[Optional[AssetFilterRecord]]:
+        """Live list of filter records (None entries are stale)"""
+        return self._filter_records
+
+    def get_filter_records(self) -> List[AssetFilterRecord]:
+        """
+        Get filter records for all rows, building any that are stale
+
+        Returns:
+            List of AssetFilterRecord in row order
+        """
+        records = self._filter_records
+        for row, record in enumerate(records):
+            if record is None:
+                records[row] = AssetFilterRecord(self._assets[row])
+        return records
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=None):
+        """Mark filter records stale for changed rows"""
+        if roles == [Qt.ItemDataRole.DecorationRole]:
+            return  # Thumbnail repaint only
+        first = max(top_left.row(), 0)
+        last = min(bottom_right.row(), len(self._filter_records) - 1)
+        for row in range(first, last + 1):
+            self._filter_records[row] = None
+
+    def _rebuild_uuid_index(self):
+        """Rebuild the UUID index after rows were replaced, removed or reordered"""
+        self._uuid_index = {}
+        self._removed_rows.clear()
+        self._removed_uuids.clear()
+        self._index_rows(0)
+
+    def _row_of(self, uuid: str) -> Optional[int]:
+        """Current row of a UUID, applying removals not yet re-indexed"""
+        row = self._uuid_index.get(uuid)
+        if row is None:
+            if uuid in self._removed_uuids:
+                # A later duplicate of a removed row isn't indexed until a flush
+                self._flush_removals()
+                return self._uuid_index.get(uuid)
+            return None
+        for removed in self._removed_rows:
+            if removed < row:
+                row -= 1
+        return row
+
+    def _flush_removals(self):
+        """Re-index once for the single removals queued by remove_asset()"""
+        if not self._removed_rows:
+            return
+        first = min(self._removed_rows)
+        self._removed_rows.clear()
+        self._removed_uuids.clear()
+
+        # Rows before `first` never moved; entries at or past it are stale
+        index = self._uuid_index
+        seen = set()
+        assets = self._assets
+        for row in range(first, len(assets)):
+            uuid = assets[row].get('uuid')
+            if uuid is None or uuid in seen:
+                continue
+            seen.add(uuid)
+            old = index.get(uuid)
+            if old is None or old >= first:
+                index[uuid] = row
+
+    def _reindex_after_removal(self, first: int, removed_uuids: List[Optional[str]]):
+        """Re-index rows from `first` after rows starting there were removed
+
+        Only the removed UUIDs and the rows that shifted are touched, in
+        one pass, so removals near the end of a large list stay cheap.
+        """
+        index = self._uuid_index
+        shift = len(removed_uuids)
+        for uuid in removed_uuids:
+            # Entries before `first` (earlier duplicates) are still valid
+            if index.get(uuid, -1) >= first:
+                del index[uuid]
+        assets = self._assets
+        for row in range(first, len(assets)):
+            uuid = assets[row].get('uuid')
+            old = index.get(uuid)
+            # Moved first occurrence, or a duplicate of a removed UUID
+            if uuid is not None and (old == row + shift or old is None):
+                index[uuid] = row
+
+    def _index_rows(self, first: int):
+        """Index rows from `first` to the end (first occurrence of a UUID wins)"""
+        self._flush_removals()
+        index = self._uuid_index
+        for row in range(first, len(self._assets)):
+            uuid = self._assets[row].get('uuid')
+            if uuid is not None and uuid not in index:
+                index[uuid] = row
+
     def rowCount(self, parent=QModelIndex()) -> int:
         """Return number of assets"""
         if parent.isValid():
@@ -488,4 +862,4 @@ class AssetListModel(QAbstractListModel):
         self._load_time = 0.0
 
 
-__all__ = ['AssetListModel', 'AssetRole']
+__all__ = ['AssetListModel', 'AssetRole', 'AssetFilterRecord']
@@ -34,6 +34,7 @@ from .constants import (
     STATUS_PROCESSING,
     STATUS_COMPLETED,
     STATUS_FAILED,
+    THUMBNAIL_BATCH_PROGRESS_SUFFIX,
 )
 
 __all__ = [
@@ -54,4 +55,5 @@ __all__ = [
     'STATUS_PROCESSING',
     'STATUS_COMPLETED',
     'STATUS_FAILED',
+    'THUMBNAIL_BATCH_PROGRESS_SUFFIX',
 ]
@@ -27,4 +27,9 @@ FILE_PATTERNS = {
     "import_asset": "import_*.json",
     "review_screenshot": "screenshot_*.json",
     "regenerate_thumbnail": "thumbnail_*.json",
+    "thumbnail_batch": "thumbbatch_*.json",
 }
+
+# Batch thumbnail jobs: Blender appends one JSON line per finished item
+# to "<manifest stem>.progress.jsonl" next to the manifest
+THUMBNAIL_BATCH_PROGRESS_SUFFIX = ".progress.jsonl"
@@ -255,6 +255,27 @@ MESSAGE_TYPES: Dict[str, MessageDef] = {
                   description="Path where thumbnail should be saved"),
         ]
     ),
+
+    # -------------------------------------------------------------------------
+    # THUMBNAIL BATCH (Desktop → Blender)
+    # -------------------------------------------------------------------------
+    "thumbnail_batch": MessageDef(
+        direction=DIRECTION_DESKTOP_TO_BLENDER,
+        file_pattern="thumbbatch_*.json",
+        description="Manifest of thumbnails to regenerate as one resumable job; "
+                    "per-item results are appended to the job's progress file",
+        fields=[
+            Field("job_id", source="job_id", required=True,
+                  description="Unique job identifier (also in the file name)"),
+            Field("items", source="items", required=True,
+                  description="List of {asset_uuid, asset_name, usd_file_path, thumbnail_path}"),
+            Field("item_count", source="item_count", required=False,
+                  description="Number of items in the manifest"),
+            Field("thumbnail_size", source="thumbnail_size", required=False,
+                  default=256,
+                  description="Rendered thumbnail size in pixels"),
+        ]
+    ),
 }
 
 
@@ -8,10 +8,22 @@ from .base_repository import BaseRepository
 from .asset_repository import AssetRepository
 from .folder_repository import FolderRepository
 from .asset_folder_repository import AssetFolderRepository
+from .connection_manager import ConnectionManager, get_connection_manager
 from .database_service import DatabaseService, get_database_service
+from .write_queue import WriteQueue, get_write_queue
+from .library_loader import LibraryLoadWorker
+from .search_worker import SearchWorker
+from .delete_worker import DeleteWorker
 from .blender_service import BlenderService, get_blender_service
 from .asset_manager import AssetManager, get_asset_manager
 from .thumbnail_loader import ThumbnailLoader, ThumbnailLoadTask, get_thumbnail_loader
+from .indexed_disk_cache import IndexedDiskCache
+from .thumbnail_disk_cache import ThumbnailDiskCache, get_thumbnail_disk_cache
+from .thumbnail_atlas import ThumbnailAtlas
+from .path_info_cache import PathInfoCache, get_path_info_cache
+from .thumbnail_decode_pool import ThumbnailDecodePool, get_thumbnail_decode_pool
+from .thumbnail_batch_service import ThumbnailBatchService, get_thumbnail_batch_service
+from .image_cache import ImageCache, get_image_cache
 from .addon_installer_service import AddonInstallerService, get_addon_installer
 from .cold_storage_service import ColdStorageService, get_cold_storage_service
 from .archive_service import ArchiveService, get_archive_service
@@ -30,8 +42,15 @@ __all__ = [
     'FolderRepository',
     'AssetFolderRepository',
     # Services
+    'ConnectionManager',
+    'get_connection_manager',
     'DatabaseService',
     'get_database_service',
+    'WriteQueue',
+    'get_write_queue',
+    'LibraryLoadWorker',
+    'SearchWorker',
+    'DeleteWorker',
     'BlenderService',
     'get_blender_service',
     'AssetManager',
@@ -39,6 +58,18 @@ __all__ = [
     'ThumbnailLoader',
     'ThumbnailLoadTask',
     'get_thumbnail_loader',
+    'IndexedDiskCache',
+    'ThumbnailDiskCache',
+    'get_thumbnail_disk_cache',
+    'ThumbnailAtlas',
+    'PathInfoCache',
+    'get_path_info_cache',
+    'ThumbnailDecodePool',
+    'get_thumbnail_decode_pool',
+    'ThumbnailBatchService',
+    'get_thumbnail_batch_service',
+    'ImageCache',
+    'get_image_cache',
     'AddonInstallerService',
     'get_addon_installer',
     # Storage services
@@ -6,7 +6,7 @@ Handles folder membership for assets (folders as tags).
 """
 
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from .base_repository import BaseRepository
 
@@ -85,6 +85,67 @@ class AssetFolderRepository(BaseRepository):
         ''', (asset_uuid,))
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_all_asset_folders(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get folders for every asset in one query
+
+        Bulk counterpart of get_asset_folders() used for library loads.
+
+        Returns:
+            Dict of asset_uuid -> list of folder dicts ordered by path
+        """
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT af.asset_uuid, f.id, f.name, f.path, f.parent_id
+            FROM asset_folders af
+            INNER JOIN folders f ON f.id = af.folder_id
+            ORDER BY f.path
+        ''')
+        return self._group_asset_folders(cursor.fetchall())
+
+    def get_asset_folders_many(self, asset_uuids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get folders for many assets with chunked IN queries
+
+        Args:
+            asset_uuids: Asset UUIDs
+
+        Returns:
+            Dict of asset_uuid -> list of folder dicts ordered by path
+            (assets in no folder are absent)
+        """
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+
+        rows = []
+        asset_uuids = list(dict.fromkeys(asset_uuids))
+        for start in range(0, len(asset_uuids), self.UUID_CHUNK_SIZE):
+            chunk = asset_uuids[start:start + self.UUID_CHUNK_SIZE]
+            placeholders = ', '.join('?' for _ in chunk)
+            cursor.execute(f'''
+                SELECT af.asset_uuid, f.id, f.name, f.path, f.parent_id
+                FROM asset_folders af
+                INNER JOIN folders f ON f.id = af.folder_id
+                WHERE af.asset_uuid IN ({placeholders})
+                ORDER BY f.path
+            ''', chunk)
+            rows.extend(cursor.fetchall())
+        return self._group_asset_folders(rows)
+
+    @staticmethod
+    def _group_asset_folders(rows) -> Dict[str, List[Dict[str, Any]]]:
+        """Group (asset_uuid, id, name, path, parent_id) rows by asset"""
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            results.setdefault(row[0], []).append({
+                'id': row[1],
+                'name': row[2],
+                'path': row[3],
+                'parent_id': row[4],
+            })
+        return results
+
     def set_asset_folders(self, asset_uuid: str, folder_ids: List[int]) -> bool:
         """
         Set all folders for an asset (replaces existing)
@@ -198,6 +259,30 @@ class AssetFolderRepository(BaseRepository):
         """
         return self.add_asset_to_folder(asset_uuid, legacy_folder_id)
 
+    def migrate_legacy_folder_ids(self, assignments: List[Tuple[str, int]]) -> bool:
+        """
+        Batch version of migrate_legacy_folder_id()
+
+        Args:
+            assignments: List of (asset_uuid, legacy_folder_id) pairs
+
+        Returns:
+            True if successful
+        """
+        if not assignments:
+            return True
+
+        try:
+            with self._transaction() as conn:
+                now = datetime.now()
+                conn.executemany('''
+                    INSERT OR IGNORE INTO asset_folders (asset_uuid, folder_id, created_date)
+                    VALUES (?, ?, ?)
+                ''', [(uuid, folder_id, now) for uuid, folder_id in assignments])
+                return True
+        except Exception as e:
+            return False
+
     def copy_folders_to_asset(self, source_uuid: str, target_uuid: str) -> bool:
         """
         Copy folder memberships from one asset to another
@@ -7,12 +7,16 @@ Extracted from MainWindow for proper separation of concerns.
 
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from .database_service import get_database_service
 from .blender_service import get_blender_service
+from .thumbnail_batch_service import get_thumbnail_batch_service
+from .data_change_notifier import get_data_change_notifier
 from ..events.event_bus import get_event_bus
 from ..core.exceptions import AssetNotFoundError, FileOperationError, DatabaseError
 
@@ -24,10 +28,10 @@ class AssetManager(QObject):
     Centralized service for asset operations
 
     Features:
-    - Delete assets (single and batch)
+    - Delete assets (single and batch; batch file work on a worker pool)
     - Toggle favorites
     - Move assets between folders
-    - Queue thumbnail regeneration
+    - Queue thumbnail regeneration (single assets or batch jobs)
     - Emits signals for UI updates
 
     Usage:
@@ -42,14 +46,20 @@ class AssetManager(QObject):
     favorite_toggled = pyqtSignal(str, bool)  # uuid, is_favorite
     asset_moved = pyqtSignal(str, int)  # uuid, new_folder_id
     assets_moved = pyqtSignal(list, int, int)  # [uuids], folder_id, success_count
+    favorites_changed = pyqtSignal(list, bool)  # [uuids], is_favorite
     thumbnail_queued = pyqtSignal(str)  # uuid
+    batch_progress = pyqtSignal(str, int, int)  # operation, done, total
     operation_error = pyqtSignal(str, str)  # operation, error_message
 
+    # Worker threads for batch file operations (I/O bound)
+    FILE_WORKERS = 8
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._db_service = get_database_service()
         self._blender_service = get_blender_service()
         self._event_bus = get_event_bus()
+        self._notifier = get_data_change_notifier()
 
     def delete_asset(self, uuid: str, delete_files: bool = True) -> Tuple[bool, str]:
         """
@@ -74,69 +84,27 @@ class AssetManager(QObject):
 
         asset_name = asset.get('name', 'Unknown')
         file_deleted = False
-        asset_folder = None
 
         # Phase 1: Delete files if requested
         if delete_files:
-            usd_path = asset.get('usd_file_path', '')
-            blend_path = asset.get('blend_backup_path', '')
-
-            # Use blend_path if usd_path is empty
-            file_path = usd_path or blend_path
-            if file_path:
-                # Structure: library/meshes/AssetName/VariantName/files
-                # variant_folder = Path(file_path).parent  (e.g., .../AssetName/Base)
-                # asset_folder = variant_folder.parent     (e.g., .../AssetName)
-                variant_folder = Path(file_path).parent
-                asset_folder = variant_folder.parent
-
-
-                try:
-                    # Delete the variant folder
-                    if variant_folder.exists():
-                        shutil.rmtree(variant_folder)
-
-                    # If asset folder is now empty, delete it too
-                    if asset_folder.exists():
-                        remaining = list(asset_folder.iterdir())
-                        if not remaining:
-                            asset_folder.rmdir()
-                        else:
-                            pass
-
-                    # Also check for and delete archived versions
-                    # Structure: storage/library/meshes/AssetName/Base/file.blend
-                    # asset_folder = storage/library/meshes/AssetName
-                    # storage_root = storage/ (where _archive/ and reviews/ live)
-                    storage_root = asset_folder.parent.parent.parent  # Go up: meshes -> library -> storage
-                    asset_type_folder = asset_folder.parent.name  # e.g., "meshes"
-
-                    # Archives are at: storage/_archive/meshes/AssetName/...
-                    archive_folder = storage_root / "_archive"
-                    archived_asset = archive_folder / asset_type_folder / asset_folder.name
-
-                    if archived_asset.exists():
-                        shutil.rmtree(archived_asset)
+            folders, asset_folder = self._get_asset_file_folders(asset)
+            try:
+                for folder in folders:
+                    if folder.exists():
+                        shutil.rmtree(folder)
 
-                    # Reviews are at: storage/reviews/meshes/AssetName/...
-                    reviews_folder = storage_root / "reviews"
-                    reviews_asset = reviews_folder / asset_type_folder / asset_folder.name
+                # If asset folder is now empty, delete it too
+                self._remove_if_empty(asset_folder)
 
-                    if reviews_asset.exists():
-                        shutil.rmtree(reviews_asset)
-
-                    file_deleted = True
-
-                except Exception as e:
-                    # File deletion failed - do NOT proceed with database deletion
-                    # This prevents orphaned DB records
-                    error_msg = f"Could not delete asset folder: {e}"
-                    logger.error(error_msg)
-                    self.operation_error.emit("delete_files", str(e))
-                    return False, f"File deletion failed: {e}"
-            else:
-                # No file path, nothing to delete
                 file_deleted = True
+
+            except Exception as e:
+                # File deletion failed - do NOT proceed with database deletion
+                # This prevents orphaned DB records
+                error_msg = f"Could not delete asset folder: {e}"
+                logger.error(error_msg)
+                self.operation_error.emit("delete_files", str(e))
+                return False, f"File deletion failed: {e}"
         else:
             file_deleted = True  # Skipped by request
 
@@ -156,70 +124,241 @@ class AssetManager(QObject):
 
         return False, "Unexpected state in delete operation"
 
-    def delete_assets_batch(self, uuids: List[str], delete_files: bool = True) -> Tuple[int, int]:
+    def delete_assets_batch(
+        self,
+        uuids: List[str],
+        delete_files: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[int, int]:
         """
         Delete multiple assets
 
-        Uses atomic per-asset deletion: for each asset, file deletion must succeed
-        before database deletion proceeds.
+        See _delete_assets for how files and database rows are kept
+        consistent. Emits one batch of change notifications.
 
         Args:
             uuids: List of asset UUIDs
             delete_files: Whether to delete asset files from disk
+            progress_callback: Optional callable(done, total) for file work
 
         Returns:
             Tuple of (deleted_count, total_count)
         """
-        deleted_count = 0
-        file_errors = []
-        db_errors = []
+        deleted = self._delete_assets(uuids, delete_files, progress_callback)
+        self._notifier.assets_removed(deleted)
+        self.assets_deleted.emit(uuids, len(deleted))
+        return len(deleted), len(uuids)
+
+    def _delete_assets(
+        self,
+        uuids: List[str],
+        delete_files: bool,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[str]:
+        """
+        Delete assets in three phases
 
+        1. Variant folders are renamed aside on a worker pool (cheap and
+           reversible). Assets whose folders cannot be moved are skipped,
+           like the per-asset delete skips the database when rmtree fails.
+        2. The remaining assets are deleted from the database in one
+           transaction. Folders still holding files of an asset that was
+           not deleted are renamed back.
+        3. The moved-aside folders are deleted on the worker pool, along
+           with the archive and review folders of assets that have no
+           variant folder left.
+
+        Sends no change notifications, so it can run off the GUI thread;
+        callers notify with the returned UUIDs.
+
+        Returns:
+            UUIDs deleted from the database
+        """
+        uuids = list(dict.fromkeys(uuids))
+        assets = self._db_service.get_assets_by_uuids(uuids)
         for uuid in uuids:
-            asset = self._db_service.get_asset_by_uuid(uuid)
-            if not asset:
+            if uuid not in assets:
                 logger.warning(f"Asset not found for batch delete: {uuid}")
-                continue
-
-            asset_name = asset.get('name', uuid)
-            file_deleted = False
-
-            # Phase 1: Delete files if requested
-            if delete_files:
-                usd_path = asset.get('usd_file_path', '')
-                if usd_path:
-                    asset_folder = Path(usd_path).parent
-                    try:
-                        if asset_folder.exists():
-                            shutil.rmtree(asset_folder)
-                            file_deleted = True
-                        else:
-                            file_deleted = True  # Already gone
-                    except Exception as e:
-                        file_errors.append(f"{asset_name}: {e}")
-                        logger.warning(f"Could not delete folder for {uuid}: {e}")
-                        # Skip DB deletion for this asset
-                        continue
-                else:
-                    file_deleted = True
-            else:
-                file_deleted = True
 
-            # Phase 2: Delete from database (only if file deletion succeeded)
-            if file_deleted:
-                if self._db_service.delete_asset(uuid):
-                    deleted_count += 1
-                else:
-                    db_errors.append(f"{asset_name}: database error")
+        file_errors = []
+        blocked = set()
+        owners: Dict[Path, List[str]] = {}  # variant folder -> uuids whose files it holds
+        staged: Dict[Path, Path] = {}  # moved-aside path -> original folder
+        # asset folder -> its archive and review folders, shared by all variants
+        shared_folders: Dict[Path, List[Path]] = {}
+        asset_owners: Dict[Path, List[str]] = {}  # asset folder -> uuids in this batch
+
+        # Phase 1: Move files aside
+        if delete_files:
+            for uuid, asset in assets.items():
+                folders, asset_folder = self._get_asset_file_folders(asset)
+                if not folders:
+                    continue
+                variant_folder, *asset_shared = folders
+                owners.setdefault(variant_folder, []).append(uuid)
+                shared_folders.setdefault(asset_folder, asset_shared)
+                asset_owners.setdefault(asset_folder, []).append(uuid)
+
+            results = self._run_file_jobs(
+                self._stage_folder, list(owners), "delete_stage", progress_callback
+            )
+            for folder, (staged_path, error) in results.items():
+                if error is not None:
+                    file_errors.append(f"{folder.name}: {error}")
+                    blocked.update(owners[folder])
+                    logger.warning(f"Could not delete folder {folder}: {error}")
+                elif staged_path is not None:
+                    staged[staged_path] = folder
+
+        # Phase 2: Delete from database in one transaction
+        deletable = [uuid for uuid in assets if uuid not in blocked]
+        deleted = self._db_service.delete_assets(deletable) if deletable else []
+        db_failed = deleted is None
+        if db_failed:
+            deleted = []
+        deleted_set = set(deleted)
+
+        # Roll back folders that still hold files of an asset that wasn't deleted
+        for staged_path, folder in list(staged.items()):
+            if not deleted_set.issuperset(owners[folder]):
+                del staged[staged_path]
+                try:
+                    staged_path.rename(folder)
+                except OSError as e:
+                    logger.error(f"Could not restore {folder} from {staged_path}: {e}")
+
+        # Archives and reviews belong to the whole asset; remove them only
+        # once its last variant folder is gone
+        for asset_folder, folders in shared_folders.items():
+            if deleted_set.isdisjoint(asset_owners[asset_folder]):
+                continue
+            if self._has_variant_folders(asset_folder):
+                continue
+            for folder in folders:
+                if folder.exists():
+                    staged[folder] = folder
+
+        # Phase 3: Delete moved-aside files
+        if staged:
+            results = self._run_file_jobs(
+                self._purge_folder, list(staged), "delete_files", progress_callback
+            )
+            for staged_path, (_, error) in results.items():
+                if error is not None:
+                    # Database rows are already gone; leave the folder for manual cleanup
+                    file_errors.append(f"{staged[staged_path].name}: {error}")
+                    logger.warning(f"Could not remove {staged_path}: {error}")
+
+            for asset_folder in shared_folders:
+                try:
+                    self._remove_if_empty(asset_folder)
+                except OSError:
+                    pass
 
         # Report errors
-        total_errors = len(file_errors) + len(db_errors)
-        if total_errors > 0:
-            error_msg = f"{len(file_errors)} file errors, {len(db_errors)} db errors"
+        db_errors = len(deletable) - len(deleted)
+        if file_errors or db_errors:
+            error_msg = f"{len(file_errors)} file errors, {db_errors} db errors"
             self.operation_error.emit("batch_delete", error_msg)
 
-        logger.info(f"Batch delete: {deleted_count}/{len(uuids)} assets deleted")
-        self.assets_deleted.emit(uuids, deleted_count)
-        return deleted_count, len(uuids)
+        logger.info(f"Batch delete: {len(deleted)}/{len(uuids)} assets deleted")
+        return deleted
+
+    def _run_file_jobs(
+        self,
+        func: Callable[[Path], Any],
+        paths: List[Path],
+        operation: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[Path, Tuple[Any, Optional[Exception]]]:
+        """
+        Run a file operation for each path on a worker pool
+
+        Progress is reported from the calling thread as jobs complete.
+
+        Returns:
+            Dict of path -> (result, error)
+        """
+        results: Dict[Path, Tuple[Any, Optional[Exception]]] = {}
+        total = len(paths)
+        if not total:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.FILE_WORKERS, total)) as pool:
+            futures = {pool.submit(func, path): path for path in paths}
+            for done, future in enumerate(as_completed(futures), 1):
+                path = futures[future]
+                try:
+                    results[path] = (future.result(), None)
+                except Exception as e:
+                    results[path] = (None, e)
+                self.batch_progress.emit(operation, done, total)
+                if progress_callback:
+                    progress_callback(done, total)
+
+        return results
+
+    @staticmethod
+    def _get_asset_file_folders(asset: Dict[str, Any]) -> Tuple[List[Path], Optional[Path]]:
+        """
+        Get the folders holding an asset's files
+
+        Structure: storage/library/meshes/AssetName/VariantName/files.
+        Archived versions live in storage/_archive/meshes/AssetName and
+        reviews in storage/reviews/meshes/AssetName.
+
+        Returns:
+            Tuple of (folders to delete, asset folder to remove if left empty)
+        """
+        # Use blend_path if usd_path is empty
+        file_path = asset.get('usd_file_path') or asset.get('blend_backup_path')
+        if not file_path:
+            return [], None
+
+        variant_folder = Path(file_path).parent
+        asset_folder = variant_folder.parent
+        storage_root = asset_folder.parent.parent.parent  # Go up: meshes -> library -> storage
+        asset_type_folder = asset_folder.parent.name  # e.g., "meshes"
+
+        folders = [
+            variant_folder,
+            storage_root / "_archive" / asset_type_folder / asset_folder.name,
+            storage_root / "reviews" / asset_type_folder / asset_folder.name,
+        ]
+        return folders, asset_folder
+
+    @staticmethod
+    def _stage_folder(folder: Path) -> Optional[Path]:
+        """Rename a folder aside for deletion; returns the new path (None if missing)"""
+        if not folder.exists():
+            return None
+        staged_path = folder.with_name(f".{folder.name}.deleting-{uuid4().hex[:8]}")
+        folder.rename(staged_path)
+        return staged_path
+
+    @staticmethod
+    def _purge_folder(path: Path) -> None:
+        """Delete a moved-aside folder"""
+        shutil.rmtree(path)
+
+    @staticmethod
+    def _has_variant_folders(asset_folder: Path) -> bool:
+        """Check if an asset folder still holds a variant folder (not one moved aside)"""
+        try:
+            return any(
+                path.is_dir() and not path.name.startswith('.')
+                for path in asset_folder.iterdir()
+            )
+        except FileNotFoundError:
+            return False
+        except OSError:
+            return True  # Unknown; keep the shared folders
+
+    @staticmethod
+    def _remove_if_empty(folder: Optional[Path]) -> None:
+        """Remove a folder if it exists and is empty"""
+        if folder is not None and folder.exists() and not any(folder.iterdir()):
+            folder.rmdir()
 
     def toggle_favorite(self, uuid: str) -> Tuple[bool, bool]:
         """
@@ -263,6 +402,8 @@ class AssetManager(QObject):
         """
         Set favorite status for multiple assets
 
+        One database transaction and one batch of change notifications.
+
         Args:
             uuids: List of asset UUIDs
             is_favorite: New favorite state
@@ -270,12 +411,13 @@ class AssetManager(QObject):
         Returns:
             Number of successfully updated assets
         """
-        success_count = 0
-        for uuid in uuids:
-            if self._db_service.set_favorite(uuid, is_favorite):
-                success_count += 1
-                self.favorite_toggled.emit(uuid, is_favorite)
-        return success_count
+        updated = self._db_service.set_assets_favorite(list(dict.fromkeys(uuids)), is_favorite)
+        if updated:
+            with self._notifier.batch():
+                for uuid in updated:
+                    self._notifier.asset_updated(uuid)
+            self.favorites_changed.emit(updated, is_favorite)
+        return len(updated)
 
     def move_to_folder(self, uuid: str, folder_id: int) -> bool:
         """
@@ -297,6 +439,8 @@ class AssetManager(QObject):
         """
         Move multiple assets to a folder
 
+        One database transaction and one batch of change notifications.
+
         Args:
             uuids: List of asset UUIDs
             folder_id: Target folder ID
@@ -304,13 +448,14 @@ class AssetManager(QObject):
         Returns:
             Number of successfully moved assets
         """
-        success_count = 0
-        for uuid in uuids:
-            if self._db_service.update_asset(uuid, {'folder_id': folder_id}):
-                success_count += 1
+        updated = self._db_service.update_assets(list(dict.fromkeys(uuids)), {'folder_id': folder_id})
+        if updated:
+            with self._notifier.batch():
+                for uuid in updated:
+                    self._notifier.asset_updated(uuid)
 
-        self.assets_moved.emit(uuids, folder_id, success_count)
-        return success_count
+        self.assets_moved.emit(updated, folder_id, len(updated))
+        return len(updated)
 
     def queue_regenerate_thumbnail(self, uuid: str) -> Tuple[bool, str]:
         """
@@ -329,24 +474,18 @@ class AssetManager(QObject):
             self.operation_error.emit("regenerate_thumbnail", error_msg)
             return False, "Asset not found"
 
-        usd_path = asset.get('usd_file_path', '')
-        if not usd_path:
+        item = self._thumbnail_job_item(asset)
+        if item is None:
             error_msg = f"No USD file path for asset: {uuid}"
             logger.warning(error_msg)
             self.operation_error.emit("regenerate_thumbnail", error_msg)
             return False, "No USD file path for this asset"
 
-        # Get or create thumbnail path (versioned)
-        thumbnail_path = asset.get('thumbnail_path', '')
-        if not thumbnail_path:
-            version_label = asset.get('version_label', 'v001')
-            thumbnail_path = str(Path(usd_path).parent / f"thumbnail.{version_label}.png")
-
         success = self._blender_service.queue_regenerate_thumbnail(
             uuid=uuid,
-            asset_name=asset.get('name', 'Unknown'),
-            usd_file_path=usd_path,
-            thumbnail_path=thumbnail_path
+            asset_name=item['name'],
+            usd_file_path=item['usd_file_path'],
+            thumbnail_path=item['thumbnail_path']
         )
 
         if success:
@@ -359,6 +498,66 @@ class AssetManager(QObject):
             self.operation_error.emit("regenerate_thumbnail", error_msg)
             return False, error_msg
 
+    def queue_regenerate_thumbnails(self, uuids: List[str]) -> Tuple[bool, str]:
+        """
+        Queue thumbnail regeneration for many assets as one Blender job
+
+        Args:
+            uuids: Asset UUIDs
+
+        Returns:
+            Tuple of (success, message)
+        """
+        assets = self._db_service.get_assets_by_uuids(list(dict.fromkeys(uuids)))
+        return self._queue_thumbnail_batch(assets.values())
+
+    def queue_regenerate_all_thumbnails(self) -> Tuple[bool, str]:
+        """
+        Queue thumbnail regeneration for every asset in the library
+
+        Returns:
+            Tuple of (success, message)
+        """
+        return self._queue_thumbnail_batch(self._db_service.get_all_assets())
+
+    def _queue_thumbnail_batch(self, assets) -> Tuple[bool, str]:
+        """Write one batch manifest for assets that have a USD file"""
+        items = [item for item in map(self._thumbnail_job_item, assets) if item]
+        if not items:
+            error_msg = "No assets with a USD file to render"
+            self.operation_error.emit("regenerate_thumbnail", error_msg)
+            return False, error_msg
+
+        job_id = get_thumbnail_batch_service().submit(items)
+        if job_id is None:
+            error_msg = "Failed to queue thumbnail regeneration. Is Blender running?"
+            logger.error(error_msg)
+            self.operation_error.emit("regenerate_thumbnail", error_msg)
+            return False, error_msg
+
+        logger.info(f"Queued thumbnail batch {job_id}: {len(items)} assets")
+        return True, f"Thumbnail regeneration queued for {len(items)} assets"
+
+    @staticmethod
+    def _thumbnail_job_item(asset: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Render request fields for an asset, or None if it has no USD file"""
+        usd_path = asset.get('usd_file_path', '')
+        if not usd_path:
+            return None
+
+        # Get or create thumbnail path (versioned)
+        thumbnail_path = asset.get('thumbnail_path', '')
+        if not thumbnail_path:
+            version_label = asset.get('version_label', 'v001')
+            thumbnail_path = str(Path(usd_path).parent / f"thumbnail.{version_label}.png")
+
+        return {
+            'uuid': asset['uuid'],
+            'name': asset.get('name', 'Unknown'),
+            'usd_file_path': usd_path,
+            'thumbnail_path': thumbnail_path,
+        }
+
     def get_asset_names(self, uuids: List[str], max_count: int = 5) -> List[str]:
         """
         Get asset names for display (e.g., in confirmation dialogs)
@@ -399,10 +598,68 @@ class AssetManager(QObject):
             logger.warning(error_msg)
             return False, "Asset not found"
 
-        asset_id = asset.get('asset_id')
-        variant_name = asset.get('variant_name', 'Base')
         asset_name = asset.get('name', 'Unknown')
+        scope = self._get_delete_scope(asset)
 
+        deleted = self._delete_assets(scope, delete_files=True)
+        self._notifier.assets_removed(deleted)
+        deleted_count = len(deleted)
+
+        # Log result
+        if deleted_count == len(scope):
+            logger.info(f"Complete delete of '{asset_name}': {deleted_count} records")
+            return True, f"Deleted {deleted_count} asset(s)"
+        elif deleted_count > 0:
+            logger.warning(f"Partial delete of '{asset_name}': {deleted_count}/{len(scope)}")
+            errors = len(scope) - deleted_count
+            return True, f"Deleted {deleted_count}/{len(scope)} assets ({errors} errors)"
+        else:
+            error_msg = f"Failed to delete any assets of '{asset_name}'"
+            logger.error(error_msg)
+            return False, error_msg
+
+    def delete_assets_complete(
+        self,
+        uuids: List[str],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[List[str], int, int]:
+        """
+        Comprehensive delete (see delete_asset_complete) for many assets
+
+        All versions and variants in scope are deleted as one batch. Meant
+        for DeleteWorker: no change notifications are sent, the caller
+        sends them on the GUI thread with the returned record UUIDs.
+
+        Args:
+            uuids: Asset UUIDs to delete
+            progress_callback: Optional callable(done, total) for file work
+
+        Returns:
+            Tuple of (deleted record UUIDs, assets with at least one record
+            deleted, total_count)
+        """
+        assets = self._db_service.get_assets_by_uuids(uuids)
+        scopes = {
+            uuid: self._get_delete_scope(assets[uuid])
+            for uuid in uuids if uuid in assets
+        }
+        all_uuids = [rec_uuid for scope in scopes.values() for rec_uuid in scope]
+
+        deleted = self._delete_assets(all_uuids, True, progress_callback)
+        deleted_set = set(deleted)
+        deleted_count = sum(1 for scope in scopes.values() if deleted_set.intersection(scope))
+
+        logger.info(f"Complete delete: {deleted_count}/{len(uuids)} assets, {len(deleted)} records")
+        return deleted, deleted_count, len(uuids)
+
+    def _get_delete_scope(self, asset: Dict[str, Any]) -> List[str]:
+        """
+        Get UUIDs of every record a complete delete of asset removes
+
+        Base deletes all variants, other variants only their own versions.
+        """
+        asset_id = asset.get('asset_id')
+        variant_name = asset.get('variant_name', 'Base')
 
         # Collect all assets to delete
         assets_to_delete = []
@@ -423,33 +680,7 @@ class AssetManager(QObject):
             # Fallback: just delete the single asset
             assets_to_delete = [asset]
 
-        # Delete each asset (files + DB + related data)
-        deleted_count = 0
-        errors = []
-
-
-        for rec in assets_to_delete:
-            rec_uuid = rec.get('uuid')
-            if not rec_uuid:
-                continue
-
-            success, msg = self.delete_asset(rec_uuid, delete_files=True)
-            if success:
-                deleted_count += 1
-            else:
-                errors.append(f"{rec.get('name', rec_uuid)}: {msg}")
-
-        # Log result
-        if deleted_count == len(assets_to_delete):
-            logger.info(f"Complete delete of '{asset_name}': {deleted_count} records")
-            return True, f"Deleted {deleted_count} asset(s)"
-        elif deleted_count > 0:
-            logger.warning(f"Partial delete of '{asset_name}': {deleted_count}/{len(assets_to_delete)}")
-            return True, f"Deleted {deleted_count}/{len(assets_to_delete)} assets ({len(errors)} errors)"
-        else:
-            error_msg = f"Failed to delete any assets: {'; '.join(errors[:3])}"
-            logger.error(error_msg)
-            return False, error_msg
+        return [rec.get('uuid') for rec in assets_to_delete if rec.get('uuid')]
 
     def get_delete_info(self, uuid: str) -> dict:
         """
@@ -13,8 +13,10 @@ Refactored to delegate to:
 
 import json
 import logging
+import re
+import sqlite3
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +84,8 @@ class AssetRepository(BaseRepository):
             update=self.update,
             add=self.add,
             row_to_dict=self._row_to_dict,
+            rows_to_dicts=self._rows_to_dicts,
+            table_columns=self._get_table_columns,
         )
 
         self._variants = AssetVariants(
@@ -89,18 +93,21 @@ class AssetRepository(BaseRepository):
             get_by_uuid=self.get_by_uuid,
             add=self.add,
             row_to_dict=self._row_to_dict,
+            rows_to_dicts=self._rows_to_dicts,
         )
 
         self._features = AssetFeatures(
             get_connection=self._get_connection,
             transaction=self._transaction,
             row_to_dict=self._row_to_dict,
+            rows_to_dicts=self._rows_to_dicts,
             parse_tags=self._parse_tags,
         )
 
         self._cold_storage = AssetColdStorage(
             get_connection=self._get_connection,
             row_to_dict=self._row_to_dict,
+            rows_to_dicts=self._rows_to_dicts,
         )
 
         self._representations = RepresentationDesignations(
@@ -269,6 +276,34 @@ class AssetRepository(BaseRepository):
             return data
         return None
 
+    def get_by_uuids(self, uuids: List[str],
+                     include_dynamic: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many assets by UUID with chunked IN queries.
+
+        Args:
+            uuids: Asset UUIDs
+            include_dynamic: Whether to include dynamic metadata from EAV storage
+
+        Returns:
+            Dict of uuid -> asset dict for the assets that exist
+        """
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+
+        rows = []
+        uuids = list(dict.fromkeys(uuids))
+        for start in range(0, len(uuids), self.UUID_CHUNK_SIZE):
+            chunk = uuids[start:start + self.UUID_CHUNK_SIZE]
+            placeholders = ', '.join('?' for _ in chunk)
+            cursor.execute(f'SELECT * FROM assets WHERE uuid IN ({placeholders})', chunk)
+            rows.extend(cursor.fetchall())
+
+        return {
+            data['uuid']: data
+            for data in self._rows_to_dicts(rows, include_dynamic=include_dynamic)
+        }
+
     def name_exists(self, name: str, folder_id: Optional[int] = None,
                     exclude_uuid: Optional[str] = None) -> bool:
         """
@@ -314,7 +349,7 @@ class AssetRepository(BaseRepository):
         Returns:
             List of asset dicts
         """
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         cursor = conn.cursor()
 
         query = "SELECT * FROM assets WHERE 1=1"
@@ -335,7 +370,37 @@ class AssetRepository(BaseRepository):
         query += " ORDER BY name"
         cursor.execute(query, params)
 
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
+
+    def iter_all(self, page_size: int = 500,
+                 include_retired: bool = False) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate all assets in name order, one page at a time.
+
+        Used for progressive loading: each page is converted and hydrated
+        with EAV metadata as it is fetched, so the first rows are available
+        without reading the whole table.
+
+        Args:
+            page_size: Number of assets per page
+            include_retired: If True, include retired assets (default: False)
+
+        Yields:
+            Lists of asset dicts
+        """
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+
+        query = "SELECT * FROM assets"
+        if not include_retired:
+            query += " WHERE (is_retired = 0 OR is_retired IS NULL)"
+        query += " ORDER BY name"
+        cursor.execute(query)
+
+        while True:
+            rows = cursor.fetchmany(page_size)
+            if not rows:
+                break
+            yield self._rows_to_dicts(rows)
 
     def update(self, uuid: str, updates: Dict[str, Any]) -> bool:
         """
@@ -343,17 +408,7 @@ class AssetRepository(BaseRepository):
 
         Writes to both column storage and EAV for dynamic fields (dual-write).
         """
-        # Separate dynamic fields for EAV write
-        dynamic_updates = {}
-        column_updates = {}
-
-        for key, value in updates.items():
-            if key in self.DYNAMIC_FIELDS:
-                dynamic_updates[key] = value
-                # Still write to column as well during transition
-                column_updates[key] = value
-            else:
-                column_updates[key] = value
+        column_updates, dynamic_updates = self._prepare_updates(updates)
 
         # Update columns and EAV atomically in same transaction
         success = False
@@ -361,15 +416,6 @@ class AssetRepository(BaseRepository):
             with self._transaction() as conn:
                 cursor = conn.cursor()
 
-                if 'tags' in column_updates and isinstance(column_updates['tags'], list):
-                    column_updates['tags'] = json.dumps(column_updates['tags'])
-
-                # Check if modified_date column exists before adding it
-                cursor.execute("PRAGMA table_info(assets)")
-                columns = {col[1] for col in cursor.fetchall()}
-                if 'modified_date' in columns:
-                    column_updates['modified_date'] = datetime.now().isoformat()
-
                 # Update columns
                 if column_updates:
                     set_clause = ', '.join([f"{key} = ?" for key in column_updates.keys()])
@@ -404,6 +450,93 @@ class AssetRepository(BaseRepository):
 
         return success
 
+    def update_many(self, uuids: List[str], updates: Dict[str, Any]) -> List[str]:
+        """
+        Apply the same updates to many assets in one transaction.
+
+        Column writes use a single executemany and dynamic fields a single
+        EAV batch write. Emits one entities_batch_updated event instead of
+        one entity_updated per asset.
+
+        Args:
+            uuids: Asset UUIDs
+            updates: Field values to set on every asset
+
+        Returns:
+            UUIDs that were updated (empty if the transaction failed)
+        """
+        uuids = list(dict.fromkeys(uuid for uuid in uuids if uuid))
+        if not uuids or not updates:
+            return []
+
+        column_updates, dynamic_updates = self._prepare_updates(updates)
+
+        updated_uuids: List[str] = []
+        try:
+            with self._transaction() as conn:
+                cursor = conn.cursor()
+
+                set_clause = ', '.join([f"{key} = ?" for key in column_updates.keys()])
+                values = list(column_updates.values())
+                cursor.executemany(
+                    f'UPDATE assets SET {set_clause} WHERE uuid = ?',
+                    [(*values, uuid) for uuid in uuids]
+                )
+
+                if cursor.rowcount == len(uuids):
+                    updated_uuids = uuids
+                elif cursor.rowcount > 0:
+                    updated_uuids = self._existing_uuids(cursor, uuids)
+
+                if updated_uuids and dynamic_updates:
+                    self._write_dynamic_to_eav_many(updated_uuids, dynamic_updates, conn=conn)
+
+        except Exception as e:
+            logger.debug(f"Batch asset update failed: {e}")
+            return []
+
+        try:
+            self._entity_event_bus.emit_entities_batch_updated('asset', updated_uuids)
+        except Exception as e:
+            logger.debug(f"Event emission failed for batch asset update: {e}")
+
+        return updated_uuids
+
+    def _prepare_updates(self, updates: Dict[str, Any]):
+        """
+        Split updates into column and EAV writes and normalize values.
+
+        Dynamic fields are written to both (dual-write transition).
+        Adds modified_date when the column exists.
+
+        Returns:
+            Tuple of (column_updates, dynamic_updates)
+        """
+        column_updates = dict(updates)
+        dynamic_updates = {
+            key: value for key, value in updates.items() if key in self.DYNAMIC_FIELDS
+        }
+
+        if 'tags' in column_updates and isinstance(column_updates['tags'], list):
+            column_updates['tags'] = json.dumps(column_updates['tags'])
+
+        if 'modified_date' in self._get_table_columns('assets'):
+            column_updates['modified_date'] = datetime.now().isoformat()
+
+        return column_updates, dynamic_updates
+
+    def _existing_uuids(self, cursor, uuids: List[str]) -> List[str]:
+        """Filter uuids to those present in the assets table, keeping order."""
+        existing = set()
+        for start in range(0, len(uuids), self.UUID_CHUNK_SIZE):
+            chunk = uuids[start:start + self.UUID_CHUNK_SIZE]
+            placeholders = ', '.join('?' for _ in chunk)
+            cursor.execute(
+                f'SELECT uuid FROM assets WHERE uuid IN ({placeholders})', chunk
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        return [uuid for uuid in uuids if uuid in existing]
+
     def delete(self, uuid: str) -> bool:
         """Delete asset by UUID and its EAV metadata.
 
@@ -455,29 +588,170 @@ class AssetRepository(BaseRepository):
 
         return deleted
 
-    def search(self, query: str) -> List[Dict[str, Any]]:
-        """Search assets by name, description, or tags"""
-        conn = self._get_connection()
+    def delete_many(self, uuids: List[str]) -> Optional[List[str]]:
+        """
+        Delete many assets and their junction rows and EAV metadata.
+
+        Everything is removed in one transaction with chunked IN deletes
+        (children before parents, as in delete()). Emits one
+        entities_batch_deleted event.
+
+        Args:
+            uuids: Asset UUIDs
+
+        Returns:
+            UUIDs that were deleted, or None if the transaction failed
+            (nothing was deleted)
+        """
+        uuids = list(dict.fromkeys(uuid for uuid in uuids if uuid))
+        if not uuids:
+            return []
+
+        try:
+            with self._transaction() as conn:
+                cursor = conn.cursor()
+                deleted = self._existing_uuids(cursor, uuids)
+
+                for start in range(0, len(deleted), self.UUID_CHUNK_SIZE):
+                    chunk = deleted[start:start + self.UUID_CHUNK_SIZE]
+                    placeholders = ', '.join('?' for _ in chunk)
+                    cursor.execute(
+                        f'DELETE FROM asset_tags WHERE asset_uuid IN ({placeholders})', chunk
+                    )
+                    cursor.execute(
+                        f'DELETE FROM asset_folders WHERE asset_uuid IN ({placeholders})', chunk
+                    )
+                    cursor.execute(
+                        f'DELETE FROM entity_metadata WHERE entity_uuid IN ({placeholders})', chunk
+                    )
+                    cursor.execute(
+                        f'DELETE FROM assets WHERE uuid IN ({placeholders})', chunk
+                    )
+        except Exception as e:
+            logger.error(f"Batch asset delete failed: {e}")
+            return None
+
+        try:
+            self._entity_event_bus.emit_entities_batch_deleted('asset', deleted)
+        except Exception as e:
+            logger.debug(f"Event emission failed for batch asset delete: {e}")
+
+        return deleted
+
+    # bm25() weights for assets_fts columns (name, description, tags, asset_type, author)
+    SEARCH_WEIGHTS = (10.0, 2.0, 5.0, 3.0, 1.0)
+
+    @staticmethod
+    def build_search_match(query: str) -> str:
+        """
+        Build an FTS5 MATCH expression from user search text
+
+        Each word becomes a quoted prefix term; terms are ANDed.
+        "oak cha" -> '"oak"* "cha"*'
+
+        Args:
+            query: Raw search text
+
+        Returns:
+            MATCH expression, or empty string if query has no words
+        """
+        return ' '.join(f'"{term}"*' for term in re.findall(r'\w+', query.lower()))
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search assets by name, description, tags, type or author
+
+        Uses the assets_fts index with prefix matching, best matches first.
+        Falls back to a LIKE scan if the index is unavailable.
+
+        Args:
+            query: Search text
+            limit: Maximum results (None for all)
+
+        Returns:
+            Matching assets ordered by relevance
+        """
+        match = self.build_search_match(query)
+        if not match:
+            return self._search_like(query, limit)
+
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f'''
+                SELECT assets.* FROM assets_fts
+                JOIN assets ON assets.id = assets_fts.rowid
+                WHERE assets_fts MATCH ?
+                ORDER BY bm25(assets_fts, {', '.join(map(str, self.SEARCH_WEIGHTS))}), assets.name
+                LIMIT ?
+            ''', (match, -1 if limit is None else limit))
+        except sqlite3.OperationalError:
+            return self._search_like(query, limit)
+
+        return self._rows_to_dicts(cursor.fetchall())
+
+    def search_uuids(self, query: str, limit: Optional[int] = None) -> Optional[List[str]]:
+        """
+        Get UUIDs of assets matching search text, best matches first
+
+        Index-only lookup for filtering already-loaded assets.
+
+        Args:
+            query: Search text
+            limit: Maximum results (None for all)
+
+        Returns:
+            Ranked UUID list, or None if the search index is unavailable
+            or the query has no words for it to match
+        """
+        match = self.build_search_match(query)
+        if not match:
+            return None
+
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f'''
+                SELECT assets.uuid FROM assets_fts
+                JOIN assets ON assets.id = assets_fts.rowid
+                WHERE assets_fts MATCH ?
+                ORDER BY bm25(assets_fts, {', '.join(map(str, self.SEARCH_WEIGHTS))})
+                LIMIT ?
+            ''', (match, -1 if limit is None else limit))
+        except sqlite3.OperationalError:
+            return None
+
+        return [row[0] for row in cursor.fetchall()]
+
+    def _search_like(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Search assets with a LIKE scan (no search index)"""
+        conn = self._get_read_connection()
         cursor = conn.cursor()
 
         search_pattern = f"%{query}%"
         cursor.execute('''
             SELECT * FROM assets
-            WHERE name LIKE ? OR description LIKE ? OR tags LIKE ?
+            WHERE name LIKE ? OR description LIKE ? OR tags LIKE ? OR author LIKE ?
             ORDER BY name
-        ''', (search_pattern, search_pattern, search_pattern))
+            LIMIT ?
+        ''', (search_pattern, search_pattern, search_pattern, search_pattern,
+              -1 if limit is None else limit))
 
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
     def get_count(self, folder_id: Optional[int] = None,
-                  asset_type: Optional[str] = None) -> int:
+                  asset_type: Optional[str] = None,
+                  include_retired: bool = True) -> int:
         """Get count of assets"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         cursor = conn.cursor()
 
         query = "SELECT COUNT(*) FROM assets WHERE 1=1"
         params = []
 
+        if not include_retired:
+            query += " AND (is_retired = 0 OR is_retired IS NULL)"
+
         if folder_id is not None:
             query += " AND folder_id = ?"
             params.append(folder_id)
@@ -500,6 +774,10 @@ class AssetRepository(BaseRepository):
         """Set favorite status for an asset."""
         return self._features.set_favorite(uuid, is_favorite)
 
+    def set_favorite_many(self, uuids: List[str], is_favorite: bool) -> List[str]:
+        """Set favorite status for many assets in one transaction; returns UUIDs updated."""
+        return self.update_many(uuids, {'is_favorite': 1 if is_favorite else 0})
+
     def get_favorites(self) -> List[Dict[str, Any]]:
         """Get all favorite assets."""
         return self._features.get_favorites()
@@ -531,12 +809,18 @@ class AssetRepository(BaseRepository):
             return False
         return self.update(uuid, {'status': status})
 
+    def set_status_many(self, uuids: List[str], status: str) -> int:
+        """Set lifecycle status for many assets; returns number updated"""
+        if status not in self.VALID_STATUSES:
+            return 0
+        return len(self.update_many(uuids, {'status': status}))
+
     def get_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get assets by lifecycle status"""
         conn = self._get_connection()
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM assets WHERE status = ? ORDER BY name', (status,))
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
     def get_all_statuses(self) -> List[str]:
         """Get all unique statuses used"""
@@ -763,6 +1047,65 @@ class AssetRepository(BaseRepository):
 
         return data
 
+    def _rows_to_dicts(self, rows, include_dynamic: bool = True) -> List[Dict[str, Any]]:
+        """
+        Convert a result set to dicts, hydrating EAV metadata in bulk.
+
+        Same output as calling _row_to_dict() per row, but loads metadata
+        for the whole result set with chunked queries instead of one
+        query per asset.
+
+        Args:
+            rows: Database rows
+            include_dynamic: Whether to merge EAV metadata
+
+        Returns:
+            List of asset dicts
+        """
+        if not rows:
+            return []
+
+        # Read column names once; dict(row) re-resolves them for every row
+        keys = rows[0].keys()
+        results = []
+        for row in rows:
+            data = dict(zip(keys, row))
+            data['tags'] = self._parse_tags(data.get('tags'))
+            results.append(data)
+
+        if include_dynamic:
+            self._enrich_many_with_metadata(results)
+
+        return results
+
+    def _enrich_many_with_metadata(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Enrich a list of asset dicts with EAV metadata in bulk.
+
+        Args:
+            items: Asset dicts to enrich (modified in place)
+        """
+        try:
+            eav_by_uuid = self._metadata_service.get_entities_metadata(
+                [data.get('uuid') for data in items]
+            )
+        except Exception as e:
+            # Don't fail the read if EAV lookup fails
+            logger.debug(f"Bulk EAV lookup failed: {e}")
+            return
+
+        if not eav_by_uuid:
+            return
+
+        for data in items:
+            eav_data = eav_by_uuid.get(data.get('uuid'))
+            if not eav_data:
+                continue
+            # EAV values override column values for dynamic fields
+            for field_name, value in eav_data.items():
+                if value is not None:
+                    data[field_name] = value
+
     def _enrich_with_metadata(self, data: Dict[str, Any]) -> None:
         """
         Enrich asset dict with dynamic metadata from EAV storage.
@@ -818,5 +1161,28 @@ class AssetRepository(BaseRepository):
             # Log but don't fail - column write already succeeded
             pass
 
+    def _write_dynamic_to_eav_many(self, uuids: List[str], data: Dict[str, Any], conn=None) -> None:
+        """
+        Write the same dynamic fields to EAV storage for many assets.
+
+        Args:
+            uuids: Asset UUIDs
+            data: Dict containing field values (filters to DYNAMIC_FIELDS only)
+            conn: Optional connection for participating in existing transaction
+        """
+        dynamic_data = {
+            k: v for k, v in data.items()
+            if k in self.DYNAMIC_FIELDS and v is not None
+        }
+
+        if not uuids or not dynamic_data:
+            return
+
+        try:
+            self._metadata_service.set_entities_metadata(uuids, 'asset', dynamic_data, conn=conn)
+        except Exception as e:
+            # Log but don't fail - column write already succeeded
+            pass
+
 
 __all__ = ['AssetRepository']
@@ -282,6 +282,7 @@ class BackupService:
     def _get_database_stats(cls, storage_path: Path) -> Dict[str, Any]:
         """Get statistics from database for manifest"""
         import sqlite3
+        from .connection_manager import ConnectionManager, get_connection_manager
 
         stats = {}
         db_path = storage_path / Config.META_FOLDER / Config.DEFAULT_DB_NAME
@@ -289,8 +290,15 @@ class BackupService:
         if not db_path.exists():
             return stats
 
+        manager = get_connection_manager()
+        managed = db_path.resolve() == manager.db_path.resolve()
+        conn = None
         try:
-            conn = sqlite3.connect(str(db_path))
+            if managed:
+                conn = manager.get_connection(ConnectionManager.ROLE_READ)
+            else:
+                # Not the open library, so no writer to queue behind; read-only
+                conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
             cursor = conn.cursor()
 
             # Get schema version
@@ -308,10 +316,11 @@ class BackupService:
             # Get tag count
             cursor.execute("SELECT COUNT(*) FROM tags")
             stats['tag_count'] = cursor.fetchone()[0]
-
-            conn.close()
         except Exception:
             pass
+        finally:
+            if conn is not None and not managed:
+                conn.close()
 
         return stats
 
@@ -2,16 +2,18 @@
 BaseRepository - Base class for repository pattern
 
 Pattern: Repository base with shared database access
-Provides thread-local connections and transaction support.
+Provides thread-local connections and transaction support through
+ConnectionManager.
 """
 
 import sqlite3
 import threading
 from pathlib import Path
-from typing import Optional
+from typing import FrozenSet, Optional
 from contextlib import contextmanager
 
 from ..config import Config
+from .connection_manager import ConnectionManager, get_connection_manager
 
 
 class BaseRepository:
@@ -19,9 +21,10 @@ class BaseRepository:
     Base repository with shared database infrastructure
 
     Features:
-    - Thread-local connections for thread safety
-    - WAL mode for better concurrency
-    - Transaction support via context manager
+    - Thread-local connections for thread safety (via ConnectionManager)
+    - Read-only connections for query paths
+    - Write transactions serialized on a single writer connection
+    - Per-thread table column cache
     - Shared across all repositories
     """
 
@@ -30,49 +33,82 @@ class BaseRepository:
     _local = threading.local()
     _initialized = False
 
+    # Bumped by invalidate_schema_cache(); column caches from an older
+    # generation are discarded on next use
+    _schema_generation = 0
+
+    # Max UUIDs bound per IN (...) query (SQLite parameter limit)
+    UUID_CHUNK_SIZE = 500
+
     @classmethod
     def initialize(cls, db_path: Optional[Path] = None):
         """Initialize the shared database path"""
         cls._db_path = db_path or Config.get_database_path()
+        get_connection_manager().configure(cls._db_path)
+        cls.invalidate_schema_cache()
         cls._initialized = True
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get thread-local database connection"""
+        """Get thread-local autocommit database connection"""
+        if not BaseRepository._initialized:
+            BaseRepository.initialize()
+
+        # Inside _transaction() this is the writer connection holding the transaction
+        return get_connection_manager().get_connection()
+
+    def _get_read_connection(self) -> sqlite3.Connection:
+        """Get thread-local read-only connection for query paths"""
         if not BaseRepository._initialized:
             BaseRepository.initialize()
 
-        if not hasattr(BaseRepository._local, 'connection') or BaseRepository._local.connection is None:
-            # Thread-local connections ensure thread safety without needing check_same_thread=False
-            # isolation_level=None enables autocommit so readers always see latest committed data
-            # (critical for seeing changes made by external processes like Blender addon)
-            BaseRepository._local.connection = sqlite3.connect(
-                str(BaseRepository._db_path),
-                timeout=30.0,
-                isolation_level=None
-            )
-            BaseRepository._local.connection.execute("PRAGMA foreign_keys = ON")
-            BaseRepository._local.connection.execute("PRAGMA journal_mode = WAL")
-            BaseRepository._local.connection.row_factory = sqlite3.Row
-
-        return BaseRepository._local.connection
+        return get_connection_manager().get_connection(ConnectionManager.ROLE_READ)
+
+    @classmethod
+    def invalidate_schema_cache(cls):
+        """Discard cached table columns on all threads (call after migrations)"""
+        BaseRepository._schema_generation += 1
+
+    def _get_table_columns(self, table: str) -> FrozenSet[str]:
+        """
+        Get column names of a table
+
+        Read with PRAGMA table_info once per thread and cached until
+        the schema cache is invalidated.
+
+        Args:
+            table: Table name
+
+        Returns:
+            Set of column names (empty if the table does not exist)
+        """
+        conn = self._get_connection()
+        local = BaseRepository._local
+        generation = BaseRepository._schema_generation
+
+        cache = getattr(local, 'table_columns', None)
+        if cache is None or local.table_columns_generation != generation:
+            cache = local.table_columns = {}
+            local.table_columns_generation = generation
+
+        columns = cache.get(table)
+        if columns is None:
+            cursor = conn.execute(f"PRAGMA table_info({table})")
+            columns = cache[table] = frozenset(col[1] for col in cursor.fetchall())
+        return columns
 
     @contextmanager
     def _transaction(self):
-        """Context manager for database transactions"""
-        conn = self._get_connection()
-        conn.execute("BEGIN")
-        try:
+        """Context manager for write transactions on the shared writer connection"""
+        if not BaseRepository._initialized:
+            BaseRepository.initialize()
+
+        with get_connection_manager().transaction() as conn:
             yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
 
     def close(self):
-        """Close database connection for current thread"""
-        if hasattr(BaseRepository._local, 'connection') and BaseRepository._local.connection:
-            BaseRepository._local.connection.close()
-            BaseRepository._local.connection = None
+        """Close database connections for current thread"""
+        get_connection_manager().close_thread()
+        BaseRepository._local.table_columns = None
 
 
 __all__ = ['BaseRepository']
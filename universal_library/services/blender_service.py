@@ -8,12 +8,13 @@ Now uses the protocol module for schema-driven message building.
 """
 
 import json
+import os
 import tempfile
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
-from ..protocol import build_message, QUEUE_DIR_NAME
+from ..protocol import build_message, QUEUE_DIR_NAME, THUMBNAIL_BATCH_PROGRESS_SUFFIX
 
 
 class BlenderService:
@@ -243,6 +244,80 @@ class BlenderService:
         except Exception as e:
             return False
 
+    def queue_thumbnail_batch(
+        self,
+        job_id: str,
+        items: List[Dict[str, Any]],
+        thumbnail_size: int = 256
+    ) -> Optional[Path]:
+        """
+        Queue one manifest regenerating many thumbnails in Blender.
+
+        Blender appends a line per finished item to the job's progress
+        file (see batch_progress_path) and skips items already listed
+        there when it restarts, so a job survives a crash on either side.
+
+        Args:
+            job_id: Unique job identifier
+            items: Dicts with uuid, name, usd_file_path and thumbnail_path
+            thumbnail_size: Rendered thumbnail size in pixels
+
+        Returns:
+            Path of the manifest, or None if it could not be written
+        """
+        self._ensure_queue_dir()
+
+        batch_items = []
+        for item in items:
+            try:
+                # Same fields as a single regenerate_thumbnail request
+                message = build_message("regenerate_thumbnail", item)
+            except Exception as e:
+                continue
+            batch_items.append({
+                key: message[key]
+                for key in ("asset_uuid", "asset_name", "usd_file_path", "thumbnail_path")
+            })
+        if not batch_items:
+            return None
+
+        metadata: Dict[str, Any] = {
+            "job_id": job_id,
+            "items": batch_items,
+            "item_count": len(batch_items),
+            "thumbnail_size": thumbnail_size,
+        }
+
+        try:
+            request = build_message("thumbnail_batch", metadata)
+        except Exception as e:
+            return None
+
+        queue_file = self._queue_dir / f"thumbbatch_{job_id}.json"
+        tmp_file = queue_file.with_name(f"{queue_file.name}.tmp")
+
+        try:
+            # Write then rename so Blender never reads a partial manifest
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(request, f)
+            os.replace(tmp_file, queue_file)
+            return queue_file
+        except Exception as e:
+            return None
+
+    @staticmethod
+    def batch_progress_path(manifest_path: Path) -> Path:
+        """
+        Get the progress file Blender appends batch results to.
+
+        Args:
+            manifest_path: Path of a thumbbatch_*.json manifest
+
+        Returns:
+            Path of the matching progress file
+        """
+        return manifest_path.with_name(manifest_path.stem + THUMBNAIL_BATCH_PROGRESS_SUFFIX)
+
     def get_queue_status(self) -> dict:
         """
         Get status of pending requests.
@@ -0,0 +1,353 @@
+"""
+ConnectionManager - Lifecycle of SQLite connections to the library database
+
+Pattern: Singleton owning every connection to the library database
+- Per-thread connections with tuned PRAGMAs
+- Read-only connections for query paths
+- One shared writer connection; write transactions are serialized
+- Connections left behind by finished threads are closed
+- Stats for the Maintenance tab
+"""
+
+import itertools
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class _ThreadToken:
+    """Lives in a thread's local data; collected when the thread goes away"""
+
+    __slots__ = ('key', '__weakref__')
+
+    def __init__(self, key: int):
+        self.key = key
+
+
+def _is_lock_error(error: sqlite3.OperationalError) -> bool:
+    """Check if an OperationalError is a busy/locked timeout"""
+    message = str(error).lower()
+    return 'locked' in message or 'busy' in message
+
+
+class ConnectionManager:
+    """
+    Central owner of library database connections
+
+    Roles:
+        default: Autocommit read/write connection per thread (repositories)
+        read: Autocommit query_only connection per thread (hot read paths)
+        legacy: Implicit-transaction connection per thread (schema,
+            maintenance and other DatabaseService callers)
+
+    Write transactions from repositories run on a single writer
+    connection guarded by a lock, so in-process writers queue up here
+    instead of spinning on SQLite's busy handler.
+    """
+
+    ROLE_DEFAULT = 'default'
+    ROLE_READ = 'read'
+    ROLE_LEGACY = 'legacy'
+
+    # BEGIN IMMEDIATE slower than this was blocked by another process
+    BUSY_WAIT_THRESHOLD_S = 0.05
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self._db_path = Path(db_path) if db_path else None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._write_lock = threading.RLock()
+
+        # (thread key, role) -> connection, for every per-thread connection
+        self._connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+        self._keys = itertools.count(1)
+        # Keys of threads whose local data was collected (appended by finalizers)
+        self._finished: deque = deque()
+        self._writer: Optional[sqlite3.Connection] = None
+        # Bumped by close_all(); threads drop their stale handles on next use
+        self._generation = 0
+
+        self._opened = 0
+        self._closed_idle = 0
+        self._write_transactions = 0
+        self._busy_waits = 0
+        self._lock_timeouts = 0
+        self._write_wait_s = 0.0
+
+    @property
+    def db_path(self) -> Path:
+        """Path of the managed database"""
+        if self._db_path is None:
+            self._db_path = Config.get_database_path()
+        return self._db_path
+
+    def configure(self, db_path: Path):
+        """
+        Point the manager at a database file
+
+        Connections to a previously configured file are closed.
+
+        Args:
+            db_path: Path to database file
+        """
+        db_path = Path(db_path)
+        if self._db_path is not None and db_path != self._db_path:
+            self.close_all()
+        self._db_path = db_path
+
+    # ==================== CONNECTIONS ====================
+
+    def get_connection(self, role: str = ROLE_DEFAULT) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection for a role
+
+        Args:
+            role: ROLE_DEFAULT, ROLE_READ or ROLE_LEGACY
+
+        Returns:
+            Connection owned by the calling thread
+        """
+        if role != self.ROLE_LEGACY and getattr(self._local, 'transaction_depth', 0):
+            # Inside transaction() on this thread: everything goes through the
+            # writer so helpers see (and join) the open transaction
+            return self._writer
+
+        connections = getattr(self._local, 'connections', None)
+        if connections is None or self._local.generation != self._generation:
+            connections = self._local.connections = {}
+            self._local.generation = self._generation
+
+        conn = connections.get(role)
+        if conn is None:
+            self.close_idle()
+            conn = connections[role] = self._open(role)
+            with self._lock:
+                self._connections[(self._thread_key(), role)] = conn
+                self._opened += 1
+        return conn
+
+    def _thread_key(self) -> int:
+        """Get the registry key of the calling thread"""
+        token = getattr(self._local, 'token', None)
+        if token is None:
+            token = self._local.token = _ThreadToken(next(self._keys))
+            # Runs when the thread's local data is cleared; closing is
+            # deferred to close_idle() on whichever thread comes next
+            weakref.finalize(token, self._finished.append, token.key)
+        return token.key
+
+    def _open(self, role: str) -> sqlite3.Connection:
+        """Open and configure a connection for a role"""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=Config.DB_BUSY_TIMEOUT_S,
+            # Autocommit so readers always see the latest committed data
+            # (including changes made by external processes like the Blender addon)
+            isolation_level='' if role == self.ROLE_LEGACY else None,
+            # Thread affinity is enforced by this manager; this lets a finished
+            # thread's connections be closed from another thread
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        if role == self.ROLE_READ:
+            conn.execute("PRAGMA query_only = ON")
+        else:
+            conn.execute("PRAGMA journal_mode = WAL")
+        # NORMAL is durable across application crashes in WAL mode
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = -{Config.DB_CACHE_SIZE_KB}")
+        conn.execute(f"PRAGMA mmap_size = {Config.DB_MMAP_SIZE_MB * 1024 * 1024}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    def close_thread(self):
+        """Close the calling thread's connections"""
+        connections = getattr(self._local, 'connections', None)
+        if not connections:
+            return
+
+        key = self._thread_key()
+        with self._lock:
+            for role in connections:
+                self._connections.pop((key, role), None)
+        for conn in connections.values():
+            self._close(conn)
+        connections.clear()
+
+    def close_idle(self) -> int:
+        """
+        Close connections left behind by finished threads
+
+        Returns:
+            Number of connections closed
+        """
+        if not self._finished:
+            return 0
+
+        stale = []
+        with self._lock:
+            while self._finished:
+                key = self._finished.popleft()
+                for role in (self.ROLE_DEFAULT, self.ROLE_READ, self.ROLE_LEGACY):
+                    conn = self._connections.pop((key, role), None)
+                    if conn is not None:
+                        stale.append(conn)
+            self._closed_idle += len(stale)
+
+        for conn in stale:
+            self._close(conn)
+        return len(stale)
+
+    def close_all(self):
+        """Close every connection (library switch, shutdown)"""
+        with self._write_lock, self._lock:
+            stale = list(self._connections.values())
+            self._connections.clear()
+            if self._writer is not None:
+                stale.append(self._writer)
+                self._writer = None
+            self._generation += 1
+        for conn in stale:
+            self._close(conn)
+
+    @staticmethod
+    def _close(conn: sqlite3.Connection):
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Error closing connection: {e}")
+
+    def get_data_version(self) -> Tuple[int, int, int]:
+        """
+        Get a library-wide change counter
+
+        Based on PRAGMA data_version of the calling thread's read
+        connection, which changes whenever another connection or process
+        commits. Compare values for equality only.
+
+        Returns:
+            Opaque token; equal tokens mean nothing was committed in between
+        """
+        conn = self.get_connection(self.ROLE_READ)
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        # A reopened connection restarts its counter
+        return (self._generation, id(conn), version)
+
+    # ==================== WRITES ====================
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a write transaction on the shared writer connection
+
+        Acquires the write lock, then BEGIN IMMEDIATE so the database write
+        lock is taken up front rather than on the first write statement.
+        Until the block exits, get_connection() on this thread returns the
+        writer as well.
+
+        Yields:
+            Writer connection (only valid inside the block)
+        """
+        start = time.perf_counter()
+        if not self._write_lock.acquire(blocking=False):
+            with self._lock:
+                self._busy_waits += 1
+            if not self._write_lock.acquire(timeout=Config.DB_BUSY_TIMEOUT_S):
+                with self._lock:
+                    self._lock_timeouts += 1
+                raise sqlite3.OperationalError("database is locked")
+
+        try:
+            conn = self._get_writer()
+            begin = time.perf_counter()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError as e:
+                self._record_error(e)
+                raise
+            acquired = time.perf_counter()
+
+            with self._lock:
+                self._write_transactions += 1
+                self._write_wait_s += acquired - start
+                if acquired - begin > self.BUSY_WAIT_THRESHOLD_S:
+                    self._busy_waits += 1
+
+            self._local.transaction_depth = 1
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                if isinstance(e, sqlite3.OperationalError):
+                    self._record_error(e)
+                raise
+            finally:
+                self._local.transaction_depth = 0
+        finally:
+            self._write_lock.release()
+
+    def _get_writer(self) -> sqlite3.Connection:
+        """Get the shared writer connection (write lock must be held)"""
+        if self._writer is None:
+            self._writer = self._open(self.ROLE_DEFAULT)
+            with self._lock:
+                self._opened += 1
+        return self._writer
+
+    def _record_error(self, error: sqlite3.OperationalError):
+        if _is_lock_error(error):
+            with self._lock:
+                self._lock_timeouts += 1
+
+    # ==================== STATS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get connection statistics
+
+        Returns:
+            Dict with open connection counts by role and write contention counters
+        """
+        self.close_idle()
+        with self._lock:
+            roles = [role for _, role in self._connections]
+            transactions = self._write_transactions
+            return {
+                'open_connections': len(roles) + (1 if self._writer is not None else 0),
+                'read_connections': roles.count(self.ROLE_READ),
+                'thread_connections': roles.count(self.ROLE_DEFAULT) + roles.count(self.ROLE_LEGACY),
+                'writer_open': self._writer is not None,
+                'opened_total': self._opened,
+                'closed_idle': self._closed_idle,
+                'write_transactions': transactions,
+                'busy_waits': self._busy_waits,
+                'lock_timeouts': self._lock_timeouts,
+                'avg_write_wait_ms': (self._write_wait_s / transactions * 1000) if transactions else 0.0,
+            }
+
+
+# Singleton instance
+_connection_manager_instance: Optional[ConnectionManager] = None
+
+
+def get_connection_manager() -> ConnectionManager:
+    """Get global ConnectionManager singleton instance"""
+    global _connection_manager_instance
+    if _connection_manager_instance is None:
+        _connection_manager_instance = ConnectionManager()
+    return _connection_manager_instance
+
+
+__all__ = ['ConnectionManager', 'get_connection_manager']
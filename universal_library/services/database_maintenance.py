@@ -14,6 +14,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
 
+from .connection_manager import ConnectionManager, get_connection_manager
 from .schema_manager import SchemaManager
 
 
@@ -149,6 +150,13 @@ class DatabaseMaintenance:
         cursor = self._connection.cursor()
         cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
 
+        # Merge full-text index segments before compacting
+        try:
+            cursor.execute("INSERT INTO assets_fts (assets_fts) VALUES ('optimize')")
+            self._connection.commit()
+        except sqlite3.OperationalError:
+            pass  # No search index (FTS5 unavailable)
+
         # Run VACUUM
         self._connection.execute('VACUUM')
         self._connection.commit()
@@ -184,12 +192,14 @@ class DatabaseMaintenance:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = backup_dir / f"database_backup_{timestamp}.db"
 
-        # Use SQLite backup API for consistency
-        source = sqlite3.connect(str(self._db_path))
+        # Use SQLite backup API for consistency, reading through the
+        # library's managed read connection; only the new file is opened here
+        source = get_connection_manager().get_connection(ConnectionManager.ROLE_READ)
         dest = sqlite3.connect(str(backup_path))
-        source.backup(dest)
-        source.close()
-        dest.close()
+        try:
+            source.backup(dest)
+        finally:
+            dest.close()
 
         return backup_path
 
@@ -12,15 +12,15 @@ Refactored to delegate to:
 
 import logging
 import sqlite3
-import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
 from ..config import Config
 from .base_repository import BaseRepository
+from .connection_manager import ConnectionManager, get_connection_manager
 from .asset_repository import AssetRepository
 from .folder_repository import FolderRepository
 from .tag_repository import TagRepository
@@ -62,9 +62,6 @@ class DatabaseService:
         self._tags = TagRepository()
         self._asset_folders = AssetFolderRepository()
 
-        # For backward compatibility with direct connection access
-        self.local = threading.local()
-
         # Initialize sub-modules (lazy - after connection is available)
         self._schema_manager = None
         self._maintenance = None
@@ -78,17 +75,8 @@ class DatabaseService:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection (for schema init and backward compat)"""
-        if not hasattr(self.local, 'connection') or self.local.connection is None:
-            # Thread-local connections ensure thread safety without needing check_same_thread=False
-            self.local.connection = sqlite3.connect(
-                str(self.db_path),
-                timeout=30.0
-            )
-            self.local.connection.execute("PRAGMA foreign_keys = ON")
-            self.local.connection.execute("PRAGMA journal_mode = WAL")
-            self.local.connection.row_factory = sqlite3.Row
-
-        return self.local.connection
+        # Implicit-transaction connection: callers commit/rollback themselves
+        return get_connection_manager().get_connection(ConnectionManager.ROLE_LEGACY)
 
     @contextmanager
     def transaction(self):
@@ -202,6 +190,10 @@ class DatabaseService:
         """Get asset by UUID"""
         return self._assets.get_by_uuid(uuid)
 
+    def get_assets_by_uuids(self, uuids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get many assets by UUID (uuid -> asset) with chunked queries"""
+        return self._assets.get_by_uuids(uuids)
+
     def get_all_assets(self, folder_id: Optional[int] = None,
                        asset_type: Optional[str] = None,
                        include_retired: bool = False) -> List[Dict[str, Any]]:
@@ -221,19 +213,112 @@ class DatabaseService:
         """Update asset metadata"""
         return self._assets.update(uuid, updates)
 
+    def update_assets(self, uuids: List[str], updates: Dict[str, Any]) -> List[str]:
+        """Apply the same updates to many assets in one transaction; returns UUIDs updated"""
+        return self._assets.update_many(uuids, updates)
+
     def delete_asset(self, uuid: str) -> bool:
         """Delete asset by UUID"""
         result = self._assets.delete(uuid)
         return result
 
-    def search_assets(self, query: str) -> List[Dict[str, Any]]:
-        """Search assets by name or description"""
-        return self._assets.search(query)
+    def delete_assets(self, uuids: List[str]) -> Optional[List[str]]:
+        """Delete many assets in one transaction; returns deleted UUIDs (None on failure)"""
+        return self._assets.delete_many(uuids)
+
+    def search_assets(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Search assets by name, description, tags, type or author"""
+        return self._assets.search(query, limit)
+
+    def search_asset_uuids(self, query: str, limit: Optional[int] = None) -> Optional[List[str]]:
+        """Get ranked UUIDs of matching assets (None if the index can't answer)"""
+        return self._assets.search_uuids(query, limit)
 
     def get_asset_count(self, folder_id: Optional[int] = None,
-                        asset_type: Optional[str] = None) -> int:
+                        asset_type: Optional[str] = None,
+                        include_retired: bool = True) -> int:
         """Get count of assets"""
-        return self._assets.get_count(folder_id, asset_type)
+        return self._assets.get_count(folder_id, asset_type, include_retired)
+
+    # ==================== LIBRARY SNAPSHOT ====================
+
+    def get_library_snapshot(self, migrate_legacy_folders: bool = True) -> Dict[str, Any]:
+        """
+        Load everything the asset browser needs using set-based queries.
+
+        Replaces the per-asset get_asset_tags()/get_asset_folders() calls
+        on library load with one query per table, joined in Python.
+
+        Args:
+            migrate_legacy_folders: Add assets that only have a legacy
+                folder_id to the multi-folder system (batched)
+
+        Returns:
+            Dict with:
+                - assets: Asset dicts enriched with tags_v2 and folders_v2
+                - variant_counts: asset_id -> variant count (excluding Base)
+                - tags_with_counts: Tag dicts with usage counts
+        """
+        assets = []
+        for page in self.iter_library_pages(migrate_legacy_folders=migrate_legacy_folders):
+            assets.extend(page)
+
+        return {
+            'assets': assets,
+            'variant_counts': self._assets.get_variant_counts(),
+            'tags_with_counts': self._tags.get_tags_with_counts(),
+        }
+
+    def iter_library_pages(self, page_size: int = 500,
+                           migrate_legacy_folders: bool = True) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate library assets in name order, enriched like get_library_snapshot().
+
+        Tag and folder memberships are loaded once up front; assets are
+        then fetched and hydrated one page at a time.
+
+        Args:
+            page_size: Number of assets per page
+            migrate_legacy_folders: Add assets that only have a legacy
+                folder_id to the multi-folder system (batched per page)
+
+        Yields:
+            Lists of asset dicts with tags_v2 and folders_v2
+        """
+        tags_by_asset = self._tags.get_all_asset_tags()
+        folders_by_asset = self._asset_folders.get_all_asset_folders()
+        folders_by_id = None
+
+        for assets in self._assets.iter_all(page_size):
+            if migrate_legacy_folders:
+                legacy = [
+                    (asset['uuid'], asset['folder_id'])
+                    for asset in assets
+                    if asset.get('uuid') and asset.get('folder_id')
+                    and asset['uuid'] not in folders_by_asset
+                ]
+                if legacy and self._asset_folders.migrate_legacy_folder_ids(legacy):
+                    if folders_by_id is None:
+                        folders_by_id = {
+                            folder['id']: {
+                                'id': folder['id'],
+                                'name': folder.get('name'),
+                                'path': folder.get('path'),
+                                'parent_id': folder.get('parent_id'),
+                            }
+                            for folder in self._folders.get_all()
+                        }
+                    for uuid, folder_id in legacy:
+                        folder = folders_by_id.get(folder_id)
+                        if folder:
+                            folders_by_asset[uuid] = [dict(folder)]
+
+            for asset in assets:
+                uuid = asset.get('uuid')
+                asset['tags_v2'] = tags_by_asset.get(uuid, [])
+                asset['folders_v2'] = folders_by_asset.get(uuid, [])
+
+            yield assets
 
     # ==================== USER FEATURES (delegates to AssetRepository) ====================
 
@@ -245,6 +330,10 @@ class DatabaseService:
         """Set favorite status for an asset"""
         return self._assets.set_favorite(uuid, is_favorite)
 
+    def set_assets_favorite(self, uuids: List[str], is_favorite: bool) -> List[str]:
+        """Set favorite status for many assets in one transaction; returns UUIDs updated"""
+        return self._assets.set_favorite_many(uuids, is_favorite)
+
     def get_favorite_assets(self) -> List[Dict[str, Any]]:
         """Get all favorite assets"""
         return self._assets.get_favorites()
@@ -275,6 +364,10 @@ class DatabaseService:
         """Set lifecycle status for an asset (wip, review, approved, deprecated, archived)"""
         return self._assets.set_status(uuid, status)
 
+    def set_assets_status(self, uuids: List[str], status: str) -> int:
+        """Set lifecycle status for many assets in one transaction; returns number updated"""
+        return self._assets.set_status_many(uuids, status)
+
     def get_assets_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get all assets with a specific status"""
         return self._assets.get_by_status(status)
@@ -512,6 +605,10 @@ class DatabaseService:
         """Get all tags for an asset (with full_path)"""
         return self._tags.get_asset_tags(asset_uuid)
 
+    def get_asset_tags_many(self, asset_uuids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get tags for many assets (asset_uuid -> tags) with chunked queries"""
+        return self._tags.get_asset_tags_many(asset_uuids)
+
     def set_asset_tags(self, asset_uuid: str, tag_ids: List[int]) -> bool:
         """Set all tags for an asset (replaces existing)"""
         return self._tags.set_asset_tags(asset_uuid, tag_ids)
@@ -550,6 +647,10 @@ class DatabaseService:
         """Get all folders for an asset"""
         return self._asset_folders.get_asset_folders(asset_uuid)
 
+    def get_asset_folders_many(self, asset_uuids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Get folders for many assets (asset_uuid -> folders) with chunked queries"""
+        return self._asset_folders.get_asset_folders_many(asset_uuids)
+
     def set_asset_folders(self, asset_uuid: str, folder_ids: List[int]) -> bool:
         """Set all folders for an asset (replaces existing)"""
         return self._asset_folders.set_asset_folders(asset_uuid, folder_ids)
@@ -657,27 +758,38 @@ class DatabaseService:
         Returns:
             True if successful
         """
-        conn = self._get_connection()
         try:
-            conn.execute('''
-                INSERT OR REPLACE INTO app_settings (key, value, updated_at)
-                VALUES (?, ?, CURRENT_TIMESTAMP)
-            ''', (key, value))
-            conn.commit()
+            with get_connection_manager().transaction() as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO app_settings (key, value, updated_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                ''', (key, value))
             return True
         except Exception as e:
             logger.warning(f"Failed to set app setting {key}: {e}")
             return False
 
     def close(self):
-        """Close database connections"""
-        if hasattr(self.local, 'connection') and self.local.connection:
-            self.local.connection.close()
-            self.local.connection = None
-        self._assets.close()
-        self._folders.close()
-        self._tags.close()
-        self._asset_folders.close()
+        """Close database connections for current thread"""
+        get_connection_manager().close_thread()
+
+    def get_data_version(self) -> Tuple[int, int, int]:
+        """
+        Get a token that changes whenever the library database is written
+
+        Returns:
+            Opaque token; compare with a previous value for equality
+        """
+        return get_connection_manager().get_data_version()
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """
+        Get library database connection statistics
+
+        Returns:
+            Dict with open connections, busy waits and lock timeouts
+        """
+        return get_connection_manager().get_stats()
 
 
 # Singleton instance
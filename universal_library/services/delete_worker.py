@@ -0,0 +1,56 @@
+"""
+DeleteWorker - Background batch delete
+
+Pattern: Single-shot QThread worker
+Runs AssetManager.delete_assets_complete() off the UI thread so the
+window keeps painting delete progress without re-entering the event loop.
+Only the database and file work runs here: the deleted UUIDs go back to
+the GUI thread, which sends the change notifications.
+"""
+
+import logging
+from typing import List
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .asset_manager import get_asset_manager
+from .database_service import get_database_service
+
+logger = logging.getLogger(__name__)
+
+
+class DeleteWorker(QThread):
+    """
+    Background worker for one complete delete of many assets
+
+    Deletes are not cancellable: once started the batch runs to the end,
+    so callers wait for it (e.g. on window close).
+
+    Signals:
+        progress(done, total): File work progress
+        delete_finished(deleted_uuids, deleted_count, total_count): Emitted
+            when done; deleted_uuids are every database record removed
+    """
+
+    progress = pyqtSignal(int, int)
+    delete_finished = pyqtSignal(list, int, int)
+
+    def __init__(self, uuids: List[str], parent=None):
+        super().__init__(parent)
+        self._uuids = list(uuids)
+
+    def run(self):
+        deleted, deleted_count, total = [], 0, len(self._uuids)
+        try:
+            deleted, deleted_count, total = get_asset_manager().delete_assets_complete(
+                self._uuids, progress_callback=self.progress.emit
+            )
+        except Exception as e:
+            logger.error(f"Batch delete failed: {e}")
+        finally:
+            # Release this thread's connections; the worker thread is not reused
+            get_database_service().close()
+            self.delete_finished.emit(deleted, deleted_count, total)
+
+
+__all__ = ['DeleteWorker']
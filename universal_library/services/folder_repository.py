@@ -42,11 +42,12 @@ class FolderRepository(BaseRepository):
         # No root folder exists, create one
         try:
             now = datetime.now()
-            cursor.execute('''
-                INSERT INTO folders (name, parent_id, path, created_date, modified_date)
-                VALUES (?, ?, ?, ?, ?)
-            ''', ("Root", None, "", now, now))
-            conn.commit()
+            with self._transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT INTO folders (name, parent_id, path, created_date, modified_date)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', ("Root", None, "", now, now))
             return cursor.lastrowid
         except sqlite3.IntegrityError:
             cursor.execute('SELECT id FROM folders WHERE parent_id IS NULL LIMIT 1')
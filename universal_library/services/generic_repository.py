@@ -126,17 +126,7 @@ class GenericRepository(BaseRepository):
 
         cursor.execute(query, params)
 
-        entities = []
-        for row in cursor.fetchall():
-            data = dict(row)
-            # Load dynamic metadata for each
-            uuid = data.get('uuid')
-            if uuid:
-                dynamic = self._metadata_service.get_entity_metadata(uuid)
-                data.update(dynamic)
-            entities.append(self._entity_class(data))
-
-        return entities
+        return self._rows_to_entities(cursor.fetchall())
 
     def save(self, entity: Entity) -> bool:
         """
@@ -307,16 +297,7 @@ class GenericRepository(BaseRepository):
 
         cursor.execute(query, params)
 
-        entities = []
-        for row in cursor.fetchall():
-            data = dict(row)
-            uuid = data.get('uuid')
-            if uuid:
-                dynamic = self._metadata_service.get_entity_metadata(uuid)
-                data.update(dynamic)
-            entities.append(self._entity_class(data))
-
-        return entities
+        return self._rows_to_entities(cursor.fetchall())
 
     def _find_by_dynamic_field(
         self,
@@ -367,6 +348,22 @@ class GenericRepository(BaseRepository):
         )
         return cursor.fetchone() is not None
 
+    def _rows_to_entities(self, rows) -> List[Entity]:
+        """Build entities from rows, loading dynamic metadata in bulk."""
+        items = [dict(row) for row in rows]
+        dynamic_by_uuid = self._metadata_service.get_entities_metadata(
+            [data.get('uuid') for data in items]
+        )
+
+        entities = []
+        for data in items:
+            dynamic = dynamic_by_uuid.get(data.get('uuid'))
+            if dynamic:
+                data.update(dynamic)
+            entities.append(self._entity_class(data))
+
+        return entities
+
 
 def get_generic_repository(entity_type: str) -> GenericRepository:
     """
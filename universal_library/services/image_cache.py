@@ -0,0 +1,257 @@
+"""
+ImageCache - One memory budget for every in-memory image cache
+
+Pattern: Singleton byte-budgeted LRU with per-consumer quotas and pinning
+Thumbnails, version previews and review screenshots share one budget
+(Config.IMAGE_CACHE_BUDGET_MB) instead of separate unbounded caches, so
+browsing large review sessions can't grow memory without limit. Each
+consumer also has a quota so one can't push the others out; entries on
+screen are pinned and only evicted after everything else.
+"""
+
+import itertools
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, Union
+
+from PyQt6.QtGui import QImage, QPixmap
+
+from ..config import Config
+
+Image = Union[QPixmap, QImage]
+
+_MB = 1024 * 1024
+
+
+class _Consumer:
+    """Entries and accounting of one consumer"""
+
+    __slots__ = ('name', 'quota', 'entries', 'bytes', 'pinned',
+                 'hits', 'misses', 'evictions')
+
+    def __init__(self, name: str, quota: int):
+        self.name = name
+        self.quota = quota  # Bytes; 0 = only the global budget applies
+        self.entries: 'OrderedDict[str, Tuple[Image, int, int]]' = OrderedDict()  # key -> (image, bytes, tick)
+        self.bytes = 0
+        self.pinned: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def oldest_unpinned(self) -> Optional[Tuple[str, int]]:
+        """(key, tick) of the least recently used entry not pinned"""
+        for key, (_, _, tick) in self.entries.items():
+            if key not in self.pinned:
+                return key, tick
+        return None
+
+
+class ImageCache:
+    """
+    Shared LRU cache of QPixmaps and QImages, bounded in bytes
+
+    Entries are evicted least recently used first, within the consumer
+    when it exceeds its quota and across consumers when the total
+    exceeds the budget. Pinned entries are never evicted; pin what is
+    on screen and the budget may be exceeded only by visible images.
+    Only use from the GUI thread.
+
+    Usage:
+        cache = get_image_cache()
+        pixmap = cache.get('previews', key)
+        if pixmap is None:
+            pixmap = cache.put('previews', key, QPixmap.fromImage(image))
+    """
+
+    def __init__(self, budget_mb: Optional[int] = None,
+                 quotas_mb: Optional[Dict[str, int]] = None):
+        self._budget = (budget_mb or Config.IMAGE_CACHE_BUDGET_MB) * _MB
+        self._quotas_mb = dict(Config.IMAGE_CACHE_QUOTAS_MB if quotas_mb is None else quotas_mb)
+        self._consumers: Dict[str, _Consumer] = {}
+        self._tick = itertools.count()
+        self._bytes = 0
+        self._peak_bytes = 0
+
+    @property
+    def budget_bytes(self) -> int:
+        """Global budget in bytes"""
+        return self._budget
+
+    def _consumer(self, name: str) -> _Consumer:
+        consumer = self._consumers.get(name)
+        if consumer is None:
+            consumer = _Consumer(name, self._quotas_mb.get(name, 0) * _MB)
+            self._consumers[name] = consumer
+        return consumer
+
+    @staticmethod
+    def _cost(image: Image) -> int:
+        return image.width() * image.height() * max(image.depth(), 8) // 8
+
+    def get(self, consumer: str, key: str) -> Optional[Image]:
+        """
+        Look up an image
+
+        Args:
+            consumer: Consumer name (e.g. 'thumbnails')
+            key: Consumer-defined key
+
+        Returns:
+            Cached image, or None on a miss
+        """
+        owner = self._consumer(consumer)
+        entry = owner.entries.get(key)
+        if entry is None:
+            owner.misses += 1
+            return None
+        owner.entries[key] = (entry[0], entry[1], next(self._tick))
+        owner.entries.move_to_end(key)
+        owner.hits += 1
+        return entry[0]
+
+    def peek(self, consumer: str, key: str) -> Optional[Image]:
+        """
+        Look up an image without counting a hit or miss or refreshing it
+
+        For probing alternatives (e.g. other sizes of the same image).
+
+        Args:
+            consumer: Consumer name
+            key: Consumer-defined key
+
+        Returns:
+            Cached image, or None
+        """
+        entry = self._consumer(consumer).entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, consumer: str, key: str, image: Image) -> Image:
+        """
+        Store an image, evicting older entries to stay within budget
+
+        Args:
+            consumer: Consumer name
+            key: Consumer-defined key
+            image: QPixmap or QImage
+
+        Returns:
+            The stored image (for chaining)
+        """
+        owner = self._consumer(consumer)
+        self.remove(consumer, key)
+        if image.isNull():
+            return image
+
+        cost = self._cost(image)
+        owner.entries[key] = (image, cost, next(self._tick))
+        owner.bytes += cost
+        self._bytes += cost
+        self._peak_bytes = max(self._peak_bytes, self._bytes)
+        self._evict(owner)
+        return image
+
+    def remove(self, consumer: str, key: str):
+        """
+        Drop one entry
+
+        Args:
+            consumer: Consumer name
+            key: Consumer-defined key
+        """
+        owner = self._consumer(consumer)
+        entry = owner.entries.pop(key, None)
+        if entry is not None:
+            owner.bytes -= entry[1]
+            self._bytes -= entry[1]
+
+    def clear(self, consumer: Optional[str] = None):
+        """
+        Drop every entry of a consumer, or of all consumers
+
+        Args:
+            consumer: Consumer name, or None for all
+        """
+        owners = [self._consumer(consumer)] if consumer else list(self._consumers.values())
+        for owner in owners:
+            self._bytes -= owner.bytes
+            owner.entries.clear()
+            owner.bytes = 0
+
+    def set_pinned(self, consumer: str, keys: Iterable[str]):
+        """
+        Replace the keys a consumer keeps pinned (e.g. what is on screen)
+
+        Keys may be pinned before they are stored.
+
+        Args:
+            consumer: Consumer name
+            keys: Keys to pin; an empty iterable unpins everything
+        """
+        owner = self._consumer(consumer)
+        owner.pinned = set(keys)
+        self._evict(owner)
+
+    def _evict(self, owner: _Consumer):
+        """Evict LRU entries of an over-quota consumer, then across consumers"""
+        while owner.quota and owner.bytes > owner.quota:
+            oldest = owner.oldest_unpinned()
+            if oldest is None:
+                break
+            self._drop(owner, oldest[0])
+
+        while self._bytes > self._budget:
+            victim = None
+            for candidate in self._consumers.values():
+                oldest = candidate.oldest_unpinned()
+                if oldest is not None and (victim is None or oldest[1] < victim[2]):
+                    victim = (candidate, oldest[0], oldest[1])
+            if victim is None:
+                break  # Only pinned entries left
+            self._drop(victim[0], victim[1])
+
+    def _drop(self, owner: _Consumer, key: str):
+        self.remove(owner.name, key)
+        owner.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with budget, usage and peak in MB plus per-consumer counters
+        """
+        consumers = {}
+        for name, owner in sorted(self._consumers.items()):
+            lookups = owner.hits + owner.misses
+            consumers[name] = {
+                'entries': len(owner.entries),
+                'used_mb': owner.bytes / _MB,
+                'quota_mb': owner.quota / _MB,
+                'pinned': len(owner.pinned.intersection(owner.entries)),
+                'hits': owner.hits,
+                'misses': owner.misses,
+                'hit_rate': (owner.hits / lookups * 100) if lookups else 0,
+                'evictions': owner.evictions,
+            }
+        return {
+            'budget_mb': self._budget / _MB,
+            'used_mb': self._bytes / _MB,
+            'peak_mb': self._peak_bytes / _MB,
+            'entries': sum(c['entries'] for c in consumers.values()),
+            'consumers': consumers,
+        }
+
+
+# Singleton instance
+_image_cache_instance: Optional[ImageCache] = None
+
+
+def get_image_cache() -> ImageCache:
+    """Get global ImageCache singleton instance"""
+    global _image_cache_instance
+    if _image_cache_instance is None:
+        _image_cache_instance = ImageCache()
+    return _image_cache_instance
+
+
+__all__ = ['ImageCache', 'get_image_cache']
@@ -0,0 +1,395 @@
+"""
+IndexedDiskCache - Base for size-bounded file caches with a packed index
+
+Pattern: LRU cache backed by one file per entry plus one packed index
+Subclasses (ThumbnailDiskCache, MeshDiskCache) define the key, the index
+record layout and how a file name maps back to an entry; this base owns
+the index file, LRU eviction, stats and crash recovery.
+
+The cache folders live under the library and are shared by every app
+instance using that library, so the index on disk is only trusted when
+nothing could have written files it doesn't list:
+
+- Before writing a file, a process touches its own 'dirty-<token>'
+  marker. It removes it at save_index() only if nothing is left
+  unindexed: no writes in flight, no file it failed to delete, and no
+  other process rewrote the index since it was read (the index header
+  carries the writer's token).
+- On first use, any dirty marker (a crashed or still running instance)
+  or a missing index makes the cache scan its folder: unindexed files
+  are adopted if they validate, and deleted otherwise.
+"""
+
+import logging
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class IndexedDiskCache:
+    """
+    Size-bounded on-disk cache with a persisted LRU index
+
+    Subclasses set INDEX_MAGIC, INDEX_VERSION, SAVE_EVERY and LABEL, and
+    implement the hooks in the SUBCLASS HOOKS section. Entries must have
+    `mtime_ns` and `nbytes` attributes; a newer mtime_ns supersedes an
+    older file of the same key.
+    """
+
+    INDEX_FILE = 'index.bin'
+    DIRTY_PREFIX = 'dirty-'  # Per-process marker: files may exist outside the index
+    INDEX_MAGIC = b'ULXX'
+    INDEX_VERSION = 1
+    _HEADER = struct.Struct('<4sHI8s')  # magic, version, entry count, writer token
+
+    # Persist the index after this many changes (and on save_index())
+    SAVE_EVERY = 64
+
+    # Temp files younger than this may belong to another instance's write
+    STALE_TEMP_SECONDS = 3600
+
+    LABEL = 'disk cache'  # For log messages
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._unsaved_changes = 0
+        self._writes_in_flight = 0
+        self._orphaned = False  # A file could not be deleted
+        self._token = os.urandom(8)  # Identifies this instance's index writes
+        self._index_token: Optional[bytes] = None  # Writer of the index as last read or written
+        self._shared = False  # Another process rewrote the index this session
+        self._dirty = False  # Our dirty marker is on disk
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    # ==================== SUBCLASS HOOKS ====================
+
+    def _default_cache_dir(self) -> Path:
+        raise NotImplementedError
+
+    def _max_size_mb(self) -> int:
+        raise NotImplementedError
+
+    def _entry_path(self, key: Hashable, entry: Any) -> Path:
+        """Path of the file holding `entry`"""
+        raise NotImplementedError
+
+    def _pack_record(self, key: Hashable, entry: Any) -> bytes:
+        raise NotImplementedError
+
+    def _unpack_record(self, data: bytes, offset: int) -> Tuple[Hashable, Any, int]:
+        """Decode one index record at `offset`; returns (key, entry, next offset)"""
+        raise NotImplementedError
+
+    def _recover_file(self, path: Path) -> Optional[Tuple[Hashable, Any]]:
+        """(key, entry) for a valid unindexed file, or None to delete it"""
+        raise NotImplementedError
+
+    # ==================== PUBLIC ====================
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding the index and cached files"""
+        if self._cache_dir is None:
+            self._cache_dir = self._default_cache_dir()
+        return self._cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        """Size budget for cached files"""
+        return self._max_size_mb() * 1024 * 1024
+
+    def clear(self):
+        """Remove every cached file and the index"""
+        with self._lock:
+            self._ensure_loaded()
+            for key in list(self._entries):
+                self._drop(key)
+            self._unlink(self.cache_dir / self.INDEX_FILE)
+            self._index_token = None
+            self._unsaved_changes = 0
+
+    def save_index(self):
+        """Write the index file if it has unsaved changes, and drop our dirty marker if nothing is unindexed"""
+        with self._lock:
+            if not self._loaded:
+                return
+            if self._unsaved_changes:
+                self._write_index()
+            if self._shared or self._orphaned:
+                self._mark_dirty()  # Leave recovery to the next start
+            elif self._dirty and not self._unsaved_changes and not self._writes_in_flight:
+                self._unlink(self._dirty_path())
+                self._dirty = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with entry count, size and hit/miss counters
+        """
+        with self._lock:
+            self._ensure_loaded()
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'size_mb': self._total_bytes / (1024 * 1024),
+                'max_size_mb': self._max_size_mb(),
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': (self._hits / lookups * 100) if lookups else 0,
+                'writes': self._writes,
+                'evictions': self._evictions,
+            }
+
+    # ==================== LOOKUP / STORE HELPERS ====================
+
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        """Entry for `key`, moved to the recently used end (lock must be held)"""
+        self._ensure_loaded()
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _read_failed(self, key: Hashable, entry: Any):
+        """Drop an entry whose file couldn't be read (lock must be held)
+
+        The read happens outside the lock, so a concurrent put() may have
+        replaced the entry meanwhile; only the entry that was read is dropped.
+        """
+        if self._entries.get(key) is entry:
+            self._drop(key)
+        self._misses += 1
+
+    def _begin_write(self):
+        """Call before writing cache files (lock must be held)"""
+        self._ensure_loaded()  # Its file recovery must not race the write
+        self._mark_dirty()
+        self._writes_in_flight += 1
+
+    def _store(self, key: Hashable, entry: Any):
+        """Index a written file, deleting the one it replaces (lock must be held)"""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._total_bytes -= old.nbytes
+            old_path = self._entry_path(key, old)
+            if old_path != self._entry_path(key, entry):
+                self._unlink(old_path)
+        self._entries[key] = entry
+        self._total_bytes += entry.nbytes
+        self._writes += 1
+
+    def _end_write(self, stored: int):
+        """Call after a write started with _begin_write (lock must be held)"""
+        self._writes_in_flight -= 1
+        self._evict()
+        if stored:
+            self._changed(stored)
+
+    # ==================== INDEX ====================
+
+    def _dirty_path(self) -> Path:
+        return self.cache_dir / f"{self.DIRTY_PREFIX}{self._token.hex()}"
+
+    def _mark_dirty(self):
+        """Touch our dirty marker before files are written (lock must be held)
+
+        Touched on every write rather than once: another instance's
+        recovery removes markers it has accounted for.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._dirty_path().touch()
+            self._dirty = True
+        except OSError as e:
+            logger.debug(f"Failed to write {self.LABEL} marker: {e}")
+
+    def _ensure_loaded(self):
+        """Read the index on first use, recovering files if it can't be trusted (lock must be held)"""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        index_path = self.cache_dir / self.INDEX_FILE
+        try:
+            data = index_path.read_bytes()
+        except FileNotFoundError:
+            data = b''
+        except OSError as e:
+            logger.warning(f"Failed to read {self.LABEL} index: {e}")
+            return
+
+        if data:
+            try:
+                magic, version, count, token = self._HEADER.unpack_from(data, 0)
+                if magic != self.INDEX_MAGIC or version != self.INDEX_VERSION:
+                    logger.info(f"{self.LABEL.capitalize()} index has an unknown format, starting empty")
+                    count = 0
+                    data = b''
+                else:
+                    self._index_token = token
+                offset = self._HEADER.size
+                for _ in range(count):
+                    key, entry, offset = self._unpack_record(data, offset)
+                    # Stored least recently used first
+                    self._entries[key] = entry
+                    self._total_bytes += entry.nbytes
+            except (struct.error, UnicodeDecodeError, ValueError) as e:
+                logger.warning(f"{self.LABEL.capitalize()} index is corrupt, starting empty: {e}")
+                self._entries.clear()
+                self._total_bytes = 0
+                self._index_token = None
+                data = b''
+
+        # Scanning the folder (possibly on a network share) is only needed
+        # if some instance may have left files outside the index
+        try:
+            markers = list(self.cache_dir.glob(f"{self.DIRTY_PREFIX}*"))
+        except OSError:
+            markers = []
+        if not data or markers:
+            # Removed first: an instance still running re-marks before its next write
+            for marker in markers:
+                self._unlink(marker)
+            self._recover_files()
+        self._evict()
+
+    def _recover_files(self):
+        """Adopt valid files the index doesn't know, delete the rest (lock must be held)
+
+        Unindexed files are left by a crash between index saves, by another
+        instance whose index was overwritten, or by interrupted writes (temp
+        files). Adopted entries go to the least recently used end, so they
+        are evicted first.
+        """
+        known = {self._entry_path(key, entry) for key, entry in self._entries.items()}
+        try:
+            subdirs = [d for d in self.cache_dir.iterdir() if d.is_dir()]
+        except OSError:
+            return
+
+        adopted = 0
+        for path in self._iter_files(subdirs):
+            if path in known:
+                continue
+            if path.suffix == '.tmp':
+                if self._is_stale(path):
+                    self._unlink(path)
+                continue
+            recovered = self._recover_file(path)
+            if recovered is None:
+                self._unlink(path)
+                continue
+            key, entry = recovered
+            current = self._entries.get(key)
+            if current is not None and current.mtime_ns >= entry.mtime_ns:
+                self._unlink(path)  # Superseded by the indexed version
+                continue
+            if current is not None:
+                self._drop(key)  # Written after the index was saved; this one is newer
+            self._entries[key] = entry
+            self._entries.move_to_end(key, last=False)
+            self._total_bytes += entry.nbytes
+            adopted += 1
+
+        if adopted:
+            logger.info(f"Recovered {adopted} unindexed {self.LABEL} file(s)")
+            self._changed(adopted)
+
+    @staticmethod
+    def _iter_files(subdirs) -> Iterator[Path]:
+        for subdir in subdirs:
+            try:
+                yield from subdir.iterdir()
+            except OSError:
+                continue
+
+    def _is_stale(self, path: Path) -> bool:
+        try:
+            return time.time() - path.stat().st_mtime > self.STALE_TEMP_SECONDS
+        except OSError:
+            return False
+
+    def _write_index(self):
+        """Write the packed index atomically (lock must be held)"""
+        index_path = self.cache_dir / self.INDEX_FILE
+        if self._read_index_token(index_path) != self._index_token:
+            # Another instance saved its view since ours was read; files
+            # only it knows are now unindexed until the next recovery
+            self._shared = True
+
+        parts = [self._HEADER.pack(self.INDEX_MAGIC, self.INDEX_VERSION,
+                                   len(self._entries), self._token)]
+        parts.extend(self._pack_record(key, entry) for key, entry in self._entries.items())
+
+        tmp_path = index_path.with_name(f"{index_path.name}.{self._token.hex()}.tmp")
+        try:
+            tmp_path.write_bytes(b''.join(parts))
+            os.replace(tmp_path, index_path)
+            self._index_token = self._token
+            self._unsaved_changes = 0
+        except OSError as e:
+            logger.warning(f"Failed to write {self.LABEL} index: {e}")
+
+    def _read_index_token(self, index_path: Path) -> Optional[bytes]:
+        """Writer token of the index on disk, None if absent or unreadable"""
+        try:
+            with open(index_path, 'rb') as f:
+                magic, version, _, token = self._HEADER.unpack(f.read(self._HEADER.size))
+        except (OSError, struct.error):
+            return None
+        if magic != self.INDEX_MAGIC or version != self.INDEX_VERSION:
+            return None
+        return token
+
+    def _changed(self, count: int = 1):
+        """Count index changes, saving every SAVE_EVERY (lock must be held)"""
+        self._unsaved_changes += count
+        if self._unsaved_changes >= self.SAVE_EVERY:
+            self._write_index()
+
+    # ==================== EVICTION ====================
+
+    def _evict(self):
+        """Drop least recently used entries over budget (lock must be held)"""
+        budget = self.max_bytes
+        while self._total_bytes > budget and self._entries:
+            self._drop(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _drop(self, key: Hashable):
+        """Remove an entry and its file (lock must be held)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._total_bytes -= entry.nbytes
+        self._unlink(self._entry_path(key, entry))
+        self._changed()
+
+    def _unlink(self, path: Path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # Left behind outside the index; recover it next start
+            self._orphaned = True
+            logger.debug(f"Failed to remove {self.LABEL} file {path}: {e}")
+
+
+__all__ = ['IndexedDiskCache']
@@ -0,0 +1,86 @@
+"""
+LibraryLoader - Progressive background library loading
+
+Pattern: QThread worker streaming pages to the UI thread
+Keeps the main window responsive while large libraries load.
+"""
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .database_service import get_database_service
+
+
+class LibraryLoadWorker(QThread):
+    """
+    Background worker that streams library assets in pages
+
+    Runs on its own thread, so repositories hand it a separate
+    thread-local SQLite connection. Pages are delivered through queued
+    signals and can be appended to AssetListModel as they arrive.
+
+    Signals:
+        load_started(total, variant_counts): Emitted before the first page
+        page_loaded(assets, loaded, total): Emitted for each page
+        load_finished(tags_with_counts, loaded): Emitted after the last page
+        load_failed(message): Emitted if loading raised
+    """
+
+    load_started = pyqtSignal(int, dict)
+    page_loaded = pyqtSignal(list, int, int)
+    load_finished = pyqtSignal(list, int)
+    load_failed = pyqtSignal(str)
+
+    # Small first page so visible cards appear quickly, then larger pages
+    FIRST_PAGE_SIZE = 200
+    PAGE_SIZE = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop after the current page; no further signals are emitted"""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """Check if the load was cancelled"""
+        return self._cancelled
+
+    def run(self):
+        db_service = get_database_service()
+        try:
+            total = db_service.get_asset_count(include_retired=False)
+            variant_counts = db_service.get_variant_counts()
+            if self._cancelled:
+                return
+            self.load_started.emit(total, variant_counts)
+
+            loaded = 0
+            pending = []
+            for page in db_service.iter_library_pages(self.FIRST_PAGE_SIZE):
+                if self._cancelled:
+                    return
+                pending.extend(page)
+                # Emit the first page immediately, then batch into larger pages
+                if loaded == 0 or len(pending) >= self.PAGE_SIZE:
+                    loaded += len(pending)
+                    self.page_loaded.emit(pending, loaded, max(total, loaded))
+                    pending = []
+
+            if pending and not self._cancelled:
+                loaded += len(pending)
+                self.page_loaded.emit(pending, loaded, max(total, loaded))
+
+            if self._cancelled:
+                return
+            self.load_finished.emit(db_service.get_tags_with_counts(), loaded)
+
+        except Exception as e:
+            if not self._cancelled:
+                self.load_failed.emit(f"Failed to load library: {e}")
+        finally:
+            # Release this thread's connections; the worker thread is not reused
+            db_service.close()
+
+
+__all__ = ['LibraryLoadWorker']
@@ -9,7 +9,7 @@ Handles:
 """
 
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from .base_repository import BaseRepository
 
 
@@ -326,23 +326,65 @@ class MetadataService(BaseRepository):
 
         result = {}
         for row in cursor.fetchall():
-            field_name = row[0]
-            field_type = row[1]
-
-            # Extract value based on type
-            if field_type == 'integer':
-                result[field_name] = row[3]
-            elif field_type == 'real':
-                result[field_name] = row[4]
-            elif field_type == 'boolean':
-                result[field_name] = bool(row[3]) if row[3] is not None else None
-            elif field_type == 'json':
-                result[field_name] = json.loads(row[5]) if row[5] else None
-            else:  # string
-                result[field_name] = row[2]
+            result[row[0]] = self._extract_value(row[1], row[2], row[3], row[4], row[5])
 
         return result
 
+    def get_entities_metadata(self, entity_uuids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get dynamic metadata for many entities at once.
+
+        Bulk counterpart of get_entity_metadata() for list reads. UUIDs are
+        queried in chunks so the statement stays under SQLite's bound
+        parameter limit.
+
+        Args:
+            entity_uuids: Entity UUIDs
+
+        Returns:
+            Dictionary of entity_uuid -> {field_name -> value}. Entities
+            without metadata are omitted.
+        """
+        uuids = list(dict.fromkeys(u for u in entity_uuids if u))
+        if not uuids:
+            return {}
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(uuids), self.UUID_CHUNK_SIZE):
+            chunk = uuids[start:start + self.UUID_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f'''
+                SELECT em.entity_uuid, mf.field_name, mf.field_type,
+                       em.value_text, em.value_int, em.value_real, em.value_json
+                FROM entity_metadata em
+                JOIN metadata_fields mf ON em.field_id = mf.id
+                WHERE em.entity_uuid IN ({placeholders})
+            ''', chunk)
+
+            for row in cursor.fetchall():
+                results.setdefault(row[0], {})[row[1]] = self._extract_value(
+                    row[2], row[3], row[4], row[5], row[6]
+                )
+
+        return results
+
+    @staticmethod
+    def _extract_value(field_type: str, value_text, value_int, value_real, value_json) -> Any:
+        """Pick the typed value column for a field type."""
+        if field_type == 'integer':
+            return value_int
+        elif field_type == 'real':
+            return value_real
+        elif field_type == 'boolean':
+            return bool(value_int) if value_int is not None else None
+        elif field_type == 'json':
+            return json.loads(value_json) if value_json else None
+        else:  # string
+            return value_text
+
     def set_entity_metadata(
         self,
         entity_uuid: str,
@@ -398,21 +440,9 @@ class MetadataService(BaseRepository):
 
                 field_id, field_type = row
 
-                # Prepare value columns
-                value_text = value_int = value_real = value_json = None
-
-                if value is None:
-                    pass  # All nulls
-                elif field_type == 'integer':
-                    value_int = int(value)
-                elif field_type == 'real':
-                    value_real = float(value)
-                elif field_type == 'boolean':
-                    value_int = 1 if value else 0
-                elif field_type == 'json':
-                    value_json = json.dumps(value)
-                else:  # string
-                    value_text = str(value)
+                value_text, value_int, value_real, value_json = self._encode_value(
+                    field_type, value
+                )
 
                 # Upsert
                 cursor.execute('''
@@ -432,6 +462,107 @@ class MetadataService(BaseRepository):
         except Exception as e:
             return False
 
+    def set_entities_metadata(
+        self,
+        entity_uuids: List[str],
+        entity_type: str,
+        metadata: Dict[str, Any],
+        conn: Any = None
+    ) -> bool:
+        """
+        Set the same dynamic metadata on many entities.
+
+        Field definitions are resolved once and all values are written
+        with a single executemany.
+
+        Args:
+            entity_uuids: Entity UUIDs
+            entity_type: Entity type name
+            metadata: Dictionary of field_name -> value
+            conn: Optional external connection (for participating in existing transaction)
+
+        Returns:
+            True if successful
+        """
+        if conn is not None:
+            return self._set_entities_metadata_with_conn(entity_uuids, entity_type, metadata, conn)
+
+        try:
+            with self._transaction() as conn:
+                return self._set_entities_metadata_with_conn(
+                    entity_uuids, entity_type, metadata, conn
+                )
+        except Exception as e:
+            return False
+
+    def _set_entities_metadata_with_conn(
+        self,
+        entity_uuids: List[str],
+        entity_type: str,
+        metadata: Dict[str, Any],
+        conn: Any
+    ) -> bool:
+        """Internal method to set metadata on many entities using provided connection."""
+        try:
+            cursor = conn.cursor()
+
+            params = []
+            for field_name, value in metadata.items():
+                cursor.execute('''
+                    SELECT mf.id, mf.field_type FROM metadata_fields mf
+                    JOIN entity_types et ON mf.entity_type_id = et.id
+                    WHERE et.name = ? AND mf.field_name = ?
+                ''', (entity_type, field_name))
+
+                row = cursor.fetchone()
+                if not row:
+                    continue
+
+                field_id, field_type = row
+                values = self._encode_value(field_type, value)
+                params.extend(
+                    (entity_type, entity_uuid, field_id, *values)
+                    for entity_uuid in entity_uuids
+                )
+
+            if params:
+                cursor.executemany('''
+                    INSERT INTO entity_metadata
+                    (entity_type, entity_uuid, field_id, value_text, value_int, value_real, value_json)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(entity_uuid, field_id) DO UPDATE SET
+                        value_text = excluded.value_text,
+                        value_int = excluded.value_int,
+                        value_real = excluded.value_real,
+                        value_json = excluded.value_json,
+                        modified_date = CURRENT_TIMESTAMP
+                ''', params)
+
+            return True
+
+        except Exception as e:
+            return False
+
+    @staticmethod
+    def _encode_value(field_type: str, value: Any) -> Tuple[Any, Any, Any, Any]:
+        """Split a value into (value_text, value_int, value_real, value_json) columns."""
+        value_text = value_int = value_real = value_json = None
+
+        if value is None:
+            pass  # All nulls
+        elif field_type == 'integer':
+            value_int = int(value)
+        elif field_type == 'real':
+            value_real = float(value)
+        elif field_type == 'boolean':
+            value_int = 1 if value else 0
+        elif field_type == 'json':
+            value_json = json.dumps(value)
+        else:  # string
+            value_text = str(value)
+
+        return value_text, value_int, value_real, value_json
+
     def delete_entity_metadata(self, entity_uuid: str) -> bool:
         """Delete all metadata for an entity."""
         try:
@@ -0,0 +1,134 @@
+"""
+PathInfoCache - Cached file existence and mtime lookups
+
+Pattern: Singleton TTL cache in front of os.stat()
+Keeps filesystem calls out of paint paths: thumbnail requests ask this
+cache instead of stat-ing the file on every repaint, which is costly on
+network (SMB/NFS) library roots.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from ..config import Config
+
+
+class PathInfo(NamedTuple):
+    """Snapshot of a file's metadata"""
+    exists: bool
+    mtime_ns: int
+    size: int
+
+
+_MISSING = PathInfo(False, 0, 0)
+
+
+class PathInfoCache:
+    """
+    TTL cache of (exists, mtime, size) per path
+
+    Entries are refreshed with a single os.stat() once older than
+    Config.PATH_INFO_TTL_S, or sooner when invalidated by a change
+    notification (asset updated, refresh, thumbnail regenerated).
+
+    Usage:
+        info = get_path_info_cache().get(path)
+        if info.exists:
+            key = f"{uuid}_{info.mtime_ns}"
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[PathInfo, float]] = {}  # path -> (info, expires)
+
+        self._lookups = 0
+        self._stat_calls = 0
+
+    @property
+    def ttl(self) -> float:
+        """Seconds an entry is trusted without a stat"""
+        return Config.PATH_INFO_TTL_S if self._ttl is None else self._ttl
+
+    def get(self, path) -> PathInfo:
+        """
+        Get metadata of a file
+
+        Args:
+            path: File path (str or Path)
+
+        Returns:
+            PathInfo (exists=False if the file is missing or unreadable)
+        """
+        key = str(path)
+        now = time.monotonic()
+        with self._lock:
+            self._lookups += 1
+            cached = self._entries.get(key)
+            if cached is not None and cached[1] > now:
+                return cached[0]
+
+        info = self._stat(key)
+        with self._lock:
+            self._stat_calls += 1
+            self._entries[key] = (info, now + self.ttl)
+        return info
+
+    @staticmethod
+    def _stat(path: str) -> PathInfo:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return _MISSING
+        return PathInfo(True, st.st_mtime_ns, st.st_size)
+
+    def invalidate(self, path=None):
+        """
+        Drop cached metadata so the next lookup stats again
+
+        Args:
+            path: File path, or None for all paths
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with lookups, stat() calls and entry count
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'lookups': self._lookups,
+                'stat_calls': self._stat_calls,
+                'stats_per_lookup': (self._stat_calls / self._lookups) if self._lookups else 0,
+            }
+
+    def reset_stats(self):
+        """Reset lookup and stat() counters"""
+        with self._lock:
+            self._lookups = 0
+            self._stat_calls = 0
+
+
+# Singleton instance
+_path_info_cache_instance: Optional[PathInfoCache] = None
+
+
+def get_path_info_cache() -> PathInfoCache:
+    """Get global PathInfoCache singleton instance"""
+    global _path_info_cache_instance
+    if _path_info_cache_instance is None:
+        _path_info_cache_instance = PathInfoCache()
+    return _path_info_cache_instance
+
+
+__all__ = ['PathInfo', 'PathInfoCache', 'get_path_info_cache']
@@ -23,6 +23,7 @@ class AssetColdStorage:
         self,
         get_connection: Callable[[], sqlite3.Connection],
         row_to_dict: Callable,
+        rows_to_dicts: Callable,
     ):
         """
         Initialize with repository callbacks.
@@ -30,9 +31,11 @@ class AssetColdStorage:
         Args:
             get_connection: Function to get database connection
             row_to_dict: Function to convert row to dict
+            rows_to_dicts: Function to convert a result set to dicts in bulk
         """
         self._get_connection = get_connection
         self._row_to_dict = row_to_dict
+        self._rows_to_dicts = rows_to_dicts
 
     def get_cold_assets(self) -> List[Dict[str, Any]]:
         """Get all assets in cold storage."""
@@ -43,7 +46,7 @@ class AssetColdStorage:
             WHERE is_cold = 1
             ORDER BY name
         ''')
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
     def get_non_cold_assets(self) -> List[Dict[str, Any]]:
         """Get all assets not in cold storage (active/hot)."""
@@ -54,7 +57,7 @@ class AssetColdStorage:
             WHERE is_cold = 0 OR is_cold IS NULL
             ORDER BY name
         ''')
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
     def get_latest_non_cold_assets(self) -> List[Dict[str, Any]]:
         """Get latest versions of assets not in cold storage."""
@@ -66,7 +69,7 @@ class AssetColdStorage:
               AND (is_latest = 1 OR is_latest IS NULL)
             ORDER BY name
         ''')
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
 
 __all__ = ['AssetColdStorage']
@@ -25,6 +25,7 @@ class AssetFeatures:
         get_connection: Callable[[], sqlite3.Connection],
         transaction: Callable,
         row_to_dict: Callable,
+        rows_to_dicts: Callable,
         parse_tags: Callable,
     ):
         """
@@ -34,11 +35,13 @@ class AssetFeatures:
             get_connection: Function to get database connection
             transaction: Context manager for transactions
             row_to_dict: Function to convert row to dict
+            rows_to_dicts: Function to convert a result set to dicts in bulk
             parse_tags: Function to parse tags JSON
         """
         self._get_connection = get_connection
         self._transaction = transaction
         self._row_to_dict = row_to_dict
+        self._rows_to_dicts = rows_to_dicts
         self._parse_tags = parse_tags
 
     def toggle_favorite(self, uuid: str) -> bool:
@@ -81,7 +84,7 @@ class AssetFeatures:
         conn = self._get_connection()
         cursor = conn.cursor()
         cursor.execute('SELECT * FROM assets WHERE is_favorite = 1 ORDER BY name')
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
     def update_last_viewed(self, uuid: str) -> bool:
         """Update last viewed timestamp for an asset."""
@@ -108,7 +111,7 @@ class AssetFeatures:
             LIMIT ?
         ''', (limit,))
 
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
     def get_all_tags(self) -> List[str]:
         """Get all unique tags used across all assets."""
@@ -27,6 +27,7 @@ class AssetVariants:
         get_by_uuid: Callable[[str], Optional[Dict[str, Any]]],
         add: Callable[[Dict[str, Any]], Optional[int]],
         row_to_dict: Callable,
+        rows_to_dicts: Callable,
     ):
         """
         Initialize with repository callbacks.
@@ -36,11 +37,13 @@ class AssetVariants:
             get_by_uuid: Function to get asset by UUID
             add: Function to add asset
             row_to_dict: Function to convert row to dict
+            rows_to_dicts: Function to convert a result set to dicts in bulk
         """
         self._get_connection = get_connection
         self._get_by_uuid = get_by_uuid
         self._add = add
         self._row_to_dict = row_to_dict
+        self._rows_to_dicts = rows_to_dicts
 
     def get_variant_counts(self) -> Dict[str, int]:
         """
@@ -114,7 +117,7 @@ class AssetVariants:
             WHERE asset_id = ? AND variant_name = ?
             ORDER BY version DESC
         ''', (asset_id, variant_name))
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
     def get_latest_variant_version(self, asset_id: str, variant_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -11,7 +11,7 @@ Handles:
 
 import sqlite3
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Callable
+from typing import List, Dict, Optional, Any, Callable, FrozenSet
 
 
 class AssetVersions:
@@ -30,6 +30,8 @@ class AssetVersions:
         update: Callable[[str, Dict[str, Any]], bool],
         add: Callable[[Dict[str, Any]], Optional[int]],
         row_to_dict: Callable,
+        rows_to_dicts: Callable,
+        table_columns: Callable[[str], FrozenSet[str]],
     ):
         """
         Initialize with repository callbacks.
@@ -41,6 +43,8 @@ class AssetVersions:
             update: Function to update asset
             add: Function to add asset
             row_to_dict: Function to convert row to dict
+            rows_to_dicts: Function to convert a result set to dicts in bulk
+            table_columns: Function to get cached column names of a table
         """
         self._get_connection = get_connection
         self._transaction = transaction
@@ -48,6 +52,8 @@ class AssetVersions:
         self._update = update
         self._add = add
         self._row_to_dict = row_to_dict
+        self._rows_to_dicts = rows_to_dicts
+        self._table_columns = table_columns
 
     def get_versions(self, version_group_id: str) -> List[Dict[str, Any]]:
         """Get all versions of an asset by version group ID."""
@@ -58,7 +64,7 @@ class AssetVersions:
             WHERE version_group_id = ?
             ORDER BY version DESC
         ''', (version_group_id,))
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
     def get_latest_version(self, version_group_id: str) -> Optional[Dict[str, Any]]:
         """Get the latest version of an asset."""
@@ -156,7 +162,7 @@ class AssetVersions:
             WHERE version_group_id = ?
             ORDER BY version DESC
         ''', (version_group_id,))
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
     def promote_to_latest(self, uuid: str) -> bool:
         """
@@ -222,8 +228,7 @@ class AssetVersions:
                 cursor = conn.cursor()
 
                 # Check if columns exist
-                cursor.execute("PRAGMA table_info(assets)")
-                columns = {col[1] for col in cursor.fetchall()}
+                columns = self._table_columns('assets')
 
                 updates = {'status': 'approved'}
 
@@ -299,7 +304,7 @@ class AssetVersions:
         query += " ORDER BY name"
         cursor.execute(query, params)
 
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return self._rows_to_dicts(cursor.fetchall())
 
 
 __all__ = ['AssetVersions']
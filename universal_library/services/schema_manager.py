@@ -11,7 +11,9 @@ Handles:
 import logging
 import sqlite3
 from datetime import datetime
-from typing import Set
+from typing import Optional, Set
+
+from .base_repository import BaseRepository
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,31 @@ class SchemaManager:
     while preserving existing data.
     """
 
-    SCHEMA_VERSION = 21  # Rig metadata realignment: animation_count + bound_mesh_count
+    SCHEMA_VERSION = 22  # FTS5 search index (assets_fts) + sync triggers
+
+    # Columns indexed by assets_fts, in bm25() weight order
+    SEARCH_INDEX_COLUMNS = ('name', 'description', 'tags', 'asset_type', 'author')
+
+    # Triggers keeping assets_fts in sync (created by _create_search_index)
+    _SEARCH_INDEX_TRIGGERS = (
+        'assets_fts_ai', 'assets_fts_ad', 'assets_fts_au',
+        'asset_tags_fts_ai', 'asset_tags_fts_ad', 'tags_fts_au',
+    )
+
+    # Row source for assets_fts: legacy JSON tags plus tag-system names
+    _SEARCH_INDEX_SELECT = '''
+        SELECT a.id, a.name, a.description,
+               COALESCE(a.tags, '') || ' ' || COALESCE((
+                   SELECT group_concat(t.name, ' ')
+                   FROM asset_tags at JOIN tags t ON t.id = at.tag_id
+                   WHERE at.asset_uuid = a.uuid
+               ), ''),
+               a.asset_type, a.author
+        FROM assets a
+    '''
+
+    # Whether this process's SQLite build has FTS5 (probed once)
+    _fts5_supported: Optional[bool] = None
 
     def __init__(self, connection: sqlite3.Connection):
         """
@@ -88,6 +114,9 @@ class SchemaManager:
             # Commit only if everything succeeded
             self._connection.commit()
 
+            # Repositories re-read table columns after migrations
+            BaseRepository.invalidate_schema_cache()
+
         except Exception as e:
             # Rollback on any failure to prevent partial schema
             self._connection.rollback()
@@ -337,6 +366,7 @@ class SchemaManager:
 
         # Create indexes
         self._create_indexes(cursor)
+        self._create_search_index(cursor)
 
         # Data migrations
         self._migrate_variant_data(cursor, asset_columns_existing)
@@ -692,6 +722,117 @@ class SchemaManager:
         for index_sql in indexes:
             cursor.execute(index_sql)
 
+    def _create_search_index(self, cursor: sqlite3.Cursor):
+        """
+        Create the assets_fts full-text index and its sync triggers (schema v22).
+
+        assets_fts rows share rowid with assets.id. Triggers on assets,
+        asset_tags and tags keep the index current, so search never needs
+        a table scan. Runs on every open: if this SQLite build lacks FTS5
+        the triggers are dropped (they would make every asset write fail)
+        and searches fall back to LIKE. A build with FTS5 that finds the
+        triggers missing rebuilds the index, since writes made without
+        them never reached it.
+        """
+        trigger_names = tuple(self._SEARCH_INDEX_TRIGGERS)
+
+        if not self._fts5_available():
+            for name in trigger_names:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            logger.warning("FTS5 unavailable, search index disabled (LIKE fallback)")
+            return
+
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'assets_fts'"
+        )
+        exists = cursor.fetchone() is not None
+
+        placeholders = ', '.join('?' * len(trigger_names))
+        cursor.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' "
+            f"AND name IN ({placeholders})",
+            trigger_names,
+        )
+        stale = exists and cursor.fetchone()[0] < len(trigger_names)
+
+        if not exists:
+            try:
+                cursor.execute(f'''
+                    CREATE VIRTUAL TABLE assets_fts USING fts5(
+                        {', '.join(self.SEARCH_INDEX_COLUMNS)},
+                        prefix = '2 3',
+                        tokenize = 'unicode61 remove_diacritics 2'
+                    )
+                ''')
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS5 unavailable, search index not created: {e}")
+                return
+
+        columns = ', '.join(self.SEARCH_INDEX_COLUMNS)
+        select = self._SEARCH_INDEX_SELECT
+
+        def resync(ids_sql: str) -> str:
+            return f'''
+                DELETE FROM assets_fts WHERE rowid IN ({ids_sql});
+                INSERT INTO assets_fts (rowid, {columns})
+                    {select} WHERE a.id IN ({ids_sql});
+            '''
+
+        triggers = {
+            'assets_fts_ai': (
+                'AFTER INSERT ON assets',
+                resync('new.id'),
+            ),
+            'assets_fts_ad': (
+                'AFTER DELETE ON assets',
+                'DELETE FROM assets_fts WHERE rowid = old.id;',
+            ),
+            'assets_fts_au': (
+                'AFTER UPDATE OF name, description, tags, asset_type, author, uuid ON assets',
+                resync('new.id'),
+            ),
+            'asset_tags_fts_ai': (
+                'AFTER INSERT ON asset_tags',
+                resync('SELECT id FROM assets WHERE uuid = new.asset_uuid'),
+            ),
+            'asset_tags_fts_ad': (
+                'AFTER DELETE ON asset_tags',
+                resync('SELECT id FROM assets WHERE uuid = old.asset_uuid'),
+            ),
+            'tags_fts_au': (
+                'AFTER UPDATE OF name ON tags',
+                resync(
+                    'SELECT a.id FROM assets a JOIN asset_tags at '
+                    'ON at.asset_uuid = a.uuid WHERE at.tag_id = new.id'
+                ),
+            ),
+        }
+        for name, (event, body) in triggers.items():
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {body} END'
+            )
+
+        if stale:
+            cursor.execute('DELETE FROM assets_fts')
+        if stale or not exists:
+            # Backfill existing assets
+            cursor.execute(f'INSERT INTO assets_fts (rowid, {columns}) {select}')
+            logger.info("Built assets_fts search index")
+
+    @classmethod
+    def _fts5_available(cls) -> bool:
+        """Check whether this SQLite build has the FTS5 module (once per process)."""
+        if cls._fts5_supported is None:
+            probe = sqlite3.connect(':memory:')
+            try:
+                probe.execute('CREATE VIRTUAL TABLE fts5_probe USING fts5(x)')
+                cls._fts5_supported = True
+            except sqlite3.OperationalError:
+                cls._fts5_supported = False
+            finally:
+                probe.close()
+        return cls._fts5_supported
+
     def _migrate_variant_data(self, cursor: sqlite3.Cursor, existing_columns: Set[str]):
         """Run data migrations for variant system."""
         # Migrate existing assets to variant system - run unconditionally to catch any
@@ -0,0 +1,60 @@
+"""
+SearchWorker - Background full-text search queries
+
+Pattern: Single-shot QThread worker
+Runs an assets_fts lookup off the UI thread and hands back the result.
+"""
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .database_service import get_database_service
+
+
+class SearchWorker(QThread):
+    """
+    Background worker for one search query
+
+    A new worker is started per (debounced) query. Superseded workers
+    are cancelled and their late results dropped, so only the latest
+    query ever reaches the UI.
+
+    Signals:
+        results_ready(text, uuids): Ranked UUID list, or None if the
+            search index can't answer the query
+    """
+
+    results_ready = pyqtSignal(str, object)
+
+    def __init__(self, text: str, parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._cancelled = False
+
+    @property
+    def text(self) -> str:
+        """Search text this worker was started for"""
+        return self._text
+
+    def cancel(self):
+        """Drop the result; no signal is emitted after this"""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """Check if the query was cancelled"""
+        return self._cancelled
+
+    def run(self):
+        db_service = get_database_service()
+        try:
+            uuids = db_service.search_asset_uuids(self._text)
+        except Exception:
+            uuids = None
+        finally:
+            # Release this thread's connections; the worker thread is not reused
+            db_service.close()
+
+        if not self._cancelled:
+            self.results_ready.emit(self._text, uuids)
+
+
+__all__ = ['SearchWorker']
@@ -482,15 +482,85 @@ class TagRepository(BaseRepository):
             ORDER BY t.name
         ''')
 
+        rows = cursor.fetchall()
+        paths = self._build_path_map(cursor)
+
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             d = dict(row)
-            d['full_path'] = self._build_path(cursor, d['id'])
+            d['full_path'] = paths.get(d['id'], d['name'])
             results.append(d)
 
         results.sort(key=lambda t: t['full_path'].lower())
         return results
 
+    def get_all_asset_tags(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get tags for every tagged asset in one query.
+
+        Bulk counterpart of get_asset_tags() used for library loads.
+
+        Returns:
+            Dict of asset_uuid -> list of tag dicts (with full_path),
+            sorted by full_path like get_asset_tags()
+        """
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT at.asset_uuid, t.id, t.name, t.color, t.parent_id
+            FROM asset_tags at
+            INNER JOIN tags t ON t.id = at.tag_id
+        ''')
+        return self._group_asset_tags(cursor, cursor.fetchall())
+
+    def get_asset_tags_many(self, asset_uuids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get tags for many assets with chunked IN queries.
+
+        Args:
+            asset_uuids: Asset UUIDs
+
+        Returns:
+            Dict of asset_uuid -> list of tag dicts, like get_all_asset_tags()
+            (untagged assets are absent)
+        """
+        conn = self._get_read_connection()
+        cursor = conn.cursor()
+
+        rows = []
+        asset_uuids = list(dict.fromkeys(asset_uuids))
+        for start in range(0, len(asset_uuids), self.UUID_CHUNK_SIZE):
+            chunk = asset_uuids[start:start + self.UUID_CHUNK_SIZE]
+            placeholders = ', '.join('?' for _ in chunk)
+            cursor.execute(f'''
+                SELECT at.asset_uuid, t.id, t.name, t.color, t.parent_id
+                FROM asset_tags at
+                INNER JOIN tags t ON t.id = at.tag_id
+                WHERE at.asset_uuid IN ({placeholders})
+            ''', chunk)
+            rows.extend(cursor.fetchall())
+        return self._group_asset_tags(cursor, rows)
+
+    def _group_asset_tags(self, cursor, rows) -> Dict[str, List[Dict[str, Any]]]:
+        """Group (asset_uuid, id, name, color, parent_id) rows by asset, with full_path."""
+        if not rows:
+            return {}
+        paths = self._build_path_map(cursor)
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            results.setdefault(row[0], []).append({
+                'id': row[1],
+                'name': row[2],
+                'color': row[3],
+                'parent_id': row[4],
+                'full_path': paths.get(row[1], row[2]),
+            })
+
+        for tags in results.values():
+            tags.sort(key=lambda t: t['full_path'].lower())
+        return results
+
     def search_tags(self, query: str) -> List[Dict[str, Any]]:
         """Search tags by name or full path (partial match)."""
         conn = self._get_connection()
@@ -523,6 +593,29 @@ class TagRepository(BaseRepository):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _build_path_map(self, cursor) -> Dict[int, str]:
+        """Build dot-separated paths for all tags from a single table read."""
+        cursor.execute('SELECT id, name, parent_id FROM tags')
+        nodes = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+        paths: Dict[int, str] = {}
+        for tag_id in nodes:
+            parts = []
+            current_id = tag_id
+            visited = set()
+
+            while current_id is not None and current_id in nodes:
+                if current_id in visited:
+                    break  # Circular reference guard
+                visited.add(current_id)
+                name, current_id = nodes[current_id]
+                parts.append(name)
+
+            parts.reverse()
+            paths[tag_id] = '.'.join(parts)
+
+        return paths
+
     def _build_path(self, cursor, tag_id: int) -> str:
         """Build dot-separated path by walking parent chain."""
         parts = []
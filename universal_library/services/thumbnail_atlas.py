@@ -0,0 +1,163 @@
+"""
+ThumbnailAtlas - Small thumbnails packed into shared pixmap pages
+
+Pattern: Fixed-slot texture atlas with LRU slot reuse
+Small cards (list view, compact grid) draw from a few large pixmaps
+instead of one QPixmap and cache key per asset, which keeps per-item
+overhead flat for libraries with tens of thousands of assets.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QImage, QPainter, QPixmap
+
+from ..config import Config
+
+
+class ThumbnailAtlas:
+    """
+    Square thumbnail tiles stored in fixed slots of large pixmap pages
+
+    Pages are allocated as slots are needed, up to a page budget; when
+    full, the least recently used tile's slot is reused. Only use from
+    the GUI thread (pages are QPixmaps).
+
+    Usage:
+        tile = atlas.find(uuid, mtime_ns)
+        if tile:
+            page, source_rect = tile
+            painter.drawPixmap(target_rect, page, source_rect)
+    """
+
+    def __init__(self, tile_size: Optional[int] = None, page_size: Optional[int] = None,
+                 max_pages: Optional[int] = None):
+        self.tile_size = tile_size or Config.THUMBNAIL_ATLAS_TILE_SIZE
+        page_size = page_size or Config.THUMBNAIL_ATLAS_PAGE_SIZE
+        self.max_pages = max_pages or Config.THUMBNAIL_ATLAS_MAX_PAGES
+
+        self._columns = max(1, page_size // self.tile_size)
+        self._page_size = self._columns * self.tile_size
+        self._tiles_per_page = self._columns * self._columns
+
+        self._pages: List[QPixmap] = []
+        self._entries: 'OrderedDict[str, Tuple[int, int]]' = OrderedDict()  # uuid -> (slot, mtime_ns)
+        self._free: List[int] = []
+        self._next_slot = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of tiles"""
+        return self.max_pages * self._tiles_per_page
+
+    def find(self, uuid: str, mtime_ns: int) -> Optional[Tuple[QPixmap, QRect]]:
+        """
+        Look up a tile
+
+        Args:
+            uuid: Asset UUID
+            mtime_ns: Current mtime of the source thumbnail
+
+        Returns:
+            (page pixmap, tile rect in the page), or None if absent or stale
+        """
+        entry = self._entries.get(uuid)
+        if entry is None or entry[1] != mtime_ns:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(uuid)
+        self._hits += 1
+        return self._tile(entry[0])
+
+    def insert(self, uuid: str, mtime_ns: int, image: QImage) -> Tuple[QPixmap, QRect]:
+        """
+        Store a thumbnail, scaling it to the tile size if needed
+
+        Args:
+            uuid: Asset UUID
+            mtime_ns: mtime of the source thumbnail
+            image: Square thumbnail image
+
+        Returns:
+            (page pixmap, tile rect in the page)
+        """
+        entry = self._entries.pop(uuid, None)
+        slot = entry[0] if entry is not None else self._allocate()
+        self._entries[uuid] = (slot, mtime_ns)
+
+        page, rect = self._tile(slot)
+        painter = QPainter(page)
+        # Replace the old tile's pixels, including alpha
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawImage(rect, image)
+        painter.end()
+        return page, rect
+
+    def remove(self, uuid: str):
+        """
+        Free an asset's tile
+
+        Args:
+            uuid: Asset UUID
+        """
+        entry = self._entries.pop(uuid, None)
+        if entry is not None:
+            self._free.append(entry[0])
+
+    def clear(self):
+        """Drop every tile and release the pages"""
+        self._entries.clear()
+        self._free.clear()
+        self._pages.clear()
+        self._next_slot = 0
+
+    def _allocate(self) -> int:
+        """Get a slot for a new tile, evicting the least recently used if full"""
+        if self._free:
+            return self._free.pop()
+        if self._next_slot < self.capacity:
+            slot = self._next_slot
+            self._next_slot += 1
+            if slot // self._tiles_per_page >= len(self._pages):
+                page = QPixmap(self._page_size, self._page_size)
+                page.fill(Qt.GlobalColor.transparent)
+                self._pages.append(page)
+            return slot
+        _, (slot, _) = self._entries.popitem(last=False)
+        self._evictions += 1
+        return slot
+
+    def _tile(self, slot: int) -> Tuple[QPixmap, QRect]:
+        page_index, index = divmod(slot, self._tiles_per_page)
+        row, column = divmod(index, self._columns)
+        rect = QRect(column * self.tile_size, row * self.tile_size, self.tile_size, self.tile_size)
+        return self._pages[page_index], rect
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get atlas statistics
+
+        Returns:
+            Dict with tile and page counts, memory and hit/miss counters
+        """
+        lookups = self._hits + self._misses
+        page_bytes = self._page_size * self._page_size * 4
+        return {
+            'tiles': len(self._entries),
+            'capacity': self.capacity,
+            'pages': len(self._pages),
+            'memory_mb': len(self._pages) * page_bytes / (1024 * 1024),
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': (self._hits / lookups * 100) if lookups else 0,
+            'evictions': self._evictions,
+        }
+
+
+__all__ = ['ThumbnailAtlas']
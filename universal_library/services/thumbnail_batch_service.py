@@ -0,0 +1,330 @@
+"""
+ThumbnailBatchService - Batch thumbnail regeneration jobs
+
+Pattern: Singleton QObject polling Blender's per-job progress files
+Regenerating many thumbnails is one manifest (thumbbatch_*.json) instead
+of one queue file per asset. Blender appends a JSON line per finished
+item to the job's progress file; this service reads new lines on a
+timer, drops stale cached thumbnails and refills the disk mip cache for
+finished items on a thread pool, and reports progress as results arrive.
+
+Jobs are resumable: Blender skips items already in the progress file,
+and resume_jobs() picks up manifests left behind by a previous session.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from PyQt6.QtCore import QObject, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from ..config import Config
+from ..protocol import STATUS_COMPLETED, STATUS_FAILED
+from .blender_service import get_blender_service
+from .path_info_cache import get_path_info_cache
+from .thumbnail_disk_cache import get_thumbnail_disk_cache
+from .thumbnail_loader import ThumbnailLoadTask, get_thumbnail_loader
+
+logger = logging.getLogger(__name__)
+
+
+class _BatchJob:
+    """Desktop-side state of one batch job"""
+
+    __slots__ = ('job_id', 'manifest_path', 'progress_path', 'total', 'offset',
+                 'completed', 'failed', 'filling')
+
+    def __init__(self, job_id: str, manifest_path: Path, progress_path: Path, total: int):
+        self.job_id = job_id
+        self.manifest_path = manifest_path
+        self.progress_path = progress_path
+        self.total = total
+        self.offset = 0  # Bytes of the progress file already consumed
+        self.completed: set = set()
+        self.failed: Dict[str, str] = {}  # uuid -> error
+        self.filling: set = set()  # uuids with a cache fill in flight
+
+    @property
+    def done(self) -> bool:
+        return len(self.completed) + len(self.failed) >= self.total and not self.filling
+
+
+class ThumbnailBatchService(QObject):
+    """
+    Submits batch thumbnail jobs to Blender and tracks their results
+
+    Usage:
+        service = get_thumbnail_batch_service()
+        service.thumbnail_ready.connect(on_thumbnail_ready)
+        job_id = service.submit(items)
+    """
+
+    job_progress = pyqtSignal(str, int, int, int)  # job_id, completed, failed, total
+    thumbnail_ready = pyqtSignal(str)  # uuid; new thumbnail rendered and cached
+    job_finished = pyqtSignal(str, int, int)  # job_id, completed, failed
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._blender_service = get_blender_service()
+        self._jobs: Dict[str, _BatchJob] = {}
+        self._owner: Dict[str, str] = {}  # uuid -> job_id for in-flight fills
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(
+            Config.THUMBNAIL_BATCH_THREADS or max(1, (os.cpu_count() or 2) // 2)
+        )
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(Config.THUMBNAIL_BATCH_POLL_MS)
+        self._poll_timer.timeout.connect(self.poll)
+
+        self._fill_started: Dict[str, float] = {}
+        self._fill_times: List[float] = []
+        self._fills_failed = 0
+
+    # ==================== JOBS ====================
+
+    def submit(self, items: List[Dict[str, Any]], thumbnail_size: int = 256) -> Optional[str]:
+        """
+        Queue a batch job in Blender
+
+        Args:
+            items: Dicts with uuid, name, usd_file_path and thumbnail_path
+            thumbnail_size: Rendered thumbnail size in pixels
+
+        Returns:
+            Job ID, or None if the manifest could not be written
+        """
+        job_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:8]}"
+        manifest_path = self._blender_service.queue_thumbnail_batch(job_id, items, thumbnail_size)
+        if manifest_path is None:
+            return None
+
+        total = self._read_total(manifest_path)
+        self._track(_BatchJob(job_id, manifest_path,
+                              self._blender_service.batch_progress_path(manifest_path), total))
+        logger.info(f"Queued thumbnail batch {job_id} ({total} assets)")
+        return job_id
+
+    def resume_jobs(self) -> int:
+        """
+        Track manifests left in the queue by a previous session
+
+        Results Blender recorded while the app was closed are processed
+        on the next poll; already cached thumbnails are cheap to refill.
+
+        Returns:
+            Number of jobs picked up
+        """
+        queue_dir = self._blender_service.queue_directory
+        resumed = 0
+        for manifest_path in sorted(queue_dir.glob("thumbbatch_*.json")):
+            job_id = manifest_path.stem[len("thumbbatch_"):]
+            if job_id in self._jobs:
+                continue
+            total = self._read_total(manifest_path)
+            if not total:
+                continue
+            self._track(_BatchJob(job_id, manifest_path,
+                                  self._blender_service.batch_progress_path(manifest_path), total))
+            resumed += 1
+        if resumed:
+            logger.info(f"Resumed {resumed} thumbnail batch job(s)")
+        return resumed
+
+    def cancel(self, job_id: str):
+        """
+        Stop a job; Blender drops it once the manifest is gone
+
+        Args:
+            job_id: Job ID from submit()
+        """
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        self._remove_files(job)
+        self.job_finished.emit(job.job_id, len(job.completed), len(job.failed))
+        self._update_timer()
+
+    def active_jobs(self) -> List[str]:
+        """IDs of jobs still running"""
+        return list(self._jobs)
+
+    def _track(self, job: _BatchJob):
+        self._jobs[job.job_id] = job
+        self.job_progress.emit(job.job_id, 0, 0, job.total)
+        self._update_timer()
+
+    def _update_timer(self):
+        if self._jobs and not self._poll_timer.isActive():
+            self._poll_timer.start()
+        elif not self._jobs:
+            self._poll_timer.stop()
+
+    @staticmethod
+    def _read_total(manifest_path: Path) -> int:
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        return manifest.get('item_count') or len(manifest.get('items', []))
+
+    # ==================== PROGRESS ====================
+
+    def poll(self):
+        """Read new results from every job's progress file"""
+        for job in list(self._jobs.values()):
+            records = self._read_new_records(job)
+            if records:
+                for record in records:
+                    self._apply_record(job, record)
+                self.job_progress.emit(job.job_id, len(job.completed), len(job.failed), job.total)
+            self._finish_if_done(job)
+
+    @staticmethod
+    def _read_new_records(job: _BatchJob) -> List[Dict[str, Any]]:
+        """Parse complete lines appended since the last poll"""
+        try:
+            with open(job.progress_path, 'rb') as f:
+                f.seek(job.offset)
+                data = f.read()
+        except OSError:
+            return []
+
+        # A line still being written by Blender is read on the next poll
+        end = data.rfind(b'\n') + 1
+        if not end:
+            return []
+        job.offset += end
+
+        records = []
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Torn line from a crash; Blender re-renders that item
+            if isinstance(record, dict) and record.get('asset_uuid'):
+                records.append(record)
+        return records
+
+    def _apply_record(self, job: _BatchJob, record: Dict[str, Any]):
+        uuid = record['asset_uuid']
+        if uuid in job.completed or uuid in job.filling:
+            return
+        if record.get('status') != STATUS_COMPLETED:
+            job.failed[uuid] = record.get('error', STATUS_FAILED)
+            return
+        job.failed.pop(uuid, None)
+        self._start_fill(job, uuid, record.get('thumbnail_path', ''))
+
+    def _finish_if_done(self, job: _BatchJob):
+        if not job.done:
+            return
+        self._jobs.pop(job.job_id, None)
+        self._remove_files(job)
+        logger.info(
+            f"Thumbnail batch {job.job_id} finished: "
+            f"{len(job.completed)} rendered, {len(job.failed)} failed"
+        )
+        self.job_finished.emit(job.job_id, len(job.completed), len(job.failed))
+        self._update_timer()
+
+    @staticmethod
+    def _remove_files(job: _BatchJob):
+        for path in (job.manifest_path, job.progress_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove {path}: {e}")
+
+    # ==================== CACHE FILL ====================
+
+    def _start_fill(self, job: _BatchJob, uuid: str, thumbnail_path: str):
+        """Drop the stale thumbnail and decode the new one into the mip cache"""
+        # Removes pixmaps, atlas tile and disk mips of the old file
+        get_thumbnail_loader().invalidate_thumbnail(uuid)
+        if not thumbnail_path:
+            job.completed.add(uuid)
+            self.thumbnail_ready.emit(uuid)
+            return
+        get_path_info_cache().invalidate(thumbnail_path)
+
+        job.filling.add(uuid)
+        self._owner[uuid] = job.job_id
+        self._fill_started[uuid] = time.perf_counter()
+
+        # A load at the largest mip size decodes the source once and
+        # writes every mip, i.e. exactly the cache fill
+        size = max(get_thumbnail_disk_cache().MIP_SIZES)
+        task = ThumbnailLoadTask(uuid, Path(thumbnail_path), f"batch_{uuid}", size)
+        task.signals.load_complete.connect(self._on_fill_complete)
+        task.signals.load_failed.connect(self._on_fill_failed)
+        self._pool.start(task)
+
+    def _on_fill_complete(self, uuid: str, cache_key: str, image: QImage, elapsed_ms: float):
+        self._finish_fill(uuid)
+
+    def _on_fill_failed(self, uuid: str, cache_key: str, error_message: str):
+        logger.debug(f"Thumbnail cache fill failed for {uuid}: {error_message}")
+        self._fills_failed += 1
+        self._finish_fill(uuid)
+
+    def _finish_fill(self, uuid: str):
+        started = self._fill_started.pop(uuid, None)
+        if started is not None:
+            self._fill_times.append((time.perf_counter() - started) * 1000)
+            self._fill_times = self._fill_times[-200:]
+
+        job = self._jobs.get(self._owner.pop(uuid, ''))
+        if job is not None:
+            job.filling.discard(uuid)
+            job.completed.add(uuid)
+        # Views reload the asset; a failed fill just means a normal load
+        self.thumbnail_ready.emit(uuid)
+        if job is not None:
+            self.job_progress.emit(job.job_id, len(job.completed), len(job.failed), job.total)
+            self._finish_if_done(job)
+
+    # ==================== STATS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batch statistics
+
+        Returns:
+            Dict with job and item counts and cache fill timings
+        """
+        jobs = list(self._jobs.values())
+        return {
+            'jobs': len(jobs),
+            'items': sum(job.total for job in jobs),
+            'completed': sum(len(job.completed) for job in jobs),
+            'failed': sum(len(job.failed) for job in jobs),
+            'filling': len(self._fill_started),
+            'fill_threads': self._pool.maxThreadCount(),
+            'fills_failed': self._fills_failed,
+            'avg_fill_ms': (sum(self._fill_times) / len(self._fill_times)) if self._fill_times else 0.0,
+        }
+
+
+# Singleton instance
+_thumbnail_batch_service_instance: Optional[ThumbnailBatchService] = None
+
+
+def get_thumbnail_batch_service() -> ThumbnailBatchService:
+    """Get global ThumbnailBatchService singleton instance"""
+    global _thumbnail_batch_service_instance
+    if _thumbnail_batch_service_instance is None:
+        _thumbnail_batch_service_instance = ThumbnailBatchService()
+    return _thumbnail_batch_service_instance
+
+
+__all__ = ['ThumbnailBatchService', 'get_thumbnail_batch_service']
@@ -0,0 +1,250 @@
+"""
+ThumbnailDecodePool - Thumbnail decoding in worker processes
+
+Pattern: Singleton around a ProcessPoolExecutor (optional backend)
+Decodes thumbnail sources with Pillow in separate processes and renders
+their whole mip chain there, so large preview renders don't contend with
+the UI thread for the GIL. Pixels of every level come back through one
+shared memory block allocated by the caller; only the block name and a
+flag cross the process boundary.
+
+Enabled with Config.THUMBNAIL_DECODE_BACKEND = 'process'. Falls back to
+in-thread Qt decoding when Pillow is missing or the pool breaks.
+"""
+
+import importlib.util
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from PyQt6.QtGui import QImage
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def _pillow_available() -> bool:
+    """Check if Pillow is installed (without importing it here)"""
+    return importlib.util.find_spec('PIL') is not None
+
+
+def _decode_into(path: str, sizes: tuple, shm_name: str) -> Optional[bool]:
+    """
+    Decode an image into center-cropped squares in a shared memory block
+
+    Runs in a worker process. The first (largest) size is cropped from
+    the source; each smaller one is scaled from the level before it.
+    Levels are stored back to back, size * size * 4 bytes each.
+
+    Args:
+        path: Source image path
+        sizes: Output sizes, largest first
+        shm_name: Name of a block big enough for every level
+
+    Returns:
+        True if the pixels are RGBA, False if RGBX, None if decoding failed
+    """
+    from PIL import Image, ImageOps
+
+    levels = []
+    try:
+        with Image.open(path) as img:
+            # JPEG: decode at the smallest DCT scale still covering the output
+            img.draft('RGB', (sizes[0], sizes[0]))
+            has_alpha = img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+            img = img.convert('RGBA' if has_alpha else 'RGB')
+            img = ImageOps.fit(img, (sizes[0], sizes[0]), Image.Resampling.BICUBIC)
+            for size in sizes:
+                if img.width != size:
+                    img = img.resize((size, size), Image.Resampling.BICUBIC)
+                levels.append(img.tobytes('raw', 'RGBA' if has_alpha else 'RGBX'))
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        offset = 0
+        for data in levels:
+            shm.buf[offset:offset + len(data)] = data
+            offset += len(data)
+    finally:
+        shm.close()
+    return has_alpha
+
+
+class ThumbnailDecodePool:
+    """
+    Process pool decoding thumbnails into square QImages
+
+    decode() and decode_mips() block the calling (loader) thread until a
+    worker process has produced the pixels, so they are meant to be
+    called from ThumbnailLoadTask, not from the UI thread.
+
+    Usage:
+        pool = get_thumbnail_decode_pool()
+        if pool.enabled:
+            image = pool.decode(path, 512)  # None -> fall back to Qt decoding
+            mips = pool.decode_mips(path, (128, 256, 512))
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self._workers = workers
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._broken = False
+        self._pillow: Optional[bool] = None
+
+        self._decoded = 0
+        self._failed = 0
+        self._decode_total_s = 0.0
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes (one per core unless configured)"""
+        if self._workers is None:
+            self._workers = Config.THUMBNAIL_PROCESS_COUNT or os.cpu_count() or 1
+        return self._workers
+
+    @property
+    def enabled(self) -> bool:
+        """True if thumbnails should be decoded in worker processes"""
+        if Config.THUMBNAIL_DECODE_BACKEND != 'process' or self._broken:
+            return False
+        if self._pillow is None:
+            self._pillow = _pillow_available()
+            if not self._pillow:
+                logger.warning("Pillow not installed - decoding thumbnails in threads instead")
+        return self._pillow
+
+    def decode(self, path: Path, size: int) -> Optional[QImage]:
+        """
+        Decode an image to a center-cropped square
+
+        Args:
+            path: Source image path
+            size: Output width and height
+
+        Returns:
+            QImage, or None if the worker could not decode the file
+        """
+        images = self.decode_mips(path, (size,))
+        return images[size] if images is not None else None
+
+    def decode_mips(self, path: Path, sizes: Iterable[int]) -> Optional[Dict[int, QImage]]:
+        """
+        Decode an image to center-cropped squares of several sizes
+
+        The worker also scales the smaller levels (each from the next
+        larger one), so the calling process only copies pixels.
+
+        Args:
+            path: Source image path
+            sizes: Output widths and heights
+
+        Returns:
+            Dict of size -> QImage, or None if the worker could not decode the file
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return None
+
+        sizes = tuple(sorted(set(sizes), reverse=True))
+        start = time.perf_counter()
+        shm = shared_memory.SharedMemory(create=True, size=sum(size * size * 4 for size in sizes))
+        try:
+            try:
+                has_alpha = executor.submit(_decode_into, str(path), sizes, shm.name).result()
+            except BrokenProcessPool as e:
+                self._mark_broken(e)
+                return None
+
+            if has_alpha is None:
+                with self._lock:
+                    self._failed += 1
+                return None
+
+            image_format = QImage.Format.Format_RGBA8888 if has_alpha else QImage.Format.Format_RGBX8888
+            images = {}
+            offset = 0
+            for size in sizes:
+                nbytes = size * size * 4
+                # copy() detaches the pixels from the shared block before it is released
+                view = QImage(shm.buf[offset:offset + nbytes], size, size, size * 4, image_format)
+                images[size] = view.copy()
+                del view
+                offset += nbytes
+        finally:
+            shm.close()
+            shm.unlink()
+
+        with self._lock:
+            self._decoded += 1
+            self._decode_total_s += time.perf_counter() - start
+        return images
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Create the pool on first use"""
+        with self._lock:
+            if self._broken:
+                return None
+            if self._executor is None:
+                # Spawn: forking a process with live Qt threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+            return self._executor
+
+    def _mark_broken(self, error: Exception):
+        logger.warning(f"Thumbnail decode pool failed, decoding in threads instead: {error}")
+        with self._lock:
+            self._broken = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get decode statistics
+
+        Returns:
+            Dict with backend state, worker count and decode timings
+        """
+        with self._lock:
+            return {
+                'backend': 'process' if self.enabled else 'thread',
+                'workers': self.workers if self._executor is not None else 0,
+                'decoded': self._decoded,
+                'failed': self._failed,
+                'avg_decode_ms': (self._decode_total_s / self._decoded * 1000) if self._decoded else 0.0,
+            }
+
+
+# Singleton instance
+_thumbnail_decode_pool_instance: Optional[ThumbnailDecodePool] = None
+
+
+def get_thumbnail_decode_pool() -> ThumbnailDecodePool:
+    """Get global ThumbnailDecodePool singleton instance"""
+    global _thumbnail_decode_pool_instance
+    if _thumbnail_decode_pool_instance is None:
+        _thumbnail_decode_pool_instance = ThumbnailDecodePool()
+    return _thumbnail_decode_pool_instance
+
+
+__all__ = ['ThumbnailDecodePool', 'get_thumbnail_decode_pool']
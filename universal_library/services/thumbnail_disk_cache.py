@@ -0,0 +1,268 @@
+"""
+ThumbnailDiskCache - Persistent cache of pre-scaled thumbnails
+
+Pattern: Singleton LRU cache backed by files plus one packed index
+Stores 128/256/512 px center-cropped variants of each asset thumbnail
+under the library cache folder, so cold starts and card size changes
+read small files instead of decoding full-size renders.
+
+Index persistence and recovery of unindexed files (after a crash, or
+from another app instance on the same library) come from IndexedDiskCache.
+A mip file's name carries the uuid, mip and source mtime, and its image
+header must match the mip size for it to be adopted.
+"""
+
+import logging
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtGui import QImage, QImageReader
+
+from ..config import Config
+from ..utils.image_utils import scale_and_crop_image
+from .indexed_disk_cache import IndexedDiskCache
+
+logger = logging.getLogger(__name__)
+
+
+class _CacheEntry:
+    """Index record for one cached mip file"""
+
+    __slots__ = ('mtime_ns', 'nbytes', 'fmt')
+
+    def __init__(self, mtime_ns: int, nbytes: int, fmt: int):
+        self.mtime_ns = mtime_ns
+        self.nbytes = nbytes
+        self.fmt = fmt
+
+
+class ThumbnailDiskCache(IndexedDiskCache):
+    """
+    Size-bounded on-disk thumbnail cache
+
+    Entries are keyed by (uuid, mip size) and remember the source file's
+    mtime; a changed source is a miss and gets re-rendered. The index
+    (LRU order, sizes, mtimes) is kept in memory and persisted to a
+    single packed file; mip images are stored one file each.
+
+    Usage:
+        cache = get_thumbnail_disk_cache()
+        image = cache.get(uuid, cache.mip_for(300), mtime_ns)
+        if image is None:
+            cache.put(uuid, mtime_ns, source_image)
+            # or, with mips rendered elsewhere (e.g. a decode worker):
+            cache.put_mips(uuid, mtime_ns, mips)
+    """
+
+    MIP_SIZES = (128, 256, 512)
+
+    INDEX_MAGIC = b'ULTC'
+    INDEX_VERSION = 3  # v2: source mtime in mip file names; v3: writer token in header
+    _KEY_LEN = struct.Struct('<H')     # uuid length
+    _RECORD = struct.Struct('<HqIB')   # mip, source mtime_ns, file size, format
+
+    # File formats (stored in the index)
+    FMT_JPG = 0
+    FMT_PNG = 1
+    _EXTENSIONS = {FMT_JPG: 'jpg', FMT_PNG: 'png'}
+    _FORMATS = {ext: fmt for fmt, ext in _EXTENSIONS.items()}
+    JPEG_QUALITY = 90
+
+    SAVE_EVERY = 64
+    LABEL = 'thumbnail cache'
+
+    @classmethod
+    def mip_for(cls, target_size: int) -> Optional[int]:
+        """
+        Get the smallest mip size that covers a target size
+
+        Args:
+            target_size: Requested thumbnail size in pixels
+
+        Returns:
+            Mip size, or None if larger than the biggest mip
+        """
+        for size in cls.MIP_SIZES:
+            if size >= target_size:
+                return size
+        return None
+
+    # ==================== LOOKUP / STORE ====================
+
+    def get(self, uuid: str, mip: int, mtime_ns: int) -> Optional[QImage]:
+        """
+        Load a cached mip
+
+        Args:
+            uuid: Asset UUID
+            mip: Mip size (one of MIP_SIZES)
+            mtime_ns: Current mtime of the source thumbnail
+
+        Returns:
+            QImage, or None on miss (absent, stale or unreadable)
+        """
+        key = (uuid, mip)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None or entry.mtime_ns != mtime_ns:
+                self._misses += 1
+                return None
+            path = self._file_path(uuid, mip, mtime_ns, entry.fmt)
+
+        image = QImage(str(path))
+        if image.isNull():
+            with self._lock:
+                self._read_failed(key, entry)
+            return None
+
+        with self._lock:
+            self._hits += 1
+        return image
+
+    def put(self, uuid: str, mtime_ns: int, source: QImage) -> Dict[int, QImage]:
+        """
+        Render and store all mips of a source image
+
+        Each mip is center-cropped square; smaller mips are scaled from
+        the next larger one rather than from the source.
+
+        Args:
+            uuid: Asset UUID
+            mtime_ns: mtime of the source thumbnail
+            source: Decoded source image
+
+        Returns:
+            Dict of mip size -> rendered image (returned even if writing failed)
+        """
+        mips: Dict[int, QImage] = {}
+        image = source
+        for mip in sorted(self.MIP_SIZES, reverse=True):
+            image = scale_and_crop_image(image, mip, smooth=True)
+            mips[mip] = image
+        self.put_mips(uuid, mtime_ns, mips)
+        return mips
+
+    def put_mips(self, uuid: str, mtime_ns: int, mips: Dict[int, QImage]):
+        """
+        Store already rendered mips of a source image
+
+        Args:
+            uuid: Asset UUID
+            mtime_ns: mtime of the source thumbnail
+            mips: Dict of mip size -> square image, one per MIP_SIZES entry
+        """
+        fmt = self.FMT_PNG if mips[max(mips)].hasAlphaChannel() else self.FMT_JPG
+
+        with self._lock:
+            self._begin_write()
+
+        written = []
+        for mip, image in mips.items():
+            path = self._file_path(uuid, mip, mtime_ns, fmt)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                quality = self.JPEG_QUALITY if fmt == self.FMT_JPG else -1
+                if not image.save(str(tmp_path), self._EXTENSIONS[fmt].upper(), quality):
+                    self._unlink(tmp_path)
+                    continue
+                os.replace(tmp_path, path)
+                written.append((mip, path.stat().st_size))
+            except OSError as e:
+                self._unlink(tmp_path)
+                logger.debug(f"Failed to write thumbnail cache file {path}: {e}")
+
+        with self._lock:
+            for mip, nbytes in written:
+                self._store((uuid, mip), _CacheEntry(mtime_ns, nbytes, fmt))
+            self._end_write(len(written))
+
+    def invalidate(self, uuid: str):
+        """
+        Remove all cached mips of an asset
+
+        Args:
+            uuid: Asset UUID
+        """
+        with self._lock:
+            self._ensure_loaded()
+            for mip in self.MIP_SIZES:
+                self._drop((uuid, mip))
+
+    # ==================== INDEX RECORDS ====================
+
+    def _default_cache_dir(self) -> Path:
+        return Config.get_thumbnails_cache_directory()
+
+    def _max_size_mb(self) -> int:
+        return Config.THUMBNAIL_CACHE_SIZE_MB
+
+    def _entry_path(self, key: Tuple[str, int], entry: _CacheEntry) -> Path:
+        return self._file_path(key[0], key[1], entry.mtime_ns, entry.fmt)
+
+    def _pack_record(self, key: Tuple[str, int], entry: _CacheEntry) -> bytes:
+        uuid = key[0].encode('utf-8')
+        return (self._KEY_LEN.pack(len(uuid)) + uuid
+                + self._RECORD.pack(key[1], entry.mtime_ns, entry.nbytes, entry.fmt))
+
+    def _unpack_record(self, data: bytes, offset: int) -> Tuple[Tuple[str, int], _CacheEntry, int]:
+        (key_len,) = self._KEY_LEN.unpack_from(data, offset)
+        offset += self._KEY_LEN.size
+        uuid = data[offset:offset + key_len].decode('utf-8')
+        offset += key_len
+        mip, mtime_ns, nbytes, fmt = self._RECORD.unpack_from(data, offset)
+        offset += self._RECORD.size
+        return (uuid, mip), _CacheEntry(mtime_ns, nbytes, fmt), offset
+
+    def _recover_file(self, path: Path) -> Optional[Tuple[Tuple[str, int], _CacheEntry]]:
+        """Entry for a mip file whose name parses and whose image header matches its mip"""
+        parsed = self._parse_file_name(path)
+        if parsed is None or parsed[0][:2] != path.parent.name:
+            return None
+        uuid, mip, mtime_ns, fmt = parsed
+        size = QImageReader(str(path)).size()
+        if size.width() != mip or size.height() != mip:
+            return None
+        try:
+            nbytes = path.stat().st_size
+        except OSError:
+            return None
+        return (uuid, mip), _CacheEntry(mtime_ns, nbytes, fmt)
+
+    def _parse_file_name(self, path: Path) -> Optional[Tuple[str, int, int, int]]:
+        """Parse '<uuid>_<mip>_<mtime_ns>.<ext>' into (uuid, mip, mtime_ns, fmt)"""
+        fmt = self._FORMATS.get(path.suffix[1:])
+        parts = path.stem.rsplit('_', 2)
+        if fmt is None or len(parts) != 3:
+            return None
+        uuid, mip, mtime_ns = parts
+        try:
+            mip, mtime_ns = int(mip), int(mtime_ns)
+        except ValueError:
+            return None
+        if mip not in self.MIP_SIZES or not uuid:
+            return None
+        return uuid, mip, mtime_ns, fmt
+
+    def _file_path(self, uuid: str, mip: int, mtime_ns: int, fmt: int) -> Path:
+        # Two-character fan-out keeps directories small; the source mtime
+        # in the name lets unindexed files be recovered after a crash
+        return self.cache_dir / uuid[:2] / f"{uuid}_{mip}_{mtime_ns}.{self._EXTENSIONS[fmt]}"
+
+
+# Singleton instance
+_thumbnail_disk_cache_instance: Optional[ThumbnailDiskCache] = None
+
+
+def get_thumbnail_disk_cache() -> ThumbnailDiskCache:
+    """Get global ThumbnailDiskCache singleton instance"""
+    global _thumbnail_disk_cache_instance
+    if _thumbnail_disk_cache_instance is None:
+        _thumbnail_disk_cache_instance = ThumbnailDiskCache()
+    return _thumbnail_disk_cache_instance
+
+
+__all__ = ['ThumbnailDiskCache', 'get_thumbnail_disk_cache']
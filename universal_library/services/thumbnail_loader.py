@@ -5,21 +5,35 @@ Pattern: Background loading with QRunnable workers
 Based on animation_library architecture.
 """
 
+import heapq
+import itertools
 import time
+from collections import deque
 from pathlib import Path
-from typing import Optional, Set, Dict, Any
-from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, QThreadPool
+from typing import Optional, Set, Dict, Any, Iterable, List, Tuple
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, QThreadPool, QTimer, QRect
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QPixmap, QPixmapCache, QImage
+from PyQt6.QtGui import QPixmap, QImage
 
 from ..config import Config
 from ..utils.image_utils import load_image_as_qimage, scale_and_crop_image
+from .thumbnail_disk_cache import get_thumbnail_disk_cache
+from .path_info_cache import get_path_info_cache
+from .thumbnail_decode_pool import get_thumbnail_decode_pool
+from .thumbnail_atlas import ThumbnailAtlas
+from .image_cache import get_image_cache
 
 
 class ThumbnailLoadSignals(QObject):
     """Signals for ThumbnailLoadTask"""
     load_complete = pyqtSignal(str, str, QImage, float)  # uuid, cache_key, image, elapsed_ms
-    load_failed = pyqtSignal(str, str)  # uuid, error_message
+    load_failed = pyqtSignal(str, str, str)  # uuid, cache_key, error_message
+    load_cancelled = pyqtSignal(str, str)  # uuid, cache_key
+
+
+class ThumbnailFitSignals(QObject):
+    """Signals for ThumbnailFitTask"""
+    fit_complete = pyqtSignal(str, str, QImage)  # uuid, fitted_key, image
 
 
 class ThumbnailLoadTask(QRunnable):
@@ -28,6 +42,8 @@ class ThumbnailLoadTask(QRunnable):
 
     Features:
     - Loads image from disk in background thread
+    - Reads pre-scaled mips from the persistent disk cache when possible
+    - Optionally decodes in worker processes (ThumbnailDecodePool)
     - Scales and crops to target size
     - DPI scaling support
     - Performance timing
@@ -42,35 +58,35 @@ class ThumbnailLoadTask(QRunnable):
         asset_uuid: str,
         thumbnail_path: Path,
         cache_key: str,
-        target_size: int = 300
+        target_size: int = 300,
+        mtime_ns: Optional[int] = None
     ):
         super().__init__()
         self.asset_uuid = asset_uuid
         self.thumbnail_path = thumbnail_path
         self.cache_key = cache_key
         self.target_size = target_size
+        self.mtime_ns = mtime_ns  # Source mtime if the caller already knows it
         self.signals = ThumbnailLoadSignals()
         self.start_time = time.time()
+        self.cancelled = False
+
+    def cancel(self):
+        """Skip the load if the task has not started yet"""
+        self.cancelled = True
 
     def run(self):
         """Execute thumbnail loading task"""
+        if self.cancelled:
+            self.signals.load_cancelled.emit(self.asset_uuid, self.cache_key)
+            return
+
+        self.start_time = time.time()
         try:
-            # Load source image (this is the slow disk I/O operation)
-            source_image = load_image_as_qimage(self.thumbnail_path)
-            if source_image is None:
-                self.signals.load_failed.emit(
-                    self.asset_uuid,
-                    f"Failed to load image: {self.thumbnail_path}"
-                )
+            processed_image = self._load_from_disk_cache()
+            if processed_image is None:
                 return
 
-            # Scale and crop to target size
-            processed_image = scale_and_crop_image(
-                source_image,
-                self.target_size,
-                smooth=True
-            )
-
             # Apply DPI scaling for high-resolution displays
             if QApplication.instance():
                 screen = QApplication.primaryScreen()
@@ -92,9 +108,145 @@ class ThumbnailLoadTask(QRunnable):
         except Exception as e:
             self.signals.load_failed.emit(
                 self.asset_uuid,
+                self.cache_key,
                 f"Thumbnail load error: {e}"
             )
 
+    def _load_from_disk_cache(self) -> Optional[QImage]:
+        """
+        Get the scaled thumbnail, preferring a cached mip over the source
+
+        On a miss the source is decoded once and all mips are cached. With
+        the process backend a worker decodes it and renders the mips.
+
+        Returns:
+            Image at target size, or None if loading failed (signal emitted)
+        """
+        disk_cache = get_thumbnail_disk_cache()
+        mip = disk_cache.mip_for(self.target_size)
+        mtime_ns = None
+        if mip is not None:
+            mtime_ns = self.mtime_ns
+            if mtime_ns is None:
+                info = get_path_info_cache().get(self.thumbnail_path)
+                mtime_ns = info.mtime_ns if info.exists else None
+
+        if mtime_ns is not None:
+            cached = disk_cache.get(self.asset_uuid, mip, mtime_ns)
+            if cached is not None:
+                return self._fit(cached)
+
+            mips = self._decode_mips()
+            if mips is not None:
+                disk_cache.put_mips(self.asset_uuid, mtime_ns, mips)
+                return self._fit(mips[mip])
+
+        # Load source image (this is the slow disk I/O operation)
+        source_image = self._decode_source(in_pool=mtime_ns is None)
+        if source_image is None:
+            self.signals.load_failed.emit(
+                self.asset_uuid,
+                self.cache_key,
+                f"Failed to load image: {self.thumbnail_path}"
+            )
+            return None
+
+        if mtime_ns is not None:
+            mips = disk_cache.put(self.asset_uuid, mtime_ns, source_image)
+            return self._fit(mips[mip])
+
+        # Larger than the biggest mip: scale the source directly
+        return scale_and_crop_image(source_image, self.target_size, smooth=True)
+
+    def _decode_mips(self) -> Optional[Dict[int, QImage]]:
+        """
+        Decode the source and render every disk cache mip in a worker process
+
+        Returns:
+            Dict of mip size -> image, or None without the process backend
+            or if the worker could not decode the file
+        """
+        decode_pool = get_thumbnail_decode_pool()
+        if not decode_pool.enabled:
+            return None
+        return decode_pool.decode_mips(self.thumbnail_path, get_thumbnail_disk_cache().MIP_SIZES)
+
+    def _decode_source(self, in_pool: bool) -> Optional[QImage]:
+        """
+        Decode the source thumbnail
+
+        With in_pool and the process backend a worker decodes it, scaled
+        down to the target size.
+
+        Returns:
+            Decoded image, or None if the file could not be read
+        """
+        decode_pool = get_thumbnail_decode_pool()
+        if in_pool and decode_pool.enabled:
+            image = decode_pool.decode(self.thumbnail_path, self.target_size)
+            if image is not None:
+                return image
+        return load_image_as_qimage(self.thumbnail_path)
+
+    def _fit(self, image: QImage) -> QImage:
+        """Scale and crop a (square) mip to the target size"""
+        if image.width() == self.target_size and image.height() == self.target_size:
+            return image
+        return scale_and_crop_image(image, self.target_size, smooth=True)
+
+
+class ThumbnailFitTask(QRunnable):
+    """
+    Background task scaling a cached thumbnail to a card's exact device size
+
+    Keeps the smooth scale out of paint(); the view draws the unscaled
+    level until the fitted pixmap arrives.
+    """
+
+    def __init__(self, asset_uuid: str, fitted_key: str, image: QImage, pixels: int):
+        super().__init__()
+        self.asset_uuid = asset_uuid
+        self.fitted_key = fitted_key
+        self.image = image
+        self.pixels = pixels
+        self.signals = ThumbnailFitSignals()
+        self.cancelled = False
+
+    def cancel(self):
+        """Skip the scale if the task has not started yet"""
+        self.cancelled = True
+
+    def run(self):
+        """Execute the scale"""
+        if self.cancelled:
+            return
+        fitted = scale_and_crop_image(self.image, self.pixels, smooth=True)
+        self.signals.fit_complete.emit(self.asset_uuid, self.fitted_key, fitted)
+
+
+class _ThumbnailRequest:
+    """Queued load request; ordered by (priority, seq)"""
+
+    __slots__ = ('priority', 'seq', 'uuid', 'path', 'mtime_ns', 'cache_key',
+                 'size', 'cancellable', 'atlas', 'requested')
+
+    def __init__(self, priority: int, seq: int, uuid: str, path: Path,
+                 mtime_ns: int, cache_key: str, size: int, cancellable: bool,
+                 atlas: bool = False):
+        self.priority = priority
+        self.seq = seq
+        self.uuid = uuid
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.cache_key = cache_key
+        self.size = size
+        self.cancellable = cancellable
+        self.atlas = atlas  # Store in the atlas instead of the image cache
+        self.requested = time.perf_counter()
+
+    def __lt__(self, other: '_ThumbnailRequest') -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
 
 class ThumbnailLoader(QObject):
     """
@@ -103,8 +255,12 @@ class ThumbnailLoader(QObject):
     Features:
     - Background loading with worker threads
     - Load deduplication (prevents duplicate requests)
+    - Size buckets shared by nearby target sizes
+    - Priority queue: visible rows first, then prefetch; requests that
+      scrolled out of view are dropped before they start
     - Performance monitoring (cache hit rates, load times)
-    - QPixmapCache integration
+    - Shared ImageCache budget; visible thumbnails are pinned
+    - Atlas tiles for small cards (one batched signal per event loop pass)
     - DPI scaling support
 
     Usage:
@@ -113,33 +269,89 @@ class ThumbnailLoader(QObject):
         pixmap = loader.request_thumbnail(uuid, path, size)
         if pixmap is None:
             # Loading in background, will emit thumbnail_loaded when done
+
+        # Small cards
+        if loader.uses_atlas(size):
+            tile = loader.request_tile(uuid, path)  # (page, rect) or None
     """
 
     # Signals
     thumbnail_loaded = pyqtSignal(str, QPixmap)  # uuid, pixmap
     thumbnail_failed = pyqtSignal(str, str)  # uuid, error_message
+    tiles_loaded = pyqtSignal(list)  # uuids whose atlas tiles were stored
+    fitted_loaded = pyqtSignal(list)  # uuids whose exact-size pixmaps were stored
+
+    # Requested sizes are rounded up to these levels (matching the disk
+    # cache mips), so zooming the card grid reuses cached pixmaps instead
+    # of loading a new size per slider step. Views that draw many cards
+    # use request_fitted() for a pixmap scaled once, on a worker, to their
+    # exact rect.
+    SIZE_BUCKETS = (64, 128, 256, 512)
+
+    # Exact sizes kept per asset; older ones (earlier zoom steps) are evicted
+    FITTED_SIZES_PER_ASSET = 2
+
+    # Request priorities (lower runs first)
+    PRIORITY_VISIBLE = 0
+    PRIORITY_PREFETCH = 1
+
+    # Latency samples kept for stats
+    STATS_WINDOW = 1000
+
+    # ImageCache consumer for thumbnail pixmaps
+    CACHE_CONSUMER = 'thumbnails'
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # Thread pool for background loading
         self.thread_pool = QThreadPool.globalInstance()
-        self.thread_pool.setMaxThreadCount(Config.THUMBNAIL_THREAD_COUNT)
+        thread_count = Config.THUMBNAIL_THREAD_COUNT
+        decode_pool = get_thumbnail_decode_pool()
+        if decode_pool.enabled:
+            # Threads mostly wait on worker processes; keep every process busy
+            thread_count = max(thread_count, decode_pool.workers)
+        self.thread_pool.setMaxThreadCount(thread_count)
 
         # Load deduplication - prevents same thumbnail being loaded multiple times
         self.pending_requests: Set[str] = set()
 
+        # Requests wait here and are handed to the pool only when a worker
+        # is free, so they can still be reordered or dropped
+        self._queue: List[_ThumbnailRequest] = []
+        self._queued: Dict[str, _ThumbnailRequest] = {}  # cache_key -> live request
+        self._in_flight: Dict[QObject, Tuple[ThumbnailLoadTask, _ThumbnailRequest]] = {}
+        self._seq = itertools.count()
+
         # Performance monitoring
-        self.load_times: list[float] = []
+        self.load_times: deque = deque(maxlen=self.STATS_WINDOW)
+        self.latencies: deque = deque(maxlen=self.STATS_WINDOW)
         self.cache_hits: int = 0
         self.cache_misses: int = 0
         self.total_requests: int = 0
+        self.prefetch_requests: int = 0
+        self.dropped_requests: int = 0
+
+        # File existence/mtime lookups without per-paint stat() calls
+        self._path_info = get_path_info_cache()
+        self._paths: Dict[str, str] = {}  # uuid -> last requested thumbnail path
+        self._fitted_keys: Dict[str, List[str]] = {}  # uuid -> exact-size cache keys, newest last
+        self._fitting: Dict[str, ThumbnailFitTask] = {}  # uuid -> pending scale to its latest size
+        self._fitted_uuids: List[str] = []
+
+        # Pixmaps share the app-wide image budget
+        self._image_cache = get_image_cache()
+
+        # Small thumbnails live in shared atlas pages
+        self.atlas = ThumbnailAtlas()
+        self._loaded_tiles: List[str] = []
 
     def request_thumbnail(
         self,
         asset_uuid: str,
         thumbnail_path: str,
-        target_size: int = 300
+        target_size: int = 300,
+        cancellable: bool = False
     ) -> Optional[QPixmap]:
         """
         Request thumbnail (returns from cache or starts async load)
@@ -148,116 +360,519 @@ class ThumbnailLoader(QObject):
             asset_uuid: Asset UUID
             thumbnail_path: Path to thumbnail image file
             target_size: Target size for scaling
+            cancellable: Drop the request if a later set_viewport() no longer
+                lists the asset (for views that report their viewport)
 
         Returns:
-            QPixmap if in cache, None if loading in background
+            QPixmap if in cache (may be another size level; scale to fit),
+            None if loading in background
         """
         if not thumbnail_path:
             return None
 
-        path = Path(thumbnail_path)
-        if not path.exists():
+        # Memory-only on repeat paints; the file is stat-ed once per TTL
+        info = self._path_info.get(thumbnail_path)
+        if not info.exists:
             # File missing (possibly moved to archive) - emit failed so UI can refresh from DB
             self.thumbnail_failed.emit(asset_uuid, "File not found (may have been archived)")
             return None
 
         self.total_requests += 1
+        self._paths[asset_uuid] = thumbnail_path
 
-        # Generate cache key (includes file mtime for auto-invalidation)
-        cache_key = self._generate_cache_key(asset_uuid, target_size, thumbnail_path)
-
-        # Check cache first (fast path)
-        pixmap = QPixmapCache.find(cache_key)
-        if pixmap:
+        pixmap, fallback = self._lookup(asset_uuid, info.mtime_ns, target_size)
+        if pixmap is not None:
             self.cache_hits += 1
             return pixmap
 
         self.cache_misses += 1
+        self._enqueue(asset_uuid, thumbnail_path, info.mtime_ns, target_size,
+                      self.PRIORITY_VISIBLE, cancellable)
+        self._dispatch()
 
-        # Check if already loading (deduplication)
-        if cache_key in self.pending_requests:
-            # Already loading, don't start duplicate request
+        return fallback  # None: caller should show placeholder
+
+    def request_fitted(
+        self,
+        asset_uuid: str,
+        thumbnail_path: str,
+        size: int,
+        dpr: float = 1.0,
+        cancellable: bool = False
+    ) -> Optional[Tuple[QPixmap, QRect]]:
+        """
+        Request a thumbnail scaled and center-cropped to exactly its drawn size
+
+        The cached size level (or atlas tile) is smooth-scaled once per asset
+        and device size on a worker and kept in the image cache, so painting
+        draws it 1:1. Until then the level itself is returned for the painter
+        to stretch; fitted_loaded announces the exact-size pixmaps.
+
+        Args:
+            asset_uuid: Asset UUID
+            thumbnail_path: Path to thumbnail image file
+            size: Width and height of the target rect (logical pixels)
+            dpr: Device pixel ratio of the paint device
+            cancellable: Drop the request if a later set_viewport() no longer
+                lists the asset
+
+        Returns:
+            (pixmap, source rect) to draw into the target rect, or None if
+            loading in background
+        """
+        if not thumbnail_path:
             return None
 
-        # Not in cache - start background load
-        self.pending_requests.add(cache_key)
+        pixels = max(1, round(size * dpr))
+        info = self._path_info.get(thumbnail_path)
+        key = self._fitted_key(asset_uuid, pixels, info.mtime_ns)
+        if info.exists:
+            fitted = self._image_cache.get(self.CACHE_CONSUMER, key)
+            if fitted is not None:
+                self.total_requests += 1
+                self.cache_hits += 1
+                return fitted, fitted.rect()
+
+        if self.uses_atlas(size):
+            tile = self.request_tile(asset_uuid, thumbnail_path, cancellable)
+            if tile is None:
+                return None
+            page, source_rect = tile
+            if source_rect.width() == pixels and source_rect.height() == pixels:
+                return tile
+            if not self._is_fitting(asset_uuid, key):
+                self._schedule_fit(asset_uuid, key, page.copy(source_rect).toImage(), pixels)
+            return tile
+
+        source = self.request_thumbnail(asset_uuid, thumbnail_path, size, cancellable)
+        if source is None:
+            return None
+        if source.width() == pixels and source.height() == pixels:
+            return source, source.rect()
+        # Smaller stand-in levels are shown while the real one loads, not fitted
+        if source.width() >= self.bucket_for(size) and not self._is_fitting(asset_uuid, key):
+            self._schedule_fit(asset_uuid, key, source.toImage(), pixels)
+        return source, source.rect()
+
+    def _is_fitting(self, asset_uuid: str, fitted_key: str) -> bool:
+        """Check if a scale to this exact size is already pending"""
+        task = self._fitting.get(asset_uuid)
+        return task is not None and task.fitted_key == fitted_key
+
+    def _schedule_fit(self, asset_uuid: str, fitted_key: str, image: QImage, pixels: int):
+        """Scale a thumbnail to an exact size on a worker"""
+        # A newer size (next zoom step) supersedes one still waiting for a worker
+        previous = self._fitting.get(asset_uuid)
+        if previous is not None:
+            previous.cancel()
+
+        task = ThumbnailFitTask(asset_uuid, fitted_key, image, pixels)
+        task.signals.fit_complete.connect(self._on_fit_complete)
+        self._fitting[asset_uuid] = task
+        self.thread_pool.start(task)
+
+    def _on_fit_complete(self, uuid: str, fitted_key: str, image: QImage):
+        """Store an exact-size pixmap unless it was superseded or invalidated"""
+        task = self._fitting.get(uuid)
+        if task is None or task.fitted_key != fitted_key:
+            return
+        del self._fitting[uuid]
+
+        keys = self._fitted_keys.setdefault(uuid, [])
+        if fitted_key in keys:
+            keys.remove(fitted_key)
+        keys.append(fitted_key)
+        while len(keys) > self.FITTED_SIZES_PER_ASSET:
+            self._image_cache.remove(self.CACHE_CONSUMER, keys.pop(0))
+        self._image_cache.put(self.CACHE_CONSUMER, fitted_key, QPixmap.fromImage(image))
+
+        if not self._fitted_uuids:
+            QTimer.singleShot(0, self._emit_fitted_loaded)
+        self._fitted_uuids.append(uuid)
+
+    def _emit_fitted_loaded(self):
+        """Announce the exact-size pixmaps stored since the last event loop pass"""
+        uuids, self._fitted_uuids = self._fitted_uuids, []
+        if uuids:
+            self.fitted_loaded.emit(uuids)
+
+    def uses_atlas(self, target_size: int) -> bool:
+        """Check if thumbnails drawn at a size should come from the atlas"""
+        return target_size <= self.atlas.tile_size
+
+    def request_tile(
+        self,
+        asset_uuid: str,
+        thumbnail_path: str,
+        cancellable: bool = False
+    ) -> Optional[Tuple[QPixmap, QRect]]:
+        """
+        Request an atlas tile (returns it if stored or starts async load)
+
+        Completed loads are announced together through tiles_loaded rather
+        than one thumbnail_loaded per asset.
+
+        Args:
+            asset_uuid: Asset UUID
+            thumbnail_path: Path to thumbnail image file
+            cancellable: Drop the request if a later set_viewport() no longer
+                lists the asset
+
+        Returns:
+            (atlas page, tile rect) if stored, None if loading in background
+        """
+        if not thumbnail_path:
+            return None
+
+        info = self._path_info.get(thumbnail_path)
+        if not info.exists:
+            self.thumbnail_failed.emit(asset_uuid, "File not found (may have been archived)")
+            return None
+
+        self.total_requests += 1
+        self._paths[asset_uuid] = thumbnail_path
+
+        tile = self.atlas.find(asset_uuid, info.mtime_ns)
+        if tile is not None:
+            self.cache_hits += 1
+            return tile
+
+        self.cache_misses += 1
+        self._enqueue(asset_uuid, thumbnail_path, info.mtime_ns, self.atlas.tile_size,
+                      self.PRIORITY_VISIBLE, cancellable, atlas=True)
+        self._dispatch()
+        return None
+
+    def set_viewport(
+        self,
+        visible: Iterable[Tuple[str, str]],
+        prefetch: Iterable[Tuple[str, str]],
+        target_size: int,
+        dpr: float = 1.0
+    ):
+        """
+        Reprioritize loads for a view's visible and upcoming rows
+
+        Queued cancellable requests for assets in neither list are dropped,
+        queued requests for visible assets move to the front, and the
+        prefetch assets are queued behind them. Visible thumbnails are
+        pinned in the image cache: the exact-size pixmaps request_fitted()
+        paints, and the size level they are scaled from.
+
+        Args:
+            visible: (uuid, thumbnail_path) of rows currently on screen
+            prefetch: (uuid, thumbnail_path) of rows about to scroll in
+            target_size: Thumbnail size the view draws at
+            dpr: Device pixel ratio the view paints with
+        """
+        visible = [(uuid, path) for uuid, path in visible if path]
+        prefetch = [(uuid, path) for uuid, path in prefetch if path]
+        visible_uuids = {uuid for uuid, _ in visible}
+        wanted = visible_uuids | {uuid for uuid, _ in prefetch}
+
+        changed = False
+        for key, request in list(self._queued.items()):
+            if request.uuid in visible_uuids:
+                if request.priority != self.PRIORITY_VISIBLE:
+                    self._requeue(request, self.PRIORITY_VISIBLE)
+                    changed = True
+            elif request.cancellable and request.uuid not in wanted:
+                del self._queued[key]
+                self.pending_requests.discard(key)
+                self.dropped_requests += 1
+                changed = True
+
+        for task, request in self._in_flight.values():
+            if request.cancellable and request.uuid not in wanted:
+                task.cancel()
+
+        atlas = self.uses_atlas(target_size)
+
+        # Keep what is on screen when the image budget forces evictions
+        # (atlas tiles are outside the image cache, their fitted copies not)
+        pinned = []
+        size = self.bucket_for(target_size)
+        pixels = max(1, round(target_size * dpr))
+        for uuid, thumbnail_path in visible:
+            info = self._path_info.get(thumbnail_path)
+            if info.exists:
+                pinned.append(self._fitted_key(uuid, pixels, info.mtime_ns))
+                if not atlas:
+                    pinned.append(self._cache_key(uuid, size, info.mtime_ns))
+        self._image_cache.set_pinned(self.CACHE_CONSUMER, pinned)
+
+        for uuid, thumbnail_path in prefetch:
+            if uuid in visible_uuids:
+                continue
+            info = self._path_info.get(thumbnail_path)
+            if not info.exists:
+                continue
+            if atlas:
+                cached = self.atlas.find(uuid, info.mtime_ns) is not None
+            else:
+                cached = self._lookup(uuid, info.mtime_ns, target_size)[0] is not None
+            if not cached:
+                if self._enqueue(uuid, thumbnail_path, info.mtime_ns, target_size,
+                                 self.PRIORITY_PREFETCH, True, atlas=atlas):
+                    self.prefetch_requests += 1
+                    changed = True
+
+        if changed:
+            heapq.heapify(self._queue)
+            self._dispatch()
+
+    def _lookup(self, asset_uuid: str, mtime_ns: int,
+                target_size: int) -> Tuple[Optional[QPixmap], Optional[QPixmap]]:
+        """
+        Look up a thumbnail in the image cache
+
+        Returns:
+            (pixmap to use, smaller stand-in level); the first is None on a miss
+        """
+        size = self.bucket_for(target_size)
 
-        task = ThumbnailLoadTask(
-            asset_uuid,
-            path,
-            cache_key,
-            target_size=target_size
+        # Check cache first (fast path)
+        pixmap = self._image_cache.get(self.CACHE_CONSUMER, self._cache_key(asset_uuid, size, mtime_ns))
+        if pixmap is not None:
+            return pixmap, None
+
+        # Another level of the same thumbnail: a larger one is served as is,
+        # a smaller one stands in while the requested level loads
+        fallback = self._find_cached_level(asset_uuid, size, mtime_ns)
+        if fallback is not None and fallback.width() >= size:
+            return fallback, None
+        return None, fallback
+
+    def _enqueue(self, asset_uuid: str, thumbnail_path: str, mtime_ns: int,
+                 target_size: int, priority: int, cancellable: bool,
+                 atlas: bool = False) -> bool:
+        """
+        Queue a load unless the same thumbnail is already pending
+
+        Returns:
+            True if a new request was queued
+        """
+        if atlas:
+            size = self.atlas.tile_size
+            cache_key = self._atlas_key(asset_uuid, mtime_ns)
+        else:
+            size = self.bucket_for(target_size)
+            cache_key = self._cache_key(asset_uuid, size, mtime_ns)
+
+        # Check if already loading (deduplication)
+        if cache_key in self.pending_requests:
+            request = self._queued.get(cache_key)
+            if request is not None:
+                if priority < request.priority:
+                    self._requeue(request, priority)
+                    heapq.heapify(self._queue)
+                # A non-cancellable caller also needs it
+                request.cancellable = request.cancellable and cancellable
+            return False
+
+        request = _ThumbnailRequest(
+            priority, next(self._seq), asset_uuid, Path(thumbnail_path), mtime_ns,
+            cache_key, size, cancellable, atlas
         )
+        self.pending_requests.add(cache_key)
+        self._queued[cache_key] = request
+        heapq.heappush(self._queue, request)
+        return True
+
+    def _requeue(self, request: _ThumbnailRequest, priority: int):
+        """Change a queued request's priority (caller re-heapifies)"""
+        request.priority = priority
+        # Newest requests first within a priority: what was just scrolled to
+        request.seq = -next(self._seq)
+
+    def _dispatch(self):
+        """Hand queued requests to the pool while workers are free"""
+        max_in_flight = max(1, self.thread_pool.maxThreadCount())
+        while self._queue and len(self._in_flight) < max_in_flight:
+            request = heapq.heappop(self._queue)
+            if self._queued.get(request.cache_key) is not request:
+                continue  # Dropped
+            del self._queued[request.cache_key]
+
+            task = ThumbnailLoadTask(
+                request.uuid,
+                request.path,
+                request.cache_key,
+                target_size=request.size,
+                mtime_ns=request.mtime_ns
+            )
 
-        # Connect signals
-        task.signals.load_complete.connect(self._on_load_complete)
-        task.signals.load_failed.connect(self._on_load_failed)
+            # Connect signals
+            task.signals.load_complete.connect(self._on_load_complete)
+            task.signals.load_failed.connect(self._on_load_failed)
+            task.signals.load_cancelled.connect(self._on_load_cancelled)
 
-        # Start task in thread pool
-        self.thread_pool.start(task)
+            # Start task in thread pool
+            self._in_flight[task.signals] = (task, request)
+            self.thread_pool.start(task)
 
-        return None  # Caller should show placeholder
+    def _finish_task(self) -> Optional[_ThumbnailRequest]:
+        """Release the finished task's worker slot and start the next request"""
+        entry = self._in_flight.pop(self.sender(), None)
+        self._dispatch()
+        return entry[1] if entry else None
 
     def _on_load_complete(self, uuid: str, cache_key: str, image: QImage, elapsed_ms: float):
         """Handle successful thumbnail load"""
+        request = self._finish_task()
+
         # Remove from pending
         self.pending_requests.discard(cache_key)
 
         # Track load time
         self.load_times.append(elapsed_ms)
+        if request is not None:
+            self.latencies.append((time.perf_counter() - request.requested) * 1000)
+
+        if request is not None and request.atlas:
+            self.atlas.insert(uuid, request.mtime_ns, image)
+            if not self._loaded_tiles:
+                QTimer.singleShot(0, self._emit_tiles_loaded)
+            self._loaded_tiles.append(uuid)
+            return
 
         # Convert to pixmap
         pixmap = QPixmap.fromImage(image)
 
         # Store in cache
-        QPixmapCache.insert(cache_key, pixmap)
+        self._image_cache.put(self.CACHE_CONSUMER, cache_key, pixmap)
 
         # Emit signal so views can update
         self.thumbnail_loaded.emit(uuid, pixmap)
 
-    def _on_load_failed(self, uuid: str, error_message: str):
+    def _emit_tiles_loaded(self):
+        """Announce the atlas tiles stored since the last event loop pass"""
+        uuids, self._loaded_tiles = self._loaded_tiles, []
+        if uuids:
+            self.tiles_loaded.emit(uuids)
+
+    def _on_load_failed(self, uuid: str, cache_key: str, error_message: str):
         """Handle failed thumbnail load"""
-        # Remove from pending using exact cache key prefix matching
-        # Use f"asset_{uuid}_" to avoid uuid_1 matching uuid_11
-        key_prefix = f"asset_{uuid}_"
-        to_remove = [key for key in self.pending_requests if key.startswith(key_prefix)]
-        for key in to_remove:
-            self.pending_requests.discard(key)
+        self._finish_task()
+
+        # Remove from pending
+        self.pending_requests.discard(cache_key)
 
         # Emit failure signal
         self.thumbnail_failed.emit(uuid, error_message)
 
-    def _generate_cache_key(self, asset_uuid: str, target_size: int, thumbnail_path: str = None) -> str:
-        """Generate unique cache key for thumbnail.
-        
-        Includes file modification time so cache auto-invalidates when file changes.
+    def _on_load_cancelled(self, uuid: str, cache_key: str):
+        """Handle a load dropped before it started"""
+        self._finish_task()
+        self.pending_requests.discard(cache_key)
+        self.dropped_requests += 1
+
+    @classmethod
+    def bucket_for(cls, target_size: int) -> int:
         """
-        mtime_suffix = ""
-        if thumbnail_path:
-            try:
-                path = Path(thumbnail_path)
-                if path.exists():
-                    mtime_suffix = f"_{int(path.stat().st_mtime)}"
-            except Exception:
-                pass
-        return f"asset_{asset_uuid}_{target_size}{mtime_suffix}"
-    
+        Round a requested size up to its cache level
+
+        Args:
+            target_size: Requested size in pixels
+
+        Returns:
+            Smallest bucket covering the size (the size itself above the largest bucket)
+        """
+        for size in cls.SIZE_BUCKETS:
+            if size >= target_size:
+                return size
+        return target_size
+
+    def _find_cached_level(self, asset_uuid: str, size: int,
+                           mtime_ns: int) -> Optional[QPixmap]:
+        """Find the nearest cached level of a thumbnail, larger levels first"""
+        larger = [s for s in self.SIZE_BUCKETS if s > size]
+        smaller = [s for s in reversed(self.SIZE_BUCKETS) if s < size]
+        for level in larger + smaller:
+            pixmap = self._image_cache.peek(self.CACHE_CONSUMER, self._cache_key(asset_uuid, level, mtime_ns))
+            if pixmap is not None:
+                return pixmap
+        return None
+
+    @staticmethod
+    def _cache_key(asset_uuid: str, size: int, mtime_ns: int) -> str:
+        """Cache key for a thumbnail level; includes the file mtime so keys change with the file"""
+        return f"asset_{asset_uuid}_{size}_{mtime_ns}"
+
+    @staticmethod
+    def _fitted_key(asset_uuid: str, pixels: int, mtime_ns: int) -> str:
+        """Cache key for a thumbnail scaled to an exact device size"""
+        return f"fit_{asset_uuid}_{pixels}_{mtime_ns}"
+
+    @staticmethod
+    def _atlas_key(asset_uuid: str, mtime_ns: int) -> str:
+        """Pending-request key for an atlas tile load"""
+        return f"atlas_{asset_uuid}_{mtime_ns}"
+
     def invalidate_thumbnail(self, asset_uuid: str):
         """Remove cached thumbnails for a specific asset.
         
         Call this when a thumbnail file has been updated externally.
         """
-        # QPixmapCache doesn't support prefix removal, so we need to
-        # remove common sizes manually
-        for size in [64, 128, 256, 300, 512]:
-            # Try without mtime (old keys) and hope it matches
-            key = f"asset_{asset_uuid}_{size}"
-            QPixmapCache.remove(key)
-        
+        path = self._paths.get(asset_uuid)
+        if path:
+            # Drop the levels keyed by the last known mtime
+            self._drop_levels(asset_uuid, self._path_info.get(path).mtime_ns)
+            # Re-stat on the next request so it builds a fresh key
+            self._path_info.invalidate(path)
+        self._drop_loads(asset_uuid)
+
+    def invalidate_if_changed(self, asset_uuid: str, thumbnail_path: Optional[str]) -> bool:
+        """
+        Invalidate a thumbnail only if its file changed since it was loaded
+
+        Cheap for metadata-only edits (favorite, tags, folders): one stat
+        of a thumbnail this loader has served, nothing otherwise.
+
+        Args:
+            asset_uuid: Asset UUID
+            thumbnail_path: Thumbnail path now stored for the asset
+
+        Returns:
+            True if cached thumbnails were dropped
+        """
+        path = self._paths.get(asset_uuid)
+        if not path:
+            return False  # Never loaded, nothing cached
+        if path != thumbnail_path:
+            self.invalidate_thumbnail(asset_uuid)
+            return True
+
+        cached = self._path_info.get(path)
+        self._path_info.invalidate(path)
+        if self._path_info.get(path) == cached:
+            return False
+        self._drop_levels(asset_uuid, cached.mtime_ns)
+        self._drop_loads(asset_uuid)
+        return True
+
+    def _drop_levels(self, asset_uuid: str, mtime_ns: int):
+        """Remove cached size levels of one thumbnail version"""
+        for size in self.SIZE_BUCKETS:
+            self._image_cache.remove(self.CACHE_CONSUMER, self._cache_key(asset_uuid, size, mtime_ns))
+
+    def _drop_loads(self, asset_uuid: str):
+        """Remove an asset's exact-size pixmaps, atlas tile, queued loads and disk cache entries"""
+        for key in self._fitted_keys.pop(asset_uuid, ()):
+            self._image_cache.remove(self.CACHE_CONSUMER, key)
+        task = self._fitting.pop(asset_uuid, None)
+        if task is not None:
+            task.cancel()
+        self.atlas.remove(asset_uuid)
+
         # Also remove from pending requests
-        to_remove = [k for k in self.pending_requests if asset_uuid in k]
+        key_prefixes = (f"asset_{asset_uuid}_", f"atlas_{asset_uuid}_")
+        to_remove = [k for k in self.pending_requests if k.startswith(key_prefixes)]
         for k in to_remove:
             self.pending_requests.discard(k)
+            self._queued.pop(k, None)
+
+        get_thumbnail_disk_cache().invalidate(asset_uuid)
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -268,6 +883,7 @@ class ThumbnailLoader(QObject):
         """
         hit_rate = (self.cache_hits / self.total_requests * 100) if self.total_requests > 0 else 0
         avg_load_time = (sum(self.load_times) / len(self.load_times)) if self.load_times else 0
+        latencies = sorted(self.latencies)
 
         return {
             'total_requests': self.total_requests,
@@ -275,18 +891,40 @@ class ThumbnailLoader(QObject):
             'cache_misses': self.cache_misses,
             'cache_hit_rate': hit_rate,
             'avg_load_time_ms': avg_load_time,
+            'avg_latency_ms': (sum(latencies) / len(latencies)) if latencies else 0,
+            'p95_latency_ms': latencies[int(len(latencies) * 0.95)] if latencies else 0,
             'pending_count': len(self.pending_requests),
+            'queued_count': len(self._queued),
+            'in_flight_count': len(self._in_flight),
+            'prefetch_requests': self.prefetch_requests,
+            'dropped_requests': self.dropped_requests,
             'thread_count': self.thread_pool.maxThreadCount(),
+            'disk_cache': get_thumbnail_disk_cache().get_stats(),
+            'path_info': self._path_info.get_stats(),
+            'decode_pool': get_thumbnail_decode_pool().get_stats(),
+            'atlas': self.atlas.get_stats(),
+            'image_cache': self._image_cache.get_stats()['consumers'].get(self.CACHE_CONSUMER, {}),
         }
 
     def clear_cache(self):
-        """Clear QPixmapCache"""
-        QPixmapCache.clear()
+        """Clear cached pixmaps and queued loads"""
+        self._image_cache.clear(self.CACHE_CONSUMER)
+        self._fitted_keys.clear()
+        for task in self._fitting.values():
+            task.cancel()
+        self._fitting.clear()
         self.pending_requests.clear()
+        self._queued.clear()
+        self._queue.clear()
+        self._path_info.invalidate()
+        self.atlas.clear()
 
     def reset_stats(self):
         """Reset performance statistics"""
         self.load_times.clear()
+        self.latencies.clear()
+        self.prefetch_requests = 0
+        self.dropped_requests = 0
         self.cache_hits = 0
         self.cache_misses = 0
         self.total_requests = 0
@@ -309,4 +947,4 @@ def get_thumbnail_loader() -> ThumbnailLoader:
     return _thumbnail_loader_instance
 
 
-__all__ = ['ThumbnailLoader', 'ThumbnailLoadTask', 'get_thumbnail_loader']
+__all__ = ['ThumbnailLoader', 'ThumbnailLoadTask', 'ThumbnailFitTask', 'get_thumbnail_loader']
@@ -0,0 +1,353 @@
+"""
+WriteQueue - Coalescing single-writer queue for small database writes
+
+Pattern: Singleton with a background writer thread
+Small, frequent writes (favorites, tags, last viewed, folder memberships) are queued and committed together in grouped transactions
+on the shared writer connection, instead of one transaction each on the
+UI thread.
+"""
+
+import heapq
+import itertools
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from ..config import Config
+from .connection_manager import get_connection_manager
+
+logger = logging.getLogger(__name__)
+
+
+class _WriteOp:
+    """One queued write; ordered by (priority, seq)"""
+
+    __slots__ = ('priority', 'seq', 'key', 'fn', 'callbacks', 'submitted')
+
+    def __init__(self, priority: int, seq: int, key: Optional[Hashable],
+                 fn: Callable[[sqlite3.Connection], Any]):
+        self.priority = priority
+        self.seq = seq
+        self.key = key
+        self.fn = fn  # None once superseded by a later write with the same key
+        self.callbacks: List[Callable[[bool], None]] = []
+        self.submitted = time.perf_counter()
+
+    def __lt__(self, other: '_WriteOp') -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class WriteQueue:
+    """
+    Background queue that batches small writes into grouped transactions
+
+    Writes are functions taking the writer connection. A write submitted
+    with a key replaces a still-pending write with the same key, so e.g.
+    toggling a tag twice costs nothing. HIGH priority writes are
+    committed without waiting for the batch window.
+
+    Usage:
+        queue = get_write_queue()
+        queue.set_favorite(uuid, True, on_done=callback)
+        queue.add_assets_to_folder(uuids, folder_id, on_done=callback)
+        queue.flush()  # Block until committed (before reading back)
+    """
+
+    PRIORITY_HIGH = 0
+    PRIORITY_NORMAL = 1
+    PRIORITY_LOW = 2
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap: List[_WriteOp] = []
+        self._pending: Dict[Hashable, _WriteOp] = {}  # key -> latest pending op
+        self._live: Dict[int, _WriteOp] = {}  # seq -> op, queued or in flight
+        self._seq = itertools.count(1)
+        self._thread: Optional[threading.Thread] = None
+        self._flush_requested = False
+        self._stopping = False
+
+        self._submitted = 0
+        self._coalesced = 0
+        self._committed = 0
+        self._failed = 0
+        self._batches = 0
+        self._max_depth = 0
+        self._commit_total_s = 0.0
+        self._commit_max_s = 0.0
+        self._queue_wait_total_s = 0.0
+
+    # ==================== SUBMIT / FLUSH ====================
+
+    def submit(self, fn: Callable[[sqlite3.Connection], Any],
+               priority: int = PRIORITY_NORMAL,
+               key: Optional[Hashable] = None,
+               on_done: Optional[Callable[[bool], None]] = None):
+        """
+        Queue a write
+
+        Args:
+            fn: Function executing the write on the given connection
+                (runs on the writer thread inside a transaction)
+            priority: PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW
+            key: Optional coalescing key; replaces a pending write with the same key
+            on_done: Optional callable(success) run on the writer thread once
+                the write (or the write that superseded it) committed or failed
+        """
+        with self._cond:
+            op = _WriteOp(priority, next(self._seq), key, fn)
+            if on_done is not None:
+                op.callbacks.append(on_done)
+            if key is not None:
+                previous = self._pending.get(key)
+                if previous is not None:
+                    # Superseded: keep it in the heap but skip it when popped
+                    previous.fn = None
+                    self._live.pop(previous.seq, None)
+                    op.priority = min(op.priority, previous.priority)
+                    op.callbacks[:0] = previous.callbacks
+                    self._coalesced += 1
+                self._pending[key] = op
+
+            heapq.heappush(self._heap, op)
+            self._live[op.seq] = op
+            self._submitted += 1
+            self._max_depth = max(self._max_depth, len(self._live))
+
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Commit everything queued so far and wait for it
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True if all writes queued before the call were committed (or failed)
+        """
+        if threading.current_thread() is self._thread:
+            return False
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            target = next(self._seq)
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._live and min(self._live) < target:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Flush pending writes and stop the writer thread
+
+        Writes submitted while stopping are still committed before the
+        thread exits, and a later submit() starts a new writer thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the flush
+        """
+        self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._cond:
+            self._stopping = False
+
+    def _ensure_thread(self):
+        """Start the writer thread on first use (condition must be held)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="WriteQueue", daemon=True
+            )
+            self._thread.start()
+
+    # ==================== WRITER THREAD ====================
+
+    def _run(self):
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+                if batch:
+                    self._commit(batch)
+        finally:
+            get_connection_manager().close_thread()
+
+    def _next_batch(self) -> Optional[List[_WriteOp]]:
+        """Wait for writes, then collect a batch (None when stopping)"""
+        window = Config.WRITE_QUEUE_BATCH_MS / 1000.0
+        with self._cond:
+            while not self._heap:
+                if self._stopping:
+                    return None
+                self._cond.wait()
+
+            # Let small writes accumulate unless something is urgent
+            deadline = time.monotonic() + window
+            while (not self._flush_requested and not self._stopping
+                   and self._heap[0].priority > self.PRIORITY_HIGH
+                   and len(self._live) < Config.WRITE_QUEUE_MAX_BATCH):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = []
+            while self._heap and len(batch) < Config.WRITE_QUEUE_MAX_BATCH:
+                op = heapq.heappop(self._heap)
+                if op.fn is None:
+                    continue
+                if op.key is not None and self._pending.get(op.key) is op:
+                    del self._pending[op.key]
+                batch.append(op)
+
+            if not self._heap:
+                self._flush_requested = False
+            return batch
+
+    def _commit(self, batch: List[_WriteOp]):
+        """Run a batch in one transaction, falling back to one transaction per write"""
+        manager = get_connection_manager()
+        start = time.perf_counter()
+        failed_ops = set()
+        try:
+            with manager.transaction() as conn:
+                for op in batch:
+                    op.fn(conn)
+        except Exception as e:
+            logger.warning(f"Batched write of {len(batch)} operation(s) failed, retrying singly: {e}")
+            for op in batch:
+                try:
+                    with manager.transaction() as conn:
+                        op.fn(conn)
+                except Exception as op_error:
+                    failed_ops.add(op.seq)
+                    logger.error(f"Queued write failed: {op_error}")
+        elapsed = time.perf_counter() - start
+        failed = len(failed_ops)
+
+        for op in batch:
+            for callback in op.callbacks:
+                try:
+                    callback(op.seq not in failed_ops)
+                except Exception as e:
+                    logger.error(f"Write completion callback failed: {e}")
+
+        with self._cond:
+            for op in batch:
+                self._live.pop(op.seq, None)
+                self._queue_wait_total_s += start - op.submitted
+            self._batches += 1
+            self._committed += len(batch) - failed
+            self._failed += failed
+            self._commit_total_s += elapsed
+            self._commit_max_s = max(self._commit_max_s, elapsed)
+            self._cond.notify_all()
+
+    # ==================== STATS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics
+
+        Returns:
+            Dict with queue depth, coalescing and commit latency figures
+        """
+        with self._cond:
+            batches = self._batches
+            done = self._committed + self._failed
+            return {
+                'queue_depth': len(self._live),
+                'max_queue_depth': self._max_depth,
+                'submitted': self._submitted,
+                'coalesced': self._coalesced,
+                'committed': self._committed,
+                'failed': self._failed,
+                'batches': batches,
+                'avg_batch_size': (done / batches) if batches else 0.0,
+                'avg_commit_ms': (self._commit_total_s / batches * 1000) if batches else 0.0,
+                'max_commit_ms': self._commit_max_s * 1000,
+                'avg_queue_wait_ms': (self._queue_wait_total_s / done * 1000) if done else 0.0,
+            }
+
+    # ==================== COMMON WRITES ====================
+
+    def touch_last_viewed(self, uuid: str, priority: int = PRIORITY_LOW):
+        """Queue recording that an asset was viewed now (UTC, like update_last_viewed)"""
+        self.submit(
+            lambda conn: conn.execute(
+                'UPDATE assets SET last_viewed_date = CURRENT_TIMESTAMP WHERE uuid = ?',
+                (uuid,)
+            ),
+            priority, key=('last_viewed', uuid)
+        )
+
+    def set_favorite(self, uuid: str, is_favorite: bool,
+                     priority: int = PRIORITY_NORMAL,
+                     on_done: Optional[Callable[[bool], None]] = None):
+        """Queue setting an asset's favorite flag (replaces a pending toggle of the same asset)"""
+        value = 1 if is_favorite else 0
+        self.submit(
+            lambda conn: conn.execute(
+                'UPDATE assets SET is_favorite = ?, modified_date = CURRENT_TIMESTAMP WHERE uuid = ?',
+                (value, uuid)
+            ),
+            priority, key=('favorite', uuid), on_done=on_done
+        )
+
+    def set_asset_tag(self, asset_uuid: str, tag_id: int, tagged: bool,
+                      priority: int = PRIORITY_NORMAL,
+                      on_done: Optional[Callable[[bool], None]] = None):
+        """Queue adding or removing a tag on an asset (replaces a pending change of the same tag)"""
+        if tagged:
+            sql = 'INSERT OR IGNORE INTO asset_tags (asset_uuid, tag_id, created_date) VALUES (?, ?, ?)'
+            params = (asset_uuid, tag_id, datetime.now())
+        else:
+            sql = 'DELETE FROM asset_tags WHERE asset_uuid = ? AND tag_id = ?'
+            params = (asset_uuid, tag_id)
+        self.submit(
+            lambda conn: conn.execute(sql, params),
+            priority, key=('tag', asset_uuid, tag_id), on_done=on_done
+        )
+
+    def add_assets_to_folder(self, asset_uuids: List[str], folder_id: int,
+                             priority: int = PRIORITY_NORMAL,
+                             on_done: Optional[Callable[[bool], None]] = None):
+        """Queue adding assets to a folder as one write"""
+        created = datetime.now()
+        rows = [(asset_uuid, folder_id, created) for asset_uuid in dict.fromkeys(asset_uuids)]
+        self.submit(
+            lambda conn: conn.executemany(
+                'INSERT OR IGNORE INTO asset_folders (asset_uuid, folder_id, created_date) VALUES (?, ?, ?)',
+                rows
+            ),
+            priority, on_done=on_done
+        )
+
+
+# Singleton instance
+_write_queue_instance: Optional[WriteQueue] = None
+
+
+def get_write_queue() -> WriteQueue:
+    """Get global WriteQueue singleton instance"""
+    global _write_queue_instance
+    if _write_queue_instance is None:
+        _write_queue_instance = WriteQueue()
+    return _write_queue_instance
+
+
+__all__ = ['WriteQueue', 'get_write_queue']
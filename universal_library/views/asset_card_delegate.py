@@ -7,7 +7,7 @@ Based on animation_library architecture.
 
 import math
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle
 from PyQt6.QtCore import QSize, QRect, Qt, QPoint, QEvent, QItemSelectionModel, QPointF, QRectF
 from PyQt6.QtGui import (
@@ -132,6 +132,19 @@ class AssetCardDelegate(QStyledItemDelegate):
     # Comment badge color (for assets with unresolved review comments)
     COMMENT_BADGE_COLOR = '#E91E63'  # Pink/Magenta - distinct and attention-grabbing
 
+    # Fonts used while painting: key -> (family, size, weight)
+    PAINT_FONTS = {
+        'badge_small': (Fonts.SHOT_CARD_BADGE.family, 8, QFont.Weight.Bold),
+        'badge': (Fonts.SHOT_CARD_BADGE.family, 9, QFont.Weight.Bold),
+        'grid_name': (Fonts.SHOT_CARD_NAME.family, Fonts.SHOT_CARD_NAME.size, QFont.Weight.DemiBold),
+        'list_name': (Fonts.HEADER_SMALL.family, Fonts.HEADER_SMALL.size, QFont.Weight.Bold),
+        'list_meta': (Fonts.SHOT_CARD_DURATION.family, Fonts.SHOT_CARD_DURATION.size, QFont.Weight.Normal),
+    }
+
+    # Render caches are emptied once they grow past these sizes
+    MAX_BADGE_CACHE = 512
+    MAX_ELIDE_CACHE = 8192
+
     def __init__(self, parent=None, view_mode: str = "grid"):
         super().__init__(parent)
         self._view_mode = view_mode
@@ -142,8 +155,13 @@ class AssetCardDelegate(QStyledItemDelegate):
         # Cache for SVG renderers
         self._svg_cache: Dict[str, QSvgRenderer] = {}
 
-        # Connect thumbnail loader signals
-        self._thumbnail_loader.thumbnail_loaded.connect(self._on_thumbnail_loaded)
+        # Paint caches: fonts/metrics, pre-rendered badges, elided names
+        self._fonts: Dict[str, Tuple[QFont, QFontMetrics]] = {}
+        self._badge_cache: Dict[tuple, Tuple[QPixmap, int]] = {}
+        self._elide_cache: Dict[tuple, Tuple[str, str, int]] = {}
+
+        # Rows repaint when their thumbnail arrives through the model's
+        # dataChanged (AssetListModel.notify_thumbnails_changed)
 
     def set_view_mode(self, mode: str):
         """
@@ -162,7 +180,11 @@ class AssetCardDelegate(QStyledItemDelegate):
         Args:
             size: Size in pixels
         """
-        self._card_size = max(Config.MIN_CARD_SIZE, min(size, Config.MAX_CARD_SIZE))
+        size = max(Config.MIN_CARD_SIZE, min(size, Config.MAX_CARD_SIZE))
+        if size != self._card_size:
+            # Badges and elided names are per size; old sizes won't be painted again
+            self.clear_render_cache()
+        self._card_size = size
 
     def set_edit_mode(self, enabled: bool):
         """
@@ -173,6 +195,18 @@ class AssetCardDelegate(QStyledItemDelegate):
         """
         self._edit_mode = enabled
 
+    def clear_render_cache(self):
+        """Drop cached fonts, badges and elided names (theme, font or card size changed)"""
+        self._fonts.clear()
+        self._badge_cache.clear()
+        self._elide_cache.clear()
+
+    def thumbnail_size(self) -> int:
+        """Size thumbnails are drawn at in the current view mode"""
+        if self._view_mode == "grid":
+            return self._card_size
+        return Config.LIST_ROW_HEIGHT - 8  # List mode padding on both sides
+
     def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:
         """
         Return size hint for item
@@ -442,33 +476,22 @@ class AssetCardDelegate(QStyledItemDelegate):
             self._draw_placeholder(painter, rect)
             return
 
-        # Request thumbnail (async loading)
-        pixmap = self._thumbnail_loader.request_thumbnail(
+        # Request thumbnail (async loading), scaled to the card's device size
+        # on a worker so painting is a 1:1 copy; until that arrives the
+        # cached level is stretched without smoothing.
+        # Cancellable: AssetView reports its viewport, so the load is dropped
+        # if the card scrolls away before it starts
+        fitted = self._thumbnail_loader.request_fitted(
             uuid,
             thumbnail_path,
-            target_size=rect.width()
+            rect.width(),
+            dpr=painter.device().devicePixelRatioF(),
+            cancellable=True
         )
 
-        if pixmap:
-            # Scale and draw
-            scaled = pixmap.scaled(
-                rect.width(),
-                rect.height(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
-
-            # Center crop if needed
-            x_offset = (scaled.width() - rect.width()) // 2
-            y_offset = (scaled.height() - rect.height()) // 2
-
-            painter.drawPixmap(
-                rect.x(), rect.y(),
-                rect.width(), rect.height(),
-                scaled,
-                x_offset, y_offset,
-                rect.width(), rect.height()
-            )
+        if fitted:
+            pixmap, source_rect = fitted
+            painter.drawPixmap(rect, pixmap, source_rect)
         else:
             self._draw_loading_placeholder(painter, rect)
 
@@ -502,6 +525,85 @@ class AssetCardDelegate(QStyledItemDelegate):
 
         return None
 
+    def _font(self, key: str) -> Tuple[QFont, QFontMetrics]:
+        """Get a cached paint font and its metrics"""
+        cached = self._fonts.get(key)
+        if cached is None:
+            family, size, weight = self.PAINT_FONTS[key]
+            font = QFont(family, size, weight)
+            cached = self._fonts[key] = (font, QFontMetrics(font))
+        return cached
+
+    def _badge(self, painter: QPainter, text: str, font_key: str, color: str,
+               alpha: int = 220, height: int = 14, padding: int = 3,
+               width: Optional[int] = None) -> Tuple[QPixmap, int]:
+        """
+        Get a pre-rendered text badge
+
+        Args:
+            painter: Painter the badge will be drawn with (for device pixel ratio)
+            text: Badge label
+            font_key: Key in PAINT_FONTS
+            color: Background color
+            alpha: Background alpha
+            height: Badge height
+            padding: Horizontal padding on each side of the text
+            width: Fixed badge width (default: text width plus padding)
+
+        Returns:
+            (pixmap, width in device-independent pixels)
+        """
+        dpr = painter.device().devicePixelRatioF()
+        key = (text, font_key, color, alpha, height, padding, width, dpr)
+        cached = self._badge_cache.get(key)
+        if cached is not None:
+            return cached
+
+        font, fm = self._font(font_key)
+        if width is None:
+            width = fm.horizontalAdvance(text) + padding * 2
+
+        pixmap = QPixmap(math.ceil(width * dpr), math.ceil(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        bg_color = QColor(color)
+        bg_color.setAlpha(alpha)
+        badge_painter = QPainter(pixmap)
+        badge_painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        badge_rect = QRect(0, 0, width, height)
+        badge_painter.fillRect(badge_rect, bg_color)
+        badge_painter.setFont(font)
+        badge_painter.setPen(QColor("#FFFFFF"))
+        badge_painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, text)
+        badge_painter.end()
+
+        if len(self._badge_cache) >= self.MAX_BADGE_CACHE:
+            self._badge_cache.clear()
+        cached = self._badge_cache[key] = (pixmap, width)
+        return cached
+
+    def _elided(self, uuid: str, text: str, font_key: str, width: int) -> Tuple[str, int]:
+        """
+        Get text elided to a width, cached per (uuid, width)
+
+        Returns:
+            (elided text, its horizontal advance)
+        """
+        key = (uuid, font_key, width)
+        cached = self._elide_cache.get(key)
+        if cached is not None and cached[0] == text:
+            return cached[1], cached[2]
+
+        _, fm = self._font(font_key)
+        elided = fm.elidedText(text, Qt.TextElideMode.ElideRight, width)
+        advance = fm.horizontalAdvance(elided)
+
+        if len(self._elide_cache) >= self.MAX_ELIDE_CACHE:
+            self._elide_cache.clear()
+        self._elide_cache[key] = (text, elided, advance)
+        return elided, advance
+
     def _draw_type_badge(self, painter: QPainter, thumbnail_rect: QRect, asset_type: str):
         """Draw asset type badge with Blender SVG icon"""
 
@@ -545,202 +647,108 @@ class AssetCardDelegate(QStyledItemDelegate):
             return
 
         badge_text = self.STATUS_LABELS.get(status.lower(), status.upper()[:3])
-        badge_color = QColor(self.STATUS_COLORS.get(status.lower(), '#9E9E9E'))
-
-        font = QFont(Fonts.SHOT_CARD_BADGE.family, 8, QFont.Weight.Bold)
-        painter.setFont(font)
-        fm = QFontMetrics(font)
-        text_width = fm.horizontalAdvance(badge_text)
-
-        badge_padding = 3
-        badge_height = 14
-        badge_width = text_width + (badge_padding * 2)
+        badge, badge_width = self._badge(
+            painter, badge_text, 'badge_small',
+            self.STATUS_COLORS.get(status.lower(), '#9E9E9E')
+        )
 
         # Position: top-right, below the favorite star area
-        badge_rect = QRect(
-            thumbnail_rect.right() - badge_width - 4,
-            thumbnail_rect.y() + 30,  # Below star
-            badge_width,
-            badge_height
+        painter.drawPixmap(
+            QPoint(thumbnail_rect.right() - badge_width - 4, thumbnail_rect.y() + 30),  # Below star
+            badge
         )
 
-        # Draw badge background with slight transparency
-        badge_color.setAlpha(220)
-        painter.fillRect(badge_rect, badge_color)
-
-        # Draw badge text
-        painter.setPen(QColor("#FFFFFF"))
-        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, badge_text)
-
     def _draw_representation_badge(self, painter: QPainter, thumbnail_rect: QRect, rep_type: str):
         """Draw representation type badge (above type badge in bottom-left)"""
 
         badge_text = self.REP_TYPE_LABELS.get(rep_type.lower(), rep_type.upper()[:3])
-        badge_color = QColor(self.REP_TYPE_COLORS.get(rep_type.lower(), '#607D8B'))
-
-        font = QFont(Fonts.SHOT_CARD_BADGE.family, 8, QFont.Weight.Bold)
-        painter.setFont(font)
-        fm = QFontMetrics(font)
-        text_width = fm.horizontalAdvance(badge_text)
-
-        badge_padding = 3
-        badge_height = 14
-        badge_width = text_width + (badge_padding * 2)
+        badge, _ = self._badge(
+            painter, badge_text, 'badge_small',
+            self.REP_TYPE_COLORS.get(rep_type.lower(), '#607D8B')
+        )
 
         # Position: bottom-left, above the type badge (type badge is 20px + 4px padding)
-        badge_rect = QRect(
-            thumbnail_rect.x() + 4,
-            thumbnail_rect.bottom() - badge_height - 4 - 24,  # 24px above type badge
-            badge_width,
-            badge_height
+        badge_height = 14
+        painter.drawPixmap(
+            QPoint(thumbnail_rect.x() + 4, thumbnail_rect.bottom() - badge_height - 4 - 24),  # 24px above type badge
+            badge
         )
 
-        # Draw badge background
-        badge_color.setAlpha(220)
-        painter.fillRect(badge_rect, badge_color)
-
-        # Draw badge text
-        painter.setPen(QColor("#FFFFFF"))
-        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, badge_text)
-
     def _draw_version_badge(self, painter: QPainter, thumbnail_rect: QRect, version_label: str):
         """Draw version label badge (bottom-right corner)"""
 
-        font = QFont(Fonts.SHOT_CARD_BADGE.family, 9, QFont.Weight.Bold)
-        painter.setFont(font)
-        fm = QFontMetrics(font)
-        text_width = fm.horizontalAdvance(version_label)
-
-        badge_padding = 4
-        badge_height = 14
-        badge_width = text_width + (badge_padding * 2)
+        # Dark semi-transparent background
+        badge, badge_width = self._badge(
+            painter, version_label, 'badge', "#000000", alpha=180, padding=4
+        )
 
         # Position: bottom-right corner
-        badge_rect = QRect(
-            thumbnail_rect.right() - badge_width - 4,
-            thumbnail_rect.bottom() - badge_height - 4,
-            badge_width,
-            badge_height
+        badge_height = 14
+        painter.drawPixmap(
+            QPoint(thumbnail_rect.right() - badge_width - 4, thumbnail_rect.bottom() - badge_height - 4),
+            badge
         )
 
-        # Draw badge background (dark semi-transparent)
-        bg_color = QColor("#000000")
-        bg_color.setAlpha(180)
-        painter.fillRect(badge_rect, bg_color)
-
-        # Draw badge text
-        painter.setPen(QColor("#FFFFFF"))
-        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, version_label)
-
     def _draw_variant_badge(self, painter: QPainter, thumbnail_rect: QRect, variant_name: str):
         """Draw variant indicator badge (above version badge, bottom-right)"""
 
-        font = QFont(Fonts.SHOT_CARD_BADGE.family, 9, QFont.Weight.Bold)
-        painter.setFont(font)
-        fm = QFontMetrics(font)
-
-        # Simple "var" indicator
-        display_text = "var"
-        text_width = fm.horizontalAdvance(display_text)
-
-        badge_padding = 4
-        badge_height = 14
-        badge_width = text_width + (badge_padding * 2)
+        # Simple "var" indicator (purple for variants)
+        badge, badge_width = self._badge(painter, "var", 'badge', "#7B1FA2", padding=4)
 
         # Position: above version badge (bottom-right, shifted up)
-        badge_rect = QRect(
-            thumbnail_rect.right() - badge_width - 4,
-            thumbnail_rect.bottom() - badge_height - 22,  # 22 = 14 (version badge) + 4 (gap) + 4 (margin)
-            badge_width,
-            badge_height
+        badge_height = 14
+        painter.drawPixmap(
+            QPoint(
+                thumbnail_rect.right() - badge_width - 4,
+                thumbnail_rect.bottom() - badge_height - 22  # 22 = 14 (version badge) + 4 (gap) + 4 (margin)
+            ),
+            badge
         )
 
-        # Draw badge background (purple for variants)
-        bg_color = QColor("#7B1FA2")  # Purple
-        bg_color.setAlpha(220)
-        painter.fillRect(badge_rect, bg_color)
-
-        # Draw badge text
-        painter.setPen(QColor("#FFFFFF"))
-        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, display_text)
-
     def _draw_variant_count_badge(self, painter: QPainter, thumbnail_rect: QRect, count: int):
         """Draw variant count badge for Base assets (above version badge, bottom-right)"""
 
-        font = QFont(Fonts.SHOT_CARD_BADGE.family, 9, QFont.Weight.Bold)
-        painter.setFont(font)
-        fm = QFontMetrics(font)
-
-        # Show count like "2 var"
-        display_text = f"{count} var"
-        text_width = fm.horizontalAdvance(display_text)
-
-        badge_padding = 4
-        badge_height = 14
-        badge_width = text_width + (badge_padding * 2)
+        # Show count like "2 var" (darker purple for variant count)
+        badge, badge_width = self._badge(painter, f"{count} var", 'badge', "#512DA8", padding=4)
 
         # Position: above version badge (bottom-right, shifted up)
-        badge_rect = QRect(
-            thumbnail_rect.right() - badge_width - 4,
-            thumbnail_rect.bottom() - badge_height - 22,  # 22 = 14 (version badge) + 4 (gap) + 4 (margin)
-            badge_width,
-            badge_height
+        badge_height = 14
+        painter.drawPixmap(
+            QPoint(
+                thumbnail_rect.right() - badge_width - 4,
+                thumbnail_rect.bottom() - badge_height - 22  # 22 = 14 (version badge) + 4 (gap) + 4 (margin)
+            ),
+            badge
         )
 
-        # Draw badge background (darker purple for variant count)
-        bg_color = QColor("#512DA8")  # Darker purple
-        bg_color.setAlpha(220)
-        painter.fillRect(badge_rect, bg_color)
-
-        # Draw badge text
-        painter.setPen(QColor("#FFFFFF"))
-        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, display_text)
-
     def _draw_cold_indicator(self, painter: QPainter, thumbnail_rect: QRect):
         """Draw cold storage indicator (snowflake-like icon in top-left)"""
 
         # Draw a blue "COLD" indicator
-        font = QFont(Fonts.SHOT_CARD_BADGE.family, 8, QFont.Weight.Bold)
-        painter.setFont(font)
-
-        badge_text = "COLD"
-        fm = QFontMetrics(font)
-        text_width = fm.horizontalAdvance(badge_text)
-
-        badge_padding = 3
-        badge_height = 14
-        badge_width = text_width + (badge_padding * 2)
+        badge, _ = self._badge(painter, "COLD", 'badge_small', "#1565C0")
 
         # Position: top-left corner (offset for checkbox if in edit mode)
-        badge_rect = QRect(
-            thumbnail_rect.x() + 30 if self._edit_mode else thumbnail_rect.x() + 4,
-            thumbnail_rect.y() + 4,
-            badge_width,
-            badge_height
+        painter.drawPixmap(
+            QPoint(
+                thumbnail_rect.x() + 30 if self._edit_mode else thumbnail_rect.x() + 4,
+                thumbnail_rect.y() + 4
+            ),
+            badge
         )
 
-        # Draw badge background (blue)
-        bg_color = QColor("#1565C0")
-        bg_color.setAlpha(220)
-        painter.fillRect(badge_rect, bg_color)
-
-        # Draw badge text
-        painter.setPen(QColor("#FFFFFF"))
-        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, badge_text)
-
     def _draw_tag_count(self, painter: QPainter, thumbnail_rect: QRect, count: int, has_cold_badge: bool):
         """Draw tag count indicator (small number badge)"""
 
-        font = QFont(Fonts.SHOT_CARD_BADGE.family, 9, QFont.Weight.Bold)
-        painter.setFont(font)
-
-        badge_text = str(count)
-        fm = QFontMetrics(font)
-        text_width = fm.horizontalAdvance(badge_text)
+        _, fm = self._font('badge')
 
         # Badge size - circular for single digit, pill for multiple
         badge_height = 14
-        badge_width = max(badge_height, text_width + 6)
+        badge_width = max(badge_height, fm.horizontalAdvance(str(count)) + 6)
+
+        # Sharp, subtle grey-blue background with a simple "#" label and the count
+        badge, _ = self._badge(
+            painter, f"#{count}", 'badge', "#546E7A", height=badge_height, width=badge_width
+        )
 
         # Position: top-left, offset if edit mode checkbox or COLD badge present
         x_offset = 4
@@ -749,21 +757,7 @@ class AssetCardDelegate(QStyledItemDelegate):
         if has_cold_badge:
             x_offset += 38  # After COLD badge
 
-        badge_rect = QRect(
-            thumbnail_rect.x() + x_offset,
-            thumbnail_rect.y() + 4,
-            badge_width,
-            badge_height
-        )
-
-        # Draw badge background (sharp, subtle grey-blue)
-        bg_color = QColor("#546E7A")
-        bg_color.setAlpha(220)
-        painter.fillRect(badge_rect, bg_color)
-
-        # Draw tag icon (simple label shape) and count
-        painter.setPen(QColor("#FFFFFF"))
-        painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, f"#{badge_text}")
+        painter.drawPixmap(QPoint(thumbnail_rect.x() + x_offset, thumbnail_rect.y() + 4), badge)
 
     def _get_info_icon_renderer(self) -> Optional[QSvgRenderer]:
         """Get cached SVG renderer for info icon"""
@@ -845,7 +839,7 @@ class AssetCardDelegate(QStyledItemDelegate):
             painter.fillRect(rect, bg_color)
 
         # Font
-        font = QFont(Fonts.SHOT_CARD_NAME.family, Fonts.SHOT_CARD_NAME.size, QFont.Weight.DemiBold)
+        font, _ = self._font('grid_name')
         painter.setFont(font)
 
         # Color
@@ -855,8 +849,7 @@ class AssetCardDelegate(QStyledItemDelegate):
             painter.setPen(QColor(self.COLORS['text_primary']))
 
         # Draw name (elided)
-        fm = QFontMetrics(font)
-        elided_name = fm.elidedText(name, Qt.TextElideMode.ElideRight, rect.width() - 8)
+        elided_name, _ = self._elided(index.data(AssetRole.UUIDRole), name, 'grid_name', rect.width() - 8)
         painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, elided_name)
 
     def _draw_list_text(self, painter: QPainter, rect: QRect, index, is_selected: bool):
@@ -885,8 +878,7 @@ class AssetCardDelegate(QStyledItemDelegate):
             icon_x += icon_size + 6
 
         # Name (bold)
-        font_bold = QFont(Fonts.HEADER_SMALL.family, Fonts.HEADER_SMALL.size)
-        font_bold.setBold(True)
+        font_bold, _ = self._font('list_name')
         painter.setFont(font_bold)
 
         if is_selected:
@@ -895,51 +887,42 @@ class AssetCardDelegate(QStyledItemDelegate):
             painter.setPen(QColor(self.COLORS['text_primary']))
 
         name_rect = QRect(icon_x, rect.y(), rect.width() - (icon_x - rect.x()), 20)
-        fm = QFontMetrics(font_bold)
-        elided_name = fm.elidedText(name or "Unknown", Qt.TextElideMode.ElideRight, name_rect.width())
+        elided_name, name_width = self._elided(
+            index.data(AssetRole.UUIDRole), name or "Unknown", 'list_name', name_rect.width()
+        )
         painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided_name)
 
         # Draw inline badges next to name
-        badge_x = icon_x + fm.horizontalAdvance(elided_name) + 8
-        font_badge = QFont(Fonts.SHOT_CARD_BADGE.family, 8, QFont.Weight.Bold)
-        painter.setFont(font_badge)
-        badge_fm = QFontMetrics(font_badge)
+        badge_x = icon_x + name_width + 8
+        badge_y = rect.y() + 4
 
         # Cold storage badge
         if is_cold:
-            cold_text = "COLD"
-            cold_width = badge_fm.horizontalAdvance(cold_text) + 6
-            cold_rect = QRect(badge_x, rect.y() + 4, cold_width, 12)
-            painter.fillRect(cold_rect, QColor("#1565C0"))
-            painter.setPen(QColor("#FFFFFF"))
-            painter.drawText(cold_rect, Qt.AlignmentFlag.AlignCenter, cold_text)
+            badge, cold_width = self._badge(painter, "COLD", 'badge_small', "#1565C0", alpha=255, height=12)
+            painter.drawPixmap(QPoint(badge_x, badge_y), badge)
             badge_x += cold_width + 4
 
         # Status badge (if not approved)
         if status and status != 'approved':
             status_text = self.STATUS_LABELS.get(status.lower(), status.upper()[:3])
-            status_color = QColor(self.STATUS_COLORS.get(status.lower(), '#9E9E9E'))
-            status_width = badge_fm.horizontalAdvance(status_text) + 6
-
-            status_rect = QRect(badge_x, rect.y() + 4, status_width, 12)
-            painter.fillRect(status_rect, status_color)
-            painter.setPen(QColor("#FFFFFF"))
-            painter.drawText(status_rect, Qt.AlignmentFlag.AlignCenter, status_text)
+            badge, status_width = self._badge(
+                painter, status_text, 'badge_small',
+                self.STATUS_COLORS.get(status.lower(), '#9E9E9E'), alpha=255, height=12
+            )
+            painter.drawPixmap(QPoint(badge_x, badge_y), badge)
             badge_x += status_width + 4
 
         # Representation badge (hide for 'none' and 'final')
         if rep_type and rep_type not in ('none', 'final'):
             rep_text = self.REP_TYPE_LABELS.get(rep_type.lower(), rep_type.upper()[:3])
-            rep_color = QColor(self.REP_TYPE_COLORS.get(rep_type.lower(), '#607D8B'))
-            rep_width = badge_fm.horizontalAdvance(rep_text) + 6
-
-            rep_rect = QRect(badge_x, rect.y() + 4, rep_width, 12)
-            painter.fillRect(rep_rect, rep_color)
-            painter.setPen(QColor("#FFFFFF"))
-            painter.drawText(rep_rect, Qt.AlignmentFlag.AlignCenter, rep_text)
+            badge, _ = self._badge(
+                painter, rep_text, 'badge_small',
+                self.REP_TYPE_COLORS.get(rep_type.lower(), '#607D8B'), alpha=255, height=12
+            )
+            painter.drawPixmap(QPoint(badge_x, badge_y), badge)
 
         # Metadata (smaller)
-        font_small = QFont(Fonts.SHOT_CARD_DURATION.family, Fonts.SHOT_CARD_DURATION.size)
+        font_small, _ = self._font('list_meta')
         painter.setFont(font_small)
 
         if is_selected:
@@ -966,10 +949,5 @@ class AssetCardDelegate(QStyledItemDelegate):
         metadata_rect = QRect(metadata_start_x, rect.y() + 22, rect.width() - (metadata_start_x - rect.x()), 18)
         painter.drawText(metadata_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, metadata_text)
 
-    def _on_thumbnail_loaded(self, uuid: str, pixmap: QPixmap):
-        """Handle thumbnail loaded signal"""
-        if self.parent() and hasattr(self.parent(), 'viewport'):
-            self.parent().viewport().update()
-
 
 __all__ = ['AssetCardDelegate']
@@ -105,6 +105,10 @@ class AssetTreeDelegate(QStyledItemDelegate):
         self._svg_cache: Dict[str, QSvgRenderer] = {}
 
         self._thumbnail_loader.thumbnail_loaded.connect(self._on_thumbnail_loaded)
+        # Row thumbnails are small enough to come from the atlas, whose
+        # loads are announced through tiles_loaded instead
+        self._thumbnail_loader.tiles_loaded.connect(self._on_thumbnails_ready)
+        self._thumbnail_loader.fitted_loaded.connect(self._on_thumbnails_ready)
 
     def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:
         is_parent = index.data(TREE_IS_PARENT)
@@ -254,22 +258,14 @@ class AssetTreeDelegate(QStyledItemDelegate):
             painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "No Image")
             return
 
-        pixmap = self._thumbnail_loader.request_thumbnail(
-            uuid, thumbnail_path, target_size=rect.width()
+        fitted = self._thumbnail_loader.request_fitted(
+            uuid, thumbnail_path, rect.width(),
+            dpr=painter.device().devicePixelRatioF()
         )
 
-        if pixmap:
-            scaled = pixmap.scaled(
-                rect.width(), rect.height(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            x_off = (scaled.width() - rect.width()) // 2
-            y_off = (scaled.height() - rect.height()) // 2
-            painter.drawPixmap(
-                rect.x(), rect.y(), rect.width(), rect.height(),
-                scaled, x_off, y_off, rect.width(), rect.height()
-            )
+        if fitted:
+            pixmap, source_rect = fitted
+            painter.drawPixmap(rect, pixmap, source_rect)
         else:
             painter.fillRect(rect, QColor(COLORS['background_secondary']))
             painter.setPen(QColor("#A0A0A0"))
@@ -314,5 +310,10 @@ class AssetTreeDelegate(QStyledItemDelegate):
         if self.parent() and hasattr(self.parent(), 'viewport'):
             self.parent().viewport().update()
 
+    def _on_thumbnails_ready(self, uuids: list):
+        """Handle atlas tiles or exact-size pixmaps loaded - trigger repaint."""
+        if self.parent() and hasattr(self.parent(), 'viewport'):
+            self.parent().viewport().update()
+
 
 __all__ = ['AssetTreeDelegate']
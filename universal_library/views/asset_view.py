@@ -5,15 +5,18 @@ Pattern: Custom view with grid/list mode switching
 Based on animation_library architecture.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from PyQt6.QtWidgets import QListView, QAbstractItemView
 from PyQt6.QtCore import (
-    Qt, QSize, QModelIndex, pyqtSignal, QItemSelectionModel
+    Qt, QSize, QModelIndex, QPoint, QTimer, pyqtSignal, QItemSelectionModel,
+    QSortFilterProxyModel, QEvent
 )
 
 from ..config import Config
 from ..events.event_bus import get_event_bus
 from ..models.asset_list_model import AssetRole
+from ..services.thumbnail_loader import get_thumbnail_loader
+from ..themes import get_theme_manager
 from .asset_card_delegate import AssetCardDelegate
 
 
@@ -24,6 +27,8 @@ class AssetView(QListView):
     Features:
     - Grid/List mode switching
     - Virtual scrolling for performance
+    - Reports visible rows to the thumbnail loader (visible first,
+      prefetch one screen ahead in the scroll direction)
     - Drag & drop support
     - Multi-selection support
     - Keyboard navigation
@@ -41,12 +46,26 @@ class AssetView(QListView):
     # Signals
     asset_double_clicked = pyqtSignal(str)  # uuid
 
+    # Delay before reporting the viewport to the thumbnail loader
+    VIEWPORT_REPORT_MS = 30
+    # Upper bound on rows prefetched past the viewport (visible rows are never capped)
+    MAX_PREFETCH_ROWS = 400
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self._view_mode = "grid"
         self._card_size = Config.DEFAULT_CARD_SIZE
         self._event_bus = get_event_bus()
+        self._thumbnail_loader = get_thumbnail_loader()
+
+        # Viewport reporting (coalesced while scrolling)
+        self._last_scroll_value = 0
+        self._scroll_direction = 1
+        self._viewport_timer = QTimer(self)
+        self._viewport_timer.setSingleShot(True)
+        self._viewport_timer.setInterval(self.VIEWPORT_REPORT_MS)
+        self._viewport_timer.timeout.connect(self._report_viewport)
 
         self._setup_view()
         self._connect_signals()
@@ -86,15 +105,46 @@ class AssetView(QListView):
         """Connect internal signals"""
         self.doubleClicked.connect(self._on_double_clicked)
         self.selectionModel()  # Will be connected when model is set
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        get_theme_manager().theme_changed.connect(self._on_render_settings_changed)
+
+    def changeEvent(self, event):
+        """Re-render cached card text and badges when the font changes"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._on_render_settings_changed()
+
+    def _on_render_settings_changed(self, *args):
+        """Drop the delegate's pre-rendered fonts, badges and names and repaint"""
+        self._delegate.clear_render_cache()
+        self.viewport().update()
 
     def setModel(self, model):
         """Override to connect selection signals"""
+        previous = self.model()
+        if previous is not None and previous is not model:
+            for signal in self._viewport_signals(previous):
+                try:
+                    signal.disconnect(self._schedule_viewport_report)
+                except TypeError:
+                    pass  # Not connected (model set before this view existed)
         super().setModel(model)
 
         # Connect selection changed
         if self.selectionModel():
             self.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
+        # Visible rows change when the (filtered) rows change
+        if model is not None and model is not previous:
+            for signal in self._viewport_signals(model):
+                signal.connect(self._schedule_viewport_report)
+        self._schedule_viewport_report()
+
+    @staticmethod
+    def _viewport_signals(model):
+        """Model signals after which the visible rows must be re-reported"""
+        return (model.modelReset, model.layoutChanged, model.rowsInserted, model.rowsRemoved)
+
     def set_view_mode(self, mode: str):
         """
         Set view mode
@@ -108,6 +158,7 @@ class AssetView(QListView):
 
             # Notify delegate
             self._delegate.set_view_mode(mode)
+            self._schedule_viewport_report()
 
             # Emit event
             self._event_bus.emit_view_mode_changed(mode)
@@ -130,6 +181,7 @@ class AssetView(QListView):
 
             # Notify delegate
             self._delegate.set_card_size(size)
+            self._schedule_viewport_report()
 
             # Emit event
             self._event_bus.emit_card_size_changed(size)
@@ -207,22 +259,21 @@ class AssetView(QListView):
         if not model:
             return
 
-        # Find index for UUID
-        for row in range(model.rowCount()):
-            index = model.index(row, 0)
-            if index.data(AssetRole.UUIDRole) == uuid:
-                if clear_selection:
-                    self.selectionModel().select(
-                        index,
-                        QItemSelectionModel.SelectionFlag.ClearAndSelect
-                    )
-                else:
-                    self.selectionModel().select(
-                        index,
-                        QItemSelectionModel.SelectionFlag.Select
-                    )
-                self.scrollTo(index)
-                break
+        index = self._index_for_uuid(uuid)
+        if not index.isValid():
+            return
+
+        if clear_selection:
+            self.selectionModel().select(
+                index,
+                QItemSelectionModel.SelectionFlag.ClearAndSelect
+            )
+        else:
+            self.selectionModel().select(
+                index,
+                QItemSelectionModel.SelectionFlag.Select
+            )
+        self.scrollTo(index)
 
     def clear_selection(self):
         """Clear all selection"""
@@ -240,12 +291,112 @@ class AssetView(QListView):
         if not model:
             return
 
+        index = self._index_for_uuid(uuid)
+        if index.isValid():
+            self.scrollTo(index, QAbstractItemView.ScrollHint.EnsureVisible)
+
+    def _index_for_uuid(self, uuid: str) -> QModelIndex:
+        """
+        Find the view index for a UUID
+
+        Uses the source model's UUID index through the proxy when
+        available, falling back to a linear scan.
+        """
+        model = self.model()
+        if not model:
+            return QModelIndex()
+
+        source_model = model.sourceModel() if isinstance(model, QSortFilterProxyModel) else None
+        if source_model is not None and hasattr(source_model, 'get_row_for_uuid'):
+            row = source_model.get_row_for_uuid(uuid)
+            if row is None:
+                return QModelIndex()
+            return model.mapFromSource(source_model.index(row, 0))
+
         for row in range(model.rowCount()):
             index = model.index(row, 0)
             if index.data(AssetRole.UUIDRole) == uuid:
-                self.scrollTo(index, QAbstractItemView.ScrollHint.EnsureVisible)
+                return index
+        return QModelIndex()
+
+    # ==================== Thumbnail viewport ====================
+
+    def _on_scrolled(self, value: int):
+        """Track scroll direction and report the new viewport"""
+        if value != self._last_scroll_value:
+            self._scroll_direction = 1 if value > self._last_scroll_value else -1
+            self._last_scroll_value = value
+        self._schedule_viewport_report()
+
+    def _schedule_viewport_report(self, *args):
+        """Report the viewport once scrolling/layout settles for a moment"""
+        self._viewport_timer.start()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._schedule_viewport_report()
+
+    def _visible_row_range(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the first and last visible proxy rows
+
+        Returns:
+            (first, last) inclusive, or None if nothing is shown
+        """
+        model = self.model()
+        if not model or model.rowCount() == 0:
+            return None
+
+        rect = self.viewport().rect()
+        first = self.indexAt(rect.topLeft() + QPoint(1, 1))
+        first_row = first.row() if first.isValid() else 0
+
+        # Last row: scan the bottom edge right to left (the right edge of the
+        # grid may be empty space)
+        step = max(1, self.gridSize().width()) if self._view_mode == "grid" else rect.width()
+        last_row = model.rowCount() - 1
+        for x in range(rect.right() - 1, -1, -step):
+            last = self.indexAt(QPoint(x, rect.bottom() - 1))
+            if last.isValid():
+                last_row = last.row()
                 break
 
+        if last_row < first_row:
+            return None
+        return first_row, last_row
+
+    def _thumbnail_rows(self, rows: range) -> List[Tuple[str, str]]:
+        """Get (uuid, thumbnail_path) for proxy rows"""
+        model = self.model()
+        items = []
+        for row in rows:
+            index = model.index(row, 0)
+            uuid = index.data(AssetRole.UUIDRole)
+            if uuid:
+                items.append((uuid, index.data(AssetRole.ThumbnailPathRole)))
+        return items
+
+    def _report_viewport(self):
+        """Tell the thumbnail loader which rows are visible and which come next"""
+        row_range = self._visible_row_range()
+        if row_range is None:
+            self._thumbnail_loader.set_viewport([], [], self._delegate.thumbnail_size())
+            return
+
+        first, last = row_range
+        page = min(last - first + 1, self.MAX_PREFETCH_ROWS)
+        if self._scroll_direction > 0:
+            ahead = range(last + 1, min(self.model().rowCount(), last + 1 + page))
+        else:
+            ahead = range(max(0, first - page), first)
+
+        self._thumbnail_loader.set_viewport(
+            self._thumbnail_rows(range(first, last + 1)),
+            self._thumbnail_rows(ahead),
+            self._delegate.thumbnail_size(),
+            self.viewport().devicePixelRatioF()
+        )
+
     def _on_double_clicked(self, index: QModelIndex):
         """Handle double-click on item"""
         uuid = index.data(AssetRole.UUIDRole)
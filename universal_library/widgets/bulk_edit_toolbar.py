@@ -38,6 +38,7 @@ class BulkEditToolbar(QWidget):
     cold_storage_requested = pyqtSignal()  # move to cold storage
     restore_from_cold_requested = pyqtSignal()  # restore from cold storage
     publish_requested = pyqtSignal()  # publish/approve selected
+    regenerate_thumbnails_requested = pyqtSignal()  # re-render selected in Blender
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -124,6 +125,10 @@ class BulkEditToolbar(QWidget):
             }
         """)
 
+        # Regenerate thumbnails button
+        self._thumbnails_btn = QPushButton("Regenerate Thumbnails")
+        self._thumbnails_btn.setToolTip("Re-render thumbnails of selected assets in Blender")
+
     def _create_layout(self):
         """Create centered toolbar layout"""
 
@@ -149,6 +154,7 @@ class BulkEditToolbar(QWidget):
         buttons_row.addWidget(self._cold_storage_btn)
         buttons_row.addWidget(self._restore_cold_btn)
         buttons_row.addWidget(self._publish_btn)
+        buttons_row.addWidget(self._thumbnails_btn)
         buttons_row.addStretch()
         main_layout.addLayout(buttons_row)
 
@@ -161,6 +167,7 @@ class BulkEditToolbar(QWidget):
         self._cold_storage_btn.clicked.connect(self.cold_storage_requested.emit)
         self._restore_cold_btn.clicked.connect(self.restore_from_cold_requested.emit)
         self._publish_btn.clicked.connect(self.publish_requested.emit)
+        self._thumbnails_btn.clicked.connect(self.regenerate_thumbnails_requested.emit)
 
         # Status dropdown
         self._status_combo.currentIndexChanged.connect(self._on_status_selected)
@@ -316,6 +323,7 @@ class BulkEditToolbar(QWidget):
         self._rep_combo.setEnabled(has_selection)
         self._cold_storage_btn.setEnabled(has_selection)
         self._restore_cold_btn.setEnabled(has_selection)
+        self._thumbnails_btn.setEnabled(has_selection)
 
     def _on_mode_changed(self, mode):
         """Handle operation mode change - refresh UI state."""
@@ -7,6 +7,7 @@ Extracts bulk edit logic from MainWindow for better separation of concerns.
 from typing import List, Tuple, Callable, Optional
 from PyQt6.QtWidgets import QWidget, QMessageBox
 
+from ...services.asset_manager import get_asset_manager
 from ...services.cold_storage_service import get_cold_storage_service
 from ...services.control_authority import get_control_authority
 
@@ -20,6 +21,7 @@ class BulkEditController:
     - Archive/Restore operations
     - Cold storage operations (file migration)
     - Publish/approve operations
+    - Thumbnail regeneration (one Blender batch job)
     """
 
     def __init__(
@@ -59,8 +61,9 @@ class BulkEditController:
         return self._asset_view.get_selected_uuids()
 
     def _check_selection(self) -> Optional[List[str]]:
-        """Check if there's a selection and return UUIDs or show warning."""
-        selected_uuids = self._get_selected_uuids()
+        """Check if there's a selection and return unique UUIDs or show warning."""
+        # Deduplicate so counts match what update_many reports
+        selected_uuids = list(dict.fromkeys(self._get_selected_uuids() or []))
         if not selected_uuids:
             QMessageBox.warning(
                 self._parent, "No Selection", "Please select assets first"
@@ -112,15 +115,9 @@ class BulkEditController:
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        # Update each asset
-        success_count = 0
-        failed_count = 0
-        for uuid in selected_uuids:
-            result = self._db_service.set_asset_status(uuid, new_status)
-            if result:
-                success_count += 1
-            else:
-                failed_count += 1
+        # Update all assets in one transaction
+        success_count = self._db_service.set_assets_status(selected_uuids, new_status)
+        failed_count = count - success_count
 
         # Reload and show status
         if success_count > 0:
@@ -374,6 +371,18 @@ class BulkEditController:
                 f"Failed to publish {failed_count} asset(s). Check console for details."
             )
 
+    def regenerate_thumbnails(self) -> None:
+        """Queue thumbnail regeneration for selected assets as one Blender job."""
+        selected_uuids = self._check_selection()
+        if not selected_uuids:
+            return
+
+        success, message = get_asset_manager().queue_regenerate_thumbnails(selected_uuids)
+        if success:
+            self._status_bar.set_status(message)
+        else:
+            QMessageBox.warning(self._parent, "Regenerate Thumbnails", message)
+
     def change_representation(self, rep_type: str) -> None:
         """
         Change representation type for all selected assets.
@@ -401,15 +410,11 @@ class BulkEditController:
         if reply != QMessageBox.StandardButton.Yes:
             return
 
-        # Update each asset
-        success_count = 0
-        failed_count = 0
-        for uuid in selected_uuids:
-            result = self._db_service.update_asset(uuid, {'representation_type': rep_type})
-            if result:
-                success_count += 1
-            else:
-                failed_count += 1
+        # Update all assets in one transaction
+        success_count = len(self._db_service.update_assets(
+            selected_uuids, {'representation_type': rep_type}
+        ))
+        failed_count = count - success_count
 
         # Reload and show status
         if success_count > 0:
@@ -13,6 +13,7 @@ from PyQt6.QtGui import QPixmap, QImage
 
 from .config import VersionHistoryConfig
 from ....config import Config
+from ....services.image_cache import get_image_cache
 
 
 class PreviewSignals(QObject):
@@ -61,9 +62,12 @@ class PreviewPanel:
     """
     Manages preview panel for version history dialog.
 
-    Handles async loading and caching of preview images.
+    Handles async loading and caching of preview images
+    (in the shared ImageCache; the displayed preview is pinned).
     """
 
+    CACHE_CONSUMER = 'previews'
+
     def __init__(
         self,
         info_label: QLabel,
@@ -82,7 +86,7 @@ class PreviewPanel:
         self._image_label = image_label
         self._thread_pool = thread_pool or QThreadPool.globalInstance()
 
-        self._cache: Dict[str, QPixmap] = {}
+        self._cache = get_image_cache()
         self._pending_uuid: Optional[str] = None
 
     def load_preview(self, uuid: str, thumbnail_path: str):
@@ -93,8 +97,12 @@ class PreviewPanel:
             return
 
         # Check cache first
-        if uuid in self._cache:
-            self._image_label.setPixmap(self._cache[uuid])
+        key = self._cache_key(uuid, thumbnail_path)
+        self._cache.set_pinned(self.CACHE_CONSUMER, [key])
+        cached = self._cache.get(self.CACHE_CONSUMER, key)
+        if cached is not None:
+            self._pending_uuid = uuid
+            self._image_label.setPixmap(cached)
             return
 
         # Show loading state
@@ -104,13 +112,19 @@ class PreviewPanel:
 
         # Create and start task
         task = PreviewLoadTask(uuid, thumbnail_path, VersionHistoryConfig.PREVIEW_SIZE)
-        task.signals.loaded.connect(self._on_loaded)
+        task.signals.loaded.connect(
+            lambda loaded_uuid, pixmap, key=key: self._on_loaded(loaded_uuid, pixmap, key)
+        )
         task.signals.failed.connect(self._on_failed)
         self._thread_pool.start(task)
 
-    def _on_loaded(self, uuid: str, pixmap: QPixmap):
+    @staticmethod
+    def _cache_key(uuid: str, thumbnail_path: str) -> str:
+        return f"{uuid}:{VersionHistoryConfig.PREVIEW_SIZE}:{thumbnail_path}"
+
+    def _on_loaded(self, uuid: str, pixmap: QPixmap, key: str):
         """Handle async preview load complete."""
-        self._cache[uuid] = pixmap
+        self._cache.put(self.CACHE_CONSUMER, key, pixmap)
 
         if uuid == self._pending_uuid:
             self._image_label.setPixmap(pixmap)
@@ -150,6 +164,7 @@ class PreviewPanel:
 
     def clear(self):
         """Clear preview panel."""
+        self._cache.set_pinned(self.CACHE_CONSUMER, [])
         self._info_label.setText("Select a version to preview")
         self._image_label.clear()
         self._image_label.setText("No preview")
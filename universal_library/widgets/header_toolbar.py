@@ -16,6 +16,7 @@ from PyQt6.QtGui import QIcon, QAction
 from ..config import Config
 from ..events.event_bus import get_event_bus
 from ..services.control_authority import get_control_authority
+from ..services.search_worker import SearchWorker
 
 # Path to utility icons
 ICONS_DIR = Path(__file__).parent / "icons" / "utility"
@@ -26,7 +27,7 @@ class HeaderToolbar(QWidget):
     Header toolbar with search and view controls
 
     Features:
-    - Search box with debounced filtering
+    - Search box with debounced filtering and background index lookup
     - View mode toggle (grid/list)
     - Card size slider (grid mode)
     - Asset type filter dropdown
@@ -39,6 +40,7 @@ class HeaderToolbar(QWidget):
 
     # Signals
     search_text_changed = pyqtSignal(str)
+    search_results_ready = pyqtSignal(str, object)  # (text, ranked uuids or None)
     view_mode_changed = pyqtSignal(str)  # "grid", "list", or "tree"
     card_size_changed = pyqtSignal(int)
     asset_type_filter_changed = pyqtSignal(str)  # "" for all, or specific type
@@ -74,6 +76,7 @@ class HeaderToolbar(QWidget):
         self._search_timer = QTimer()
         self._search_timer.setSingleShot(True)
         self._search_timer.timeout.connect(self._emit_search)
+        self._search_worker = None
 
         # Setup UI
         self._create_widgets()
@@ -327,14 +330,50 @@ class HeaderToolbar(QWidget):
 
     def _on_search_text_changed(self, text: str):
         """Handle search text change with debounce"""
+        self._cancel_search_query()
         self._search_timer.stop()
         self._search_timer.start(Config.SEARCH_DEBOUNCE_MS)
 
     def _emit_search(self):
-        """Emit search text after debounce"""
+        """Emit search text after debounce and start the index lookup"""
         text = self._search_box.text()
         self.search_text_changed.emit(text)
         self._event_bus.emit_search_text_changed(text)
+        self._start_search_query(text)
+
+    def _start_search_query(self, text: str):
+        """Run the search index lookup for text, superseding any pending query"""
+        self._cancel_search_query()
+
+        if not text.strip():
+            self.search_results_ready.emit(text, None)
+            return
+
+        worker = SearchWorker(text, self)
+        worker.results_ready.connect(self._on_search_results_ready)
+        worker.finished.connect(worker.deleteLater)
+        self._search_worker = worker
+        worker.start()
+
+    def _cancel_search_query(self):
+        """Cancel the pending index lookup and ignore its late result"""
+        worker = self._search_worker
+        if worker is None:
+            return
+        self._search_worker = None
+        worker.cancel()
+        try:
+            worker.results_ready.disconnect()
+        except TypeError:
+            pass
+
+    def _on_search_results_ready(self, text: str, uuids):
+        """Forward index results if they are for the current query"""
+        if self.sender() is not self._search_worker:
+            return
+        self._search_worker = None
+        if text == self._search_box.text():
+            self.search_results_ready.emit(text, uuids)
 
     def _on_type_filter_changed(self, index: int):
         """Handle asset type filter change"""
@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout,
     QSplitter, QMessageBox, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QSettings, QTimer
+from PyQt6.QtCore import Qt, QSettings, QTimer, pyqtSignal
 from PyQt6.QtGui import QCloseEvent
 
 from ..config import Config
@@ -18,7 +18,16 @@ from ..events.event_bus import get_event_bus
 from ..services.database_service import get_database_service
 from ..services.control_authority import get_control_authority
 from ..services.thumbnail_loader import get_thumbnail_loader
+from ..services.thumbnail_disk_cache import get_thumbnail_disk_cache
+from ..services.thumbnail_decode_pool import get_thumbnail_decode_pool
+from ..services.thumbnail_batch_service import get_thumbnail_batch_service
 from ..services.asset_manager import get_asset_manager
+from ..services.data_change_notifier import get_data_change_notifier
+from ..services.library_loader import LibraryLoadWorker
+from ..services.search_worker import SearchWorker
+from ..services.delete_worker import DeleteWorker
+from ..services.write_queue import get_write_queue
+from ..services.asset_3d_resolver import asset_supports_3d
 from ..models.asset_list_model import AssetListModel
 from ..models.asset_filter_proxy_model import AssetFilterProxyModel
 from ..models.asset_tree_model import AssetTreeModel
@@ -56,6 +65,16 @@ class MainWindow(QMainWindow):
         +------------------------------------------+
     """
 
+    LOADING_STATUS = "Loading assets..."
+
+    # Emitted from the write queue thread once a queued folder move commits
+    _folder_write_committed = pyqtSignal()
+    # Emitted from the write queue thread once a queued favorite toggle commits
+    _favorite_write_committed = pyqtSignal(str, bool, bool)  # uuid, is_favorite, success
+
+    # Loaded thumbnails are checked against the database at most this often
+    CHANGE_CHECK_MS = 250
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -72,11 +91,34 @@ class MainWindow(QMainWindow):
         self._event_bus = get_event_bus()
         self._db_service = get_database_service()
         self._thumbnail_loader = get_thumbnail_loader()
+        self._thumbnail_batch_service = get_thumbnail_batch_service()
 
         # Initialize control authority with database service
         self._control_authority = get_control_authority()
         self._control_authority.set_db_service(self._db_service)
 
+        # Background library loader (set while a load is running)
+        self._library_loader = None
+
+        # Background batch delete (set while a delete is running)
+        self._delete_worker = None
+
+        # 3D preview preloader; imported on first selection, False if 3D is unavailable
+        self._glb_preloader = None
+
+        # Assets whose thumbnails arrived since the last database change check,
+        # and assets whose thumbnails failed (always refreshed). Rows are
+        # stamped with the database version they were read at: the version
+        # of the last full load, or of their last refresh since
+        self._change_check_uuids = set()
+        self._failed_check_uuids = set()
+        self._data_version = None
+        self._row_data_versions = {}
+        self._change_check_timer = QTimer(self)
+        self._change_check_timer.setSingleShot(True)
+        self._change_check_timer.setInterval(self.CHANGE_CHECK_MS)
+        self._change_check_timer.timeout.connect(self._check_library_changes)
+
         # Models
         self._asset_model = AssetListModel()
         self._proxy_model = AssetFilterProxyModel()
@@ -90,6 +132,8 @@ class MainWindow(QMainWindow):
         self._connect_signals()
         self._load_settings()
         self._load_assets()
+        # Pick up batch thumbnail jobs still running from a previous session
+        self._thumbnail_batch_service.resume_jobs()
 
     def _setup_window(self):
         """Configure window properties"""
@@ -215,8 +259,8 @@ class MainWindow(QMainWindow):
         self._proxy_model.layoutChanged.connect(self._on_proxy_layout_changed)
         self._proxy_model.modelReset.connect(self._on_proxy_layout_changed)
 
-        # Header toolbar search -> filter assets
-        self._header_toolbar.search_text_changed.connect(self._on_search_text_changed)
+        # Header toolbar search -> filter assets (after the index lookup)
+        self._header_toolbar.search_results_ready.connect(self._on_search_results_ready)
 
         # Header toolbar type filter -> filter assets
         self._header_toolbar.asset_type_filter_changed.connect(self._on_type_filter_changed)
@@ -276,6 +320,9 @@ class MainWindow(QMainWindow):
         self._bulk_edit_toolbar.publish_requested.connect(
             self._bulk_edit_ctrl.publish_selected
         )
+        self._bulk_edit_toolbar.regenerate_thumbnails_requested.connect(
+            self._bulk_edit_ctrl.regenerate_thumbnails
+        )
 
         # Metadata panel edit -> edit asset (BLEND + APPEND)
         self._metadata_panel.edit_requested.connect(self._on_edit_requested)
@@ -299,29 +346,100 @@ class MainWindow(QMainWindow):
         self._event_bus.request_delete_assets.connect(self._on_delete_assets_requested)
         self._event_bus.request_retire_assets.connect(self._on_retire_assets_requested)
         self._event_bus.assets_moved.connect(self._on_assets_moved)
+        self._folder_write_committed.connect(self._on_folder_write_committed)
+        self._favorite_write_committed.connect(self._on_favorite_write_committed)
         self._event_bus.asset_updated.connect(self._on_asset_updated)
+        self._event_bus.assets_batch_updated.connect(self._on_assets_batch_updated)
+        self._event_bus.assets_batch_removed.connect(self._on_assets_batch_removed)
 
-        # Thumbnail loaded -> refresh asset data from DB (piggyback on thumbnail cache invalidation)
+        # Thumbnail loaded -> repaint the row; refresh asset data from DB only if
+        # the database changed (piggyback on thumbnail cache invalidation)
         self._thumbnail_loader.thumbnail_loaded.connect(self._on_thumbnail_loaded)
+        self._thumbnail_loader.tiles_loaded.connect(self._on_tiles_loaded)
+        # Exact-size pixmaps scaled on a worker -> repaint only
+        self._thumbnail_loader.fitted_loaded.connect(self._asset_model.notify_thumbnails_changed)
         # Thumbnail failed (file missing) -> also refresh, may indicate version change
         self._thumbnail_loader.thumbnail_failed.connect(self._on_thumbnail_failed)
 
+        # Batch thumbnail jobs: repaint assets as Blender finishes them
+        self._thumbnail_batch_service.thumbnail_ready.connect(self._on_batch_thumbnail_ready)
+        self._thumbnail_batch_service.job_progress.connect(self._on_thumbnail_batch_progress)
+        self._thumbnail_batch_service.job_finished.connect(self._on_thumbnail_batch_finished)
+
+    def _on_batch_thumbnail_ready(self, uuid: str):
+        """A regenerated thumbnail is cached; repaint so views load it"""
+        self._asset_model.notify_thumbnails_changed([uuid])
+
+    def _on_thumbnail_batch_progress(self, job_id: str, completed: int, failed: int, total: int):
+        """Show batch thumbnail progress in the status bar"""
+        message = f"Rendering thumbnails in Blender: {completed + failed}/{total}"
+        if failed:
+            message += f" ({failed} failed)"
+        self._status_bar.set_status(message)
+
+    def _on_thumbnail_batch_finished(self, job_id: str, completed: int, failed: int):
+        """Report the result of a batch thumbnail job"""
+        message = f"Regenerated {completed} thumbnails"
+        if failed:
+            self._status_bar.set_error(f"{message}, {failed} failed")
+        else:
+            self._status_bar.set_status(message)
+
     def _on_thumbnail_failed(self, uuid: str, error_message: str):
         """When thumbnail file is missing, refresh asset from DB (may have new version)"""
-        # Use same logic as thumbnail_loaded - check for version changes
-        self._on_thumbnail_loaded(uuid, None)
+        # A missing file usually means a new version replaced it, which may
+        # have been committed before the last change check; refresh regardless
+        # of the database version
+        self._failed_check_uuids.add(uuid)
+        self._queue_change_check([])
+
+    def _on_tiles_loaded(self, uuids: list):
+        """Atlas tiles arrive in batches; handle them like loaded thumbnails"""
+        self._asset_model.notify_thumbnails_changed(uuids)
+        self._queue_change_check(uuids)
 
     def _on_thumbnail_loaded(self, uuid: str, pixmap):
-        """When thumbnail reloads from disk, also refresh asset data from DB"""
-        # Get old is_latest value before refresh
-        old_asset = self._asset_model.get_asset_by_uuid(uuid)
-        was_latest = old_asset.get('is_latest', 1) if old_asset else 1
-        
-        # Refresh this asset
-        self._asset_model.refresh_asset(uuid)
-        
-        # If it was latest but now isn't, a new version was added - fetch it
-        if was_latest:
+        """When thumbnail reloads from disk, repaint its row and check the DB for changes"""
+        self._asset_model.notify_thumbnails_changed([uuid])
+        self._queue_change_check([uuid])
+
+    def _queue_change_check(self, uuids):
+        """Check the assets against the database on the next change check"""
+        self._change_check_uuids.update(uuids)
+        if not self._change_check_timer.isActive():
+            self._change_check_timer.start()
+
+    def _check_library_changes(self):
+        """Refresh queued assets from DB; loaded ones only if read before the database last changed"""
+        uuids, self._change_check_uuids = self._change_check_uuids, set()
+        failed, self._failed_check_uuids = self._failed_check_uuids, set()
+        version = self._db_service.get_data_version()
+        stale = {
+            uuid for uuid in uuids
+            if self._row_data_versions.get(uuid, self._data_version) != version
+        }
+        stale |= failed
+        for uuid in stale:
+            self._row_data_versions[uuid] = version
+        if stale:
+            self._refresh_asset_versions(stale)
+
+    def _refresh_asset_versions(self, uuids):
+        """Refresh assets from DB in bulk and pick up newly added latest versions"""
+        # Get old is_latest values before refresh
+        was_latest = set()
+        for uuid in uuids:
+            old_asset = self._asset_model.get_asset_by_uuid(uuid)
+            if old_asset and old_asset.get('is_latest', 1):
+                was_latest.add(uuid)
+
+        # Refresh these assets
+        refreshed = self._asset_model.refresh_assets(uuids)
+
+        # If one was latest but now isn't, a new version was added - fetch it
+        for uuid in refreshed:
+            if uuid not in was_latest:
+                continue
             new_asset = self._asset_model.get_asset_by_uuid(uuid)
             is_now_latest = new_asset.get('is_latest', 1) if new_asset else 1
             
@@ -330,7 +448,9 @@ class MainWindow(QMainWindow):
                 version_group_id = new_asset.get('version_group_id')
                 if version_group_id:
                     latest = self._db_service.get_latest_asset_version(version_group_id)
-                    if latest and latest.get('uuid') != uuid:
+                    # Several refreshed rows may share the new version
+                    if (latest and latest.get('uuid') != uuid
+                            and self._asset_model.get_asset_by_uuid(latest['uuid']) is None):
                         # Enrich and add new version
                         latest['tags_v2'] = self._db_service.get_asset_tags(latest['uuid'])
                         latest['folders_v2'] = self._db_service.get_asset_folders(latest['uuid'])
@@ -372,41 +492,89 @@ class MainWindow(QMainWindow):
         settings.setValue("splitter/sizes", self._splitter.sizes())
 
     def _load_assets(self):
-        """Load assets from database"""
-        self._status_bar.set_status("Loading assets...")
-
-        # Get all assets from database
-        assets = self._db_service.get_all_assets()
-
-        # Enrich assets with tags_v2 and folders_v2 (review system removed)
-        for asset in assets:
-            uuid = asset.get('uuid')
-            if uuid:
-                asset['tags_v2'] = self._db_service.get_asset_tags(uuid)
-                asset['folders_v2'] = self._db_service.get_asset_folders(uuid)
-                # Auto-migrate legacy folder_id if no folders_v2 entries
-                if not asset['folders_v2'] and asset.get('folder_id'):
-                    self._db_service.migrate_asset_to_multi_folder(uuid, asset['folder_id'])
-                    asset['folders_v2'] = self._db_service.get_asset_folders(uuid)
-
-        # Load into model
-        self._asset_model.set_assets(assets)
+        """Load assets from database in the background, page by page"""
+        # Supersede any load still in flight
+        self._cancel_library_load()
 
-        # Load variant counts for badge display
-        variant_counts = self._db_service.get_variant_counts()
-        self._asset_model.set_variant_counts(variant_counts)
+        self._status_bar.set_status(self.LOADING_STATUS)
+        self._status_bar.set_progress(0, 0)
 
-        # Trigger initial sort (required for lessThan to be called)
+        # Empty the model and set sort state up front; the proxy
+        # (dynamicSortFilter) filters and sorts each page as it is inserted
+        self._asset_model.set_assets([])
         self._proxy_model.sort(0, Qt.SortOrder.AscendingOrder)
+        self._data_version = self._db_service.get_data_version()
+        self._row_data_versions.clear()
+
+        loader = LibraryLoadWorker(self)
+        loader.load_started.connect(self._on_library_load_started)
+        loader.page_loaded.connect(self._on_library_page_loaded)
+        loader.load_finished.connect(self._on_library_load_finished)
+        loader.load_failed.connect(self._on_library_load_failed)
+        loader.finished.connect(loader.deleteLater)
+        self._library_loader = loader
+        loader.start()
+
+    def _cancel_library_load(self):
+        """Cancel a running background load and ignore its late signals"""
+        loader = self._library_loader
+        if loader is None:
+            return
+        self._library_loader = None
+        loader.cancel()
+        for signal in (loader.load_started, loader.page_loaded,
+                       loader.load_finished, loader.load_failed):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
+        self._status_bar.clear_progress()
+
+    def _on_library_load_started(self, total: int, variant_counts: dict):
+        """Loader started - badge data is ready before the first page"""
+        self._asset_model.set_variant_counts(variant_counts)
+        self._status_bar.set_progress(0, total)
 
-        # Refresh tag filter with available tags
-        tags_with_counts = self._db_service.get_tags_with_counts()
+    def _on_library_page_loaded(self, assets: list, loaded: int, total: int):
+        """Append a page of assets as it arrives"""
+        self._asset_model.append_assets(assets)
+        self._status_bar.set_progress(loaded, total)
+        self._status_bar.set_asset_count(loaded)
+
+    def _on_library_load_finished(self, tags_with_counts: list, count: int):
+        """All pages loaded"""
+        self._library_loader = None
         self._header_toolbar.refresh_tag_filter(tags_with_counts)
 
-        # Update status
-        count = len(assets)
+        self._status_bar.clear_progress()
         self._status_bar.set_asset_count(count)
-        self._status_bar.set_status("Ready")
+        # Don't overwrite a status set by the caller while we were loading
+        if self._status_bar.status_text() == self.LOADING_STATUS:
+            self._status_bar.set_status("Ready")
+
+    def _on_library_load_failed(self, message: str):
+        """Loader raised - keep whatever pages already arrived"""
+        self._library_loader = None
+        self._status_bar.clear_progress()
+        self._status_bar.set_error(message)
+
+    def _apply_library_snapshot(self, snapshot: dict) -> list:
+        """Push a DatabaseService library snapshot into the model and tag filter"""
+        # A full snapshot replaces anything a background load would append
+        self._cancel_library_load()
+
+        assets = snapshot['assets']
+        self._asset_model.set_assets(assets)
+        self._data_version = self._db_service.get_data_version()
+        self._row_data_versions.clear()
+
+        # Variant counts for badge display
+        self._asset_model.set_variant_counts(snapshot['variant_counts'])
+
+        # Refresh tag filter with available tags
+        self._header_toolbar.refresh_tag_filter(snapshot['tags_with_counts'])
+
+        return assets
 
     # ==================== SLOT HANDLERS ====================
 
@@ -460,16 +628,57 @@ class MainWindow(QMainWindow):
             asset = self._asset_model.get_asset_at_index(source_index.row())
 
             if asset:
+                # Sampled first: the metadata panel resets to 2D for the new asset
+                preview_3d_visible = self._metadata_panel.is_3d_preview_visible()
+
                 # Update metadata panel via event bus
                 self._event_bus.asset_selected.emit(asset.get('uuid', ''))
 
+                # Record the view for the Recent folder (opt-in, batched in the background)
+                if Config.RECORD_VIEW_ON_SELECT:
+                    get_write_queue().touch_last_viewed(asset.get('uuid', ''))
+
                 # Update status
                 name = asset.get('name', 'Unknown')
                 self._status_bar.set_status(f"Selected: {name}")
+
+                if preview_3d_visible:
+                    self._preload_neighbour_previews(index.row(), asset)
+                elif self._glb_preloader:
+                    self._glb_preloader.cancel()
         else:
             # Clear selection
             self._event_bus.asset_selected.emit('')
             self._status_bar.set_status("Ready")
+            if self._glb_preloader:
+                self._glb_preloader.cancel()
+
+    def _preload_neighbour_previews(self, row: int, current: dict):
+        """Parse the 3D previews of the assets around the selection ahead of time.
+
+        Only called while a 3D preview is on screen; `current` (the selected
+        asset) stays pinned in the mesh cache while the preloads run."""
+        if self._glb_preloader is None:
+            try:
+                from .viewport_3d import get_glb_preloader
+                self._glb_preloader = get_glb_preloader()
+            except ImportError:
+                self._glb_preloader = False  # PyOpenGL missing; the 3D toggle is disabled too
+        if not self._glb_preloader:
+            return
+
+        # Nearest first, alternating after/before the selection in view order
+        rows = self._proxy_model.rowCount()
+        assets = []
+        for distance in range(1, Config.GLB_PRELOAD_NEIGHBOURS + 1):
+            for neighbour in (row + distance, row - distance):
+                if not 0 <= neighbour < rows:
+                    continue
+                source_index = self._proxy_model.mapToSource(self._proxy_model.index(neighbour, 0))
+                asset = self._asset_model.get_asset_at_index(source_index.row())
+                if asset_supports_3d(asset):
+                    assets.append(asset)
+        self._glb_preloader.schedule(assets, current=current)
 
     def _on_asset_double_clicked(self, uuid: str):
         """Handle asset double-click - import to Blender if quick import enabled"""
@@ -479,9 +688,9 @@ class MainWindow(QMainWindow):
         link_mode = self._metadata_panel.get_link_mode()
         self._import_asset(uuid, "BLEND", link_mode)
 
-    def _on_search_text_changed(self, text: str):
-        """Handle search text change"""
-        self._proxy_model.set_search_text(text)
+    def _on_search_results_ready(self, text: str, matches):
+        """Handle debounced search text plus its search index matches"""
+        self._proxy_model.set_search_text(text, matches)
 
         count = self._proxy_model.rowCount()
         if text:
@@ -575,20 +784,7 @@ class MainWindow(QMainWindow):
         thumbnail_loader.clear_cache()
 
         # Reload assets from database
-        assets = self._db_service.get_all_assets()
-
-        # Enrich assets with tags_v2 and folders_v2 (review system removed)
-        for asset in assets:
-            uuid = asset.get('uuid')
-            if uuid:
-                asset['tags_v2'] = self._db_service.get_asset_tags(uuid)
-                asset['folders_v2'] = self._db_service.get_asset_folders(uuid)
-
-        self._asset_model.set_assets(assets)
-
-        # Refresh tag filter with available tags
-        tags_with_counts = self._db_service.get_tags_with_counts()
-        self._header_toolbar.refresh_tag_filter(tags_with_counts)
+        assets = self._apply_library_snapshot(self._db_service.get_library_snapshot())
 
         # Refresh folder tree
         self._folder_tree.refresh()
@@ -793,19 +989,31 @@ class MainWindow(QMainWindow):
         is_favorite = asset.get('is_favorite', 0)
         new_value = 0 if is_favorite else 1
 
-        if self._db_service.update_asset(uuid, {'is_favorite': new_value}):
-            # Update model
-            self._asset_model.update_asset(uuid, {'is_favorite': new_value})
+        # Update model right away; the write is queued off the UI thread
+        # (rapid toggles of the same asset coalesce into one write)
+        self._asset_model.update_asset(uuid, {'is_favorite': new_value})
+        write_queue = get_write_queue()
+        write_queue.set_favorite(
+            uuid, bool(new_value), write_queue.PRIORITY_HIGH,
+            on_done=lambda success: self._favorite_write_committed.emit(uuid, bool(new_value), success)
+        )
 
-            # Update metadata panel
-            self._event_bus.asset_selected.emit(uuid)
+    def _on_favorite_write_committed(self, uuid: str, is_favorite: bool, success: bool):
+        """Queued favorite write committed - update the metadata panel, or re-read the row on failure"""
+        if not success:
+            self._asset_model.refresh_asset(uuid)
+            self._status_bar.set_error("Failed to update favorite")
+            return
+
+        # Update metadata panel
+        self._event_bus.asset_selected.emit(uuid)
 
-            status = "Added to favorites" if new_value else "Removed from favorites"
-            self._status_bar.set_status(status)
+        status = "Added to favorites" if is_favorite else "Removed from favorites"
+        self._status_bar.set_status(status)
 
     def _on_delete_assets_requested(self, uuids: list):
         """Handle delete assets request with confirmation dialog"""
-        if not uuids:
+        if not uuids or self._delete_worker is not None:
             return
 
         manager = get_asset_manager()
@@ -862,27 +1070,47 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            deleted_count = 0
-            for uuid in uuids:
-                success, result_msg = manager.delete_asset_complete(uuid)
-                if success:
-                    deleted_count += 1
+            self._status_bar.set_status(f"Deleting {len(uuids)} asset(s)...")
+            # Files are removed on a worker; block edits until it finishes
+            self._set_library_enabled(False)
+            worker = DeleteWorker(uuids, self)
+            worker.progress.connect(self._status_bar.set_progress)
+            worker.delete_finished.connect(self._on_delete_finished)
+            worker.finished.connect(worker.deleteLater)
+            self._delete_worker = worker
+            worker.start()
+        else:
+            pass
 
-            # Reload assets
-            self._load_assets()
+    def _on_delete_finished(self, deleted_uuids: list, deleted_count: int, total: int):
+        """Batch delete worker done - notify, drop the rows and report"""
+        self._delete_worker = None
+        self._status_bar.clear_progress()
+        self._set_library_enabled(True)
 
-            # Refresh folder tree
-            self._folder_tree.refresh()
+        # Notified here, not on the worker: the notifier's batch mode is
+        # global and would swallow GUI-thread notifications meanwhile.
+        # Rows leave the model through _on_assets_batch_removed.
+        notifier = get_data_change_notifier()
+        with notifier.batch():
+            notifier.assets_removed(deleted_uuids)
 
-            # Update status
-            if deleted_count == len(uuids):
-                self._status_bar.set_status(f"Deleted {deleted_count} asset(s)")
-            elif deleted_count > 0:
-                self._status_bar.set_status(f"Deleted {deleted_count}/{len(uuids)} assets")
-            else:
-                self._status_bar.set_error("Failed to delete assets")
+        # Refresh folder tree
+        self._folder_tree.refresh()
+
+        # Update status
+        if deleted_count == total:
+            self._status_bar.set_status(f"Deleted {deleted_count} asset(s)")
+        elif deleted_count > 0:
+            self._status_bar.set_status(f"Deleted {deleted_count}/{total} assets")
         else:
-            pass
+            self._status_bar.set_error("Failed to delete assets")
+
+    def _set_library_enabled(self, enabled: bool):
+        """Enable or disable the library panels (toolbars, folders, views, metadata)"""
+        for widget in (self._header_toolbar, self._bulk_edit_toolbar, self._folder_tree,
+                       self._view_stack, self._metadata_panel):
+            widget.setEnabled(enabled)
 
     def _on_retire_assets_requested(self, uuids: list):
         """Handle retire assets request (Studio/Pipeline mode)."""
@@ -958,21 +1186,17 @@ class MainWindow(QMainWindow):
 
     def _on_assets_moved(self, uuids: list, folder_id: int, count: int):
         """Handle assets moved to folder"""
-        # Add assets to the new folder in multi-folder system
-        for uuid in uuids:
-            self._db_service.add_asset_to_folder(uuid, folder_id)
-
-        # Reload assets to reflect changes
-        assets = self._db_service.get_all_assets()
-
-        # Enrich assets with tags_v2 and folders_v2 (review system removed)
-        for asset in assets:
-            uuid = asset.get('uuid')
-            if uuid:
-                asset['tags_v2'] = self._db_service.get_asset_tags(uuid)
-                asset['folders_v2'] = self._db_service.get_asset_folders(uuid)
+        # Add assets to the new folder in multi-folder system (one transaction);
+        # reload once the write is committed, without blocking the UI thread
+        write_queue = get_write_queue()
+        write_queue.add_assets_to_folder(
+            uuids, folder_id, write_queue.PRIORITY_HIGH,
+            on_done=lambda success: self._folder_write_committed.emit()
+        )
 
-        self._asset_model.set_assets(assets)
+    def _on_folder_write_committed(self):
+        """Queued folder membership write committed - reload to reflect changes"""
+        self._apply_library_snapshot(self._db_service.get_library_snapshot())
 
     def _on_asset_updated(self, uuid: str):
         """Handle asset updated event - full refresh of asset data from database"""
@@ -989,6 +1213,32 @@ class MainWindow(QMainWindow):
         # Re-filter in case is_latest changed (affects show_only_latest filter)
         self._proxy_model.invalidateFilter()
 
+    def _on_assets_batch_updated(self, uuids: list):
+        """Handle batch update event - refresh all rows in one pass, re-filter once"""
+        refreshed = self._asset_model.refresh_assets(uuids)
+        if not refreshed:
+            return
+
+        # Metadata edits (favorite, tags, folders) keep their cached thumbnails
+        thumbnail_loader = get_thumbnail_loader()
+        for uuid in refreshed:
+            asset = self._asset_model.get_asset_by_uuid(uuid)
+            if asset:
+                thumbnail_loader.invalidate_if_changed(uuid, asset.get('thumbnail_path'))
+        self._proxy_model.invalidateFilter()
+
+    def _on_assets_batch_removed(self, uuids: list):
+        """Handle batch remove event - drop rows and refresh the counts"""
+        if not self._asset_model.remove_assets(uuids):
+            return
+
+        # Variant badges and tag counts included the removed assets
+        self._asset_model.set_variant_counts(self._db_service.get_variant_counts())
+        self._header_toolbar.refresh_tag_filter(self._db_service.get_tags_with_counts())
+        self._status_bar.set_asset_count(self._asset_model.rowCount())
+        # Run removals don't reset the proxy, so the tree isn't rebuilt for us
+        self._on_proxy_layout_changed()
+
     def _show_settings(self):
         """Show settings dialog"""
         from .settings import SettingsDialog
@@ -1014,6 +1264,26 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event: QCloseEvent):
         """Handle window close"""
         self._save_settings()
+        # Stop background loads (including superseded ones still winding down)
+        for loader in self.findChildren(LibraryLoadWorker):
+            loader.cancel()
+            loader.wait()
+        for worker in self.findChildren(SearchWorker):
+            worker.cancel()
+            worker.wait()
+        # A batch delete cannot be cancelled; let it finish
+        for worker in self.findChildren(DeleteWorker):
+            worker.wait()
+        # Commit queued writes before the process exits
+        get_write_queue().stop()
+        get_thumbnail_disk_cache().save_index()
+        get_thumbnail_decode_pool().shutdown()
+        if self._glb_preloader:
+            self._glb_preloader.shutdown()
+        # The 3D viewport (optional PyOpenGL) is only imported once a preview opened
+        mesh_disk_cache = sys.modules.get(f"{__package__}.viewport_3d.mesh_disk_cache")
+        if mesh_disk_cache is not None:
+            mesh_disk_cache.shutdown_mesh_disk_cache()
         event.accept()
 
 
@@ -527,6 +527,7 @@ class MetadataPanel(QWidget):
         """Connect entity event bus signals for auto-refresh."""
         # Refresh display when current entity is updated
         self._entity_event_bus.entity_updated.connect(self._on_entity_updated)
+        self._entity_event_bus.entities_batch_updated.connect(self._on_entities_batch_updated)
         self._entity_event_bus.metadata_values_changed.connect(self._on_metadata_changed)
 
         # Refresh field definitions when schema changes
@@ -538,6 +539,11 @@ class MetadataPanel(QWidget):
         if entity_type == 'asset' and uuid == self._current_uuid:
             self.display_asset(uuid)
 
+    def _on_entities_batch_updated(self, entity_type: str, uuids: list):
+        """Handle batch update event - refresh if it includes the current asset."""
+        if entity_type == 'asset' and self._current_uuid in uuids:
+            self.display_asset(self._current_uuid)
+
     def _on_metadata_changed(self, entity_type: str, uuid: str, changes: dict):
         """Handle metadata value changes - refresh if it's the current asset."""
         if entity_type == 'asset' and uuid == self._current_uuid:
@@ -959,6 +965,12 @@ class MetadataPanel(QWidget):
         request creates a fresh dialog instead of poking the dead one."""
         self._enlarge_dialog = None
 
+    def is_3d_preview_visible(self) -> bool:
+        """True while a 3D preview is on screen, inline or in the enlarged viewer."""
+        if self._enlarge_dialog is not None and self._enlarge_dialog.isVisible():
+            return True
+        return self._thumbnail.is_3d_preview_visible()
+
     def get_import_method(self) -> str:
         """Get import method — always BLEND."""
         return "BLEND"
@@ -17,6 +17,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal, Qt, QPoint
 from PyQt6.QtGui import QColor, QIcon, QPixmap
 
+from ....services.write_queue import get_write_queue
+
 
 class _TagTreePopup(QFrame):
     """
@@ -193,12 +195,16 @@ class TagsWidget(QWidget):
     tag_removed = pyqtSignal(str, int)
     tags_changed = pyqtSignal(str, list)
 
+    # Emitted from the write queue thread once a queued tag change commits
+    _tag_write_committed = pyqtSignal(str)
+
     def __init__(self, db_service, parent=None):
         super().__init__(parent)
         self._db_service = db_service
         self._current_uuid: Optional[str] = None
         self._current_tag_ids: List[int] = []
         self._popup: Optional[_TagTreePopup] = None
+        self._tag_write_committed.connect(self._on_tag_write_committed)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -285,18 +291,34 @@ class TagsWidget(QWidget):
             return
 
         if checked and tag_id not in self._current_tag_ids:
-            self._db_service.add_tag_to_asset(self._current_uuid, tag_id)
+            self._queue_tag_write(tag_id, True)
             self._current_tag_ids.append(tag_id)
             self.tag_added.emit(self._current_uuid, tag_id)
         elif not checked and tag_id in self._current_tag_ids:
-            self._db_service.remove_tag_from_asset(self._current_uuid, tag_id)
+            self._queue_tag_write(tag_id, False)
             self._current_tag_ids.remove(tag_id)
             self.tag_removed.emit(self._current_uuid, tag_id)
 
+    def _queue_tag_write(self, tag_id: int, tagged: bool):
+        """Queue a tag change off the UI thread; pills refresh once it commits"""
+        uuid = self._current_uuid
+        get_write_queue().set_asset_tag(
+            uuid, tag_id, tagged,
+            on_done=lambda success: self._tag_write_committed.emit(uuid)
+        )
+
+    def _on_tag_write_committed(self, uuid: str):
+        """Queued tag change committed (or failed) - show the stored tags"""
+        if uuid != self._current_uuid:
+            # Another asset is shown; still let listeners pick up the change
+            tag_ids = [tag['id'] for tag in self._db_service.get_asset_tags(uuid)]
+            self.tags_changed.emit(uuid, tag_ids)
+            return
+
         # Refresh pills
-        tags_v2 = self._db_service.get_asset_tags(self._current_uuid)
+        tags_v2 = self._db_service.get_asset_tags(uuid)
         self._rebuild_pills(tags_v2)
-        self.tags_changed.emit(self._current_uuid, self._current_tag_ids.copy())
+        self.tags_changed.emit(uuid, self._current_tag_ids.copy())
 
     # ------------------------------------------------------------------
     # Pill display
@@ -372,13 +394,10 @@ class TagsWidget(QWidget):
     def _on_remove_tag(self, tag_id: int):
         if not self._current_uuid:
             return
-        if self._db_service.remove_tag_from_asset(self._current_uuid, tag_id):
-            if tag_id in self._current_tag_ids:
-                self._current_tag_ids.remove(tag_id)
-            tags_v2 = self._db_service.get_asset_tags(self._current_uuid)
-            self._rebuild_pills(tags_v2)
-            self.tag_removed.emit(self._current_uuid, tag_id)
-            self.tags_changed.emit(self._current_uuid, self._current_tag_ids.copy())
+        self._queue_tag_write(tag_id, False)
+        if tag_id in self._current_tag_ids:
+            self._current_tag_ids.remove(tag_id)
+        self.tag_removed.emit(self._current_uuid, tag_id)
 
     def _clear_pills_layout(self):
         """Remove all widgets and sub-layouts from the pills layout."""
@@ -270,6 +270,17 @@ class ThumbnailPanel(QWidget):
         self._btn_3d.setToolTip(tooltip)
         self._btn_enlarge.setEnabled(False)
 
+    def is_3d_preview_visible(self) -> bool:
+        """True while the 3D view is the active page and on screen (not
+        hidden, collapsed in the splitter or minimized)."""
+        return (
+            self._viewport is not None
+            and not self._gl_context_failed
+            and self._stack.currentIndex() == self._IDX_3D
+            and self._viewport.isVisible()
+            and not self._viewport.visibleRegion().isEmpty()
+        )
+
     def clear_asset(self):
         self._current_asset = None
         self._current_glb_path = None
@@ -9,6 +9,7 @@ Features:
 - Add screenshot button
 """
 
+import os
 from pathlib import Path
 from typing import Optional, List, Dict
 
@@ -18,7 +19,9 @@ from PyQt6.QtWidgets import (
     QFileDialog, QSizePolicy
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QSize, QMimeData
-from PyQt6.QtGui import QPixmap, QDragEnterEvent, QDropEvent, QDrag, QCursor
+from PyQt6.QtGui import QPixmap, QImageReader, QDragEnterEvent, QDropEvent, QDrag, QCursor
+
+from ...services.image_cache import get_image_cache
 
 
 class ScreenshotThumbnail(QFrame):
@@ -30,6 +33,9 @@ class ScreenshotThumbnail(QFrame):
 
     THUMB_SIZE = 120
 
+    # ImageCache consumer for the scaled thumbnails
+    CACHE_CONSUMER = 'screenshots'
+
     def __init__(self, index: int, data: Dict, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._index = index
@@ -74,19 +80,35 @@ class ScreenshotThumbnail(QFrame):
     def _load_thumbnail(self):
         """Load and display the thumbnail image."""
         file_path = self._data.get('file_path', '')
-        if file_path and Path(file_path).exists():
-            pixmap = QPixmap(file_path)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    self.THUMB_SIZE, self.THUMB_SIZE,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self._image_label.setPixmap(scaled)
-            else:
-                self._image_label.setText("?")
-        else:
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns if file_path else None
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is None:
             self._image_label.setText("?")
+            return
+
+        cache = get_image_cache()
+        key = f"{file_path}:{mtime_ns}:{self.THUMB_SIZE}"
+        pixmap = cache.get(self.CACHE_CONSUMER, key)
+        if pixmap is None:
+            pixmap = self._read_scaled(file_path)
+            if pixmap.isNull():
+                self._image_label.setText("?")
+                return
+            cache.put(self.CACHE_CONSUMER, key, pixmap)
+        self._image_label.setPixmap(pixmap)
+
+    def _read_scaled(self, file_path: str) -> QPixmap:
+        """Decode a screenshot straight to thumbnail size (no full-size copy)"""
+        reader = QImageReader(file_path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(
+                self.THUMB_SIZE, self.THUMB_SIZE, Qt.AspectRatioMode.KeepAspectRatio
+            ))
+        return QPixmap.fromImage(reader.read())
 
     def _update_style(self):
         """Update frame style based on selection state."""
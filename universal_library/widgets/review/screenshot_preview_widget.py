@@ -8,6 +8,7 @@ Features:
 - Annotation toggle button
 """
 
+import os
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 
@@ -18,6 +19,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QRectF
 from PyQt6.QtGui import QPixmap, QResizeEvent
 
+from ...services.image_cache import get_image_cache
 from .drawover_canvas import DrawoverCanvas, DrawingTool
 from .drawing_toolbar import DrawingToolbar
 
@@ -34,6 +36,9 @@ class ScreenshotPreviewWidget(QWidget):
     annotation_changed = pyqtSignal()
     annotation_mode_changed = pyqtSignal(bool)
 
+    # ImageCache consumer for full-size screenshots
+    CACHE_CONSUMER = 'review'
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
@@ -145,11 +150,10 @@ class ScreenshotPreviewWidget(QWidget):
         self._name_label.setText(self._screenshot_name)
 
         # Load pixmap
-        if file_path and Path(file_path).exists():
-            self._pixmap = QPixmap(file_path)
+        self._pixmap = self._load_pixmap(file_path)
+        if self._pixmap is not None:
             self._update_image_display()
         else:
-            self._pixmap = None
             self._image_label.setText("Image not found")
 
         # Clear canvas and pending strokes
@@ -160,6 +164,32 @@ class ScreenshotPreviewWidget(QWidget):
         # Position canvas after image loads
         QTimer.singleShot(50, self._position_canvas)
 
+    def _load_pixmap(self, file_path: str) -> Optional[QPixmap]:
+        """
+        Get a screenshot from the shared image cache, loading it on a miss
+
+        The displayed screenshot is pinned so browsing other screenshots
+        evicts older ones first.
+        """
+        cache = get_image_cache()
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns if file_path else None
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is None:
+            cache.set_pinned(self.CACHE_CONSUMER, [])
+            return None
+
+        key = f"{file_path}:{mtime_ns}"
+        cache.set_pinned(self.CACHE_CONSUMER, [key])
+        pixmap = cache.get(self.CACHE_CONSUMER, key)
+        if pixmap is None:
+            pixmap = QPixmap(file_path)
+            if pixmap.isNull():
+                return None
+            cache.put(self.CACHE_CONSUMER, key, pixmap)
+        return pixmap
+
     def _update_image_display(self):
         """Scale and display the image."""
         if not self._pixmap or self._pixmap.isNull():
@@ -325,6 +355,7 @@ class ScreenshotPreviewWidget(QWidget):
     def clear(self):
         """Clear the preview."""
         self._pixmap = None
+        get_image_cache().set_pinned(self.CACHE_CONSUMER, [])
         self._screenshot_path = None
         self._screenshot_name = None
         self._pending_strokes = None
@@ -7,6 +7,8 @@ Provides UI for:
 - Integrity check
 - Database optimization (VACUUM)
 - Backup management
+- Batch thumbnail regeneration
+- Image cache memory statistics
 """
 
 from pathlib import Path
@@ -20,6 +22,10 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 
 from ...services.database_service import get_database_service
+from ...services.write_queue import get_write_queue
+from ...services.asset_manager import get_asset_manager
+from ...services.thumbnail_batch_service import get_thumbnail_batch_service
+from ...services.image_cache import get_image_cache
 
 
 class MaintenanceTab(QWidget):
@@ -42,6 +48,9 @@ class MaintenanceTab(QWidget):
         # Maintenance Actions Group
         layout.addWidget(self._create_maintenance_section())
 
+        # Thumbnails Group
+        layout.addWidget(self._create_thumbnails_section())
+
         layout.addStretch()
 
         # Note at bottom
@@ -112,6 +121,11 @@ class MaintenanceTab(QWidget):
         self._info_label = QLabel(info_text)
         group_layout.addWidget(self._info_label)
 
+        # Connection stats
+        self._connections_label = QLabel(self._format_connection_stats())
+        self._connections_label.setStyleSheet("color: #808080;")
+        group_layout.addWidget(self._connections_label)
+
         # Pending features (if upgrade available)
         if stats['needs_upgrade'] and stats['pending_features']:
             group_layout.addSpacing(10)
@@ -174,6 +188,115 @@ class MaintenanceTab(QWidget):
 
         return group
 
+    def _create_thumbnails_section(self):
+        """Create thumbnail regeneration section"""
+        group = QGroupBox("Thumbnails")
+        group_layout = QVBoxLayout(group)
+
+        rebuild_layout = QHBoxLayout()
+        self._rebuild_thumbnails_btn = QPushButton("Rebuild All Thumbnails")
+        self._rebuild_thumbnails_btn.clicked.connect(self._on_rebuild_thumbnails)
+        rebuild_layout.addWidget(self._rebuild_thumbnails_btn)
+
+        rebuild_desc = QLabel("Render every asset in Blender as one resumable job")
+        rebuild_desc.setStyleSheet("font-style: italic; color: #808080;")
+        rebuild_layout.addWidget(rebuild_desc)
+        rebuild_layout.addStretch()
+
+        group_layout.addLayout(rebuild_layout)
+
+        self._thumbnail_job_label = QLabel()
+        self._thumbnail_job_label.setStyleSheet("color: #808080;")
+        group_layout.addWidget(self._thumbnail_job_label)
+
+        group_layout.addSpacing(10)
+
+        # In-memory image cache usage
+        self._image_cache_label = QLabel(self._format_image_cache_stats())
+        self._image_cache_label.setStyleSheet("color: #808080;")
+        group_layout.addWidget(self._image_cache_label)
+
+        batch_service = get_thumbnail_batch_service()
+        batch_service.job_progress.connect(self._on_thumbnail_job_progress)
+        batch_service.job_finished.connect(self._on_thumbnail_job_finished)
+        self._update_thumbnail_job_state()
+
+        return group
+
+    def _update_thumbnail_job_state(self, text: str = ""):
+        """Disable the rebuild button while a batch job is running"""
+        running = bool(get_thumbnail_batch_service().active_jobs())
+        self._rebuild_thumbnails_btn.setEnabled(not running)
+        if not text and running:
+            text = "Thumbnail job running in Blender..."
+        self._thumbnail_job_label.setText(text)
+        self._thumbnail_job_label.setVisible(bool(text))
+
+    def _on_thumbnail_job_progress(self, job_id: str, completed: int, failed: int, total: int):
+        """Show progress of a running batch job"""
+        text = f"Rendering: {completed + failed}/{total}"
+        if failed:
+            text += f" ({failed} failed)"
+        self._update_thumbnail_job_state(text)
+
+    def _on_thumbnail_job_finished(self, job_id: str, completed: int, failed: int):
+        """Show the result of a finished batch job"""
+        text = f"Last job: {completed} rendered"
+        if failed:
+            text += f", {failed} failed"
+        self._update_thumbnail_job_state(text)
+
+    def _on_rebuild_thumbnails(self):
+        """Queue thumbnail regeneration for the whole library"""
+        reply = QMessageBox.question(
+            self,
+            "Rebuild All Thumbnails",
+            "Render new thumbnails for every asset in Blender?\n\n"
+            "Blender must be running with the queue listener started. "
+            "The job continues where it left off if Blender is restarted.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        success, message = get_asset_manager().queue_regenerate_all_thumbnails()
+        if not success:
+            QMessageBox.warning(self, "Rebuild All Thumbnails", message)
+
+    def _format_connection_stats(self) -> str:
+        """Format connection manager stats for the status section"""
+        stats = self._db_service.get_connection_stats()
+        queue = get_write_queue().get_stats()
+        return (
+            f"<b>Connections:</b> {stats['open_connections']} open "
+            f"({stats['read_connections']} read-only)  |  "
+            f"<b>Write Transactions:</b> {stats['write_transactions']} "
+            f"(avg wait {stats['avg_write_wait_ms']:.1f} ms)  |  "
+            f"<b>Busy Waits:</b> {stats['busy_waits']}  |  "
+            f"<b>Lock Timeouts:</b> {stats['lock_timeouts']}<br>"
+            f"<b>Write Queue:</b> {queue['queue_depth']} pending "
+            f"(max {queue['max_queue_depth']})  |  "
+            f"{queue['committed']} writes in {queue['batches']} commits "
+            f"(avg {queue['avg_commit_ms']:.1f} ms, {queue['coalesced']} coalesced)"
+        )
+
+    def _format_image_cache_stats(self) -> str:
+        """Format image cache usage for the thumbnails section"""
+        stats = get_image_cache().get_stats()
+        lines = [
+            f"<b>Image Cache:</b> {stats['used_mb']:.1f} / {stats['budget_mb']:.0f} MB "
+            f"(peak {stats['peak_mb']:.1f} MB, {stats['entries']} images)"
+        ]
+        for name, consumer in stats['consumers'].items():
+            quota = f" / {consumer['quota_mb']:.0f}" if consumer['quota_mb'] else ""
+            lines.append(
+                f"&nbsp;&nbsp;{name.capitalize()}: {consumer['used_mb']:.1f}{quota} MB, "
+                f"{consumer['entries']} images ({consumer['pinned']} pinned)  |  "
+                f"{consumer['hit_rate']:.0f}% hits, {consumer['evictions']} evictions"
+            )
+        return "<br>".join(lines)
+
     def _refresh_status(self):
         """Refresh the status display"""
         stats = self._db_service.get_database_stats()
@@ -212,6 +335,8 @@ class MaintenanceTab(QWidget):
             f"<b>Cold Storage:</b> {stats['cold_count']}"
         )
         self._info_label.setText(info_text)
+        self._connections_label.setText(self._format_connection_stats())
+        self._image_cache_label.setText(self._format_image_cache_stats())
 
         QMessageBox.information(
             self,
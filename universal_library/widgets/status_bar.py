@@ -5,7 +5,7 @@ Pattern: QWidget with horizontal layout
 Based on animation_library architecture.
 """
 
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar
 from PyQt6.QtCore import Qt
 
 from ..events.event_bus import get_event_bus
@@ -18,9 +18,10 @@ class StatusBar(QWidget):
     Features:
     - Status message display
     - Asset count display
+    - Load progress indicator
 
     Layout:
-        [Status message...                    ] [1,234 assets]
+        [Status message...          ] [=====   ] [1,234 assets]
     """
 
     def __init__(self, parent=None):
@@ -42,6 +43,14 @@ class StatusBar(QWidget):
         self._status_label.setStyleSheet("color: #a0a0a0;")
         layout.addWidget(self._status_label, 1)
 
+        # Load progress (hidden unless a load is running)
+        self._progress_bar = QProgressBar()
+        self._progress_bar.setFixedWidth(160)
+        self._progress_bar.setFixedHeight(12)
+        self._progress_bar.setTextVisible(False)
+        self._progress_bar.hide()
+        layout.addWidget(self._progress_bar)
+
         # Asset count (right)
         self._count_label = QLabel("0 assets")
         self._count_label.setStyleSheet("color: #808080;")
@@ -67,6 +76,20 @@ class StatusBar(QWidget):
         self._status_label.setText(message)
         self._status_label.setStyleSheet("color: #ff6b6b;")
 
+    def status_text(self) -> str:
+        """Get current status message"""
+        return self._status_label.text()
+
+    def set_progress(self, current: int, total: int):
+        """Show progress indicator (total of 0 shows a busy indicator)"""
+        self._progress_bar.setRange(0, max(total, 0))
+        self._progress_bar.setValue(min(current, total) if total > 0 else 0)
+        self._progress_bar.show()
+
+    def clear_progress(self):
+        """Hide progress indicator"""
+        self._progress_bar.hide()
+
     def set_asset_count(self, count: int, filtered: bool = False):
         """Set asset count display"""
         if filtered:
@@ -13,13 +13,19 @@ from .asset_viewport import AssetViewport
 from .enlarged_viewer_dialog import EnlargedViewerDialog
 from .gltf_loader import (
     MeshData, SkinData, NodeData,
-    AnimationChannel, AnimationData, GLBData,
+    AnimationChannel, AnimationData, GLBData, CancelToken, LoadCancelled,
 )
-from .mesh_cache import load_mesh, load_glb_data, clear_cache
+from .mesh_cache import (
+    load_mesh, load_glb_data, peek_glb_data, clear_cache,
+    pin_glb, unpin_glb, get_cache_stats, contains_glb,
+)
+from .preloader import GlbPreloader, get_glb_preloader
 
 __all__ = [
     'AssetViewport', 'EnlargedViewerDialog',
     'MeshData', 'SkinData', 'NodeData',
-    'AnimationChannel', 'AnimationData', 'GLBData',
-    'load_mesh', 'load_glb_data', 'clear_cache',
+    'AnimationChannel', 'AnimationData', 'GLBData', 'CancelToken', 'LoadCancelled',
+    'load_mesh', 'load_glb_data', 'peek_glb_data', 'clear_cache',
+    'pin_glb', 'unpin_glb', 'get_cache_stats', 'contains_glb',
+    'GlbPreloader', 'get_glb_preloader',
 ]
@@ -5,9 +5,14 @@ Slim, single-mesh-focused viewport with an orbit camera, a ground grid, and
 flat-shaded mesh rendering with one directional light. No terrain, no
 blockers, no gizmos, no instancing — just "show me this mesh".
 
+Parsing runs on a small worker pool so selecting a heavy asset doesn't
+freeze the UI; only the GPU upload happens on the GUI (GL) thread. A newer
+load_glb() cancels the in-flight parse, and a "Loading" overlay covers the
+viewport meanwhile. Cache hits are applied immediately.
+
 Public API:
     AssetViewport(parent=None)
-        .load_glb(path)             — load and display a .glb file
+        .load_glb(path)             — load (async) and display a .glb file
         .clear()                    — remove the current mesh
         .set_background_color(qc)   — change clear color
         .reset_camera()             — re-frame the current mesh
@@ -23,9 +28,10 @@ from pathlib import Path
 from typing import Optional
 
 import numpy as np
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QColor, QImage, QMouseEvent, QSurfaceFormat, QWheelEvent
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+from PyQt6.QtWidgets import QLabel
 
 from OpenGL.GL import *  # noqa: F403
 
@@ -42,9 +48,10 @@ from .gl_shaders import (
     MAX_JOINTS, compile_shader_program,
 )
 from .gltf_loader import (
-    MeshData, GLBData, SkinData, NodeData, AnimationData, AnimationChannel,
+    CancelToken, MeshData, GLBData, SkinData, NodeData, AnimationData,
+    AnimationChannel,
 )
-from .mesh_cache import load_mesh, load_glb_data
+from .mesh_cache import load_mesh, load_glb_data, peek_glb_data
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +85,44 @@ def _light_dir_from_spherical(az_deg: float, el_deg: float) -> np.ndarray:
 
 _FALLBACK_LIGHT_DIR = _light_dir_from_spherical(45.0, 35.0)
 
+
+# GLB parsing is CPU-bound Python/numpy; two workers keep a preview and an
+# enlarged viewer responsive without competing with thumbnail loading.
+_PARSE_THREADS = 2
+_parse_pool: Optional[QThreadPool] = None
+
+
+def _get_parse_pool() -> QThreadPool:
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = QThreadPool()
+        _parse_pool.setMaxThreadCount(_PARSE_THREADS)
+    return _parse_pool
+
+
+class _GlbLoadSignals(QObject):
+    """Signals for _GlbLoadTask."""
+    finished = pyqtSignal(int, str, object)  # request_id, path, GLBData or None
+
+
+class _GlbLoadTask(QRunnable):
+    """Parse a .glb (through the shared mesh cache) on a worker thread."""
+
+    def __init__(self, request_id: int, path: str, cancel: CancelToken):
+        super().__init__()
+        self.request_id = request_id
+        self.path = path
+        self.cancel = cancel
+        self.signals = _GlbLoadSignals()
+
+    def run(self):
+        # Superseded while still queued — don't start parsing at all
+        glb = None if self.cancel.cancelled else load_glb_data(self.path, cancel=self.cancel)
+        try:
+            self.signals.finished.emit(self.request_id, self.path, glb)
+        except RuntimeError:
+            pass  # Viewport deleted while parsing
+
 # Y-up (glTF) → Z-up (UL) — same rotation the loader applies to static meshes,
 # but for skinned meshes we apply it at the joint-palette level instead.
 _Y_TO_Z_4x4 = np.array([
@@ -196,6 +241,16 @@ class AssetViewport(QOpenGLWidget):
         self._pending_glb: Optional[GLBData] = None
         self._pending_path: Optional[str] = None
 
+        # Async parse state — results for any other request id are stale
+        self._load_request = 0
+        self._load_cancel: Optional[CancelToken] = None
+        self._loading_overlay = QLabel("Loading 3D preview\u2026", self)
+        self._loading_overlay.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._loading_overlay.setStyleSheet(
+            "color: #cccccc; font-size: 11px; background: rgba(0, 0, 0, 110);"
+        )
+        self._loading_overlay.hide()
+
         # Skinning / animation state — GLBData of the currently-loaded asset.
         # Populated from the cache so we can re-sample animations per frame
         # without re-parsing. `None` means a non-animated / non-skinned asset.
@@ -221,12 +276,39 @@ class AssetViewport(QOpenGLWidget):
 
     def load_glb(self, path: str) -> None:
         """Load and display a .glb file. Path resolution / fallback is the
-        caller's responsibility — this method just tries to load."""
-        glb = load_glb_data(path)
+        caller's responsibility — this method just tries to load.
+
+        Returns immediately; `glb_loaded` / `glb_failed` fire once the file
+        is parsed. Calling again (or `clear()`) cancels a pending load."""
+        self._cancel_load()
+
+        glb = peek_glb_data(path)
+        if glb is not None:
+            self._show_glb(glb, path)
+            return
+
+        # Don't leave the previous asset on screen under the overlay
+        self._reset_meshes()
+
+        token = CancelToken()
+        self._load_cancel = token
+        task = _GlbLoadTask(self._load_request, path, token)
+        task.signals.finished.connect(self._on_glb_parsed)
+        self._set_loading(True)
+        _get_parse_pool().start(task)
+
+    def _on_glb_parsed(self, request_id: int, path: str, glb: Optional[GLBData]):
+        if request_id != self._load_request:
+            return  # Superseded by a newer load_glb() / clear()
+        self._load_cancel = None
+        self._set_loading(False)
         if not glb or not glb.meshes:
             self.glb_failed.emit(path, "Failed to load or empty mesh")
             return
+        self._show_glb(glb, path)
 
+    def _show_glb(self, glb: GLBData, path: str):
+        """Upload a parsed GLBData, or defer it until GL is initialized."""
         if not self._gl_ready:
             # Defer until initializeGL runs. _apply_glb will fire glb_loaded
             # at that point so callers don't miss the event.
@@ -245,7 +327,25 @@ class AssetViewport(QOpenGLWidget):
         self.update()
 
     def clear(self) -> None:
-        """Remove the current mesh."""
+        """Remove the current mesh and cancel any pending load."""
+        self._cancel_load()
+        self._reset_meshes()
+
+    def _cancel_load(self):
+        """Cancel the in-flight parse (if any) and invalidate its result."""
+        self._load_request += 1
+        if self._load_cancel is not None:
+            self._load_cancel.cancel()
+            self._load_cancel = None
+        self._set_loading(False)
+
+    def _set_loading(self, loading: bool):
+        if loading:
+            self._loading_overlay.setGeometry(self.rect())
+            self._loading_overlay.raise_()
+        self._loading_overlay.setVisible(loading)
+
+    def _reset_meshes(self):
         if self._gl_ready:
             self.makeCurrent()
             try:
@@ -376,6 +476,10 @@ class AssetViewport(QOpenGLWidget):
             self._gl_failed = True
             self.context_unavailable.emit()
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._loading_overlay.setGeometry(self.rect())
+
     def resizeGL(self, w: int, h: int):
         if h > 0:
             self.camera.aspect = w / h
@@ -1032,6 +1136,8 @@ class AssetViewport(QOpenGLWidget):
 
     def _cleanup_gl_resources(self):
         """Best-effort cleanup. May be called after the GL context is gone."""
+        if self._load_cancel is not None:
+            self._load_cancel.cancel()
         if not self._gl_ready:
             return
         try:
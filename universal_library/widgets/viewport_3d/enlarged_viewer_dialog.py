@@ -30,6 +30,7 @@ from PyQt6.QtWidgets import (
 
 from .asset_viewport import AssetViewport
 from .light_direction_dialog import LightDirectionDialog
+from .mesh_cache import pin_glb, unpin_glb
 from ...services.viewport_settings import (
     get_viewport_bg_color, set_viewport_bg_color,
     get_viewport_fps, set_viewport_fps,
@@ -268,6 +269,9 @@ class EnlargedViewerDialog(QDialog):
         # Stop playback while the new asset loads. _on_loaded will re-enable
         # the timeline if the new asset has animations.
         self._stop_playback()
+        # Keep the displayed asset cached while the dialog is open
+        unpin_glb(self._current_glb_path)
+        pin_glb(path)
         self._current_glb_path = path
         if self._viewport is not None:
             self._viewport.load_glb(path)
@@ -537,6 +541,17 @@ class EnlargedViewerDialog(QDialog):
     # Lifecycle
     # ------------------------------------------------------------------
 
+    def done(self, result: int):
+        """Release the mesh pin however the dialog is closed.
+
+        Esc and reject() reach here without a closeEvent, and closeEvent
+        itself ends in reject(), so this is the one place every close
+        path passes through."""
+        self._timer.stop()
+        unpin_glb(self._current_glb_path)
+        self._current_glb_path = None
+        super().done(result)
+
     def closeEvent(self, event):
         """Ensure the playback timer stops when the dialog closes."""
         self._timer.stop()
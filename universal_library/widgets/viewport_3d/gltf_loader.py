@@ -6,11 +6,19 @@ display in their authored layout. Decodes diffuse (baseColor) textures via
 QImage when present so meshes show their albedo.
 
 Pure Python — no trimesh / pygltflib / assimp. QImage handles PNG/JPEG.
+
+The file is memory-mapped and accessors are numpy views into the mapping
+(strided views for interleaved bufferViews), so the BIN chunk is never
+copied wholesale. Arrays are copied once — when transformed or converted,
+or when kept in the result — so a returned GLBData never pins the mapping
+(which would lock the file on Windows).
 """
 
 from __future__ import annotations
 
 import json
+import logging
+import mmap
 import os
 import struct
 from dataclasses import dataclass, field
@@ -19,6 +27,8 @@ import numpy as np
 
 from PyQt6.QtGui import QImage
 
+logger = logging.getLogger(__name__)
+
 
 # Y-up (glTF) → Z-up (Blender / UL) — rotate -90° around X
 _Y_TO_Z = np.array([
@@ -29,6 +39,33 @@ _Y_TO_Z = np.array([
 ], dtype=np.float64)
 
 
+class LoadCancelled(Exception):
+    """Raised by load_glb when its CancelToken is cancelled mid-parse."""
+
+
+class CancelToken:
+    """Cooperative cancellation flag for `load_glb`.
+
+    Set from any thread with `cancel()`; the parser checks it between
+    phases and primitives and raises `LoadCancelled`.
+    """
+    __slots__ = ('_cancelled',)
+
+    def __init__(self):
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def check(self):
+        if self._cancelled:
+            raise LoadCancelled()
+
+
 @dataclass
 class MeshData:
     """Loaded mesh data ready for OpenGL rendering."""
@@ -101,46 +138,92 @@ class GLBData:
     def has_animations(self) -> bool:
         return len(self.animations) > 0
 
-
-def load_glb(path: str) -> GLBData:
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held: array buffers plus decoded textures
+        (each shared texture counted once). Used for cache budgeting."""
+        arrays = []
+        images = {}
+        for m in self.meshes:
+            arrays += [m.vertices, m.normals, m.uvs, m.indices, m.joints, m.weights]
+            if m.base_image is not None:
+                images[id(m.base_image)] = m.base_image.sizeInBytes()
+        arrays += [s.inverse_bind_matrices for s in self.skins]
+        for a in self.animations:
+            for c in a.channels:
+                arrays += [c.times, c.values]
+        return sum(arr.nbytes for arr in arrays if arr is not None) + sum(images.values())
+
+
+def load_glb(path: str, cancel: Optional[CancelToken] = None) -> GLBData:
     """Parse a binary .glb file. Returns a GLBData with meshes + scene graph +
     skins + animations. For backwards compatibility, callers wanting just the
-    mesh list can read `.meshes`."""
+    mesh list can read `.meshes`.
+
+    Raises `LoadCancelled` if `cancel` is cancelled before parsing finishes."""
     with open(path, 'rb') as f:
-        magic = f.read(4)
-        if magic != b'glTF':
+        if os.fstat(f.fileno()).st_size < 12:
             raise ValueError("Not a valid GLB file")
-        version = struct.unpack('<I', f.read(4))[0]
-        if version != 2:
-            raise ValueError(f"Unsupported glTF version: {version}")
-        total_length = struct.unpack('<I', f.read(4))[0]
-
-        json_chunk = None
-        bin_chunk = None
-        while f.tell() < total_length:
-            chunk_length = struct.unpack('<I', f.read(4))[0]
-            chunk_type = f.read(4)
-            chunk_data = f.read(chunk_length)
-            if chunk_type == b'JSON':
-                json_chunk = json.loads(chunk_data.decode('utf-8'))
-            elif chunk_type == b'BIN\x00':
-                bin_chunk = chunk_data
-
-        if not json_chunk or not bin_chunk:
-            return GLBData()
-
-        ctx = _ParseContext(
-            gltf=json_chunk,
-            bin_data=bin_chunk,
-            base_dir=os.path.dirname(os.path.abspath(path)),
-        )
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
+    view = memoryview(mapped)
+    try:
+        return _parse_glb(view, path, cancel)
+    finally:
+        # Normally every view is gone by now; if an exception traceback
+        # still holds one, the mapping is closed when that is collected.
+        try:
+            view.release()
+            mapped.close()
+        except BufferError:
+            pass
+
+
+def _parse_glb(data: memoryview, path: str,
+               cancel: Optional[CancelToken]) -> GLBData:
+    magic, version, total_length = struct.unpack_from('<4sII', data, 0)
+    if magic != b'glTF':
+        raise ValueError("Not a valid GLB file")
+    if version != 2:
+        raise ValueError(f"Unsupported glTF version: {version}")
+    total_length = min(total_length, len(data))
+
+    json_chunk = None
+    bin_chunk = None
+    pos = 12
+    while pos + 8 <= total_length:
+        chunk_length, chunk_type = struct.unpack_from('<I4s', data, pos)
+        start = pos + 8
+        if chunk_type == b'JSON':
+            json_chunk = json.loads(bytes(data[start:start + chunk_length]).decode('utf-8'))
+        elif chunk_type == b'BIN\x00':
+            bin_chunk = data[start:start + chunk_length]  # view, not a copy
+        pos = start + chunk_length
+
+    if not json_chunk or bin_chunk is None or not len(bin_chunk):
+        return GLBData()
+
+    ctx = _ParseContext(
+        gltf=json_chunk,
+        bin_data=bin_chunk,
+        base_dir=os.path.dirname(os.path.abspath(path)),
+        cancel=cancel,
+    )
+    try:
+        ctx.check_cancelled()
         glb = GLBData()
         glb.nodes = _load_nodes(ctx)
         glb.skins = _load_skins(ctx)
+        ctx.check_cancelled()
         glb.meshes = _build_meshes(ctx)
+        ctx.check_cancelled()
         glb.animations = _load_animations(ctx)
         return glb
+    finally:
+        try:
+            bin_chunk.release()
+        except BufferError:
+            pass  # A view escaped; load_glb then leaves the mapping to GC
 
 
 # ----------------------------------------------------------------------
@@ -151,10 +234,15 @@ def load_glb(path: str) -> GLBData:
 @dataclass
 class _ParseContext:
     gltf: dict
-    bin_data: bytes
+    bin_data: memoryview   # BIN chunk, a view into the mapped file
     base_dir: str
     # Lazy caches keyed by index, populated on demand
     image_cache: dict = field(default_factory=dict)   # image_idx -> QImage
+    cancel: Optional[CancelToken] = None
+
+    def check_cancelled(self):
+        if self.cancel is not None:
+            self.cancel.check()
 
 
 def _build_meshes(ctx: _ParseContext) -> list[MeshData]:
@@ -279,14 +367,14 @@ def _get_dracopy():
         return DracoPy
     except ImportError:
         if not _DRACO_IMPORT_WARNED:
-            print("[gltf_loader] DracoPy not installed — Draco-compressed meshes "
-                  "will fail to load. Install with: pip install DracoPy")
+            logger.warning("[gltf_loader] DracoPy not installed — Draco-compressed meshes "
+                           "will fail to load. Install with: pip install DracoPy")
             _DRACO_IMPORT_WARNED = True
         return None
 
 
 def _decode_draco_primitive(draco_ext: dict, buffer_views: list,
-                            bin_data: bytes) -> Optional[tuple]:
+                            bin_data: memoryview) -> Optional[tuple]:
     """Decode a Draco-compressed primitive's geometry + optional skinning attrs.
 
     Returns (vertices, normals, uvs, indices, joints, weights) or None on failure.
@@ -299,7 +387,7 @@ def _decode_draco_primitive(draco_ext: dict, buffer_views: list,
 
     bv_idx = draco_ext.get('bufferView')
     if bv_idx is None or bv_idx >= len(buffer_views):
-        print("[gltf_loader] Draco primitive missing bufferView reference")
+        logger.warning("[gltf_loader] Draco primitive missing bufferView reference")
         return None
 
     bv = buffer_views[bv_idx]
@@ -310,7 +398,7 @@ def _decode_draco_primitive(draco_ext: dict, buffer_views: list,
     try:
         mesh = DracoPy.decode_buffer_to_mesh(blob)
     except Exception as e:
-        print(f"[gltf_loader] DracoPy.decode_buffer_to_mesh failed: {e}")
+        logger.warning(f"[gltf_loader] DracoPy.decode_buffer_to_mesh failed: {e}")
         return None
 
     # DracoMesh in DracoPy 2.x exposes attributes as numpy ndarrays — either
@@ -319,11 +407,11 @@ def _decode_draco_primitive(draco_ext: dict, buffer_views: list,
     # returns the row count, not the total element count.
     try:
         if mesh.points is None or np.asarray(mesh.points).size == 0:
-            print("[gltf_loader] Draco mesh has no points")
+            logger.warning("[gltf_loader] Draco mesh has no points")
             return None
         verts_flat = np.asarray(mesh.points, dtype=np.float32)
         if verts_flat.size % 3 != 0:
-            print("[gltf_loader] Draco mesh vertex buffer wrong size")
+            logger.warning("[gltf_loader] Draco mesh vertex buffer wrong size")
             return None
         vertices = verts_flat.reshape(-1, 3)
         n_verts = vertices.shape[0]
@@ -356,7 +444,7 @@ def _decode_draco_primitive(draco_ext: dict, buffer_views: list,
 
         return vertices, normals, uvs, indices, joints, weights
     except Exception as e:
-        print(f"[gltf_loader] Draco mesh attribute extraction failed: {e}")
+        logger.warning(f"[gltf_loader] Draco mesh attribute extraction failed: {e}")
         return None
 
 
@@ -371,7 +459,7 @@ def _draco_attribute_data(mesh, unique_id: int, expected_rows: int, cols: int,
     try:
         attr = mesh.get_attribute_by_unique_id(int(unique_id))
     except Exception as e:
-        print(f"[gltf_loader] Draco get_attribute_by_unique_id({unique_id}) failed: {e}")
+        logger.warning(f"[gltf_loader] Draco get_attribute_by_unique_id({unique_id}) failed: {e}")
         return None
     if attr is None:
         return None
@@ -404,12 +492,14 @@ def _parse_mesh(ctx: _ParseContext, mesh_idx: int, world: np.ndarray,
         return []
     out = []
     for primitive in meshes[mesh_idx].get('primitives', []):
+        # Outside the try below so cancellation isn't logged as a parse error
+        ctx.check_cancelled()
         try:
             md = _parse_primitive(ctx, primitive, world, skin_idx)
             if md:
                 out.append(md)
         except Exception as e:
-            print(f"[gltf_loader] Failed to parse primitive: {e}")
+            logger.error(f"[gltf_loader] Failed to parse primitive: {e}")
     return out
 
 
@@ -459,7 +549,7 @@ def _parse_primitive(ctx: _ParseContext, primitive: dict,
                 # QImage to glTexImage2D with V going down means sampling at the same
                 # UV the artist authored returns the same pixel. NO flip needed —
                 # flipping here would mirror every texture vertically.
-                uvs = uvs.astype(np.float32, copy=False)
+                uvs = _detach(uvs.astype(np.float32, copy=False))
 
         # Skinning attributes (JOINTS_0 / WEIGHTS_0). May be uint8/uint16 indices
         # and float/uint8/uint16 weights. We promote to uint32 / float32.
@@ -467,12 +557,12 @@ def _parse_primitive(ctx: _ParseContext, primitive: dict,
         if j_idx is not None:
             raw = _read_accessor(accessors[j_idx], buffer_views, bin_data)
             if raw is not None:
-                joints = raw.astype(np.uint32, copy=False)
+                joints = _detach(raw.astype(np.uint32, copy=False))
         w_idx = attributes.get('WEIGHTS_0')
         if w_idx is not None:
             raw = _read_accessor(accessors[w_idx], buffer_views, bin_data)
             if raw is not None:
-                weights = raw.astype(np.float32, copy=False)
+                weights = _detach(raw.astype(np.float32, copy=False))
 
         indices = None
         idx_accessor = primitive.get('indices')
@@ -480,6 +570,8 @@ def _parse_primitive(ctx: _ParseContext, primitive: dict,
             indices = _read_accessor(
                 accessors[idx_accessor], buffer_views, bin_data, as_indices=True
             )
+            if indices is not None:
+                indices = _detach(indices)
 
     # Skinned primitives: vertices stay in skin-local glTF (Y-up) space.
     # The skinning shader (Phase 6.5) will apply joint matrices + Y→Z at draw time.
@@ -507,8 +599,8 @@ def _parse_primitive(ctx: _ParseContext, primitive: dict,
                 base_image = _load_texture_image(ctx, tex_idx)
 
     return MeshData(
-        vertices=vertices.astype(np.float32, copy=False),
-        normals=normals.astype(np.float32, copy=False),
+        vertices=_detach(vertices.astype(np.float32, copy=False)),
+        normals=_detach(normals.astype(np.float32, copy=False)),
         uvs=uvs,
         indices=indices,
         color=color,
@@ -770,8 +862,8 @@ def _load_animations(ctx: _ParseContext) -> List[AnimationData]:
             if times is None or values is None or times.size == 0:
                 continue
 
-            times = times.astype(np.float32, copy=False)
-            values = values.astype(np.float32, copy=False)
+            times = _detach(times.astype(np.float32, copy=False))
+            values = _detach(values.astype(np.float32, copy=False))
             duration = max(duration, float(times[-1]) if times.size else 0.0)
 
             channels_out.append(AnimationChannel(
@@ -797,23 +889,24 @@ def _load_animations(ctx: _ParseContext) -> List[AnimationData]:
 
 
 def _transform_points(verts: np.ndarray, m: np.ndarray) -> np.ndarray:
-    """Apply a 4x4 matrix to (N, 3) points."""
+    """Apply an affine 4x4 matrix to (N, 3) points. Returns a new float32
+    array; `verts` (possibly a view into the mapped file) is only read."""
     if verts.size == 0:
         return verts
-    ones = np.ones((verts.shape[0], 1), dtype=np.float64)
-    homog = np.concatenate([verts.astype(np.float64), ones], axis=1)
-    out = homog @ m.T
-    return out[:, :3]
+    out = verts.astype(np.float32, copy=False) @ m[:3, :3].T.astype(np.float32)
+    out += m[:3, 3].astype(np.float32)
+    return out
 
 
 def _transform_normals(normals: np.ndarray, normal_mat: np.ndarray) -> np.ndarray:
-    """Apply a 3x3 normal matrix and renormalize."""
+    """Apply a 3x3 normal matrix and renormalize into a new float32 array."""
     if normals.size == 0:
         return normals
-    out = normals.astype(np.float64) @ normal_mat.T
+    out = normals.astype(np.float32, copy=False) @ normal_mat.T.astype(np.float32)
     norms = np.linalg.norm(out, axis=1, keepdims=True)
     norms[norms < 1e-12] = 1.0
-    return out / norms
+    out /= norms
+    return out
 
 
 def _normal_matrix(world: np.ndarray) -> np.ndarray:
@@ -826,25 +919,34 @@ def _normal_matrix(world: np.ndarray) -> np.ndarray:
     return inv.T
 
 
-def _read_accessor(accessor: dict, buffer_views: list, bin_data: bytes,
+def _detach(arr: np.ndarray) -> np.ndarray:
+    """Copy `arr` if it still views the mapped file, so results kept in
+    GLBData own their memory. Arrays already computed/converted pass through."""
+    base = arr
+    while isinstance(base, np.ndarray) and base.base is not None:
+        base = base.base
+    return arr if isinstance(base, np.ndarray) else np.array(arr, order='C')
+
+
+def _read_accessor(accessor: dict, buffer_views: list, bin_data: memoryview,
                    as_indices: bool = False) -> Optional[np.ndarray]:
+    """Return the accessor as a zero-copy (strided) view into `bin_data`.
+
+    Callers must `_detach` (or transform/convert) anything they keep. With
+    `as_indices`, narrower index types are widened to a new uint32 array.
+    Returns None if the accessor has no bufferView or runs past the buffer.
+    """
     # KNOWN LIMITATIONS — all verified safe against Blender's gltf exporter
     # (production exports inspected, none trigger any of these):
     #
-    # 1. `bufferView.byteStride` is not honored. glTF allows interleaved
-    #    attributes in one bufferView with stride > element_size; we read
-    #    them as if tightly packed. External glTFs (three.js, game engines,
-    #    Khronos samples) may interleave and would load with corrupted
-    #    vertex data. Fix path: `np.lib.stride_tricks.as_strided`.
-    #
-    # 2. `accessor.normalized` is not honored. glTF allows int8/uint8/
+    # 1. `accessor.normalized` is not honored. glTF allows int8/uint8/
     #    int16/uint16 attributes with `normalized: true`, meaning values
     #    should be divided by max_int and used as floats (compact normals,
     #    quantized weights, etc.). We return raw integers. Fix path: when
     #    `normalized=True` and dtype is integer, return `arr / dtype_max`
     #    as float32.
     #
-    # 3. `accessor.sparse` is not honored. Sparse accessors override base
+    # 2. `accessor.sparse` is not honored. Sparse accessors override base
     #    data at specific indices. Used mainly for shape-key animations,
     #    which we explicitly skip elsewhere (Phase 6 non-goal).
     bv_idx = accessor.get('bufferView')
@@ -868,11 +970,21 @@ def _read_accessor(accessor: dict, buffer_views: list, bin_data: bytes,
     }
     components = type_components.get(accessor_type, 1)
 
-    element_size = np.dtype(dtype).itemsize * components
-    data_slice = bin_data[byte_offset:byte_offset + count * element_size]
-    arr = np.frombuffer(data_slice, dtype=dtype)
+    itemsize = np.dtype(dtype).itemsize
+    element_size = itemsize * components
+    # Interleaved bufferViews: consecutive elements are byteStride apart
+    stride = buffer_view.get('byteStride') or element_size
+    if count <= 0:
+        return np.empty((0, components) if components > 1 else (0,), dtype=dtype)
+    if byte_offset + (count - 1) * stride + element_size > len(bin_data):
+        return None
+
     if components > 1:
-        arr = arr.reshape(-1, components)
+        arr = np.ndarray((count, components), dtype=dtype, buffer=bin_data,
+                         offset=byte_offset, strides=(stride, itemsize))
+    else:
+        arr = np.ndarray((count,), dtype=dtype, buffer=bin_data,
+                         offset=byte_offset, strides=(stride,))
     if as_indices:
-        return arr.astype(np.uint32)
+        return arr.astype(np.uint32, copy=False)
     return arr
@@ -1,7 +1,7 @@
 """
 GLB cache.
 
-LRU cache keyed by (absolute_path, mtime). Multiple viewports (e.g. the small
+LRU cache keyed by (absolute_path, mtime_ns, size). Multiple viewports (e.g. the small
 preview panel + the enlarged modal) share a single cache so we don't re-parse
 the same file twice.
 
@@ -14,58 +14,152 @@ Two access shapes:
     load_mesh(path)     -> Optional[list[MeshData]]  # bare mesh list (legacy)
 
 Both share the cache — calling either after the other is free.
+
+Entries are bounded by bytes, not count: each GLBData is charged its arrays
+plus decoded textures (`GLBData.nbytes`) and least recently used entries are
+evicted past Config.MESH_CACHE_MEMORY_MB. `pin_glb(path)` keeps an entry
+(e.g. the enlarged viewer's asset) out of eviction; `get_cache_stats()`
+reports hits, misses and usage.
+
+AssetViewport parses on a worker thread (see `load_glb_data(path, cancel)`),
+so cache access is guarded by a lock; `peek_glb_data` lets the GUI thread
+take a cache hit without queueing a worker.
+
+Misses consult the persistent MeshDiskCache before parsing, and fresh
+parses are written back to it in the background, so previews viewed in an
+earlier session open without re-parsing.
 """
 
 from __future__ import annotations
 
 import logging
 import os
-from collections import OrderedDict
-from typing import Optional
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Optional
 
-from .gltf_loader import GLBData, MeshData, load_glb
+from ...config import Config
+from .gltf_loader import CancelToken, GLBData, LoadCancelled, MeshData, load_glb
+from .mesh_disk_cache import get_mesh_disk_cache
 
 logger = logging.getLogger(__name__)
 
-_MAX_ENTRIES = 16
-_cache: "OrderedDict[tuple[str, float], GLBData]" = OrderedDict()
+_MB = 1024 * 1024
 
+_cache: "OrderedDict[tuple[str, int, int], GLBData]" = OrderedDict()
+_sizes: dict[tuple[str, int, int], int] = {}   # key -> GLBData.nbytes
+_pinned: Counter[str] = Counter()               # abs path -> pin count
+_lock = threading.Lock()
+_bytes = 0
+_peak_bytes = 0
+_hits = 0
+_misses = 0
+_evictions = 0
 
-def load_glb_data(path: str) -> Optional[GLBData]:
-    """Load + cache the full GLBData (meshes + skins + nodes + animations).
 
-    Returns None if the path doesn't exist or parsing fails.
-    """
+def _cache_key(path: str) -> Optional[tuple[str, int, int]]:
     if not path or not os.path.isfile(path):
         return None
-
     try:
-        mtime = os.path.getmtime(path)
+        st = os.stat(path)
     except OSError:
         return None
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
 
-    abs_path = os.path.abspath(path)
-    key = (abs_path, mtime)
-
-    if key in _cache:
-        _cache.move_to_end(key)
-        return _cache[key]
 
-    try:
-        data = load_glb(abs_path)
-    except Exception as e:
-        logger.error(f"[mesh_cache] Failed to load {abs_path}: {e}")
+def peek_glb_data(path: str) -> Optional[GLBData]:
+    """Return the cached GLBData for `path` without parsing on a miss."""
+    key = _cache_key(path)
+    if key is None:
         return None
+    global _hits
+    with _lock:
+        data = _cache.get(key)
+        if data is not None:
+            _cache.move_to_end(key)
+            _hits += 1
+        return data
+
+
+def contains_glb(path: str) -> bool:
+    """True if `path`'s current version is cached (doesn't count as a hit)."""
+    key = _cache_key(path)
+    if key is None:
+        return False
+    with _lock:
+        return key in _cache
+
+
+def load_glb_data(path: str, cancel: Optional[CancelToken] = None) -> Optional[GLBData]:
+    """Load + cache the full GLBData (meshes + skins + nodes + animations).
 
-    if data is None or not data.meshes:
+    Safe to call from worker threads. Returns None if the path doesn't
+    exist, parsing fails, or `cancel` was cancelled mid-parse.
+    """
+    key = _cache_key(path)
+    if key is None:
         return None
 
-    _cache[key] = data
-    while len(_cache) > _MAX_ENTRIES:
-        _cache.popitem(last=False)
+    global _misses
+    data = peek_glb_data(path)
+    if data is not None:
+        return data
+    with _lock:
+        _misses += 1
+
+    abs_path, mtime_ns, size = key
+    disk_cache = get_mesh_disk_cache()
+    data = disk_cache.get(abs_path, mtime_ns, size)
+    if data is None:
+        try:
+            data = load_glb(abs_path, cancel=cancel)
+        except LoadCancelled:
+            logger.debug(f"[mesh_cache] Load cancelled: {abs_path}")
+            return None
+        except Exception as e:
+            logger.error(f"[mesh_cache] Failed to load {abs_path}: {e}")
+            return None
+
+        if data is None or not data.meshes:
+            return None
+        disk_cache.put_async(abs_path, mtime_ns, size, data)
+
+    _store(key, data)
     return data
 
 
+def _store(key: tuple[str, int, int], data: GLBData):
+    global _bytes, _peak_bytes
+    nbytes = data.nbytes
+    with _lock:
+        _discard(key)
+        _cache[key] = data
+        _sizes[key] = nbytes
+        _bytes += nbytes
+        _peak_bytes = max(_peak_bytes, _bytes)
+        _evict()
+
+
+def _discard(key: tuple[str, int, int]):
+    """Drop one entry (lock must be held)."""
+    global _bytes
+    if _cache.pop(key, None) is not None:
+        _bytes -= _sizes.pop(key)
+
+
+def _evict():
+    """Drop least recently used unpinned entries over budget (lock must be held)."""
+    global _evictions
+    budget = Config.MESH_CACHE_MEMORY_MB * _MB
+    for key in list(_cache):
+        if _bytes <= budget:
+            break
+        if _pinned[key[0]] > 0:
+            continue
+        _discard(key)
+        _evictions += 1
+
+
 def load_mesh(path: str) -> Optional[list[MeshData]]:
     """Backward-compatible accessor — returns just the mesh list.
 
@@ -76,6 +170,50 @@ def load_mesh(path: str) -> Optional[list[MeshData]]:
     return data.meshes if data else None
 
 
+def pin_glb(path: str):
+    """Keep `path`'s cached GLBData (any version) from being evicted.
+
+    Pins are counted; call `unpin_glb` once per `pin_glb`. Pinned entries
+    may push the cache over budget.
+    """
+    if path:
+        with _lock:
+            _pinned[os.path.abspath(path)] += 1
+
+
+def unpin_glb(path: str):
+    """Release one `pin_glb(path)`."""
+    if not path:
+        return
+    abs_path = os.path.abspath(path)
+    with _lock:
+        _pinned[abs_path] -= 1
+        if _pinned[abs_path] <= 0:
+            del _pinned[abs_path]
+        _evict()
+
+
+def get_cache_stats() -> dict[str, Any]:
+    """Memory cache statistics: usage against the budget and hit rate."""
+    with _lock:
+        lookups = _hits + _misses
+        return {
+            'entries': len(_cache),
+            'used_mb': _bytes / _MB,
+            'peak_mb': _peak_bytes / _MB,
+            'budget_mb': Config.MESH_CACHE_MEMORY_MB,
+            'pinned': sum(1 for key in _cache if _pinned[key[0]] > 0),
+            'hits': _hits,
+            'misses': _misses,
+            'hit_rate': (_hits / lookups * 100) if lookups else 0,
+            'evictions': _evictions,
+        }
+
+
 def clear_cache():
     """Drop all cached entries."""
-    _cache.clear()
+    global _bytes
+    with _lock:
+        _cache.clear()
+        _sizes.clear()
+        _bytes = 0
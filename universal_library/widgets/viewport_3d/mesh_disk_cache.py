@@ -0,0 +1,419 @@
+"""
+Persistent cache of parsed GLB previews.
+
+Parsing a preview .glb (accessors, Draco decode, world transforms, texture
+decode) is redone on every app start otherwise. This cache writes the
+parsed `GLBData` — world-baked vertex/normal/uv/index arrays, skins, nodes,
+animations and textures downscaled to MESH_CACHE_TEXTURE_SIZE as raw
+RGBA8888 — to one flat file per asset under the library cache folder.
+
+File layout (little endian):
+    header   magic 'ULMC', version, source mtime_ns, source size, meta length
+    meta     JSON describing the GLBData; arrays are (offset, dtype, shape)
+    data     raw array buffers, each 16-byte aligned
+
+Reading maps the file and hands out numpy views into the mapping, so a hit
+is an mmap plus a JSON parse. Entries are keyed by (absolute path, mtime,
+size) and the total is kept under MESH_CACHE_DISK_SIZE_MB. The index and
+recovery of unindexed files come from IndexedDiskCache, as for
+ThumbnailDiskCache; an unindexed file is adopted if its header matches
+its name.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage
+
+from ...config import Config
+from ...services.indexed_disk_cache import IndexedDiskCache
+from .gltf_loader import (
+    AnimationChannel, AnimationData, GLBData, MeshData, NodeData, SkinData,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _CacheEntry:
+    """Index record for one cached mesh file"""
+
+    __slots__ = ('mtime_ns', 'size', 'nbytes')
+
+    def __init__(self, mtime_ns: int, size: int, nbytes: int):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.nbytes = nbytes
+
+
+class MeshDiskCache(IndexedDiskCache):
+    """
+    Size-bounded on-disk cache of parsed GLBData
+
+    Usage:
+        cache = get_mesh_disk_cache()
+        glb = cache.get(abs_path, mtime_ns, size)
+        if glb is None:
+            glb = load_glb(abs_path)
+            cache.put_async(abs_path, mtime_ns, size, glb)
+    """
+
+    FILE_MAGIC = b'ULMC'
+    FILE_VERSION = 1
+    _FILE_HEADER = struct.Struct('<4sHqQI')  # magic, version, mtime_ns, size, meta length
+    _ALIGN = 16
+
+    INDEX_MAGIC = b'ULMI'
+    INDEX_VERSION = 2  # v2: writer token in header
+    _RECORD = struct.Struct('<20sqQQ')  # path digest, mtime_ns, source size, file size
+
+    SAVE_EVERY = 16
+    LABEL = 'mesh cache'
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        super().__init__(cache_dir)
+        self._writer: Optional[ThreadPoolExecutor] = None
+
+    # ==================== LOOKUP / STORE ====================
+
+    def get(self, abs_path: str, mtime_ns: int, size: int) -> Optional[GLBData]:
+        """
+        Load a cached GLBData
+
+        Args:
+            abs_path: Absolute path of the source .glb
+            mtime_ns: Current mtime of the source
+            size: Current size of the source in bytes
+
+        Returns:
+            GLBData whose arrays view the mapped cache file, or None on miss
+        """
+        key = self._digest(abs_path)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None or entry.mtime_ns != mtime_ns or entry.size != size:
+                self._misses += 1
+                return None
+            path = self._file_path(key, mtime_ns)
+
+        try:
+            glb = self._read_file(path, mtime_ns, size)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            logger.debug(f"[mesh_disk_cache] Unreadable entry {path}: {e}")
+            glb = None
+
+        with self._lock:
+            if glb is None:
+                self._read_failed(key, entry)
+            else:
+                self._hits += 1
+        return glb
+
+    def put(self, abs_path: str, mtime_ns: int, size: int, glb: GLBData) -> bool:
+        """
+        Store a parsed GLBData
+
+        Args:
+            abs_path: Absolute path of the source .glb
+            mtime_ns: mtime of the source
+            size: Size of the source in bytes
+            glb: Parsed data (not modified)
+
+        Returns:
+            True if the entry was written
+        """
+        key = self._digest(abs_path)
+        path = self._file_path(key, mtime_ns)
+        with self._lock:
+            self._begin_write()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            nbytes = self._write_file(tmp_path, mtime_ns, size, glb)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError, TypeError) as e:
+            self._unlink(tmp_path)
+            logger.debug(f"[mesh_disk_cache] Failed to write {path}: {e}")
+            with self._lock:
+                self._end_write(0)
+            return False
+
+        with self._lock:
+            self._store(key, _CacheEntry(mtime_ns, size, nbytes))
+            self._end_write(1)
+        return True
+
+    def put_async(self, abs_path: str, mtime_ns: int, size: int, glb: GLBData):
+        """Store a GLBData on a background writer so the caller can display it now."""
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mesh-disk-cache')
+        self._writer.submit(self.put, abs_path, mtime_ns, size, glb)
+
+    def shutdown(self):
+        """Finish pending writes and persist the index"""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        self.save_index()
+
+    # ==================== FILE FORMAT ====================
+
+    def _write_file(self, path: Path, mtime_ns: int, size: int, glb: GLBData) -> int:
+        """Serialize a GLBData; returns the file size"""
+        buffers: List[np.ndarray] = []
+        descriptors: List[list] = []
+        offset = 0
+
+        def add(arr: Optional[np.ndarray]) -> Optional[int]:
+            nonlocal offset
+            if arr is None:
+                return None
+            arr = np.ascontiguousarray(arr)
+            offset = -(-offset // self._ALIGN) * self._ALIGN
+            descriptors.append([offset, arr.dtype.str, list(arr.shape)])
+            buffers.append(arr)
+            offset += arr.nbytes
+            return len(descriptors) - 1
+
+        images: List[list] = []
+        image_ids: Dict[int, int] = {}  # id(QImage) -> image index; textures are shared
+
+        def add_image(image: Optional[QImage]) -> Optional[int]:
+            if image is None or image.isNull():
+                return None
+            if id(image) not in image_ids:
+                image_ids[id(image)] = len(images)
+                images.append([add(self._image_pixels(image)), 0, 0])
+                scaled = buffers[-1]
+                images[-1][1:] = [int(scaled.shape[1]), int(scaled.shape[0])]
+            return image_ids[id(image)]
+
+        meta = {
+            'arrays': descriptors,
+            'images': images,
+            'meshes': [{
+                'vertices': add(m.vertices), 'normals': add(m.normals),
+                'uvs': add(m.uvs), 'indices': add(m.indices),
+                'joints': add(m.joints), 'weights': add(m.weights),
+                'color': list(m.color), 'image': add_image(m.base_image),
+                'skin_index': m.skin_index,
+            } for m in glb.meshes],
+            'skins': [{
+                'joints': list(s.joints), 'ibm': add(s.inverse_bind_matrices),
+                'skeleton_root': s.skeleton_root, 'name': s.name,
+            } for s in glb.skins],
+            'nodes': [{
+                'name': n.name, 'translation': n.translation.tolist(),
+                'rotation': n.rotation.tolist(), 'scale': n.scale.tolist(),
+                'children': list(n.children), 'parent': n.parent,
+                'mesh': n.mesh, 'skin': n.skin,
+            } for n in glb.nodes],
+            'animations': [{
+                'name': a.name, 'duration': a.duration,
+                'channels': [{
+                    'target_node': c.target_node, 'target_path': c.target_path,
+                    'times': add(c.times), 'values': add(c.values),
+                    'interpolation': c.interpolation,
+                } for c in a.channels],
+            } for a in glb.animations],
+        }
+
+        meta_bytes = json.dumps(meta, separators=(',', ':')).encode('utf-8')
+        header = self._FILE_HEADER.pack(self.FILE_MAGIC, self.FILE_VERSION,
+                                        mtime_ns, size, len(meta_bytes))
+        data_start = self._data_start(len(meta_bytes))
+
+        with open(path, 'wb') as f:
+            f.write(header)
+            f.write(meta_bytes)
+            f.write(b'\0' * (data_start - len(header) - len(meta_bytes)))
+            for (arr_offset, _, _), arr in zip(descriptors, buffers):
+                f.write(b'\0' * (data_start + arr_offset - f.tell()))
+                f.write(memoryview(arr).cast('B'))
+            return f.tell()
+
+    def _read_file(self, path: Path, mtime_ns: int, size: int) -> Optional[GLBData]:
+        """Map a cache file and rebuild the GLBData from views into it"""
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, file_mtime, file_size, meta_len = self._FILE_HEADER.unpack_from(mapped, 0)
+        if (magic != self.FILE_MAGIC or version != self.FILE_VERSION
+                or file_mtime != mtime_ns or file_size != size):
+            mapped.close()
+            return None
+        meta_start = self._FILE_HEADER.size
+        meta = json.loads(mapped[meta_start:meta_start + meta_len].decode('utf-8'))
+        data_start = self._data_start(meta_len)
+
+        # Views keep the mapping alive for as long as the GLBData is used
+        arrays = [
+            np.frombuffer(mapped, dtype=np.dtype(dtype), count=int(np.prod(shape)),
+                          offset=data_start + offset).reshape(shape)
+            for offset, dtype, shape in meta['arrays']
+        ]
+
+        def arr(index: Optional[int]) -> Optional[np.ndarray]:
+            return None if index is None else arrays[index]
+
+        images = []
+        for pixels_idx, width, height in meta['images']:
+            pixels = arrays[pixels_idx]
+            image = QImage(pixels.data, width, height, width * 4, QImage.Format.Format_RGBA8888)
+            images.append(image.copy())  # Detach from the mapping
+
+        glb = GLBData()
+        glb.meshes = [MeshData(
+            vertices=arr(m['vertices']), normals=arr(m['normals']),
+            uvs=arr(m['uvs']), indices=arr(m['indices']),
+            color=tuple(m['color']),
+            base_image=None if m['image'] is None else images[m['image']],
+            joints=arr(m['joints']), weights=arr(m['weights']),
+            skin_index=m['skin_index'],
+        ) for m in meta['meshes']]
+        glb.skins = [SkinData(
+            joints=s['joints'], inverse_bind_matrices=arr(s['ibm']),
+            skeleton_root=s['skeleton_root'], name=s['name'],
+        ) for s in meta['skins']]
+        glb.nodes = [NodeData(
+            name=n['name'],
+            translation=np.array(n['translation'], dtype=np.float32),
+            rotation=np.array(n['rotation'], dtype=np.float32),
+            scale=np.array(n['scale'], dtype=np.float32),
+            children=n['children'], parent=n['parent'],
+            mesh=n['mesh'], skin=n['skin'],
+        ) for n in meta['nodes']]
+        glb.animations = [AnimationData(
+            name=a['name'], duration=a['duration'],
+            channels=[AnimationChannel(
+                target_node=c['target_node'], target_path=c['target_path'],
+                times=arr(c['times']), values=arr(c['values']),
+                interpolation=c['interpolation'],
+            ) for c in a['channels']],
+        ) for a in meta['animations']]
+        return glb
+
+    def _data_start(self, meta_len: int) -> int:
+        end = self._FILE_HEADER.size + meta_len
+        return -(-end // self._ALIGN) * self._ALIGN
+
+    @staticmethod
+    def _image_pixels(image: QImage) -> np.ndarray:
+        """Downscaled RGBA8888 pixels of a texture as an (H, W, 4) array"""
+        limit = Config.MESH_CACHE_TEXTURE_SIZE
+        if image.width() > limit or image.height() > limit:
+            image = image.scaled(limit, limit, Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+        width, height = image.width(), image.height()
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        rows = np.frombuffer(bits, dtype=np.uint8).reshape(height, image.bytesPerLine())
+        return rows[:, :width * 4].reshape(height, width, 4).copy()
+
+    # ==================== INDEX RECORDS ====================
+
+    def _default_cache_dir(self) -> Path:
+        return Config.get_meshes_cache_directory()
+
+    def _max_size_mb(self) -> int:
+        return Config.MESH_CACHE_DISK_SIZE_MB
+
+    def _entry_path(self, key: bytes, entry: _CacheEntry) -> Path:
+        return self._file_path(key, entry.mtime_ns)
+
+    def _pack_record(self, key: bytes, entry: _CacheEntry) -> bytes:
+        return self._RECORD.pack(key, entry.mtime_ns, entry.size, entry.nbytes)
+
+    def _unpack_record(self, data: bytes, offset: int) -> tuple[bytes, _CacheEntry, int]:
+        key, mtime_ns, size, nbytes = self._RECORD.unpack_from(data, offset)
+        return key, _CacheEntry(mtime_ns, size, nbytes), offset + self._RECORD.size
+
+    def _recover_file(self, path: Path) -> Optional[tuple[bytes, _CacheEntry]]:
+        """Entry for a mesh file whose name parses and whose header matches it
+
+        Besides crashes and other instances, unindexed files come from
+        evictions that couldn't delete a file still mapped by a viewer
+        (Windows).
+        """
+        parsed = self._parse_file_name(path)
+        if parsed is None or parsed[0].hex()[:2] != path.parent.name:
+            return None
+        key, mtime_ns = parsed
+        size = self._read_header(path, mtime_ns)
+        if size is None:
+            return None
+        try:
+            nbytes = path.stat().st_size
+        except OSError:
+            return None
+        return key, _CacheEntry(mtime_ns, size, nbytes)
+
+    @staticmethod
+    def _parse_file_name(path: Path) -> Optional[tuple[bytes, int]]:
+        """Parse '<digest hex>_<mtime_ns>.ulmesh' into (digest, mtime_ns)"""
+        if path.suffix != '.ulmesh':
+            return None
+        name, _, mtime_ns = path.stem.partition('_')
+        try:
+            key = bytes.fromhex(name)
+            mtime_ns = int(mtime_ns)
+        except ValueError:
+            return None
+        if len(key) != hashlib.sha1().digest_size:
+            return None
+        return key, mtime_ns
+
+    def _read_header(self, path: Path, mtime_ns: int) -> Optional[int]:
+        """Source size from a cache file's header, or None if it isn't a valid file for mtime_ns"""
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(self._FILE_HEADER.size)
+            magic, version, file_mtime, size, _ = self._FILE_HEADER.unpack(header)
+        except (OSError, struct.error):
+            return None
+        if magic != self.FILE_MAGIC or version != self.FILE_VERSION or file_mtime != mtime_ns:
+            return None
+        return size
+
+    @staticmethod
+    def _digest(abs_path: str) -> bytes:
+        return hashlib.sha1(os.path.normcase(abs_path).encode('utf-8')).digest()
+
+    def _file_path(self, key: bytes, mtime_ns: int) -> Path:
+        # The mtime in the name means a changed source never overwrites a
+        # file a viewer may still have mapped
+        name = key.hex()
+        return self.cache_dir / name[:2] / f"{name}_{mtime_ns}.ulmesh"
+
+
+# Singleton instance
+_mesh_disk_cache_instance: Optional[MeshDiskCache] = None
+
+
+def get_mesh_disk_cache() -> MeshDiskCache:
+    """Get global MeshDiskCache singleton instance"""
+    global _mesh_disk_cache_instance
+    if _mesh_disk_cache_instance is None:
+        _mesh_disk_cache_instance = MeshDiskCache()
+    return _mesh_disk_cache_instance
+
+
+def shutdown_mesh_disk_cache():
+    """Finish pending writes and save the index, if the cache was used"""
+    if _mesh_disk_cache_instance is not None:
+        _mesh_disk_cache_instance.shutdown()
+
+
+__all__ = ['MeshDiskCache', 'get_mesh_disk_cache', 'shutdown_mesh_disk_cache']
@@ -0,0 +1,192 @@
+"""
+GlbPreloader — parse the 3D previews of neighbouring assets ahead of time.
+
+When the user steps through the asset grid, the main window hands the
+preloader the assets around the selection (in proxy order). Once the
+selection has been still for GLB_PRELOAD_SETTLE_MS, their .glb previews are
+parsed nearest-first on one low-priority worker into the shared mesh cache,
+so toggling to 3D or opening the enlarged viewer on them is a cache hit.
+The main window only schedules preloads while a 3D preview is on screen,
+and the selected asset's preview is pinned while a batch runs so preloads
+can never evict it.
+
+Every new selection cancels the running batch (including a parse in
+progress), so fast scrolling never queues up work. Preloading stops once
+the memory cache is GLB_PRELOAD_BUDGET_FRACTION full, leaving the rest of
+the budget to assets actually viewed.
+
+Public API:
+    get_glb_preloader()
+        .schedule(assets, current)  — assets to warm, nearest first; restarts the timer
+        .cancel()           — stop pending and running preloads
+        .shutdown()         — cancel and wait for the running preload
+        .get_stats()        — preloaded / skipped / cancelled counters
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSignal
+
+from ...config import Config
+from ...services.asset_3d_resolver import resolve_glb_path
+from .gltf_loader import CancelToken
+from .mesh_cache import contains_glb, get_cache_stats, load_glb_data, pin_glb, unpin_glb
+
+logger = logging.getLogger(__name__)
+
+
+class _PreloadSignals(QObject):
+    """Signals for _PreloadTask."""
+    finished = pyqtSignal(int, int, int)  # batch_id, preloaded, skipped
+
+
+class _PreloadTask(QRunnable):
+    """Warm the mesh cache for a list of assets, stopping on cancel or budget.
+
+    The `current` asset's preview is pinned for the duration of the batch."""
+
+    def __init__(self, batch_id: int, assets: List[Dict[str, Any]],
+                 current: Optional[Dict[str, Any]], cancel: CancelToken):
+        super().__init__()
+        self.batch_id = batch_id
+        self.assets = assets
+        self.current = current
+        self.cancel = cancel
+        self.signals = _PreloadSignals()
+
+    def run(self):
+        QThread.currentThread().setPriority(QThread.Priority.LowestPriority)
+        preloaded = skipped = 0
+        current_path = resolve_glb_path(self.current) if self.current else None
+        if current_path is not None:
+            pin_glb(str(current_path))
+        try:
+            for asset in self.assets:
+                if self.cancel.cancelled or not self._has_room():
+                    break
+                path = resolve_glb_path(asset)
+                if path is None or contains_glb(str(path)):
+                    skipped += 1
+                    continue
+                if load_glb_data(str(path), cancel=self.cancel) is not None:
+                    preloaded += 1
+        finally:
+            if current_path is not None:
+                unpin_glb(str(current_path))
+        try:
+            self.signals.finished.emit(self.batch_id, preloaded, skipped)
+        except RuntimeError:
+            pass  # Preloader deleted at shutdown
+
+    @staticmethod
+    def _has_room() -> bool:
+        stats = get_cache_stats()
+        return stats['used_mb'] < stats['budget_mb'] * Config.GLB_PRELOAD_BUDGET_FRACTION
+
+
+class GlbPreloader(QObject):
+    """
+    Debounced, cancellable preloading of neighbouring 3D previews
+
+    Usage:
+        preloader = get_glb_preloader()
+        preloader.schedule([next_asset, previous_asset, ...], current=selected_asset)
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending: List[Dict[str, Any]] = []
+        self._current: Optional[Dict[str, Any]] = None
+        self._cancel: Optional[CancelToken] = None  # Running batch
+        self._batch_id = 0
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(Config.GLB_PRELOAD_SETTLE_MS)
+        self._settle_timer.timeout.connect(self._start)
+
+        self._preloaded = 0
+        self._skipped = 0
+        self._cancelled = 0
+
+    def schedule(self, assets: List[Dict[str, Any]],
+                 current: Optional[Dict[str, Any]] = None):
+        """
+        Preload these assets' previews once the selection settles
+
+        Args:
+            assets: Asset dicts, nearest to the selection first
+            current: The selected asset, kept pinned while the batch runs
+        """
+        self.cancel()
+        self._pending = [dict(asset) for asset in assets if asset]
+        self._current = dict(current) if current else None
+        if self._pending:
+            self._settle_timer.start()
+
+    def cancel(self):
+        """Stop the pending batch and cancel the running one"""
+        self._settle_timer.stop()
+        self._pending = []
+        self._current = None
+        if self._cancel is not None:
+            self._cancel.cancel()
+            self._cancel = None
+            self._cancelled += 1
+
+    def shutdown(self):
+        """Cancel preloading and wait for the running batch to stop"""
+        self.cancel()
+        self._pool.waitForDone()
+
+    def _start(self):
+        assets, self._pending = self._pending, []
+        current, self._current = self._current, None
+        self._batch_id += 1
+        token = CancelToken()
+        self._cancel = token
+        task = _PreloadTask(self._batch_id, assets, current, token)
+        task.signals.finished.connect(self._on_finished)
+        self._pool.start(task)
+
+    def _on_finished(self, batch_id: int, preloaded: int, skipped: int):
+        if batch_id == self._batch_id:
+            self._cancel = None
+        self._preloaded += preloaded
+        self._skipped += skipped
+        if preloaded:
+            logger.debug(f"[GlbPreloader] Preloaded {preloaded} 3D preview(s)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get preloader statistics
+
+        Returns:
+            Dict with preloaded, skipped (cached / no preview) and cancelled counts
+        """
+        return {
+            'preloaded': self._preloaded,
+            'skipped': self._skipped,
+            'cancelled': self._cancelled,
+        }
+
+
+# Singleton instance
+_glb_preloader_instance: Optional[GlbPreloader] = None
+
+
+def get_glb_preloader() -> GlbPreloader:
+    """Get global GlbPreloader singleton instance"""
+    global _glb_preloader_instance
+    if _glb_preloader_instance is None:
+        _glb_preloader_instance = GlbPreloader()
+    return _glb_preloader_instance
+
+
+__all__ = ['GlbPreloader', 'get_glb_preloader']